@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
+import copy
 import time
 import traceback
 
+import numpy as np
 import zmq
 
 import carb
@@ -19,11 +21,24 @@ from omni.replicator.core.scripts.utils import viewport_manager
 from omni.syntheticdata import SyntheticData
 
 from .. import EXT_NAME
+from .image_codecs import IMAGE_CODEC_RAW, encode_image, get_codec
+from .image_output import PIXEL_FORMAT_DEFAULT, ImageOutput
+from .session import SessionEncoder
 
 # The omni.__proto__ namespace is created by this extention
 # read more at core.proto_util.py
 from omni.__proto__ import client_stream_message_pb2
 
+# High water mark of multiplexed connections, one message in flight per camera (kMultiplexedHwm of the OGN node)
+MULTIPLEXED_HWM = 16
+
+
+def _labels_table(id_to_labels: dict) -> dict:
+    """
+    BBox2DInfo.idToLabels table of the idToLabels of the bounding box annotator.
+    """
+    return {str(key): f"class:{next(iter(value.values()))}" for key, value in id_to_labels.items()}
+
 
 class ZMQAnnotator:
     """
@@ -33,6 +48,29 @@ class ZMQAnnotator:
     and streams this data to external applications via ZMQ. It can operate in two modes:
     - OGN node mode (C++ implementation)
     - Python mode (fallback implementation)
+
+    In both modes the images can either be embedded in the protobuf message, or sent
+    (multipart mode) as separate zero-copy ZMQ frames following a small protobuf header.
+    In Python mode the images can also be compressed with any codec from core.image_codecs.
+
+    With a camera id (multiplexed mode) every message is prefixed with a routing frame holding the id,
+    so the streams of many cameras can share one connection and server port. The OGN nodes of all
+    multiplexed annotators streaming to the same port share one socket, in Python mode the mission
+    gives them the same socket (see ZMQServer.subscribe_to_multiplexed_socket_in_loop on the server).
+
+    With a topic (PUB/SUB mode) the messages are published, for a server side StreamProxy, with the
+    topic serialized first in the protobuf header (ClientStreamMessage.topic), so any number of consumers
+    can subscribe to the stream (see ZMQServer.subscribe_to_topic_in_loop on the server).
+
+    The server selects the parts it reads with a StreamAnnotator bitmask (SettingsCommand.annotators),
+    the annotators it did not request are neither read from the GPU nor encoded and sent.
+
+    With a keyframe interval (delta metadata) the label table, intrinsics and pose are only sent
+    when they change and on keyframes, see core.session.SessionEncoder.
+
+    The images can be cropped to a region of interest, downscaled and converted to smaller pixel
+    formats (RGB, uint16 depth in millimeters) before they are encoded, statically or as requested by
+    the server (SettingsCommand.outputs), see core.image_output.ImageOutput.
     """
 
     def __init__(
@@ -45,6 +83,19 @@ class ZMQAnnotator:
         rgb: bool = True,
         depth: bool = True,
         bbox: bool = True,
+        multipart: bool = False,
+        color_codec: int = IMAGE_CODEC_RAW,
+        depth_codec: int = IMAGE_CODEC_RAW,
+        packed_bbox: bool = False,
+        camera_id: str = "",
+        topic: str = "",
+        keyframe_interval: int = 0,
+        crop: tuple = None,
+        downscale: int = 1,
+        color_format: int = PIXEL_FORMAT_DEFAULT,
+        depth_format: int = PIXEL_FORMAT_DEFAULT,
+        send_queue_size: int = 2,
+        drop_oldest: bool = True,
     ):
         """
         Initializes a ZMQAnnotator object.
@@ -55,11 +106,62 @@ class ZMQAnnotator:
             use_ogn_nodes (bool): Whether to use OGN nodes (C++ implementation)
             server_ip (str): The IP address of the ZMQ server
             port (int): The port to use for ZMQ communication
+            multipart (bool): Whether to send images as separate zero-copy multipart frames
+            color_codec (int): ImageCodec used for the color image (Python mode only)
+            depth_codec (int): ImageCodec used for the depth image (Python mode only)
+            packed_bbox (bool): Whether to send bounding boxes as a single packed buffer (BBox2D.packed_data)
+            camera_id (str): Camera id of the multiplexed mode, empty to stream on a connection of its own
+            topic (str): Topic of the PUB/SUB mode, empty to push the messages to a single server
+            keyframe_interval (int): Send the labels and camera metadata on change and every keyframe_interval
+                messages only (delta metadata), 0 to send them in every message
+            crop (tuple): Region of interest (x, y, width, height) of the render product to stream, None for all
+            downscale (int): Downscaling factor of the streamed images, 1 for none
+            color_format (int): PixelFormat of the color image, PIXEL_FORMAT_DEFAULT (RGBA) or PIXEL_FORMAT_RGB8
+            depth_format (int): PixelFormat of the depth image, PIXEL_FORMAT_DEFAULT (float32)
+                or PIXEL_FORMAT_DEPTH_UINT16_MM
+            send_queue_size (int): Messages of this camera waiting in the send queue of the endpoint before they
+                are dropped (OGN nodes only)
+            drop_oldest (bool): Drop the oldest queued message of this camera when its send queue quota is full,
+                the new one if False (OGN nodes only)
         """
+        if camera_id and topic:
+            raise ValueError("The multiplexed (camera_id) and PUB/SUB (topic) modes are exclusive")
+
         self.use_ogn_nodes = use_ogn_nodes
+        self.multipart = multipart
+        self.packed_bbox = packed_bbox
+        self.camera_id = camera_id
+        self._routing_frame = camera_id.encode()
+        self.topic = topic
+        # Serialized topic field, prepended to the serialized header (protobuf fields can come in any order)
+        self._topic_prefix = client_stream_message_pb2.ClientStreamMessage(topic=topic).SerializeToString()
+        self.color_codec = IMAGE_CODEC_RAW
+        self.depth_codec = IMAGE_CODEC_RAW
+        self._requested_codecs = (IMAGE_CODEC_RAW, IMAGE_CODEC_RAW)
+        self.annotators_mask = client_stream_message_pb2.STREAM_ANNOTATOR_ALL
+        self.keyframe_interval = keyframe_interval
+        self.session = SessionEncoder(keyframe_interval) if keyframe_interval > 0 else None
+        # BBox2DInfo.idToLabels table, only rebuilt when the labels of the annotator change
+        self._labels_source = None
+        self._labels_table = {}
         self.server_ip = server_ip
         self.port = port
         self.resolution = resolution
+        # Output of the streamed images, the static one is restored when the server stops requesting one
+        self._static_output = ImageOutput(crop, downscale, color_format, depth_format)
+        self.output = self._static_output
+        # Name the server selects the stream with in SettingsCommand.outputs
+        self.stream_name = camera_id or topic or str(port)
+
+        # Send queue of the endpoint, messages are sent by its sender thread (OGN nodes)
+        self.send_queue_size = send_queue_size
+        self.drop_oldest = drop_oldest
+        # Send statistics of the endpoint (Python mode), set by the mission with the socket
+        self.endpoint_stats = None
+
+        # Latency tracing (FrameTrace): frame sequence id and the last command applied by the mission
+        self.frame_id = 0
+        self._command_trace = (0, 0.0, 0.0)
 
         # Get stage and synthetic data interface
         self.stage = omni.usd.get_context().get_stage()
@@ -68,8 +170,9 @@ class ZMQAnnotator:
         # Set device based on mode (CUDA for OGN nodes, CPU for Python)
         device = "cuda" if self.use_ogn_nodes else "cpu"
 
-        # Create render product for the camera
-        name = f"{camera.split('/')[-1]}_{port}_rp"
+        # Create render product for the camera, multiplexed annotators share the port
+        self._node_suffix = f"{port}_{camera_id or topic}" if camera_id or topic else f"{port}"
+        name = f"{camera.split('/')[-1]}_{self._node_suffix}_rp"
         self._rp = viewport_manager.get_render_product(camera, resolution, False, name)
         self.rp = self._rp.hydra_texture.get_render_product_path()
 
@@ -106,8 +209,150 @@ class ZMQAnnotator:
             # since we've taken care of that above
             self.last_error_time = 0  # for throttling error rate
 
+        self.set_codecs(color_codec, depth_codec)
+
         print(f"[{EXT_NAME}] [Port: {self.port}] Constructed annotator.")
 
+    def set_codecs(self, color_codec: int, depth_codec: int) -> None:
+        """
+        Set the codecs used to encode the streamed images, as requested by the server.
+
+        Codecs are only supported in Python mode (the OGN node streams raw images), and codecs
+        which are unknown or missing their dependencies fall back to raw. The codec actually
+        used is reported in each ClientStreamMessage.
+
+        Args:
+            color_codec (int): ImageCodec for the color image
+            depth_codec (int): ImageCodec for the depth image
+        """
+        # The server repeats its request with every settings command, only act on changes
+        if (color_codec, depth_codec) == self._requested_codecs:
+            return
+        self._requested_codecs = (color_codec, depth_codec)
+
+        if self.use_ogn_nodes:
+            carb.log_warn(f"[{EXT_NAME}] [Port: {self.port}] Image codecs are not supported by the OGN node, streaming raw.")
+            return
+
+        self.color_codec = self._resolve_codec(color_codec)
+        self.depth_codec = self._resolve_codec(depth_codec)
+
+    def set_annotators(self, annotators_mask: int) -> None:
+        """
+        Set the parts of the stream messages to send, as requested by the server.
+
+        Args:
+            annotators_mask (int): StreamAnnotator bitmask, STREAM_ANNOTATOR_ALL (0) for all parts
+        """
+        # The server repeats its request with every settings command, only act on changes
+        if annotators_mask == self.annotators_mask:
+            return
+        self.annotators_mask = annotators_mask
+
+        if self.use_ogn_nodes:
+            self.zmq_node.get_attribute("inputs:annotators").set(annotators_mask)
+
+    def set_output(self, output: ImageOutput = None) -> None:
+        """
+        Set the crop, downscaling and pixel formats of the streamed images, as requested by the server.
+
+        Args:
+            output (ImageOutput): Output of the stream, None to restore the output the annotator was built with
+        """
+        output = output or self._static_output
+        # The server repeats its request with every settings command, only act on changes
+        if output == self.output:
+            return
+        self.output = output
+        print(f"[{EXT_NAME}] [Port: {self.port}] Streaming {output}")
+
+        if self.use_ogn_nodes:
+            self._set_node_output()
+
+    def _set_node_output(self) -> None:
+        """
+        Set the output inputs of the OGN node.
+        """
+        x, y, width, height = self.output.crop or (0, 0, 0, 0)
+        self.zmq_node.get_attribute("inputs:cropX").set(x)
+        self.zmq_node.get_attribute("inputs:cropY").set(y)
+        self.zmq_node.get_attribute("inputs:cropWidth").set(width)
+        self.zmq_node.get_attribute("inputs:cropHeight").set(height)
+        self.zmq_node.get_attribute("inputs:downscale").set(self.output.downscale)
+        self.zmq_node.get_attribute("inputs:colorFormat").set(self.output.color_format)
+        self.zmq_node.get_attribute("inputs:depthFormat").set(self.output.depth_format)
+
+    def _requested(self, annotator: int) -> bool:
+        """
+        Whether the server requested an annotator (a StreamAnnotator flag).
+        """
+        return not self.annotators_mask or bool(self.annotators_mask & annotator)
+
+    def set_command_trace(self, command_id: int, send_time: float, apply_time: float) -> None:
+        """
+        Record the last command applied from the server, it is echoed back in the FrameTrace of the next frames.
+
+        Args:
+            command_id (int): CommandTrace.command_id of the applied command
+            send_time (float): CommandTrace.send_time of the applied command
+            apply_time (float): When the command was applied (time.monotonic())
+        """
+        self._command_trace = (command_id, send_time, apply_time)
+
+        if self.use_ogn_nodes:
+            self.zmq_node.get_attribute("inputs:commandId").set(command_id)
+            self.zmq_node.get_attribute("inputs:commandSendTime").set(send_time)
+            self.zmq_node.get_attribute("inputs:commandApplyTime").set(apply_time)
+
+    def get_endpoint_stats(self) -> dict:
+        """
+        Send statistics of the server endpoint, summed over all the annotators streaming to it.
+
+        Returns:
+            dict: messages_sent, messages_dropped and bytes_sent
+        """
+        if self.use_ogn_nodes:
+            return {
+                "messages_sent": self.zmq_node.get_attribute("outputs:endpointMessagesSent").get(),
+                "messages_dropped": self.zmq_node.get_attribute("outputs:endpointMessagesDropped").get(),
+                "bytes_sent": self.zmq_node.get_attribute("outputs:endpointBytesSent").get(),
+            }
+        if self.endpoint_stats is None:
+            return {}
+        return self.endpoint_stats.as_dict()
+
+    def get_send_stats(self) -> dict:
+        """
+        Send counters of this annotator's OGN node, the endpoint statistics sum them over all its nodes.
+
+        Returns:
+            dict: messages_queued, messages_sent and messages_dropped, empty in Python mode
+        """
+        if not self.use_ogn_nodes:
+            return {}
+        return {
+            "messages_queued": self.zmq_node.get_attribute("outputs:messagesQueued").get(),
+            "messages_sent": self.zmq_node.get_attribute("outputs:messagesSent").get(),
+            "messages_dropped": self.zmq_node.get_attribute("outputs:messagesDropped").get(),
+        }
+
+    def _resolve_codec(self, codec_id: int) -> int:
+        """
+        Return codec_id if it can be used for encoding, IMAGE_CODEC_RAW otherwise.
+        """
+        try:
+            codec = get_codec(codec_id)
+        except KeyError:
+            carb.log_warn(f"[{EXT_NAME}] [Port: {self.port}] Unknown image codec {codec_id}, streaming raw.")
+            return IMAGE_CODEC_RAW
+
+        if not codec.available():
+            carb.log_warn(f"[{EXT_NAME}] [Port: {self.port}] Image codec {codec.name} is not installed, streaming raw.")
+            return IMAGE_CODEC_RAW
+
+        print(f"[{EXT_NAME}] [Port: {self.port}] Streaming with image codec: {codec.name}")
+        return codec_id
+
     def build_graph(self, rp_name: str, camera_path: str) -> None:
         """
         Build the OGN graph for streaming camera data.
@@ -156,14 +401,26 @@ class ZMQAnnotator:
 
         # create zmq node
         zmq_ = self.graph.create_node(
-            _graph_path + "/zmq{}".format(self.port), "isaacsim.zmq.bridge.OgnIsaacBridgeZMQNode", True
+            _graph_path + "/zmq{}".format(self._node_suffix), "isaacsim.zmq.bridge.OgnIsaacBridgeZMQNode", True
         )
         zmq_.get_attribute("inputs:port").set(self.port)
         zmq_.get_attribute("inputs:ip").set(self.server_ip)
+        zmq_.get_attribute("inputs:cameraId").set(self.camera_id)
+        zmq_.get_attribute("inputs:topic").set(self.topic)
+        zmq_.get_attribute("inputs:multipart").set(self.multipart)
+        zmq_.get_attribute("inputs:packedBBox2d").set(self.packed_bbox)
+        zmq_.get_attribute("inputs:annotators").set(self.annotators_mask)
+        zmq_.get_attribute("inputs:keyframeInterval").set(self.keyframe_interval)
+        zmq_.get_attribute("inputs:sendQueueSize").set(self.send_queue_size)
+        zmq_.get_attribute("inputs:dropOldest").set(self.drop_oldest)
+        zmq_.get_attribute("inputs:width").set(self.resolution[0])
+        zmq_.get_attribute("inputs:height").set(self.resolution[1])
+        self.zmq_node = zmq_
+        self._set_node_output()
 
         # create camera info node
         camera_ = self.graph.create_node(
-            _graph_path + "/camera{}".format(self.port), "isaacsim.zmq.bridge.OgnIsaacBridgeZMQCamera", True
+            _graph_path + "/camera{}".format(self._node_suffix), "isaacsim.zmq.bridge.OgnIsaacBridgeZMQCamera", True
         )
         camera_.get_attribute("inputs:cameraPrimPath").set(camera_path)
         camera_.get_attribute("inputs:width").set(self.resolution[0])
@@ -274,65 +531,131 @@ class ZMQAnnotator:
         start_time = time.monotonic()
         # https://docs.omniverse.nvidia.com/extensions/latest/ext_replicator/annotators_details.html#bounding-box-2d-tight
 
-        # Create protobuf message
+        # Create protobuf message, with the parts requested by the server.
+        # The sub-messages are filled in place, temporaries copied in with CopyFrom would cost an allocation
+        # and a copy each. The message itself is not reused: the upb backend of protobuf allocates the fields
+        # in an arena which Clear() does not shrink, a reused message would grow by every frame it carried.
         client_stream = client_stream_message_pb2.ClientStreamMessage()
+        client_stream.annotators = self.annotators_mask
+
+        if self._requested(client_stream_message_pb2.STREAM_ANNOTATOR_BBOX2D):
+            # Get bounding box data (performance intensive operation)
+            bbox2d_data = self.bbox2d_annot.get_data()
+
+            # Fill BBox2D information, tolist() is the fastest conversion into a repeated field
+            bbox2d_info = client_stream.bbox2d.info
+            bbox2d_info.bboxIds.extend(bbox2d_data["info"]["bboxIds"].tolist())
+            id_to_labels = bbox2d_data["info"]["idToLabels"]
+            if self.session is None:
+                if id_to_labels != self._labels_source:
+                    self._labels_source = copy.deepcopy(id_to_labels)
+                    self._labels_table = _labels_table(id_to_labels)
+                bbox2d_info.idToLabels.update(self._labels_table)
+            else:
+                # Only rebuilt when the labels change, sent with the session state
+                self.session.update_labels(id_to_labels, lambda: _labels_table(id_to_labels))
+
+            # Fill BBox2D data, in the coordinates of the streamed images
+            bboxes = self.output.adjust_bboxes(bbox2d_data["data"], self.resolution)
+            if self.packed_bbox:
+                # The annotator structured array already has the packed_data layout, no per box conversion
+                client_stream.bbox2d.packed_data = np.ascontiguousarray(bboxes).tobytes()
+            else:
+                bbox2d_message = client_stream.bbox2d.data
+                for semantic_id, x_min, y_min, x_max, y_max, occlusion_ratio in bboxes.tolist():
+                    bbox2d_message.add(
+                        semanticId=semantic_id,
+                        xMin=x_min,
+                        yMin=y_min,
+                        xMax=x_max,
+                        yMax=y_max,
+                        occlusionRatio=occlusion_ratio,
+                    )
+
+        if self._requested(client_stream_message_pb2.STREAM_ANNOTATOR_CAMERA):
+            # Fill Camera information
+            view_matrix = self.camera.get_view_matrix_ros().ravel().tolist()
+            intrinsics_matrix = []
+            try:
+                intrinsics_matrix = self.camera.get_intrinsics_matrix().ravel().tolist()
+            except:
+                # Camera.get_intrinsics_matrix() will throw exception for non pinhole cameras
+                # I this case, we will not stream camera data
+                carb.log_verbose(traceback.format_exc())
+            intrinsics_matrix = self.output.adjust_intrinsics(intrinsics_matrix, self.resolution)
+            camera_scale = self.camera_xform.get_world_scales()[0].tolist()
+            if self.session is None:
+                camera = client_stream.camera
+                camera.view_matrix_ros.extend(view_matrix)
+                camera.intrinsics_matrix.extend(intrinsics_matrix)
+                camera.camera_scale.extend(camera_scale)
+            else:
+                # The pose is sent when it changes, the intrinsics and scale with the session state
+                self.session.update_camera(view_matrix, intrinsics_matrix, camera_scale)
 
-        # Get bounding box data (performance intensive operation)
-        bbox2d_data = self.bbox2d_annot.get_data()
-
-        # Fill BBox2D information
-        bbox2d_info = client_stream_message_pb2.BBox2DInfo()
-        bbox2d_info.bboxIds.extend(bbox2d_data["info"]["bboxIds"].tolist())
-        for key, value in bbox2d_data["info"]["idToLabels"].items():
-            bbox2d_info.idToLabels[str(key)] = f"class:{next(iter(value.values()))}"
-        client_stream.bbox2d.info.CopyFrom(bbox2d_info)
-
-        # Fill BBox2D data
-        for data in bbox2d_data["data"]:
-            bbox2d_type = client_stream.bbox2d.data.add()
-            bbox2d_type.semanticId = data[0]
-            bbox2d_type.xMin = data[1]
-            bbox2d_type.yMin = data[2]
-            bbox2d_type.xMax = data[3]
-            bbox2d_type.yMax = data[4]
-            bbox2d_type.occlusionRatio = data[5]
-
-        # Fill Camera information
-        camera = client_stream_message_pb2.Camera()
-        view_matrix = self.camera.get_view_matrix_ros()
-        camera.view_matrix_ros.extend(view_matrix.flatten().tolist())
-        try:
-            intrinsics_matrix = self.camera.get_intrinsics_matrix()
-            camera.intrinsics_matrix.extend(intrinsics_matrix.flatten().tolist())
-        except:
-            # Camera.get_intrinsics_matrix() will throw exception for non pinhole cameras
-            # I this case, we will not stream camera data
-            carb.log_verbose(traceback.format_exc())
-        camera.camera_scale.extend(self.camera_xform.get_world_scales()[0].tolist())
-        client_stream.camera.CopyFrom(camera)
+        if self.session is not None:
+            self.session.fill(client_stream, camera=self._requested(client_stream_message_pb2.STREAM_ANNOTATOR_CAMERA))
 
         # Fill Clock information
-        clock = client_stream_message_pb2.Clock()
+        clock = client_stream.clock
         clock.sim_dt = dt
         clock.sys_dt = 0  # not simply accessible via python
         clock.sim_time = sim_time
         clock.sys_time = time.time()
-        client_stream.clock.CopyFrom(clock)
-
-        # Fill RGB image data
-        client_stream.color_image = self.rgb_annot.get_data().tobytes()
 
-        # Fill Depth image data
-        client_stream.depth_image = self.distance_to_camera_annot.get_data().tobytes()
-
-        # Serialize and send the message
-        message = client_stream.SerializeToString()
+        # Crop, downscale and convert, then encode the requested RGB and Depth image data
+        # (raw codec returns the buffers as is, or a contiguous copy of resampled images)
+        self.output.fill(client_stream, self.resolution)
+        images = []
+        if self._requested(client_stream_message_pb2.STREAM_ANNOTATOR_COLOR):
+            client_stream.color_codec = self.color_codec
+            color = self.output.apply_color(self.rgb_annot.get_data())
+            images.append(("color", encode_image(color, self.color_codec)))
+        if self._requested(client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH):
+            client_stream.depth_codec = self.depth_codec
+            depth = self.output.apply_depth(self.distance_to_camera_annot.get_data())
+            images.append(("depth", encode_image(depth, self.depth_codec)))
+
+        # Fill latency tracing information
+        self.frame_id += 1
+        trace = client_stream.trace
+        trace.frame_id = self.frame_id
+        trace.render_time = start_time
+        trace.command_id, trace.command_send_time, trace.command_apply_time = self._command_trace
+
+        if self.multipart:
+            # Images follow the protobuf header as separate frames, ZMQ sends them without copying
+            for frame_index, (image_name, image) in enumerate(images, start=1):
+                setattr(client_stream, f"{image_name}_image_frame", frame_index)
+            image_frames = [image for _, image in images]
+        else:
+            # Fill RGB & Depth image data
+            for image_name, image in images:
+                setattr(client_stream, f"{image_name}_image", bytes(image))
+            image_frames = []
 
         # send message with error throttling if not connected to a server
         async def graceful_send():
             try:
-                await self.sock.send(message)
+                # The send time is part of the header, so it is taken right before the header is serialized,
+                # once the coroutine runs and the socket can take the message
+                trace.send_time = time.monotonic()
+                frames = [client_stream.SerializeToString()] + image_frames
+                if self.camera_id:
+                    # Routing frame of the multiplexed mode
+                    frames.insert(0, self._routing_frame)
+                elif self.topic:
+                    # Subscription prefix of the PUB/SUB mode
+                    frames[0] = self._topic_prefix + frames[0]
+                await self.sock.send_multipart(frames, copy=False)
+                if self.endpoint_stats is not None:
+                    self.endpoint_stats.record_sent(sum(memoryview(frame).nbytes for frame in frames))
             except zmq.Again:
+                if self.endpoint_stats is not None:
+                    self.endpoint_stats.record_dropped()
+                if self.session is not None:
+                    # The dropped message may have carried a metadata change
+                    self.session.request_keyframe()
                 if sim_time - self.last_error_time > 5.0:
                     carb.log_warn("Failed to send message (no server available)")
                     self.last_error_time = sim_time
@@ -7,6 +7,7 @@ import zmq
 import zmq.asyncio
 
 import carb
+import carb.settings
 import omni
 
 from isaacsim.core.api.world import World
@@ -14,6 +15,36 @@ from isaacsim.core.api.world import World
 from .rate_limiter import RateLimitedCallback
 from .. import EXT_NAME
 
+# Number of IO threads of the ZMQ context, shared with the bridge nodes context
+IO_THREADS_SETTING = "/exts/isaacsim.zmq.bridge/ioThreads"
+
+
+class EndpointStats:
+    """
+    Send statistics of one endpoint, shared by every sender using its pooled socket.
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self.messages_sent = 0
+        self.messages_dropped = 0
+        self.bytes_sent = 0
+
+    def record_sent(self, nbytes: int) -> None:
+        self.messages_sent += 1
+        self.bytes_sent += nbytes
+
+    def record_dropped(self) -> None:
+        self.messages_dropped += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "messages_sent": self.messages_sent,
+            "messages_dropped": self.messages_dropped,
+            "bytes_sent": self.bytes_sent,
+        }
+
+
 class ZMQClient:
     """
     The ZMQClient class provides a singleton instance which handles the creation and management of ZMQ sockets.
@@ -23,6 +54,11 @@ class ZMQClient:
     - Handling connection and disconnection of sockets
     - Managing physics callbacks for rate-limited data streaming (Python-only mode)
     - Providing methods for sending and receiving data through ZMQ
+
+    Push sockets are pooled by endpoint: all the senders to one server port share a socket (and its
+    TCP connection) and its EndpointStats. The context IO threads are set with the same setting as the
+    bridge nodes (`/exts/isaacsim.zmq.bridge/ioThreads`), pyzmq bundles its own libzmq so the context
+    itself cannot be shared with the nodes.
     """
 
     _instance = None
@@ -36,7 +72,9 @@ class ZMQClient:
     def __init__(self, server_ip: str = "localhost"):
         self.server_ip = server_ip
         self.push_sockets = {}
+        self.pub_sockets = {}
         self.pull_sockets = {}
+        self.endpoint_stats = {}
         self.phyx_callbacks = {}
         self.annotators = {}
 
@@ -56,7 +94,8 @@ class ZMQClient:
             zmq.asyncio.Context: The ZMQ context.
         """
         if not self._context:
-            self._context = zmq.asyncio.Context()
+            io_threads = carb.settings.get_settings().get(IO_THREADS_SETTING) or 1
+            self._context = zmq.asyncio.Context(io_threads=max(1, int(io_threads)))
         return self._context
 
     def get_pull_socket(self, port: int) -> zmq.Socket:
@@ -101,8 +140,8 @@ class ZMQClient:
         This method iterates over all push and pull sockets, disconnects them, and closes them.
         It then clears the socket dictionaries and terminates the ZeroMQ context.
         """
-        # Disconnect and close all push sockets
-        for addr, sock in self.push_sockets.items():
+        # Disconnect and close all push and pub sockets
+        for addr, sock in list(self.push_sockets.items()) + list(self.pub_sockets.items()):
             await asyncio.sleep(0.1)
             try:
                 sock.setsockopt(zmq.LINGER, 0)  # Don't wait for pending messages
@@ -133,6 +172,7 @@ class ZMQClient:
         # Clear socket dictionaries
         self.pull_sockets = {}
         self.push_sockets = {}
+        self.pub_sockets = {}
 
         # Terminate ZMQ context
         if self._context:
@@ -144,26 +184,76 @@ class ZMQClient:
     # They provide Python-based alternatives for streaming data
     ######################################################################################
 
-    def get_push_socket(self, port: int) -> zmq.Socket:
+    def get_push_socket(self, port: int, hwm: int = 1) -> zmq.Socket:
         """
-        Creates and returns a ZeroMQ PUSH socket connected to the specified port.
+        Returns the ZeroMQ PUSH socket connected to the specified port, created on first use.
 
         This socket type is used to send data to a remote PULL socket.
+        The socket is pooled, later calls for the same port return it (with the high water mark it was created with).
 
         Args:
             port (int): The port number to connect the socket to.
+            hwm (int): High water mark, the number of messages buffered.
 
         Returns:
-            zmq.Socket: The created PUSH socket.
+            zmq.Socket: The PUSH socket.
         """
         addr = f"tcp://{self.server_ip}:{port}"
+        if addr in self.push_sockets:
+            return self.push_sockets[addr]
+
         sock = self.context().socket(zmq.PUSH)
-        sock.set_hwm(1)  # High water mark: only buffer 1 message
+        sock.set_hwm(hwm)  # High water mark: only buffer hwm messages
         sock.setsockopt(zmq.SNDTIMEO, 1000)  # 1 sec timeout for sending
         sock.connect(addr)
         self.push_sockets[addr] = sock
+        self.get_endpoint_stats(port)
         return sock
 
+    def get_pub_socket(self, port: int, hwm: int = 1) -> zmq.Socket:
+        """
+        Returns the ZeroMQ PUB socket connected to the specified port, created on first use.
+
+        This socket type is used to publish data to the frontend of a server side StreamProxy
+        (PUB/SUB mode), so several consumers can subscribe to the same stream.
+        A PUB socket never blocks, messages a subscriber is not ready for are dropped by ZMQ
+        and are not reported in the endpoint statistics.
+
+        Args:
+            port (int): The port number to connect the socket to.
+            hwm (int): High water mark, the number of messages buffered.
+
+        Returns:
+            zmq.Socket: The PUB socket.
+        """
+        addr = f"tcp://{self.server_ip}:{port}"
+        if addr in self.pub_sockets:
+            return self.pub_sockets[addr]
+
+        sock = self.context().socket(zmq.PUB)
+        sock.set_hwm(hwm)  # High water mark: only buffer hwm messages
+        sock.connect(addr)
+        self.pub_sockets[addr] = sock
+        self.get_endpoint_stats(port)
+        return sock
+
+    def get_endpoint_stats(self, port: int) -> EndpointStats:
+        """
+        Returns the send statistics of the endpoint at the specified port.
+
+        The statistics are kept when the sockets are disconnected, for the lifetime of the client.
+
+        Args:
+            port (int): The port number of the endpoint.
+
+        Returns:
+            EndpointStats: The statistics, updated by the senders.
+        """
+        addr = f"tcp://{self.server_ip}:{port}"
+        if addr not in self.endpoint_stats:
+            self.endpoint_stats[addr] = EndpointStats(addr)
+        return self.endpoint_stats[addr]
+
     def add_physx_step_callback(self, name: str, hz: float, fn: callable) -> None:
         """
         Adds a callback function to be executed at a specified simulation steps frequency.
@@ -0,0 +1,355 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Image codecs shared by the Isaac Sim client (ZMQAnnotator) and the server.
+# This module is duplicated on both sides of the bridge, keep the copies identical.
+
+import threading
+
+import numpy as np
+
+# Optional compressors, codecs depending on a missing library report as unavailable
+try:
+    import lz4.block as lz4_block
+except ImportError:
+    lz4_block = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Codec ids, must match the ImageCodec enum @ proto/client_stream_message.proto
+IMAGE_CODEC_RAW = 0
+IMAGE_CODEC_LZ4 = 1
+IMAGE_CODEC_ZSTD = 2
+IMAGE_CODEC_PNG = 3
+IMAGE_CODEC_DEPTH_PNG16 = 4
+IMAGE_CODEC_DEPTH_DELTA_ZSTD = 5
+
+# Depth codecs quantize distances to uint16 steps of 1 / DEPTH_QUANTIZATION stage units
+# (millimetres for a stage in meters). 0 is reserved for invalid / infinite depth.
+DEPTH_QUANTIZATION = 1000.0
+
+
+class ImageCodec:
+    """
+    Base class for image codecs.
+
+    A codec encodes a numpy image into a bytes-like payload, and decodes a payload back
+    into a flat numpy array of the requested dtype. Callers reshape the decoded array
+    to (height, width, channels) as they do for raw buffers.
+    """
+
+    codec_id = None
+    name = None
+
+    def available(self) -> bool:
+        """
+        Returns:
+            bool: Whether the libraries this codec depends on are installed.
+        """
+        return True
+
+    def encode(self, image: np.ndarray):
+        """
+        Encode an image.
+
+        Args:
+            image (np.ndarray): Image as numpy array
+
+        Returns:
+            bytes-like payload
+        """
+        raise NotImplementedError
+
+    def decode(self, data, dtype) -> np.ndarray:
+        """
+        Decode a payload.
+
+        Args:
+            data: Encoded payload (bytes or memoryview)
+            dtype: Numpy dtype of the decoded pixels
+
+        Returns:
+            np.ndarray: Flat array of decoded pixels
+        """
+        raise NotImplementedError
+
+
+class RawCodec(ImageCodec):
+    """Uncompressed pixel buffer, decoding wraps the payload without copying."""
+
+    codec_id = IMAGE_CODEC_RAW
+    name = "raw"
+
+    def encode(self, image: np.ndarray):
+        return np.ascontiguousarray(image)
+
+    def decode(self, data, dtype) -> np.ndarray:
+        return np.frombuffer(data, dtype=dtype)
+
+
+class LZ4Codec(ImageCodec):
+    """Lossless LZ4 block compression, the fastest option for RGBA streams."""
+
+    codec_id = IMAGE_CODEC_LZ4
+    name = "lz4"
+
+    def available(self) -> bool:
+        return lz4_block is not None
+
+    def encode(self, image: np.ndarray):
+        return lz4_block.compress(np.ascontiguousarray(image), store_size=True)
+
+    def decode(self, data, dtype) -> np.ndarray:
+        return np.frombuffer(lz4_block.decompress(data), dtype=dtype)
+
+
+class _ZstdContexts(threading.local):
+    """
+    Zstandard compressor and decompressor of the calling thread, created on first use.
+
+    The codecs are shared by all the threads (one consumer thread per camera on the server), while
+    a ZstdCompressor / ZstdDecompressor must not be used by several threads at the same time.
+    """
+
+    def __init__(self, level: int):
+        self.level = level
+        self._compressor = None
+        self._decompressor = None
+
+    def compressor(self):
+        if self._compressor is None:
+            self._compressor = zstandard.ZstdCompressor(level=self.level)
+        return self._compressor
+
+    def decompressor(self):
+        if self._decompressor is None:
+            self._decompressor = zstandard.ZstdDecompressor()
+        return self._decompressor
+
+
+class ZstdCodec(ImageCodec):
+    """Lossless Zstandard compression, smaller than LZ4 at a higher CPU cost."""
+
+    codec_id = IMAGE_CODEC_ZSTD
+    name = "zstd"
+
+    def __init__(self, level: int = 1):
+        self.level = level
+        self._contexts = _ZstdContexts(level)
+
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def encode(self, image: np.ndarray):
+        return self._contexts.compressor().compress(np.ascontiguousarray(image))
+
+    def decode(self, data, dtype) -> np.ndarray:
+        return np.frombuffer(self._contexts.decompressor().decompress(data), dtype=dtype)
+
+
+class PNGCodec(ImageCodec):
+    """Lossless PNG for 8-bit RGBA (or RGB) images, best ratio but too slow for high rate streams."""
+
+    codec_id = IMAGE_CODEC_PNG
+    name = "png"
+
+    def available(self) -> bool:
+        return cv2 is not None
+
+    def encode(self, image: np.ndarray):
+        # OpenCV expects BGR(A) channel order
+        conversion = cv2.COLOR_RGBA2BGRA if image.shape[-1] == 4 else cv2.COLOR_RGB2BGR
+        ok, encoded = cv2.imencode(".png", cv2.cvtColor(image, conversion), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise ValueError("PNG encoding failed")
+        return encoded
+
+    def decode(self, data, dtype) -> np.ndarray:
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        conversion = cv2.COLOR_BGRA2RGBA if image.shape[-1] == 4 else cv2.COLOR_BGR2RGB
+        return cv2.cvtColor(image, conversion).ravel().view(dtype)
+
+
+class DepthPNG16Codec(ImageCodec):
+    """
+    Depth quantized to uint16 (see DEPTH_QUANTIZATION) and stored as a 16-bit PNG.
+
+    Depth already quantized to uint16 is encoded as is, decoding to uint16 keeps it quantized.
+    """
+
+    codec_id = IMAGE_CODEC_DEPTH_PNG16
+    name = "depth_png16"
+
+    def available(self) -> bool:
+        return cv2 is not None
+
+    def encode(self, image: np.ndarray):
+        depth = quantize_depth(image)
+        ok, encoded = cv2.imencode(".png", depth.reshape(depth.shape[0], -1), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise ValueError("PNG encoding failed")
+        return encoded
+
+    def decode(self, data, dtype) -> np.ndarray:
+        depth = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        if np.dtype(dtype) == np.uint16:
+            return depth.ravel()
+        return dequantize_depth(depth.ravel(), dtype)
+
+
+class DepthDeltaZstdCodec(ImageCodec):
+    """
+    Depth quantized to uint16 (see DEPTH_QUANTIZATION), delta encoded along the scanlines
+    and Zstandard compressed. Neighbouring depth values are close, so the deltas are
+    mostly small and compress far better than the raw float buffer.
+
+    Depth already quantized to uint16 is encoded as is, decoding to uint16 keeps it quantized.
+    """
+
+    codec_id = IMAGE_CODEC_DEPTH_DELTA_ZSTD
+    name = "depth_delta_zstd"
+
+    def __init__(self, level: int = 1):
+        self.level = level
+        self._contexts = _ZstdContexts(level)
+
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def encode(self, image: np.ndarray):
+        depth = quantize_depth(image).ravel()
+        # uint16 arithmetic wraps around, which the cumulative sum in decode() undoes
+        delta = np.empty_like(depth)
+        delta[0] = depth[0]
+        np.subtract(depth[1:], depth[:-1], out=delta[1:])
+        return self._contexts.compressor().compress(delta)
+
+    def decode(self, data, dtype) -> np.ndarray:
+        delta = np.frombuffer(self._contexts.decompressor().decompress(data), dtype=np.uint16)
+        depth = np.cumsum(delta, dtype=np.uint16)
+        if np.dtype(dtype) == np.uint16:
+            return depth
+        return dequantize_depth(depth, dtype)
+
+
+def quantize_depth(depth: np.ndarray) -> np.ndarray:
+    """
+    Quantize float depth to uint16 steps of 1 / DEPTH_QUANTIZATION.
+
+    Non finite and non positive values map to 0, values beyond the uint16 range saturate.
+    uint16 depth is considered already quantized and returned as is.
+
+    Args:
+        depth (np.ndarray): Float depth image
+
+    Returns:
+        np.ndarray: uint16 depth image of the same shape
+    """
+    if depth.dtype == np.uint16:
+        return depth
+    scaled = np.nan_to_num(depth * DEPTH_QUANTIZATION, nan=0.0, posinf=0.0, neginf=0.0)
+    # Clip valid depth to at least one step, so it is not confused with invalid (0)
+    valid = scaled > 0
+    np.clip(scaled, 1, 65535, out=scaled)
+    scaled *= valid
+    return np.rint(scaled).astype(np.uint16)
+
+
+def dequantize_depth(depth: np.ndarray, dtype=np.float32) -> np.ndarray:
+    """
+    Convert uint16 quantized depth back to float, invalid (0) values become +inf.
+
+    Args:
+        depth (np.ndarray): uint16 depth
+        dtype: Float dtype of the result
+
+    Returns:
+        np.ndarray: Float depth
+    """
+    result = depth.astype(dtype)
+    result /= DEPTH_QUANTIZATION
+    result[depth == 0] = np.inf
+    return result
+
+
+_codecs = {}
+
+
+def register_codec(codec: ImageCodec) -> None:
+    """
+    Register a codec so it can be looked up by id or name.
+
+    Args:
+        codec (ImageCodec): Codec instance
+    """
+    _codecs[codec.codec_id] = codec
+
+
+def get_codec(codec) -> ImageCodec:
+    """
+    Look up a registered codec.
+
+    Args:
+        codec: Codec id (int) or name (str)
+
+    Returns:
+        ImageCodec: The registered codec
+
+    Raises:
+        KeyError: If no codec matches
+    """
+    if isinstance(codec, str):
+        for registered in _codecs.values():
+            if registered.name == codec:
+                return registered
+        raise KeyError(f"Unknown image codec: {codec}")
+    return _codecs[int(codec)]
+
+
+def available_codecs() -> list:
+    """
+    Returns:
+        list: Names of the registered codecs whose dependencies are installed.
+    """
+    return [codec.name for codec in _codecs.values() if codec.available()]
+
+
+def encode_image(image: np.ndarray, codec=IMAGE_CODEC_RAW):
+    """
+    Encode an image with a registered codec.
+
+    Args:
+        image (np.ndarray): Image as numpy array
+        codec: Codec id or name
+
+    Returns:
+        bytes-like payload
+    """
+    return get_codec(codec).encode(image)
+
+
+def decode_image(data, codec=IMAGE_CODEC_RAW, dtype=np.uint8) -> np.ndarray:
+    """
+    Decode an image payload with a registered codec.
+
+    Args:
+        data: Encoded payload (bytes or memoryview)
+        codec: Codec id or name
+        dtype: Numpy dtype of the decoded pixels
+
+    Returns:
+        np.ndarray: Flat array of decoded pixels
+    """
+    return get_codec(codec).decode(data, dtype)
+
+
+for _codec in (RawCodec(), LZ4Codec(), ZstdCodec(), PNGCodec(), DepthPNG16Codec(), DepthDeltaZstdCodec()):
+    register_codec(_codec)
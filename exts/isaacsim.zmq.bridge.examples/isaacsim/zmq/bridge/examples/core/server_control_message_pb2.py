@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cserver_control_message.proto\"*\n\x07Vector3\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\"J\n\x14\x43\x61meraControlCommand\x12\x1c\n\njoints_vel\x18\x01 \x01(\x0b\x32\x08.Vector3\x12\x14\n\x0c\x66ocal_length\x18\x02 \x01(\x01\"(\n\x0fSettingsCommand\x12\x15\n\radaptive_rate\x18\x01 \x01(\x08\"D\n\rFrankaCommand\x12\x1e\n\x0c\x65\x66\x66\x65\x63tor_pos\x18\x01 \x01(\x0b\x32\x08.Vector3\x12\x13\n\x0bshow_marker\x18\x02 \x01(\x08\"\xb2\x01\n\x14ServerControlMessage\x12\x37\n\x16\x63\x61mera_control_command\x18\x01 \x01(\x0b\x32\x15.CameraControlCommandH\x00\x12,\n\x10settings_command\x18\x02 \x01(\x0b\x32\x10.SettingsCommandH\x00\x12(\n\x0e\x66ranka_command\x18\x03 \x01(\x0b\x32\x0e.FrankaCommandH\x00\x42\t\n\x07\x63ommandb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cserver_control_message.proto\"*\n\x07Vector3\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\"J\n\x14\x43\x61meraControlCommand\x12\x1c\n\njoints_vel\x18\x01 \x01(\x0b\x32\x08.Vector3\x12\x14\n\x0c\x66ocal_length\x18\x02 \x01(\x01\"\xa6\x01\n\x0cStreamOutput\x12\x0e\n\x06stream\x18\x01 \x01(\t\x12\x0e\n\x06\x63rop_x\x18\x02 \x01(\r\x12\x0e\n\x06\x63rop_y\x18\x03 \x01(\r\x12\x12\n\ncrop_width\x18\x04 \x01(\r\x12\x13\n\x0b\x63rop_height\x18\x05 \x01(\r\x12\x11\n\tdownscale\x18\x06 \x01(\r\x12\x14\n\x0c\x63olor_format\x18\x07 \x01(\r\x12\x14\n\x0c\x64\x65pth_format\x18\x08 \x01(\r\"\x86\x01\n\x0fSettingsCommand\x12\x15\n\radaptive_rate\x18\x01 \x01(\x08\x12\x13\n\x0b\x63olor_codec\x18\x02 \x01(\r\x12\x13\n\x0b\x64\x65pth_codec\x18\x03 \x01(\r\x12\x12\n\nannotators\x18\x04 \x01(\r\x12\x1e\n\x07outputs\x18\x05 \x03(\x0b\x32\r.StreamOutput\"D\n\rFrankaCommand\x12\x1e\n\x0c\x65\x66\x66\x65\x63tor_pos\x18\x01 \x01(\x0b\x32\x08.Vector3\x12\x13\n\x0bshow_marker\x18\x02 \x01(\x08\"G\n\x0c\x43ommandTrace\x12\x12\n\ncommand_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12\x11\n\tsend_time\x18\x03 \x01(\x01\"\xd0\x01\n\x14ServerControlMessage\x12\x37\n\x16\x63\x61mera_control_command\x18\x01 \x01(\x0b\x32\x15.CameraControlCommandH\x00\x12,\n\x10settings_command\x18\x02 \x01(\x0b\x32\x10.SettingsCommandH\x00\x12(\n\x0e\x66ranka_command\x18\x03 \x01(\x0b\x32\x0e.FrankaCommandH\x00\x12\x1c\n\x05trace\x18\x04 \x01(\x0b\x32\r.CommandTraceB\t\n\x07\x63ommandb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -25,10 +25,14 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_VECTOR3']._serialized_end=74
   _globals['_CAMERACONTROLCOMMAND']._serialized_start=76
   _globals['_CAMERACONTROLCOMMAND']._serialized_end=150
-  _globals['_SETTINGSCOMMAND']._serialized_start=152
-  _globals['_SETTINGSCOMMAND']._serialized_end=192
-  _globals['_FRANKACOMMAND']._serialized_start=194
-  _globals['_FRANKACOMMAND']._serialized_end=262
-  _globals['_SERVERCONTROLMESSAGE']._serialized_start=265
-  _globals['_SERVERCONTROLMESSAGE']._serialized_end=443
+  _globals['_STREAMOUTPUT']._serialized_start=153
+  _globals['_STREAMOUTPUT']._serialized_end=319
+  _globals['_SETTINGSCOMMAND']._serialized_start=322
+  _globals['_SETTINGSCOMMAND']._serialized_end=456
+  _globals['_FRANKACOMMAND']._serialized_start=458
+  _globals['_FRANKACOMMAND']._serialized_end=526
+  _globals['_COMMANDTRACE']._serialized_start=528
+  _globals['_COMMANDTRACE']._serialized_end=599
+  _globals['_SERVERCONTROLMESSAGE']._serialized_start=602
+  _globals['_SERVERCONTROLMESSAGE']._serialized_end=810
 # @@protoc_insertion_point(module_scope)
@@ -22,7 +22,8 @@ from isaacsim.storage.native import get_assets_root_path
 from isaacsim.util.debug_draw import _debug_draw
 from pxr import Gf, Sdf, Tf, Usd, UsdGeom, UsdPhysics, UsdShade
 
-from . import EXT_NAME, ZMQAnnotator
+from . import EXT_NAME, MULTIPLEXED_HWM, ZMQAnnotator
+from .core.image_output import PIXEL_FORMAT_DEFAULT, ImageOutput
 from .mission import Mission
 
 # The omni.__proto__ namespace is created by this extention
@@ -63,6 +64,17 @@ class FrankaVisionMission(Mission):
         self.camera_annotators = []
 
         self.use_ogn_nodes = True  # True > use OGN C++ node, False > use Python
+        self.multipart = True  # True > send images as zero-copy multipart frames, False > embed in protobuf
+        self.packed_bbox = True  # True > send bounding boxes as one packed buffer, False > one message per box
+        self.multiplexed = False  # True > stream all cameras over one connection with camera ids, False > one port per camera
+        self.publish = False  # True > publish cameras as topics for several consumers (server StreamProxy), False > push to one server
+        self.keyframe_interval = 0  # N > labels and camera metadata sent on change and every N frames, 0 > every frame
+        self.crop = None  # (x, y, width, height) > stream a region of interest, None > the full image (server can override)
+        self.downscale = 1  # N > stream every Nth pixel of every Nth row, 1 > full resolution (server can override)
+        self.color_format = PIXEL_FORMAT_DEFAULT  # PIXEL_FORMAT_RGB8 > drop the alpha channel, DEFAULT > RGBA
+        self.depth_format = PIXEL_FORMAT_DEFAULT  # PIXEL_FORMAT_DEPTH_UINT16_MM > uint16 millimeters, DEFAULT > float32
+        self.send_queue_size = 2  # N > messages waiting to be sent per camera before drops (OGN nodes)
+        self.drop_oldest = True  # True > a full send queue drops its oldest message, False > drops the new one
 
         # Target position randomization
         self.last_trigger_time = 0
@@ -103,14 +115,33 @@ class FrankaVisionMission(Mission):
             use_ogn_nodes=self.use_ogn_nodes,
             server_ip=self.server_ip,
             port=self.ports["camera_annotator"],
+            multipart=self.multipart,
+            packed_bbox=self.packed_bbox,
+            camera_id="camera_annotator" if self.multiplexed else "",
+            topic="camera_annotator" if self.publish else "",
+            keyframe_interval=self.keyframe_interval,
+            crop=self.crop,
+            downscale=self.downscale,
+            color_format=self.color_format,
+            depth_format=self.depth_format,
+            send_queue_size=self.send_queue_size,
+            drop_oldest=self.drop_oldest,
         )
         self.camera_annotators.append(self.camera_annotator)
 
         # If not using OGN nodes, set up Python-based streaming
         if not self.use_ogn_nodes:
             print(f"[{EXT_NAME}] Using Python-based streaming")
-            self.camera_annot_sock_pub = self.zmq_client.get_push_socket(self.ports["camera_annotator"])
+            if self.publish:
+                self.camera_annot_sock_pub = self.zmq_client.get_pub_socket(
+                    self.ports["camera_annotator"], hwm=MULTIPLEXED_HWM
+                )
+            else:
+                self.camera_annot_sock_pub = self.zmq_client.get_push_socket(
+                    self.ports["camera_annotator"], hwm=MULTIPLEXED_HWM if self.multiplexed else 1
+                )
             self.camera_annotator.sock = self.camera_annot_sock_pub
+            self.camera_annotator.endpoint_stats = self.zmq_client.get_endpoint_stats(self.ports["camera_annotator"])
             self.zmq_client.add_physx_step_callback(
                 "camera_annotator", 1 / self.camera_hz, self.camera_annotator.stream
             )
@@ -143,6 +174,10 @@ class FrankaVisionMission(Mission):
 
         await self.world.stop_async()
         self.receive_commands = False
+        for annotator in self.camera_annotators:
+            print(f"[{EXT_NAME}] [Port: {annotator.port}] Endpoint stats: {annotator.get_endpoint_stats()}")
+            if annotator.use_ogn_nodes:
+                print(f"[{EXT_NAME}] [Port: {annotator.port}] Send stats: {annotator.get_send_stats()}")
         self.zmq_client.remove_physx_callbacks()
         # must wait for all callbacks to finish before disconnecting from the server
         await asyncio.sleep(0.5)
@@ -206,6 +241,14 @@ class FrankaVisionMission(Mission):
         """
         if proto_msg.HasField("settings_command"):
             self.zmq_client.adaptive_rate = proto_msg.settings_command.adaptive_rate
+            for annotator in self.camera_annotators:
+                annotator.set_codecs(
+                    proto_msg.settings_command.color_codec,
+                    proto_msg.settings_command.depth_codec,
+                )
+                annotator.set_annotators(proto_msg.settings_command.annotators)
+                outputs = proto_msg.settings_command.outputs
+                annotator.set_output(ImageOutput.requested(outputs, annotator.stream_name))
 
     def franka_sub_loop(self, proto_msg: server_control_message_pb2.ServerControlMessage) -> None:
         """Handle Franka robot commands received via ZMQ.
@@ -235,6 +278,11 @@ class FrankaVisionMission(Mission):
                     target_end_effector_orientation=rot_gt,
                 )
                 self.franka_articulation_controller.apply_action(actions)
+                if proto_msg.HasField("trace"):
+                    # Echo the command back to the server in the next frames, for latency tracing
+                    apply_time = time.monotonic()
+                    for annotator in self.camera_annotators:
+                        annotator.set_command_trace(proto_msg.trace.command_id, proto_msg.trace.send_time, apply_time)
                 if proto_msg.franka_command.show_marker:
                     self.draw.draw_points([new_effector_pos], [(0, 0, 1, 1)], [10])
             except Exception as e:
@@ -340,7 +388,9 @@ class FrankaMultiVisionMission(FrankaVisionMission):
         """
         super().start_mission()
 
-        self.ports["gripper_annotator"] = 5591
+        # In multiplexed and publish modes the gripper camera shares the connection of the main camera
+        shared_port = self.multiplexed or self.publish
+        self.ports["gripper_annotator"] = self.ports["camera_annotator"] if shared_port else 5591
 
         self.gripper_annotator = ZMQAnnotator(
             self.gripper_camera_prim_path,
@@ -348,14 +398,30 @@ class FrankaMultiVisionMission(FrankaVisionMission):
             use_ogn_nodes=self.use_ogn_nodes,
             server_ip=self.server_ip,
             port=self.ports["gripper_annotator"],
+            multipart=self.multipart,
+            packed_bbox=self.packed_bbox,
+            camera_id="gripper_annotator" if self.multiplexed else "",
+            topic="gripper_annotator" if self.publish else "",
+            keyframe_interval=self.keyframe_interval,
+            crop=self.crop,
+            downscale=self.downscale,
+            color_format=self.color_format,
+            depth_format=self.depth_format,
+            send_queue_size=self.send_queue_size,
+            drop_oldest=self.drop_oldest,
         )
         self.camera_annotators.append(self.gripper_annotator)
 
         # If not using OGN nodes, set up Python-based streaming
         if not self.use_ogn_nodes:
             print(f"[{EXT_NAME}] Using Python-based streaming")
-            self.gripper_annot_sock_pub = self.zmq_client.get_push_socket(self.ports["gripper_annotator"])
+            # Pooled, in multiplexed and publish modes this is the socket of the main camera
+            if self.publish:
+                self.gripper_annot_sock_pub = self.zmq_client.get_pub_socket(self.ports["gripper_annotator"])
+            else:
+                self.gripper_annot_sock_pub = self.zmq_client.get_push_socket(self.ports["gripper_annotator"])
             self.gripper_annotator.sock = self.gripper_annot_sock_pub
+            self.gripper_annotator.endpoint_stats = self.zmq_client.get_endpoint_stats(self.ports["gripper_annotator"])
             self.zmq_client.add_physx_step_callback(
                 "gripper_annotator", 1 / self.camera_hz, self.gripper_annotator.stream
             )
@@ -4,6 +4,7 @@
 #define CARB_EXPORTS
 
 #include <carb/PluginUtils.h>
+#include <carb/settings/ISettings.h>
 
 #include <omni/ext/IExt.h>
 #include <omni/graph/core/IGraphRegistry.h>
@@ -18,7 +19,8 @@ const struct carb::PluginImplDesc pluginImplDesc = { "isaacsim.zmq.bridge.plugin
 // These interface dependencies are required by all OmniGraph node types
 CARB_PLUGIN_IMPL_DEPS(omni::graph::core::IGraphRegistry,
                       omni::fabric::IPath,
-                      omni::fabric::IToken)
+                      omni::fabric::IToken,
+                      carb::settings::ISettings)
 
 // This macro sets up the information required to register your node type definitions with OmniGraph
 DECLARE_OGN_NODES()
@@ -0,0 +1,353 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <algorithm>
+#include <condition_variable>
+#include <cstdint>
+#include <cstring>
+#include <deque>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include <cuda/include/cuda_runtime_api.h>
+
+#include <carb/logging/Log.h>
+
+namespace isaacsim {
+namespace zmq {
+namespace bridge {
+
+// Copies of the annotator buffers to the host. The copies of a frame are enqueued from the graph evaluation,
+// recorded in one of the frame slots, and waited for on the send thread. The annotator buffers can be
+// rewritten by the next render as soon as the graph evaluation returns, so record() only returns once the
+// source buffers have been read, the copies to the host can still be in flight
+class FrameCopier {
+public:
+    virtual ~FrameCopier() = default;
+
+    // Enqueues a copy for the frame of the slot of rows rows of rowBytes bytes from src to dst,
+    // returns false on error
+    virtual bool copy(size_t slot, void* dst, size_t dstPitch, const void* src, size_t srcPitch, size_t rowBytes,
+                      size_t rows) = 0;
+
+    // Marks the end of the copies enqueued for the frame of the slot and blocks until their sources are read,
+    // returns false on error
+    virtual bool record(size_t slot) = 0;
+
+    // Drops the copies enqueued for the frame of the slot, blocks until none of them is in flight anymore
+    virtual void discard(size_t slot) = 0;
+
+    // Blocks until the copies of the frame of the slot are complete, returns false on error
+    virtual bool wait(size_t slot) = 0;
+};
+
+// Asynchronous device to host copies on a CUDA stream, with an event per frame slot.
+//
+// The annotator buffers are first copied device to device into staging buffers owned by the copier, one per
+// copy of each slot, and record() waits for these short copies only. The device to host copies then run from
+// the staging buffers while the graph goes on and the next frame is rendered. The host buffers must be pinned
+// for these copies to be asynchronous, pageable buffers are copied before record() returns
+class CudaFrameCopier : public FrameCopier {
+    // A device to host copy waiting for the device to device copies of its frame
+    struct PendingCopy {
+        void* dst;
+        size_t dstPitch;
+        const void* staging;
+        size_t rowBytes;
+        size_t rows;
+    };
+
+    struct StagingBuffer {
+        void* data{ nullptr };
+        size_t capacity{ 0 };
+    };
+
+    cudaStream_t m_stream{ nullptr };
+    std::vector<cudaEvent_t> m_events;
+    cudaEvent_t m_sourcesRead{ nullptr };
+    std::vector<std::vector<StagingBuffer>> m_staging;
+    std::vector<std::vector<PendingCopy>> m_pending;
+    bool m_created{ false };
+
+public:
+    explicit CudaFrameCopier(size_t slots) : m_events(slots, nullptr), m_staging(slots), m_pending(slots) {
+    }
+
+    ~CudaFrameCopier() override {
+        if (!m_created) {
+            return;
+        }
+        // The send thread is stopped, no copy is in flight anymore
+        for (std::vector<StagingBuffer>& buffers : m_staging) {
+            for (StagingBuffer& buffer : buffers) {
+                cudaFree(buffer.data);
+            }
+        }
+        for (cudaEvent_t event : m_events) {
+            cudaEventDestroy(event);
+        }
+        cudaEventDestroy(m_sourcesRead);
+        cudaError_t err = cudaStreamDestroy(m_stream);
+        if (err != cudaSuccess) {
+            CARB_LOG_ERROR("Error destroying CUDA stream: %s", cudaGetErrorString(err));
+        }
+    }
+
+    bool copy(size_t slot, void* dst, size_t dstPitch, const void* src, size_t srcPitch, size_t rowBytes,
+              size_t rows) override {
+        if (!create()) {
+            return false;
+        }
+        // The slot is not in flight, the copies from its staging buffers of the previous frame are complete
+        std::vector<PendingCopy>& pending = m_pending[slot];
+        std::vector<StagingBuffer>& buffers = m_staging[slot];
+        if (buffers.size() <= pending.size()) {
+            buffers.resize(pending.size() + 1);
+        }
+        StagingBuffer& staging = buffers[pending.size()];
+        size_t size = rowBytes * rows;
+        if (staging.capacity < size) {
+            cudaFree(staging.data);
+            staging.data = nullptr;
+            staging.capacity = 0;
+            if (!check(cudaMalloc(&staging.data, size), "staging allocation")) {
+                return false;
+            }
+            staging.capacity = size;
+        }
+        cudaError_t err = rows == 1 ? cudaMemcpyAsync(staging.data, src, rowBytes, cudaMemcpyDeviceToDevice, m_stream)
+                                    : cudaMemcpy2DAsync(staging.data, rowBytes, src, srcPitch, rowBytes, rows,
+                                                        cudaMemcpyDeviceToDevice, m_stream);
+        if (!check(err, "staging copy")) {
+            return false;
+        }
+        pending.push_back({ dst, dstPitch, staging.data, rowBytes, rows });
+        return true;
+    }
+
+    bool record(size_t slot) override {
+        if (!create()) {
+            m_pending[slot].clear();
+            return false;
+        }
+        bool recorded = check(cudaEventRecord(m_sourcesRead, m_stream), "event record");
+        for (const PendingCopy& copy : m_pending[slot]) {
+            if (!recorded) {
+                break;
+            }
+            cudaError_t err =
+                copy.rows == 1
+                    ? cudaMemcpyAsync(copy.dst, copy.staging, copy.rowBytes, cudaMemcpyDeviceToHost, m_stream)
+                    : cudaMemcpy2DAsync(copy.dst, copy.dstPitch, copy.staging, copy.rowBytes, copy.rowBytes,
+                                        copy.rows, cudaMemcpyDeviceToHost, m_stream);
+            recorded = check(err, "copy");
+        }
+        recorded = recorded && check(cudaEventRecord(m_events[slot], m_stream), "event record") &&
+                   check(cudaEventSynchronize(m_sourcesRead), "event synchronize");
+        if (!recorded) {
+            // The caller releases the host buffers of the frame
+            discard(slot);
+            return false;
+        }
+        m_pending[slot].clear();
+        return true;
+    }
+
+    void discard(size_t slot) override {
+        m_pending[slot].clear();
+        if (m_created) {
+            check(cudaStreamSynchronize(m_stream), "stream synchronize");
+        }
+    }
+
+    bool wait(size_t slot) override {
+        return check(cudaEventSynchronize(m_events[slot]), "event synchronize");
+    }
+
+private:
+    // Created on first use, on the thread of the graph evaluation
+    bool create() {
+        if (m_created) {
+            return true;
+        }
+        if (!check(cudaStreamCreate(&m_stream), "stream creation")) {
+            return false;
+        }
+        // Only used to synchronize, without timing they are lighter to record and wait for
+        if (!check(cudaEventCreateWithFlags(&m_sourcesRead, cudaEventDisableTiming), "event creation")) {
+            cudaStreamDestroy(m_stream);
+            return false;
+        }
+        for (size_t i = 0; i < m_events.size(); ++i) {
+            if (!check(cudaEventCreateWithFlags(&m_events[i], cudaEventDisableTiming), "event creation")) {
+                for (size_t j = 0; j < i; ++j) {
+                    cudaEventDestroy(m_events[j]);
+                }
+                cudaEventDestroy(m_sourcesRead);
+                cudaStreamDestroy(m_stream);
+                return false;
+            }
+        }
+        m_created = true;
+        return true;
+    }
+
+    static bool check(cudaError_t err, const char* operation) {
+        if (err != cudaSuccess) {
+            CARB_LOG_ERROR("CUDA %s failed: %s", operation, cudaGetErrorString(err));
+            return false;
+        }
+        return true;
+    }
+};
+
+// Synchronous host copies with memcpy, a stand-in for CudaFrameCopier when the buffers are in host memory,
+// or to exercise the send path without a GPU
+class HostFrameCopier : public FrameCopier {
+public:
+    bool copy(size_t /*slot*/, void* dst, size_t dstPitch, const void* src, size_t srcPitch, size_t rowBytes,
+              size_t rows) override {
+        uint8_t* dst_row = static_cast<uint8_t*>(dst);
+        const uint8_t* src_row = static_cast<const uint8_t*>(src);
+        for (size_t row = 0; row < rows; ++row) {
+            std::memcpy(dst_row + row * dstPitch, src_row + row * srcPitch, rowBytes);
+        }
+        return true;
+    }
+
+    bool record(size_t /*slot*/) override {
+        return true;
+    }
+
+    void discard(size_t /*slot*/) override {
+    }
+
+    bool wait(size_t /*slot*/) override {
+        return true;
+    }
+};
+
+// Hands the frames over from the graph evaluation to a background send thread, so the graph does not
+// wait for the copies to the host, the host conversions, the serialization and the ZMQ sends.
+//
+// A frame is prepared in one of a fixed number of slots (double buffered by default): acquire() returns
+// a free slot, the caller fills it and enqueues its copies, then submit() records the copies and queues it.
+// The send thread waits for the copies of the slot, calls the send function with it and frees it. When all
+// the slots are in flight the send thread is behind, acquire() fails and the caller drops the frame rather
+// than stalling the graph. The slot data itself is owned by the caller, indexed by slot.
+class AsyncFrameSender {
+public:
+    // Called on the send thread with a slot whose copies are complete, copied is false if they failed
+    using SendFunction = std::function<void(size_t slot, bool copied)>;
+
+    static constexpr size_t kDefaultSlots = 2;
+
+    AsyncFrameSender(std::unique_ptr<FrameCopier> copier, SendFunction send, size_t slots = kDefaultSlots)
+        : m_copier(std::move(copier)), m_send(std::move(send)), m_busy(slots, false) {
+        m_thread = std::thread(&AsyncFrameSender::run, this);
+    }
+
+    // Sends the frames in flight, then stops the send thread
+    ~AsyncFrameSender() {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_stop = true;
+        }
+        m_queued.notify_one();
+        m_thread.join();
+    }
+
+    AsyncFrameSender(const AsyncFrameSender&) = delete;
+    AsyncFrameSender& operator=(const AsyncFrameSender&) = delete;
+
+    size_t slots() const {
+        return m_busy.size();
+    }
+
+    FrameCopier& copier() {
+        return *m_copier;
+    }
+
+    // Returns a free slot in slot, false if all the slots are in flight
+    bool acquire(size_t& slot) {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        for (size_t i = 0; i < m_busy.size(); ++i) {
+            if (!m_busy[i]) {
+                m_busy[i] = true;
+                slot = i;
+                return true;
+            }
+        }
+        return false;
+    }
+
+    // Gives back an acquired slot without sending it
+    void cancel(size_t slot) {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_busy[slot] = false;
+        }
+        m_freed.notify_all();
+    }
+
+    // Records the copies enqueued for the slot and queues it to the send thread, returns once their sources
+    // are read. If the copies cannot be recorded the slot is freed and false is returned
+    bool submit(size_t slot) {
+        if (!m_copier->record(slot)) {
+            cancel(slot);
+            return false;
+        }
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_queue.push_back(slot);
+        }
+        m_queued.notify_one();
+        return true;
+    }
+
+    // Blocks until the frames in flight are sent
+    void flush() {
+        std::unique_lock<std::mutex> lock(m_mutex);
+        m_freed.wait(lock, [this]() { return std::find(m_busy.begin(), m_busy.end(), true) == m_busy.end(); });
+    }
+
+private:
+    std::unique_ptr<FrameCopier> m_copier;
+    SendFunction m_send;
+    std::mutex m_mutex;
+    std::condition_variable m_queued;
+    std::condition_variable m_freed;
+    std::deque<size_t> m_queue;
+    std::vector<bool> m_busy;
+    bool m_stop{ false };
+    std::thread m_thread;
+
+    void run() {
+        while (true) {
+            size_t slot;
+            {
+                std::unique_lock<std::mutex> lock(m_mutex);
+                m_queued.wait(lock, [this]() { return m_stop || !m_queue.empty(); });
+                if (m_queue.empty()) {
+                    return;
+                }
+                slot = m_queue.front();
+                m_queue.pop_front();
+            }
+            // The slots are sent in submission order, so waiting for the event of the oldest one first
+            // does not delay the others
+            bool copied = m_copier->wait(slot);
+            m_send(slot, copied);
+            cancel(slot);
+        }
+    }
+};
+
+} // bridge
+} // zmq
+} // isaacsim
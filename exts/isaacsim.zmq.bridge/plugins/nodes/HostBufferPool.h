@@ -0,0 +1,132 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <algorithm>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+#include <cuda/include/cuda_runtime_api.h>
+
+#include <carb/logging/Log.h>
+
+namespace isaacsim {
+namespace zmq {
+namespace bridge {
+
+// Pool of host buffers reused across frames for the device copies, the converted images and the serialized
+// headers, instead of allocating them every frame. Buffers are pinned (page-locked) so device copies run at
+// full bandwidth, or pageable if pinned memory cannot be allocated.
+//
+// In multipart mode a buffer is handed over to ZMQ without copying (zero-copy), ZMQ returns it to the pool
+// from its IO thread once sent (or dropped) with zmqFree. In-flight buffers keep the pool alive, so the pool
+// outlives the node if a shared connection still holds one of its messages.
+class HostBufferPool : public std::enable_shared_from_this<HostBufferPool> {
+public:
+    struct Buffer {
+        uint8_t* data{ nullptr };
+        size_t capacity{ 0 };
+        bool pinned{ false };
+        // Set while the buffer is in use, so the pool lives as long as its buffers
+        std::shared_ptr<HostBufferPool> pool;
+    };
+
+    // Returns a buffer to the pool when the handle goes out of scope
+    struct Releaser {
+        void operator()(Buffer* buffer) const {
+            HostBufferPool::zmqFree(buffer ? buffer->data : nullptr, buffer);
+        }
+    };
+    using Handle = std::unique_ptr<Buffer, Releaser>;
+
+    // Free buffers kept for reuse, enough for the color, depth, converted images and header of the frames
+    // in flight on the send thread and of the previous frame still queued in ZMQ
+    static constexpr size_t kMaxFreeBuffers = 16;
+
+    ~HostBufferPool() {
+        for (Buffer* buffer : m_free) {
+            destroy(buffer);
+        }
+    }
+
+    // Returns a buffer of at least size bytes, the smallest free one which fits or a new one
+    Handle acquire(size_t size) {
+        Buffer* buffer = nullptr;
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            auto best = m_free.end();
+            for (auto it = m_free.begin(); it != m_free.end(); ++it) {
+                if ((*it)->capacity >= size && (best == m_free.end() || (*it)->capacity < (*best)->capacity)) {
+                    best = it;
+                }
+            }
+            if (best != m_free.end()) {
+                buffer = *best;
+                m_free.erase(best);
+            }
+        }
+        if (!buffer) {
+            buffer = create(size);
+        }
+        buffer->pool = shared_from_this();
+        return Handle(buffer);
+    }
+
+    // ZMQ free function of the zero-copy messages built on pooled buffers, hint is the Buffer
+    static void zmqFree(void* /*data*/, void* hint) {
+        Buffer* buffer = static_cast<Buffer*>(hint);
+        if (!buffer) {
+            return;
+        }
+        // Keeps the pool alive until the buffer is back in it
+        std::shared_ptr<HostBufferPool> pool = std::move(buffer->pool);
+        pool->release(buffer);
+    }
+
+private:
+    std::mutex m_mutex;
+    std::vector<Buffer*> m_free;
+
+    void release(Buffer* buffer) {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_free.push_back(buffer);
+        if (m_free.size() > kMaxFreeBuffers) {
+            // The resolution or region changed, drop the smallest buffer
+            auto smallest = std::min_element(m_free.begin(), m_free.end(),
+                                             [](const Buffer* a, const Buffer* b) { return a->capacity < b->capacity; });
+            destroy(*smallest);
+            m_free.erase(smallest);
+        }
+    }
+
+    static Buffer* create(size_t size) {
+        Buffer* buffer = new Buffer();
+        buffer->capacity = std::max<size_t>(size, 1);
+        void* data = nullptr;
+        if (cudaMallocHost(&data, buffer->capacity) == cudaSuccess) {
+            buffer->pinned = true;
+        } else {
+            cudaGetLastError(); // clear the error, fall back to pageable memory
+            CARB_LOG_WARN("Failed to allocate %zu bytes of pinned host memory, using pageable memory", size);
+            data = new uint8_t[buffer->capacity];
+        }
+        buffer->data = static_cast<uint8_t*>(data);
+        return buffer;
+    }
+
+    static void destroy(Buffer* buffer) {
+        if (buffer->pinned) {
+            cudaFreeHost(buffer->data);
+        } else {
+            delete[] buffer->data;
+        }
+        delete buffer;
+    }
+};
+
+} // bridge
+} // zmq
+} // isaacsim
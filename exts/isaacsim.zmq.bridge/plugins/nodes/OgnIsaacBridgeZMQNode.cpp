@@ -1,16 +1,22 @@
 // SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 // SPDX-License-Identifier: MIT
 
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cmath>
 #include <cstring>
 #include <iostream>
 #include <memory>
 #include <mutex>
+#include <random>
 #include <string>
 #include <vector>
 
 #include <cuda/include/cuda_runtime_api.h>
 #include <zmq.hpp>
 
+#include <pxr/base/gf/matrix3d.h>
 #include <pxr/base/gf/matrix4d.h>
 #include <pxr/base/gf/vec3d.h>
 
@@ -18,28 +24,29 @@
 
 #include <OgnIsaacBridgeZMQNodeDatabase.h>
 #include "client_stream_message.pb.h"
+#include "AsyncFrameSender.h"
+#include "HostBufferPool.h"
+#include "ZMQConnectionPool.h"
 
 
 using omni::graph::core::Type;
 using omni::graph::core::BaseDataType;
 
-#define CUDA_CHECK(call)                                                   \
-do {                                                                       \
-    cudaError_t err = call;                                                \
-    if (err != cudaSuccess) {                                              \
-        fprintf(stderr, "CUDA error at %s %d: %s\n", __FILE__, __LINE__,   \
-                cudaGetErrorString(err));                                  \
-        /* Instead of exiting, log the error and continue */               \
-        return true;                                                       \
-    }                                                                      \
-} while (0)
-
-namespace zmq_lib = zmq; // assign namespace to zmq library to avoid conflicts with our library
-
 namespace isaacsim {
 namespace zmq {
 namespace bridge {
 
+// Monotonic time in seconds, same clock as Python's time.monotonic() (CLOCK_MONOTONIC on Linux)
+// so FrameTrace timestamps can be compared with the server's
+static double monotonicSeconds() {
+    return std::chrono::duration<double>(std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+// Whether an OGN string input holds the same value as a string, without converting it
+static bool sameString(const omni::graph::core::ogn::const_string& value, const std::string& current) {
+    return value.size() == current.size() && std::equal(value.data(), value.data() + value.size(), current.data());
+}
+
 struct InputDataBBox2d {
     uint32_t semanticId;
     int xMin;
@@ -48,66 +55,329 @@ struct InputDataBBox2d {
     int yMax;
     float occlusionRatio;
 };
+// BBox2D.packed_data forwards the annotator buffer as is, so the layout must stay packed
+static_assert(sizeof(InputDataBBox2d) == 24, "InputDataBBox2d must match the BBox2D.packed_data layout");
+
+// High water mark of multiplexed connections: one message in flight per camera for rigs of up to 16 cameras
+static constexpr int kMultiplexedHwm = 16;
+
+// Bytes per pixel of the annotator images (RGBA8 color, float32 depth)
+static constexpr size_t kAnnotatorPixelSize = 4;
+// uint16 depth steps per meter of PIXEL_FORMAT_DEPTH_UINT16_MM, DEPTH_QUANTIZATION of core/image_codecs.py
+static constexpr float kDepthQuantization = 1000.0f;
+
+// Region of the render product streamed with the crop and downscale inputs, computed like
+// ImageOutput.region() of the examples extension (core/image_output.py)
+struct StreamRegion {
+    bool resamples{ false };
+    uint32_t fullWidth{ 0 };
+    uint32_t x{ 0 };
+    uint32_t y{ 0 };
+    uint32_t width{ 0 };
+    uint32_t height{ 0 };
+    uint32_t downscale{ 1 };
+    uint32_t imageWidth{ 0 };
+    uint32_t imageHeight{ 0 };
+};
+
+// Move a bounding box to the streamed images, clamped to their bounds
+static InputDataBBox2d regionBBox(const InputDataBBox2d& bbox, const StreamRegion& region) {
+    auto move = [&region](int value, uint32_t offset, uint32_t limit) {
+        return std::clamp((value - static_cast<int>(offset)) / static_cast<int>(region.downscale), 0,
+                          static_cast<int>(limit) - 1);
+    };
+    InputDataBBox2d moved = bbox;
+    moved.xMin = move(bbox.xMin, region.x, region.imageWidth);
+    moved.yMin = move(bbox.yMin, region.y, region.imageHeight);
+    moved.xMax = move(bbox.xMax, region.x, region.imageWidth);
+    moved.yMax = move(bbox.yMax, region.y, region.imageHeight);
+    return moved;
+}
+
+// Intrinsics of the streamed images, pixel u of the render product is pixel (u - x) / downscale of the region
+static pxr::GfMatrix3d regionIntrinsics(const pxr::GfMatrix3d& intrinsics, const StreamRegion& region) {
+    pxr::GfMatrix3d moved = intrinsics;
+    if (region.resamples) {
+        for (int col = 0; col < 3; ++col) {
+            moved[0][col] = (intrinsics[0][col] - region.x * intrinsics[2][col]) / region.downscale;
+            moved[1][col] = (intrinsics[1][col] - region.y * intrinsics[2][col]) / region.downscale;
+        }
+    }
+    return moved;
+}
+
+// Same as quantize_depth() of core/image_codecs.py: non finite and non positive depth map to 0 (invalid),
+// valid depth is clipped to at least one step and saturates at the uint16 range
+static uint16_t quantizeDepth(float depth) {
+    float scaled = depth * kDepthQuantization;
+    if (!std::isfinite(scaled) || scaled <= 0.0f) {
+        return 0;
+    }
+    return static_cast<uint16_t>(std::lrint(std::min(std::max(scaled, 1.0f), 65535.0f)));
+}
+
+// Keep every downscale-th pixel of the rows copied from the device, converted to the streamed pixel format
+template <typename In, typename Out, typename Convert>
+static void resamplePixels(const In* src, size_t srcRowPixels, uint32_t rows, uint32_t cols, uint32_t downscale,
+                           Out* dst, Convert convert) {
+    for (uint32_t row = 0; row < rows; ++row) {
+        const In* src_row = src + row * srcRowPixels;
+        Out* dst_row = dst + static_cast<size_t>(row) * cols;
+        for (uint32_t col = 0; col < cols; ++col) {
+            dst_row[col] = convert(src_row[static_cast<size_t>(col) * downscale]);
+        }
+    }
+}
+
+struct Rgba8 {
+    uint8_t c[4];
+};
+struct Rgb8 {
+    uint8_t c[3];
+};
+
+// A frame filled by compute in a slot of the AsyncFrameSender, with the device copies of its images enqueued,
+// and sent by the send thread once they are complete
+struct PendingFrame {
+    // Reused by the frames of the slot, keeps the capacity of its fields when cleared
+    ClientStreamMessage message;
+    HostBufferPool::Handle color;
+    HostBufferPool::Handle depth;
+    size_t copySizeColor{ 0 };
+    size_t copySizeDepth{ 0 };
+    StreamRegion region;
+    bool colorRgb{ false };
+    bool depthMm{ false };
+    bool multipart{ false };
+    std::shared_ptr<ZMQConnection> connection;
+    std::string topicPrefix;
+    std::string cameraId;
+    uint32_t sendQueueSize{ 0 };
+    bool dropOldest{ true };
+};
 
 class OgnIsaacBridgeZMQNode {
-    std::unique_ptr<zmq_lib::context_t> m_zmqContext;
-    std::unique_ptr<zmq_lib::socket_t> m_zmqSocket;
+    std::shared_ptr<ZMQConnection> m_connection;
     uint32_t m_port;
     std::string m_ip;
+    std::string m_cameraId;
+    std::string m_topic;
+    std::string m_topicPrefix;
     std::mutex m_mutex;
-    cudaStream_t m_cudaStream;
-    bool m_cudaStreamNotCreated{ true };
-    uint32_t m_zmqFailCount{ 0 };
+    uint64_t m_frameId{ 0 };
+
+    // Frames in flight: compute fills a free slot and enqueues the device copies of its images, then returns
+    // without waiting for them. The send thread converts and serializes the frame once copied, and queues it
+    // to the sender thread of the connection.
+    // The host buffers of the images and the serialized header come from a pool instead of being allocated
+    // every frame
+    std::vector<PendingFrame> m_frames;
+    std::unique_ptr<AsyncFrameSender> m_sender;
+    std::shared_ptr<HostBufferPool> m_hostBuffers{ std::make_shared<HostBufferPool>() };
+    std::vector<InputDataBBox2d> m_regionBBoxes;
+
+    // Messages of this node queued, sent and dropped, shared with the messages in the connection queue.
+    // When the dropped count changes the next message carries the full metadata
+    std::shared_ptr<ZMQSendCounters> m_sendCounters{ std::make_shared<ZMQSendCounters>() };
+    uint64_t m_messagesDropped{ 0 };
+
+    // Delta metadata (keyframeInterval > 0): the label table, intrinsics and scale are sent in ClientStreamMessage.session
+    // and the pose in Camera.view_matrix_ros only on change and on keyframes, like the SessionEncoder of the
+    // examples extension (core/session.py), the server restores them with its SessionCache
+    uint64_t m_sessionId{ 0 };
+    uint32_t m_sessionVersion{ 1 };
+    uint32_t m_poseVersion{ 0 };
+    SessionState m_session;
+    std::vector<uint32_t> m_labelIds;
+    std::vector<omni::graph::core::NameToken> m_labelTokens;
+    pxr::GfMatrix4d m_viewMatrix{ 0.0 };
+    bool m_sessionSent{ false };
+    bool m_poseSent{ false };
+    bool m_keyframePending{ true };
+    uint32_t m_messagesSinceKeyframe{ 0 };
+
+    // Warned that the render product size is missing to crop or downscale
+    bool m_regionWarned{ false };
 
 public:
-    OgnIsaacBridgeZMQNode()
-        : m_zmqContext(std::make_unique<zmq_lib::context_t>(1)) {
+    OgnIsaacBridgeZMQNode() {
         CARB_LOG_INFO("OgnIsaacBridgeZMQNode::constructor\n");
+        // Random per node instance, the server does not reuse the cached state of a previous run
+        std::random_device seed;
+        std::mt19937_64 generator(seed());
+        m_sessionId = (generator() >> 1) + 1;
+
+        // Double buffered: one frame sent while the next one is copied
+        m_frames.resize(AsyncFrameSender::kDefaultSlots);
+        m_sender = std::make_unique<AsyncFrameSender>(
+            std::make_unique<CudaFrameCopier>(m_frames.size()),
+            [this](size_t slot, bool copied) { sendFrame(m_frames[slot], copied); }, m_frames.size());
     }
     ~OgnIsaacBridgeZMQNode() {
         CARB_LOG_INFO("OgnIsaacBridgeZMQNode::destructor\n");
-        if (m_zmqSocket) {
-            m_zmqSocket->close();
+        // Sends the frames in flight and joins the send thread before the frames are destroyed
+        m_sender.reset();
+        m_connection.reset();
+    }
+
+    static bool compute(OgnIsaacBridgeZMQNodeDatabase& db);
+
+    // Converts, serializes and sends a frame on the send thread once the copies of its images are complete
+    void sendFrame(PendingFrame& frame, bool copied);
+
+    // Whether the label source (semantic ids and label tokens of the annotator) changed since the last call,
+    // comparing the tokens avoids converting them to strings every frame
+    template <typename Ids, typename Labels>
+    bool labelsChanged(const Ids& ids, const Labels& labels) {
+        bool changed = ids.size() != m_labelIds.size();
+        for (size_t i = 0; !changed && i < ids.size(); ++i) {
+            changed = ids[i] != m_labelIds[i] || labels[i] != m_labelTokens[i];
         }
-        if (m_zmqContext) {
-            m_zmqContext->close();
+        if (changed) {
+            m_labelIds.clear();
+            m_labelTokens.clear();
+            for (size_t i = 0; i < ids.size(); ++i) {
+                m_labelIds.push_back(ids[i]);
+                m_labelTokens.push_back(labels[i]);
+            }
         }
+        return changed;
+    }
 
-        // Clean up CUDA stream if it was created
-        if (!m_cudaStreamNotCreated) {
-            cudaError_t err = cudaStreamDestroy(m_cudaStream);
-            if (err != cudaSuccess) {
-                // Just log the error instead of using CUDA_CHECK
-                CARB_LOG_ERROR("Error destroying CUDA stream in destructor: %s", cudaGetErrorString(err));
+    // Update the intrinsics and scale of the session state, and the pose
+    void updateCamera(const pxr::GfMatrix4d& viewMatrix, const pxr::GfMatrix3d& intrinsics, const pxr::GfVec3d& scale) {
+        bool changed = m_session.intrinsics_matrix_size() != 9 || m_session.camera_scale_size() != 3;
+        for (int i = 0; !changed && i < 9; ++i) {
+            changed = m_session.intrinsics_matrix(i) != intrinsics[i / 3][i % 3];
+        }
+        for (int i = 0; !changed && i < 3; ++i) {
+            changed = m_session.camera_scale(i) != scale[i];
+        }
+        if (changed) {
+            m_session.clear_intrinsics_matrix();
+            for (int row = 0; row < 3; ++row) {
+                for (int col = 0; col < 3; ++col) {
+                    m_session.add_intrinsics_matrix(intrinsics[row][col]);
+                }
             }
+            m_session.clear_camera_scale();
+            m_session.add_camera_scale(scale[0]);
+            m_session.add_camera_scale(scale[1]);
+            m_session.add_camera_scale(scale[2]);
+            newSessionVersion();
+        }
+
+        if (viewMatrix != m_viewMatrix) {
+            m_viewMatrix = viewMatrix;
+            m_poseVersion++;
+            m_poseSent = false;
         }
     }
 
-    static bool compute(OgnIsaacBridgeZMQNodeDatabase& db);
+    void newSessionVersion() {
+        m_sessionVersion++;
+        m_sessionSent = false;
+    }
+
+    // Set the delta metadata fields of the message: the session state when it changed or on keyframes,
+    // and the pose (if the camera part is sent) when it changed or on keyframes
+    void fillSession(ClientStreamMessage& message, uint32_t keyframeInterval, bool camera) {
+        m_messagesSinceKeyframe++;
+        bool keyframe = m_keyframePending || m_messagesSinceKeyframe >= keyframeInterval;
+        if (keyframe) {
+            m_keyframePending = false;
+            m_messagesSinceKeyframe = 0;
+        }
+
+        message.set_session_id(m_sessionId);
+        message.set_session_version(m_sessionVersion);
+        if (keyframe || !m_sessionSent) {
+            *message.mutable_session() = m_session;
+            message.mutable_session()->set_version(m_sessionVersion);
+            m_sessionSent = true;
+        }
 
-    bool initializeSocket(uint32_t port, const std::string& ip) {
+        if (camera) {
+            message.mutable_camera()->set_pose_version(m_poseVersion);
+            if (keyframe || !m_poseSent) {
+                for (int row = 0; row < 4; ++row) {
+                    for (int col = 0; col < 4; ++col) {
+                        message.mutable_camera()->add_view_matrix_ros(m_viewMatrix[row][col]);
+                    }
+                }
+                m_poseSent = true;
+            }
+        }
+    }
+
+    // Region of the render product to stream, the full render product unless cropped or downscaled
+    StreamRegion streamRegion(OgnIsaacBridgeZMQNodeDatabase& db) {
+        StreamRegion region;
+        uint32_t full_width = db.inputs.width();
+        uint32_t full_height = db.inputs.height();
+        uint32_t downscale = std::max(db.inputs.downscale(), 1u);
+        bool cropped = db.inputs.cropX() || db.inputs.cropY() || db.inputs.cropWidth() || db.inputs.cropHeight();
+        if (!cropped && downscale == 1) {
+            return region;
+        }
+        if (full_width == 0 || full_height == 0) {
+            if (!m_regionWarned) {
+                CARB_LOG_WARN("The width and height of the render product are required to crop or downscale, "
+                              "streaming full images");
+                m_regionWarned = true;
+            }
+            return region;
+        }
+        region.resamples = true;
+        region.fullWidth = full_width;
+        region.x = std::min(db.inputs.cropX(), full_width - 1);
+        region.y = std::min(db.inputs.cropY(), full_height - 1);
+        region.width = std::min(db.inputs.cropWidth() ? db.inputs.cropWidth() : full_width, full_width - region.x);
+        region.height = std::min(db.inputs.cropHeight() ? db.inputs.cropHeight() : full_height, full_height - region.y);
+        region.downscale = downscale;
+        region.imageWidth = (region.width + downscale - 1) / downscale;
+        region.imageHeight = (region.height + downscale - 1) / downscale;
+        return region;
+    }
+
+    // Takes the connection to the server from the process-wide pool. Nodes streaming to the same server port
+    // share it, with a high water mark of 1 message, or one per camera in multiplexed mode (non empty camera id).
+    // In PUB/SUB mode (non empty topic) the connection is a PUB socket, publishing to a server StreamProxy
+    bool initializeSocket(uint32_t port, const std::string& ip, const std::string& cameraId, const std::string& topic) {
         std::lock_guard<std::mutex> lock(m_mutex);
 
         m_port = port;
         m_ip = ip;
-        m_zmqFailCount = 0;
-
-        try {
-            m_zmqSocket = std::make_unique<zmq_lib::socket_t>(*m_zmqContext, zmq_lib::socket_type::push);
+        m_cameraId = cameraId;
+        m_topic = topic;
+        m_connection.reset();
 
-            int linger = 0;
-            m_zmqSocket->setsockopt(ZMQ_LINGER, &linger, sizeof(linger));
+        if (!m_cameraId.empty() && !m_topic.empty()) {
+            CARB_LOG_WARN("The multiplexed (cameraId) and PUB/SUB (topic) modes are exclusive, not streaming");
+            return false;
+        }
 
-            int hwm = 1;
-            m_zmqSocket->setsockopt(ZMQ_SNDHWM, &hwm, sizeof(hwm));
+        // Serialized ClientStreamMessage.topic field, prepended to every header so that it is
+        // both part of the protobuf message and the ZMQ subscription prefix of the topic
+        m_topicPrefix.clear();
+        if (!m_topic.empty()) {
+            ClientStreamMessage topicMessage;
+            topicMessage.set_topic(m_topic);
+            m_topicPrefix = topicMessage.SerializeAsString();
+        }
 
+        try {
             std::string address = "tcp://" + m_ip + ":" + std::to_string(m_port);
-            m_zmqSocket->connect(address);
-            CARB_LOG_INFO("Connected to %s\n", address.c_str());
+            if (!m_topic.empty()) {
+                m_connection = ZMQConnectionPool::instance().acquire(address, kMultiplexedHwm, ZMQ_PUB);
+            } else {
+                m_connection =
+                    ZMQConnectionPool::instance().acquire(address, m_cameraId.empty() ? 1 : kMultiplexedHwm, ZMQ_PUSH);
+            }
             return true;
         } catch (const std::exception& e) {
             CARB_LOG_WARN("Failed to create socket or connect to %s:%d: %s", m_ip.c_str(), m_port, e.what());
-            m_zmqSocket.reset();
+            m_connection.reset();
             return false;
         }
     }
@@ -115,57 +385,156 @@ public:
 
 
 bool OgnIsaacBridgeZMQNode::compute(OgnIsaacBridgeZMQNodeDatabase& db) {
-    // Static variable to track the last time an error was logged
-    // This persists between function calls to limit error message frequency
-    static double lastErrorLogTime = 0.0;
-
     // Get the internal state for this node
     auto& state = db.internalState<OgnIsaacBridgeZMQNode>();
 
     // Get the port and IP address from the inputs
     uint32_t port = db.inputs.port();
     const omni::graph::core::ogn::const_string& ip = db.inputs.ip();
-    std::string std_ip(ip.data(), ip.size());
-
-    // If the socket is not initialized, or the port or IP address has changed, initialize the socket
-    if (!state.m_zmqSocket || port != state.m_port || std_ip != state.m_ip) {
-        if (!state.initializeSocket(port, std_ip)) {
+    const omni::graph::core::ogn::const_string& camera_id = db.inputs.cameraId();
+    const omni::graph::core::ogn::const_string& topic = db.inputs.topic();
+
+    // If the socket is not initialized, or the port, IP address, camera id or topic has changed,
+    // initialize the socket
+    if (!state.m_connection || port != state.m_port || !sameString(ip, state.m_ip) ||
+        !sameString(camera_id, state.m_cameraId) || !sameString(topic, state.m_topic)) {
+        if (!state.initializeSocket(port, std::string(ip.data(), ip.size()), std::string(camera_id.data(), camera_id.size()),
+                                    std::string(topic.data(), topic.size()))) {
             return true;
         }
     }
 
-    // Create Protobuf message
-    ClientStreamMessage message;
+    // Annotator data is ready, start of the latency trace of this frame
+    double render_time = monotonicSeconds();
 
-    // Bounding boxes 2d
-    const InputDataBBox2d* bbox_data = reinterpret_cast<const InputDataBBox2d*>(db.inputs.dataBBox2d().data());
-    size_t num_boxes = db.inputs.dataBBox2d().size() / sizeof(InputDataBBox2d);
-    auto& bbox_ids = db.inputs.idsBBox2d();
-    auto& bbox_bbox_ids = db.inputs.bboxIdsBBox2d();
-    auto& bbox_labels = db.inputs.labelsBBox2d();
-
-    // Populate bbox2d data
-    for (size_t i = 0; i < num_boxes; ++i) {
-        const InputDataBBox2d& bbox = bbox_data[i];
-        BBox2DType* bbox_proto = message.mutable_bbox2d()->add_data();
-        bbox_proto->set_semanticid(bbox.semanticId);
-        bbox_proto->set_xmin(bbox.xMin);
-        bbox_proto->set_ymin(bbox.yMin);
-        bbox_proto->set_xmax(bbox.xMax);
-        bbox_proto->set_ymax(bbox.yMax);
-        bbox_proto->set_occlusionratio(bbox.occlusionRatio);
+    // A message was dropped since the last frame, it may have carried a metadata change, send the full metadata
+    ZMQSendCounters& counters = *state.m_sendCounters;
+    uint64_t messages_dropped = counters.messagesDropped.load();
+    if (messages_dropped != state.m_messagesDropped) {
+        state.m_messagesDropped = messages_dropped;
+        state.m_keyframePending = true;
     }
 
-    // Populate bboxIds
-    for (size_t i = 0; i < bbox_bbox_ids.size(); ++i) {
-        message.mutable_bbox2d()->mutable_info()->add_bboxids(bbox_bbox_ids[i]);
+    // Parts of the message requested by the server (StreamAnnotator bitmask, 0 for all),
+    // the annotators which are not requested are neither copied from the device nor sent
+    uint32_t annotators = db.inputs.annotators();
+    auto requested = [annotators](uint32_t annotator) { return annotators == 0 || (annotators & annotator) != 0; };
+    uint32_t keyframe_interval = db.inputs.keyframeInterval();
+
+    // Region of interest, downscaling and pixel formats of the images, applied before serialization like
+    // ImageOutput of the examples extension. Bounding boxes and intrinsics are moved to the streamed images
+    StreamRegion region = state.streamRegion(db);
+    bool color_rgb = db.inputs.colorFormat() == PIXEL_FORMAT_RGB8;
+    bool depth_mm = db.inputs.depthFormat() == PIXEL_FORMAT_DEPTH_UINT16_MM;
+
+    bool send_color = requested(STREAM_ANNOTATOR_COLOR);
+    size_t buffer_size_color = db.inputs.bufferSizeColor();
+    uint64_t raw_ptr_color = db.inputs.dataPtrColor();
+    bool send_depth = requested(STREAM_ANNOTATOR_DEPTH);
+    size_t buffer_size_depth = db.inputs.bufferSizeDepth();
+    uint64_t raw_ptr_depth = db.inputs.dataPtrDepth();
+
+    size_t full_size = static_cast<size_t>(db.inputs.width()) * db.inputs.height() * kAnnotatorPixelSize;
+    bool buffers_too_small = (send_color && buffer_size_color < full_size) || (send_depth && buffer_size_depth < full_size);
+    if (region.resamples && buffers_too_small) {
+        CARB_LOG_WARN("Annotator buffers are smaller than the width and height inputs, not streaming");
+        return true;
     }
 
-    // Populate idToLabels
-    for (size_t i = 0; i < bbox_ids.size(); ++i) {
-        int id = bbox_ids[i];
-        std::string label = db.tokenToString(bbox_labels[i]);
-        (*message.mutable_bbox2d()->mutable_info()->mutable_idtolabels())[std::to_string(id)] = label;
+    // Send counters of this node, and statistics of the endpoint summed over all the nodes sending to it
+    ZMQEndpointStats& stats = *state.m_connection->stats;
+    auto write_stats = [&db, &stats, &counters]() {
+        db.outputs.messagesQueued() = counters.messagesQueued.load();
+        db.outputs.messagesSent() = counters.messagesSent.load();
+        db.outputs.messagesDropped() = counters.messagesDropped.load();
+        db.outputs.endpointMessagesSent() = stats.messagesSent.load();
+        db.outputs.endpointMessagesDropped() = stats.messagesDropped.load();
+        db.outputs.endpointBytesSent() = stats.bytesSent.load();
+    };
+
+    // All the frame slots are in flight when the send thread does not keep up with the graph,
+    // drop this frame rather than waiting for them
+    size_t slot = 0;
+    if (!state.m_sender->acquire(slot)) {
+        counters.messagesDropped++;
+        stats.messagesDropped++;
+        write_stats();
+        return true;
+    }
+    PendingFrame& frame = state.m_frames[slot];
+
+    // Reuse the Protobuf message of the slot, cleared
+    ClientStreamMessage& message = frame.message;
+    message.Clear();
+    message.set_annotators(annotators);
+    message.set_color_format(color_rgb ? PIXEL_FORMAT_RGB8 : PIXEL_FORMAT_DEFAULT);
+    message.set_depth_format(depth_mm ? PIXEL_FORMAT_DEPTH_UINT16_MM : PIXEL_FORMAT_DEFAULT);
+    if (region.resamples) {
+        ImageRegion* image_region = message.mutable_region();
+        image_region->set_x(region.x);
+        image_region->set_y(region.y);
+        image_region->set_width(region.width);
+        image_region->set_height(region.height);
+        image_region->set_downscale(region.downscale);
+        image_region->set_image_width(region.imageWidth);
+        image_region->set_image_height(region.imageHeight);
+    }
+
+    if (requested(STREAM_ANNOTATOR_BBOX2D)) {
+        // Bounding boxes 2d
+        const InputDataBBox2d* bbox_data = reinterpret_cast<const InputDataBBox2d*>(db.inputs.dataBBox2d().data());
+        size_t num_boxes = db.inputs.dataBBox2d().size() / sizeof(InputDataBBox2d);
+        auto& bbox_ids = db.inputs.idsBBox2d();
+        auto& bbox_bbox_ids = db.inputs.bboxIdsBBox2d();
+        auto& bbox_labels = db.inputs.labelsBBox2d();
+
+        if (region.resamples) {
+            std::vector<InputDataBBox2d>& region_bboxes = state.m_regionBBoxes;
+            region_bboxes.clear();
+            for (size_t i = 0; i < num_boxes; ++i) {
+                region_bboxes.push_back(regionBBox(bbox_data[i], region));
+            }
+            bbox_data = region_bboxes.data();
+        }
+
+        // Populate bbox2d data
+        if (db.inputs.packedBBox2d()) {
+            // Single copy of the whole annotator buffer instead of one sub-message per box
+            message.mutable_bbox2d()->set_packed_data(bbox_data, num_boxes * sizeof(InputDataBBox2d));
+        } else {
+            for (size_t i = 0; i < num_boxes; ++i) {
+                const InputDataBBox2d& bbox = bbox_data[i];
+                BBox2DType* bbox_proto = message.mutable_bbox2d()->add_data();
+                bbox_proto->set_semanticid(bbox.semanticId);
+                bbox_proto->set_xmin(bbox.xMin);
+                bbox_proto->set_ymin(bbox.yMin);
+                bbox_proto->set_xmax(bbox.xMax);
+                bbox_proto->set_ymax(bbox.yMax);
+                bbox_proto->set_occlusionratio(bbox.occlusionRatio);
+            }
+        }
+
+        // Populate bboxIds
+        for (size_t i = 0; i < bbox_bbox_ids.size(); ++i) {
+            message.mutable_bbox2d()->mutable_info()->add_bboxids(bbox_bbox_ids[i]);
+        }
+
+        // Populate idToLabels, with delta metadata only when the labels change, sent with the session state
+        if (keyframe_interval == 0) {
+            for (size_t i = 0; i < bbox_ids.size(); ++i) {
+                int id = bbox_ids[i];
+                std::string label = db.tokenToString(bbox_labels[i]);
+                (*message.mutable_bbox2d()->mutable_info()->mutable_idtolabels())[std::to_string(id)] = label;
+            }
+        } else if (state.labelsChanged(bbox_ids, bbox_labels)) {
+            auto& id_to_labels = *state.m_session.mutable_idtolabels();
+            id_to_labels.clear();
+            for (size_t i = 0; i < bbox_ids.size(); ++i) {
+                int id = bbox_ids[i];
+                id_to_labels[std::to_string(id)] = db.tokenToString(bbox_labels[i]);
+            }
+            state.newSessionVersion();
+        }
     }
 
     // Simulation & System time
@@ -179,89 +548,231 @@ bool OgnIsaacBridgeZMQNode::compute(OgnIsaacBridgeZMQNodeDatabase& db) {
     message.mutable_clock()->set_sim_time(sim_time);
     message.mutable_clock()->set_sys_time(sys_time);
 
-    // Camera data
-    const pxr::GfMatrix4d& view_matrix = db.inputs.cameraViewTransform();
-    const pxr::GfVec3d& scale = db.inputs.cameraWorldScale();
-    const pxr::GfMatrix3d& intrinsics_matrix = db.inputs.cameraIntrinsics();
+    if (requested(STREAM_ANNOTATOR_CAMERA)) {
+        // Camera data
+        const pxr::GfMatrix4d& view_matrix = db.inputs.cameraViewTransform();
+        const pxr::GfVec3d& scale = db.inputs.cameraWorldScale();
+        const pxr::GfMatrix3d intrinsics_matrix = regionIntrinsics(db.inputs.cameraIntrinsics(), region);
+
+        if (keyframe_interval > 0) {
+            // The pose is sent when it changes, the intrinsics and scale with the session state
+            state.updateCamera(view_matrix, intrinsics_matrix, scale);
+        } else {
+            // Flatten and populate view_matrix_ros
+            for (int row = 0; row < 4; ++row) {
+                for (int col = 0; col < 4; ++col) {
+                    message.mutable_camera()->add_view_matrix_ros(view_matrix[row][col]);
+                }
+            }
+
+            // Populate camera_scale
+            message.mutable_camera()->add_camera_scale(scale[0]);
+            message.mutable_camera()->add_camera_scale(scale[1]);
+            message.mutable_camera()->add_camera_scale(scale[2]);
 
-    // Flatten and populate view_matrix_ros
-    for (int row = 0; row < 4; ++row) {
-        for (int col = 0; col < 4; ++col) {
-            message.mutable_camera()->add_view_matrix_ros(view_matrix[row][col]);
+            // Flatten and populate intrinsics_matrix
+            for (int row = 0; row < 3; ++row) {
+                for (int col = 0; col < 3; ++col) {
+                    message.mutable_camera()->add_intrinsics_matrix(intrinsics_matrix[row][col]);
+                }
+            }
         }
     }
 
-    // Populate camera_scale
-    message.mutable_camera()->add_camera_scale(scale[0]);
-    message.mutable_camera()->add_camera_scale(scale[1]);
-    message.mutable_camera()->add_camera_scale(scale[2]);
+    // RGB & DEPTH
 
-    // Flatten and populate intrinsics_matrix
-    for (int row = 0; row < 3; ++row) {
-        for (int col = 0; col < 3; ++col) {
-            message.mutable_camera()->add_intrinsics_matrix(intrinsics_matrix[row][col]);
+    // Enqueue the copies of the requested images from Device to Host, only the rows of the region
+    // (every downscale-th row). Submitting the frame waits until the annotator buffers are read, so the next
+    // render can rewrite them, the copies to the host run on the copier stream while the graph goes on
+    size_t row_bytes = region.width * kAnnotatorPixelSize;
+    size_t src_pitch = region.fullWidth * kAnnotatorPixelSize * region.downscale;
+    size_t region_offset = (static_cast<size_t>(region.y) * region.fullWidth + region.x) * kAnnotatorPixelSize;
+    size_t copy_size_color = region.resamples ? row_bytes * region.imageHeight : buffer_size_color;
+    size_t copy_size_depth = region.resamples ? row_bytes * region.imageHeight : buffer_size_depth;
+
+    HostBufferPool& host_buffers = *state.m_hostBuffers;
+    FrameCopier& copier = state.m_sender->copier();
+    auto enqueue_copy = [&](uint64_t raw_ptr, size_t copy_size, HostBufferPool::Handle& host_buffer) {
+        host_buffer = host_buffers.acquire(copy_size);
+        const uint8_t* src = reinterpret_cast<const uint8_t*>(raw_ptr);
+        if (region.resamples) {
+            return copier.copy(slot, host_buffer->data, row_bytes, src + region_offset, src_pitch, row_bytes,
+                               region.imageHeight);
         }
+        // Without region the full image is copied as a single row
+        return copier.copy(slot, host_buffer->data, copy_size, src, copy_size, copy_size, 1);
+    };
+    bool copying = (!send_color || enqueue_copy(raw_ptr_color, copy_size_color, frame.color)) &&
+                   (!send_depth || enqueue_copy(raw_ptr_depth, copy_size_depth, frame.depth));
+    if (!copying) {
+        CARB_LOG_WARN("Failed to copy the images from the device, will not stream images");
+        copier.discard(slot);
+        frame.color.reset();
+        frame.depth.reset();
+        state.m_sender->cancel(slot);
+        return true;
     }
 
-    // RGB & DEPTH
+    frame.copySizeColor = send_color ? copy_size_color : 0;
+    frame.copySizeDepth = send_depth ? copy_size_depth : 0;
+    frame.region = region;
+    frame.colorRgb = color_rgb;
+    frame.depthMm = depth_mm;
+    frame.multipart = db.inputs.multipart();
+    frame.connection = state.m_connection;
+    frame.topicPrefix = state.m_topicPrefix;
+    frame.cameraId = state.m_cameraId;
+    frame.sendQueueSize = db.inputs.sendQueueSize();
+    frame.dropOldest = db.inputs.dropOldest();
+
+    if (keyframe_interval > 0) {
+        state.fillSession(message, keyframe_interval, requested(STREAM_ANNOTATOR_CAMERA));
+    }
 
-    // Copy from Device to Host
-    size_t data_size_color = db.inputs.bufferSizeColor();
-    uint64_t raw_ptr_color = db.inputs.dataPtrColor();
-    auto data_ptr_color = std::make_unique<int8_t[]>(data_size_color);
+    // Latency tracing, the last applied command is set on the node inputs by the mission,
+    // the send time is set on the send thread
+    FrameTrace* trace = message.mutable_trace();
+    trace->set_frame_id(++state.m_frameId);
+    trace->set_render_time(render_time);
+    trace->set_command_id(db.inputs.commandId());
+    trace->set_command_send_time(db.inputs.commandSendTime());
+    trace->set_command_apply_time(db.inputs.commandApplyTime());
+
+    // Hand the frame over to the send thread and return without waiting for the copies to the host
+    if (!state.m_sender->submit(slot)) {
+        CARB_LOG_WARN("Failed to record the image copies, will not stream the frame");
+        frame.color.reset();
+        frame.depth.reset();
+        frame.connection.reset();
+    }
 
-    size_t data_size_depth = db.inputs.bufferSizeDepth();
-    uint64_t raw_ptr_depth = db.inputs.dataPtrDepth();
-    auto data_ptr_depth = std::make_unique<float[]>(data_size_depth / sizeof(float));
+    write_stats();
+    return true;
+}
 
-    // Create CUDA stream if not already created
-    if (state.m_cudaStreamNotCreated) {
-        CUDA_CHECK(cudaStreamCreate(&state.m_cudaStream));
-        state.m_cudaStreamNotCreated = false;
+void OgnIsaacBridgeZMQNode::sendFrame(PendingFrame& frame, bool copied) {
+    if (!copied) {
+        frame.color.reset();
+        frame.depth.reset();
+        m_sendCounters->messagesDropped++;
+        frame.connection->stats->messagesDropped++;
+        frame.connection.reset();
+        return;
     }
 
-    // If the stream is not created, warn and return true
-    if (state.m_cudaStreamNotCreated) {
-        CARB_LOG_WARN("CUDA stream not created, will not stream images");
-        return true;
+    ClientStreamMessage& message = frame.message;
+    HostBufferPool& host_buffers = *m_hostBuffers;
+    const StreamRegion& region = frame.region;
+    bool send_color = static_cast<bool>(frame.color);
+    bool send_depth = static_cast<bool>(frame.depth);
+
+    // Downscale the columns and convert the pixel formats on the host, the copies are sent as is otherwise
+    size_t src_row_pixels = region.resamples ? region.width : frame.copySizeColor / kAnnotatorPixelSize;
+    uint32_t rows = region.resamples ? region.imageHeight : 1;
+    size_t data_size_color = frame.copySizeColor;
+    if (send_color && (region.downscale > 1 || frame.colorRgb)) {
+        uint32_t cols = region.resamples ? region.imageWidth : static_cast<uint32_t>(src_row_pixels);
+        const Rgba8* src = reinterpret_cast<const Rgba8*>(frame.color->data);
+        if (frame.colorRgb) {
+            data_size_color = static_cast<size_t>(rows) * cols * sizeof(Rgb8);
+            HostBufferPool::Handle converted = host_buffers.acquire(data_size_color);
+            resamplePixels(src, src_row_pixels, rows, cols, region.downscale, reinterpret_cast<Rgb8*>(converted->data),
+                           [](const Rgba8& pixel) { return Rgb8{ { pixel.c[0], pixel.c[1], pixel.c[2] } }; });
+            frame.color = std::move(converted);
+        } else {
+            data_size_color = static_cast<size_t>(rows) * cols * sizeof(Rgba8);
+            HostBufferPool::Handle converted = host_buffers.acquire(data_size_color);
+            resamplePixels(src, src_row_pixels, rows, cols, region.downscale, reinterpret_cast<Rgba8*>(converted->data),
+                           [](const Rgba8& pixel) { return pixel; });
+            frame.color = std::move(converted);
+        }
     }
 
-    // Use the stream for memory operations
-    CUDA_CHECK(cudaMemcpyAsync(data_ptr_color.get(), reinterpret_cast<void*>(raw_ptr_color),
-                            data_size_color, cudaMemcpyDeviceToHost, state.m_cudaStream));
-
-    CUDA_CHECK(cudaMemcpyAsync(data_ptr_depth.get(), reinterpret_cast<void*>(raw_ptr_depth),
-                        data_size_depth, cudaMemcpyDeviceToHost, state.m_cudaStream));
-
-    CUDA_CHECK(cudaStreamSynchronize(state.m_cudaStream));
+    src_row_pixels = region.resamples ? region.width : frame.copySizeDepth / kAnnotatorPixelSize;
+    size_t data_size_depth = frame.copySizeDepth;
+    if (send_depth && (region.downscale > 1 || frame.depthMm)) {
+        uint32_t cols = region.resamples ? region.imageWidth : static_cast<uint32_t>(src_row_pixels);
+        const float* src = reinterpret_cast<const float*>(frame.depth->data);
+        if (frame.depthMm) {
+            data_size_depth = static_cast<size_t>(rows) * cols * sizeof(uint16_t);
+            HostBufferPool::Handle converted = host_buffers.acquire(data_size_depth);
+            resamplePixels(src, src_row_pixels, rows, cols, region.downscale,
+                           reinterpret_cast<uint16_t*>(converted->data), quantizeDepth);
+            frame.depth = std::move(converted);
+        } else {
+            data_size_depth = static_cast<size_t>(rows) * cols * sizeof(float);
+            HostBufferPool::Handle converted = host_buffers.acquire(data_size_depth);
+            resamplePixels(src, src_row_pixels, rows, cols, region.downscale, reinterpret_cast<float*>(converted->data),
+                           [](float depth) { return depth; });
+            frame.depth = std::move(converted);
+        }
+    }
 
     // Add image data to Protobuf message
-    message.set_color_image(data_ptr_color.get(), data_size_color);
-    message.set_depth_image(reinterpret_cast<const char*>(data_ptr_depth.get()), data_size_depth);
+    // In multipart mode the images are not copied into the message, they follow the
+    // protobuf header as separate ZMQ frames (frame 0 is the header itself), in the order
+    // color then depth, without the images which are not requested
+    std::vector<zmq_lib::message_t> image_messages;
+    if (frame.multipart) {
+        // Hand the host buffers over to ZMQ without copying, ZMQ returns them to the pool once sent (or dropped)
+        if (send_color) {
+            message.set_color_image_frame(static_cast<uint32_t>(image_messages.size() + 1));
+            uint8_t* data = frame.color->data;
+            image_messages.emplace_back(data, data_size_color, HostBufferPool::zmqFree, frame.color.release());
+        }
+        if (send_depth) {
+            message.set_depth_image_frame(static_cast<uint32_t>(image_messages.size() + 1));
+            uint8_t* data = frame.depth->data;
+            image_messages.emplace_back(data, data_size_depth, HostBufferPool::zmqFree, frame.depth.release());
+        }
+    } else {
+        // Copied into the image fields of the reused message, which keep their capacity across frames
+        if (send_color) {
+            message.set_color_image(reinterpret_cast<const char*>(frame.color->data), data_size_color);
+        }
+        if (send_depth) {
+            message.set_depth_image(reinterpret_cast<const char*>(frame.depth->data), data_size_depth);
+        }
+        frame.color.reset();
+        frame.depth.reset();
+    }
+
+    // Part of the header, taken right before it is serialized, the wait in the send queue of the connection
+    // counts in the send stage
+    message.mutable_trace()->set_send_time(monotonicSeconds());
 
-    // Serialize Protobuf message
-    std::string serialized_message;
-    message.SerializeToString(&serialized_message);
+    // Serialize Protobuf message directly into a pooled buffer sent without copying, after the topic in PUB/SUB mode
+    size_t header_size = message.ByteSizeLong();
+    const std::string& topic_prefix = frame.topicPrefix;
+    HostBufferPool::Handle header_buffer = host_buffers.acquire(topic_prefix.size() + header_size);
+    uint8_t* header_data = header_buffer->data;
+    std::memcpy(header_data, topic_prefix.data(), topic_prefix.size());
+    message.SerializeWithCachedSizesToArray(header_data + topic_prefix.size());
+    zmq_lib::message_t zmq_message(
+        header_data, topic_prefix.size() + header_size, HostBufferPool::zmqFree, header_buffer.release());
 
     // ZMQ Data sending
-    zmq_lib::message_t zmq_message(serialized_message.size());
-    memcpy(zmq_message.data(), serialized_message.data(), serialized_message.size());
-    auto message_sent = state.m_zmqSocket->send(zmq_message, zmq_lib::send_flags::dontwait);
-
-    if (!message_sent.has_value()) {
-        state.m_zmqFailCount++;
-        double currentTime = db.inputs.systemTime();
-        // Log the error state every 5 seconds,
-        // and only if errors are accumulating.
-        if (state.m_zmqFailCount > 20 && currentTime - lastErrorLogTime >= 5.0) {
-            CARB_LOG_ERROR("Failed to send message (no server available)");
-            lastErrorLogTime = currentTime;
-        }
-    } else {
-        state.m_zmqFailCount = 0;
+    // Queued to the sender thread of the connection, which may be shared with other nodes.
+    // In multiplexed mode the message starts with a routing frame holding the camera id,
+    // the server demultiplexes the messages to per camera handlers with it
+    ZMQOutgoingMessage outgoing;
+    outgoing.counters = m_sendCounters;
+    outgoing.queueSize = frame.sendQueueSize;
+    outgoing.dropOldest = frame.dropOldest;
+    outgoing.parts.reserve(image_messages.size() + 2);
+    if (!frame.cameraId.empty()) {
+        outgoing.parts.emplace_back(frame.cameraId.data(), frame.cameraId.size());
+    }
+    outgoing.parts.push_back(std::move(zmq_message));
+    for (zmq_lib::message_t& image_message : image_messages) {
+        outgoing.parts.push_back(std::move(image_message));
+    }
+    for (const zmq_lib::message_t& part : outgoing.parts) {
+        outgoing.bytes += part.size();
     }
 
-    return true;
+    std::shared_ptr<ZMQConnection> connection = std::move(frame.connection);
+    connection->send(std::move(outgoing));
 }
 
 // This macro provides the information necessary to OmniGraph that lets it automatically register and deregister
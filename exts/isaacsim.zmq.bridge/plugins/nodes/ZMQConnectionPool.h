@@ -0,0 +1,291 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include <zmq.hpp>
+
+#include <carb/InterfaceUtils.h>
+#include <carb/logging/Log.h>
+#include <carb/settings/ISettings.h>
+
+namespace zmq_lib = zmq; // assign namespace to zmq library to avoid conflicts with our library
+
+namespace isaacsim {
+namespace zmq {
+namespace bridge {
+
+// Setting of the number of IO threads of the process-wide ZMQ context, read when the context is created
+static constexpr const char* kIoThreadsSetting = "/exts/isaacsim.zmq.bridge/ioThreads";
+
+// Send statistics of one endpoint, shared by all nodes sending to it
+struct ZMQEndpointStats {
+    std::atomic<uint64_t> messagesSent{ 0 };
+    std::atomic<uint64_t> messagesDropped{ 0 };
+    std::atomic<uint64_t> bytesSent{ 0 };
+};
+
+// Send counters of one node, the endpoint statistics sum them over all the nodes sending to the endpoint
+struct ZMQSendCounters {
+    std::atomic<uint64_t> messagesQueued{ 0 };
+    std::atomic<uint64_t> messagesSent{ 0 };
+    std::atomic<uint64_t> messagesDropped{ 0 };
+};
+
+// A message waiting in the send queue of a connection, its parts are sent as one multipart message.
+// The queue settings are those of the node sending it, each node of a shared connection has its own
+struct ZMQOutgoingMessage {
+    std::vector<zmq_lib::message_t> parts;
+    size_t bytes{ 0 };
+    std::shared_ptr<ZMQSendCounters> counters;
+    size_t queueSize{ 2 };
+    bool dropOldest{ true };
+};
+
+// A PUSH (or PUB) socket connected to one endpoint. Nodes sending to the same endpoint share it.
+//
+// The socket is only used by the sender thread of the connection: nodes queue their messages and return,
+// so the graph evaluation does not wait for the network. The queue is bounded per node (by its send counters)
+// with the settings of its messages, so the cameras of a multiplexed rig do not evict each other's messages.
+// When a node has queueSize messages waiting, either its oldest one is dropped for the new one (dropOldest)
+// or the new one is. While the server does not keep up the sender thread waits for the socket up to
+// kSendTimeoutMs per try, then with dropOldest it drops the message it tries to send if a newer one of
+// the same node is queued, without dropOldest it tries again.
+struct ZMQConnection {
+    // Time a send waits for the server before the message is dropped or retried, also bounds the time
+    // the connection waits for its sender thread to stop
+    static constexpr int kSendTimeoutMs = 100;
+
+    std::string address;
+    // Kept alive as long as the socket, which is closed first
+    std::shared_ptr<zmq_lib::context_t> context;
+    std::unique_ptr<zmq_lib::socket_t> socket;
+    std::shared_ptr<ZMQEndpointStats> stats;
+    int hwm{ 1 };
+
+    ~ZMQConnection() {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_stop = true;
+        }
+        m_queued.notify_one();
+        if (m_sender.joinable()) {
+            m_sender.join();
+        }
+        if (socket) {
+            socket->close();
+        }
+    }
+
+    // Starts the sender thread, once the socket is connected
+    void start() {
+        m_sender = std::thread(&ZMQConnection::run, this);
+    }
+
+    // Queues a message for the sender thread and returns, the message or the oldest queued one of the same
+    // node is dropped if the node already has message.queueSize messages waiting
+    void send(ZMQOutgoingMessage message) {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            message.counters->messagesQueued++;
+            if (queued(message.counters.get()) >= std::max<size_t>(message.queueSize, 1)) {
+                if (!message.dropOldest) {
+                    drop(message);
+                    return;
+                }
+                auto oldest = std::find_if(m_queue.begin(), m_queue.end(), [&](const ZMQOutgoingMessage& queued) {
+                    return queued.counters == message.counters;
+                });
+                drop(*oldest);
+                m_queue.erase(oldest);
+            }
+            m_queue.push_back(std::move(message));
+        }
+        m_queued.notify_one();
+    }
+
+private:
+    std::mutex m_mutex;
+    std::condition_variable m_queued;
+    std::deque<ZMQOutgoingMessage> m_queue;
+    bool m_stop{ false };
+    std::thread m_sender;
+    // Messages dropped in a row, requires the lock
+    uint32_t m_failCount{ 0 };
+    std::chrono::steady_clock::time_point m_lastErrorLogTime;
+
+    void run() {
+        while (true) {
+            ZMQOutgoingMessage message;
+            {
+                std::unique_lock<std::mutex> lock(m_mutex);
+                m_queued.wait(lock, [this]() { return m_stop || !m_queue.empty(); });
+                if (m_stop) {
+                    break;
+                }
+                message = std::move(m_queue.front());
+                m_queue.pop_front();
+            }
+            bool sent = false;
+            while (!sent) {
+                bool failed = false;
+                try {
+                    sent = sendParts(message);
+                } catch (const zmq_lib::error_t& e) {
+                    CARB_LOG_WARN("Failed to send message to %s: %s", address.c_str(), e.what());
+                    failed = true;
+                }
+                std::lock_guard<std::mutex> lock(m_mutex);
+                if (sent) {
+                    m_failCount = 0;
+                } else if (failed || m_stop || (message.dropOldest && queued(message.counters.get()) > 0)) {
+                    drop(message);
+                    break;
+                }
+            }
+        }
+
+        // Not sent when the connection is closed
+        std::lock_guard<std::mutex> lock(m_mutex);
+        for (ZMQOutgoingMessage& message : m_queue) {
+            drop(message);
+        }
+        m_queue.clear();
+    }
+
+    // Waits for the socket up to the send timeout, once the first part is queued ZMQ guarantees
+    // delivery of the remaining parts
+    bool sendParts(ZMQOutgoingMessage& message) {
+        for (size_t i = 0; i < message.parts.size(); ++i) {
+            zmq_lib::send_flags flags = zmq_lib::send_flags::none;
+            if (i + 1 < message.parts.size()) {
+                flags = zmq_lib::send_flags::sndmore;
+            }
+            zmq_lib::send_result_t part_sent = socket->send(message.parts[i], flags);
+            if (i == 0 && !part_sent.has_value()) {
+                return false;
+            }
+        }
+        message.counters->messagesSent++;
+        stats->messagesSent++;
+        stats->bytesSent += message.bytes;
+        return true;
+    }
+
+    // Messages of the node with the given counters waiting in the queue, requires the lock
+    size_t queued(const ZMQSendCounters* counters) const {
+        return std::count_if(m_queue.begin(), m_queue.end(), [counters](const ZMQOutgoingMessage& message) {
+            return message.counters.get() == counters;
+        });
+    }
+
+    // Requires the lock
+    void drop(ZMQOutgoingMessage& message) {
+        message.counters->messagesDropped++;
+        stats->messagesDropped++;
+        message.parts.clear();
+
+        // Log the error state every 5 seconds,
+        // and only if errors are accumulating.
+        auto now = std::chrono::steady_clock::now();
+        if (++m_failCount > 20 && now - m_lastErrorLogTime >= std::chrono::seconds(5)) {
+            CARB_LOG_ERROR("Dropping messages to %s (no server available or not keeping up)", address.c_str());
+            m_lastErrorLogTime = now;
+        }
+    }
+};
+
+// Process-wide ZMQ context and pool of connections keyed by endpoint and socket type, shared by all bridge nodes.
+// A connection is closed when the last node using it is destroyed or moves to another endpoint,
+// the endpoint statistics are kept for the lifetime of the process. Each connection holds the context,
+// which is terminated once the pool and the last connection are gone, whichever is destroyed last.
+//
+// The Python ZMQClient uses the libzmq bundled with pyzmq, a context cannot be shared across the two
+// libraries, it has its own pool configured with the same ioThreads setting.
+class ZMQConnectionPool {
+    std::mutex m_mutex;
+    std::shared_ptr<zmq_lib::context_t> m_context;
+    std::map<std::pair<std::string, int>, std::weak_ptr<ZMQConnection>> m_connections;
+    std::map<std::string, std::shared_ptr<ZMQEndpointStats>> m_stats;
+
+public:
+    static ZMQConnectionPool& instance() {
+        static ZMQConnectionPool pool;
+        return pool;
+    }
+
+    // Returns the connection to the address with the given socket type (ZMQ_PUSH or ZMQ_PUB), connecting on
+    // first use with the given high water mark. Throws zmq_lib::error_t if the socket cannot be created or connected
+    std::shared_ptr<ZMQConnection> acquire(const std::string& address, int hwm, int socketType = ZMQ_PUSH) {
+        std::lock_guard<std::mutex> lock(m_mutex);
+
+        std::weak_ptr<ZMQConnection>& entry = m_connections[{ address, socketType }];
+        std::shared_ptr<ZMQConnection> connection = entry.lock();
+        if (connection) {
+            // The socket is owned by the sender thread, its options are not changed once connected
+            if (connection->hwm != hwm) {
+                CARB_LOG_WARN("%s is already connected with a high water mark of %d, %d requested", address.c_str(),
+                              connection->hwm, hwm);
+            }
+            return connection;
+        }
+
+        connection = std::make_shared<ZMQConnection>();
+        connection->address = address;
+        connection->hwm = hwm;
+        connection->context = context();
+        connection->socket = std::make_unique<zmq_lib::socket_t>(*connection->context, socketType);
+
+        int linger = 0;
+        int sendTimeout = ZMQConnection::kSendTimeoutMs;
+        connection->socket->setsockopt(ZMQ_LINGER, &linger, sizeof(linger));
+        connection->socket->setsockopt(ZMQ_SNDHWM, &hwm, sizeof(hwm));
+        connection->socket->setsockopt(ZMQ_SNDTIMEO, &sendTimeout, sizeof(sendTimeout));
+        connection->socket->connect(address);
+        CARB_LOG_INFO("Connected to %s\n", address.c_str());
+
+        std::shared_ptr<ZMQEndpointStats>& stats = m_stats[address];
+        if (!stats) {
+            stats = std::make_shared<ZMQEndpointStats>();
+        }
+        connection->stats = stats;
+        connection->start();
+
+        entry = connection;
+        return connection;
+    }
+
+private:
+    ZMQConnectionPool() = default;
+
+    // Created on first use, requires the lock
+    std::shared_ptr<zmq_lib::context_t> context() {
+        if (!m_context) {
+            int ioThreads = 1;
+            auto* settings = carb::getCachedInterface<carb::settings::ISettings>();
+            if (settings && settings->isAccessibleAs(carb::dictionary::ItemType::eInt, kIoThreadsSetting)) {
+                ioThreads = std::max(1, static_cast<int>(settings->getAsInt(kIoThreadsSetting)));
+            }
+            m_context = std::make_shared<zmq_lib::context_t>(ioThreads);
+            CARB_LOG_INFO("Created ZMQ context with %d IO threads\n", ioThreads);
+        }
+        return m_context;
+    }
+};
+
+} // bridge
+} // zmq
+} // isaacsim
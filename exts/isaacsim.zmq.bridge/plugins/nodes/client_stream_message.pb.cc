@@ -21,6 +21,67 @@ PROTOBUF_PRAGMA_INIT_SEG
 namespace _pb = ::google::protobuf;
 namespace _pbi = ::google::protobuf::internal;
 namespace _fl = ::google::protobuf::internal::field_layout;
+      template <typename>
+PROTOBUF_CONSTEXPR SessionState_IdToLabelsEntry_DoNotUse::SessionState_IdToLabelsEntry_DoNotUse(::_pbi::ConstantInitialized) {}
+struct SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal() {}
+  union {
+    SessionState_IdToLabelsEntry_DoNotUse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal _SessionState_IdToLabelsEntry_DoNotUse_default_instance_;
+
+inline constexpr ImageRegion::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : x_{0u},
+        y_{0u},
+        width_{0u},
+        height_{0u},
+        downscale_{0u},
+        image_width_{0u},
+        image_height_{0u},
+        _cached_size_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR ImageRegion::ImageRegion(::_pbi::ConstantInitialized)
+    : _impl_(::_pbi::ConstantInitialized()) {}
+struct ImageRegionDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ImageRegionDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ImageRegionDefaultTypeInternal() {}
+  union {
+    ImageRegion _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ImageRegionDefaultTypeInternal _ImageRegion_default_instance_;
+
+inline constexpr FrameTrace::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : frame_id_{::uint64_t{0u}},
+        render_time_{0},
+        send_time_{0},
+        command_id_{::uint64_t{0u}},
+        command_send_time_{0},
+        command_apply_time_{0},
+        _cached_size_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR FrameTrace::FrameTrace(::_pbi::ConstantInitialized)
+    : _impl_(::_pbi::ConstantInitialized()) {}
+struct FrameTraceDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR FrameTraceDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~FrameTraceDefaultTypeInternal() {}
+  union {
+    FrameTrace _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 FrameTraceDefaultTypeInternal _FrameTrace_default_instance_;
 
 inline constexpr Clock::Impl_::Impl_(
     ::_pbi::ConstantInitialized) noexcept
@@ -49,6 +110,7 @@ inline constexpr Camera::Impl_::Impl_(
       : view_matrix_ros_{},
         camera_scale_{},
         intrinsics_matrix_{},
+        pose_version_{0u},
         _cached_size_{0} {}
 
 template <typename>
@@ -101,6 +163,28 @@ struct BBox2DInfo_IdToLabelsEntry_DoNotUseDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 BBox2DInfo_IdToLabelsEntry_DoNotUseDefaultTypeInternal _BBox2DInfo_IdToLabelsEntry_DoNotUse_default_instance_;
 
+inline constexpr SessionState::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : idtolabels_{},
+        intrinsics_matrix_{},
+        camera_scale_{},
+        version_{0u},
+        _cached_size_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR SessionState::SessionState(::_pbi::ConstantInitialized)
+    : _impl_(::_pbi::ConstantInitialized()) {}
+struct SessionStateDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR SessionStateDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~SessionStateDefaultTypeInternal() {}
+  union {
+    SessionState _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 SessionStateDefaultTypeInternal _SessionState_default_instance_;
+
 inline constexpr BBox2DInfo::Impl_::Impl_(
     ::_pbi::ConstantInitialized) noexcept
       : idtolabels_{},
@@ -126,6 +210,9 @@ inline constexpr BBox2D::Impl_::Impl_(
     ::_pbi::ConstantInitialized) noexcept
       : _cached_size_{0},
         data_{},
+        packed_data_(
+            &::google::protobuf::internal::fixed_address_empty_string,
+            ::_pbi::ConstantInitialized()),
         info_{nullptr} {}
 
 template <typename>
@@ -151,9 +238,24 @@ inline constexpr ClientStreamMessage::Impl_::Impl_(
         depth_image_(
             &::google::protobuf::internal::fixed_address_empty_string,
             ::_pbi::ConstantInitialized()),
+        topic_(
+            &::google::protobuf::internal::fixed_address_empty_string,
+            ::_pbi::ConstantInitialized()),
         bbox2d_{nullptr},
         clock_{nullptr},
-        camera_{nullptr} {}
+        camera_{nullptr},
+        trace_{nullptr},
+        session_{nullptr},
+        region_{nullptr},
+        color_image_frame_{0u},
+        depth_image_frame_{0u},
+        color_codec_{static_cast< ::ImageCodec >(0)},
+        depth_codec_{static_cast< ::ImageCodec >(0)},
+        annotators_{0u},
+        session_version_{0u},
+        session_id_{::uint64_t{0u}},
+        color_format_{static_cast< ::PixelFormat >(0)},
+        depth_format_{static_cast< ::PixelFormat >(0)} {}
 
 template <typename>
 PROTOBUF_CONSTEXPR ClientStreamMessage::ClientStreamMessage(::_pbi::ConstantInitialized)
@@ -168,9 +270,8 @@ struct ClientStreamMessageDefaultTypeInternal {
 
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ClientStreamMessageDefaultTypeInternal _ClientStreamMessage_default_instance_;
-static ::_pb::Metadata file_level_metadata_client_5fstream_5fmessage_2eproto[7];
-static constexpr const ::_pb::EnumDescriptor**
-    file_level_enum_descriptors_client_5fstream_5fmessage_2eproto = nullptr;
+static ::_pb::Metadata file_level_metadata_client_5fstream_5fmessage_2eproto[11];
+static const ::_pb::EnumDescriptor* file_level_enum_descriptors_client_5fstream_5fmessage_2eproto[3];
 static constexpr const ::_pb::ServiceDescriptor**
     file_level_service_descriptors_client_5fstream_5fmessage_2eproto = nullptr;
 const ::uint32_t
@@ -222,8 +323,10 @@ const ::uint32_t
         ~0u,  // no sizeof(Split)
         PROTOBUF_FIELD_OFFSET(::BBox2D, _impl_.data_),
         PROTOBUF_FIELD_OFFSET(::BBox2D, _impl_.info_),
+        PROTOBUF_FIELD_OFFSET(::BBox2D, _impl_.packed_data_),
         ~0u,
         0,
+        ~0u,
         ~0u,  // no _has_bits_
         PROTOBUF_FIELD_OFFSET(::Clock, _internal_metadata_),
         ~0u,  // no _extensions_
@@ -247,6 +350,60 @@ const ::uint32_t
         PROTOBUF_FIELD_OFFSET(::Camera, _impl_.view_matrix_ros_),
         PROTOBUF_FIELD_OFFSET(::Camera, _impl_.camera_scale_),
         PROTOBUF_FIELD_OFFSET(::Camera, _impl_.intrinsics_matrix_),
+        PROTOBUF_FIELD_OFFSET(::Camera, _impl_.pose_version_),
+        PROTOBUF_FIELD_OFFSET(::SessionState_IdToLabelsEntry_DoNotUse, _has_bits_),
+        PROTOBUF_FIELD_OFFSET(::SessionState_IdToLabelsEntry_DoNotUse, _internal_metadata_),
+        ~0u,  // no _extensions_
+        ~0u,  // no _oneof_case_
+        ~0u,  // no _weak_field_map_
+        ~0u,  // no _inlined_string_donated_
+        ~0u,  // no _split_
+        ~0u,  // no sizeof(Split)
+        PROTOBUF_FIELD_OFFSET(::SessionState_IdToLabelsEntry_DoNotUse, key_),
+        PROTOBUF_FIELD_OFFSET(::SessionState_IdToLabelsEntry_DoNotUse, value_),
+        0,
+        1,
+        ~0u,  // no _has_bits_
+        PROTOBUF_FIELD_OFFSET(::SessionState, _internal_metadata_),
+        ~0u,  // no _extensions_
+        ~0u,  // no _oneof_case_
+        ~0u,  // no _weak_field_map_
+        ~0u,  // no _inlined_string_donated_
+        ~0u,  // no _split_
+        ~0u,  // no sizeof(Split)
+        PROTOBUF_FIELD_OFFSET(::SessionState, _impl_.version_),
+        PROTOBUF_FIELD_OFFSET(::SessionState, _impl_.idtolabels_),
+        PROTOBUF_FIELD_OFFSET(::SessionState, _impl_.intrinsics_matrix_),
+        PROTOBUF_FIELD_OFFSET(::SessionState, _impl_.camera_scale_),
+        ~0u,  // no _has_bits_
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _internal_metadata_),
+        ~0u,  // no _extensions_
+        ~0u,  // no _oneof_case_
+        ~0u,  // no _weak_field_map_
+        ~0u,  // no _inlined_string_donated_
+        ~0u,  // no _split_
+        ~0u,  // no sizeof(Split)
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.frame_id_),
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.render_time_),
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.send_time_),
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.command_id_),
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.command_send_time_),
+        PROTOBUF_FIELD_OFFSET(::FrameTrace, _impl_.command_apply_time_),
+        ~0u,  // no _has_bits_
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _internal_metadata_),
+        ~0u,  // no _extensions_
+        ~0u,  // no _oneof_case_
+        ~0u,  // no _weak_field_map_
+        ~0u,  // no _inlined_string_donated_
+        ~0u,  // no _split_
+        ~0u,  // no sizeof(Split)
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.x_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.y_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.width_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.height_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.downscale_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.image_width_),
+        PROTOBUF_FIELD_OFFSET(::ImageRegion, _impl_.image_height_),
         PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_._has_bits_),
         PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _internal_metadata_),
         ~0u,  // no _extensions_
@@ -260,11 +417,37 @@ const ::uint32_t
         PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.camera_),
         PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.color_image_),
         PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.depth_image_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.color_image_frame_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.depth_image_frame_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.color_codec_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.depth_codec_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.trace_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.topic_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.annotators_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.session_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.session_id_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.session_version_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.region_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.color_format_),
+        PROTOBUF_FIELD_OFFSET(::ClientStreamMessage, _impl_.depth_format_),
         0,
         1,
         2,
         ~0u,
         ~0u,
+        ~0u,
+        ~0u,
+        ~0u,
+        ~0u,
+        3,
+        ~0u,
+        ~0u,
+        4,
+        ~0u,
+        ~0u,
+        5,
+        ~0u,
+        ~0u,
 };
 
 static const ::_pbi::MigrationSchema
@@ -272,10 +455,14 @@ static const ::_pbi::MigrationSchema
         {0, -1, -1, sizeof(::BBox2DType)},
         {14, 24, -1, sizeof(::BBox2DInfo_IdToLabelsEntry_DoNotUse)},
         {26, -1, -1, sizeof(::BBox2DInfo)},
-        {36, 46, -1, sizeof(::BBox2D)},
-        {48, -1, -1, sizeof(::Clock)},
-        {60, -1, -1, sizeof(::Camera)},
-        {71, 84, -1, sizeof(::ClientStreamMessage)},
+        {36, 47, -1, sizeof(::BBox2D)},
+        {50, -1, -1, sizeof(::Clock)},
+        {62, -1, -1, sizeof(::Camera)},
+        {74, 84, -1, sizeof(::SessionState_IdToLabelsEntry_DoNotUse)},
+        {86, -1, -1, sizeof(::SessionState)},
+        {98, -1, -1, sizeof(::FrameTrace)},
+        {112, -1, -1, sizeof(::ImageRegion)},
+        {127, 153, -1, sizeof(::ClientStreamMessage)},
 };
 static const ::_pb::Message* const file_default_instances[] = {
     &::_BBox2DType_default_instance_._instance,
@@ -284,6 +471,10 @@ static const ::_pb::Message* const file_default_instances[] = {
     &::_BBox2D_default_instance_._instance,
     &::_Clock_default_instance_._instance,
     &::_Camera_default_instance_._instance,
+    &::_SessionState_IdToLabelsEntry_DoNotUse_default_instance_._instance,
+    &::_SessionState_default_instance_._instance,
+    &::_FrameTrace_default_instance_._instance,
+    &::_ImageRegion_default_instance_._instance,
     &::_ClientStreamMessage_default_instance_._instance,
 };
 const char descriptor_table_protodef_client_5fstream_5fmessage_2eproto[] ABSL_ATTRIBUTE_SECTION_VARIABLE(
@@ -294,29 +485,61 @@ const char descriptor_table_protodef_client_5fstream_5fmessage_2eproto[] ABSL_AT
     "\026\n\016occlusionRatio\030\006 \001(\002\"\201\001\n\nBBox2DInfo\022/"
     "\n\nidToLabels\030\001 \003(\0132\033.BBox2DInfo.IdToLabe"
     "lsEntry\022\017\n\007bboxIds\030\002 \003(\005\0321\n\017IdToLabelsEn"
-    "try\022\013\n\003key\030\001 \001(\t\022\r\n\005value\030\002 \001(\t:\0028\001\">\n\006B"
+    "try\022\013\n\003key\030\001 \001(\t\022\r\n\005value\030\002 \001(\t:\0028\001\"S\n\006B"
     "Box2D\022\031\n\004data\030\001 \003(\0132\013.BBox2DType\022\031\n\004info"
-    "\030\002 \001(\0132\013.BBox2DInfo\"K\n\005Clock\022\016\n\006sim_dt\030\001"
-    " \001(\001\022\016\n\006sys_dt\030\002 \001(\001\022\020\n\010sim_time\030\003 \001(\001\022\020"
-    "\n\010sys_time\030\004 \001(\001\"R\n\006Camera\022\027\n\017view_matri"
-    "x_ros\030\001 \003(\001\022\024\n\014camera_scale\030\002 \003(\001\022\031\n\021int"
-    "rinsics_matrix\030\003 \003(\001\"\210\001\n\023ClientStreamMes"
-    "sage\022\027\n\006bbox2d\030\001 \001(\0132\007.BBox2D\022\025\n\005clock\030\002"
-    " \001(\0132\006.Clock\022\027\n\006camera\030\003 \001(\0132\007.Camera\022\023\n"
-    "\013color_image\030\004 \001(\014\022\023\n\013depth_image\030\005 \001(\014b"
-    "\006proto3"
+    "\030\002 \001(\0132\013.BBox2DInfo\022\023\n\013packed_data\030\003 \001(\014"
+    "\"K\n\005Clock\022\016\n\006sim_dt\030\001 \001(\001\022\016\n\006sys_dt\030\002 \001("
+    "\001\022\020\n\010sim_time\030\003 \001(\001\022\020\n\010sys_time\030\004 \001(\001\"h\n"
+    "\006Camera\022\027\n\017view_matrix_ros\030\001 \003(\001\022\024\n\014came"
+    "ra_scale\030\002 \003(\001\022\031\n\021intrinsics_matrix\030\003 \003("
+    "\001\022\024\n\014pose_version\030\004 \001(\r\"\266\001\n\014SessionState"
+    "\022\017\n\007version\030\001 \001(\r\0221\n\nidToLabels\030\002 \003(\0132\035."
+    "SessionState.IdToLabelsEntry\022\031\n\021intrinsi"
+    "cs_matrix\030\003 \003(\001\022\024\n\014camera_scale\030\004 \003(\001\0321\n"
+    "\017IdToLabelsEntry\022\013\n\003key\030\001 \001(\t\022\r\n\005value\030\002"
+    " \001(\t:\0028\001\"\221\001\n\nFrameTrace\022\020\n\010frame_id\030\001 \001("
+    "\004\022\023\n\013render_time\030\002 \001(\001\022\021\n\tsend_time\030\003 \001("
+    "\001\022\022\n\ncommand_id\030\004 \001(\004\022\031\n\021command_send_ti"
+    "me\030\005 \001(\001\022\032\n\022command_apply_time\030\006 \001(\001\"\200\001\n"
+    "\013ImageRegion\022\t\n\001x\030\001 \001(\r\022\t\n\001y\030\002 \001(\r\022\r\n\005wi"
+    "dth\030\003 \001(\r\022\016\n\006height\030\004 \001(\r\022\021\n\tdownscale\030\005"
+    " \001(\r\022\023\n\013image_width\030\006 \001(\r\022\024\n\014image_heigh"
+    "t\030\007 \001(\r\"\364\003\n\023ClientStreamMessage\022\027\n\006bbox2"
+    "d\030\001 \001(\0132\007.BBox2D\022\025\n\005clock\030\002 \001(\0132\006.Clock\022"
+    "\027\n\006camera\030\003 \001(\0132\007.Camera\022\023\n\013color_image\030"
+    "\004 \001(\014\022\023\n\013depth_image\030\005 \001(\014\022\031\n\021color_imag"
+    "e_frame\030\006 \001(\r\022\031\n\021depth_image_frame\030\007 \001(\r"
+    "\022 \n\013color_codec\030\010 \001(\0162\013.ImageCodec\022 \n\013de"
+    "pth_codec\030\t \001(\0162\013.ImageCodec\022\032\n\005trace\030\n "
+    "\001(\0132\013.FrameTrace\022\r\n\005topic\030\013 \001(\t\022\022\n\nannot"
+    "ators\030\014 \001(\r\022\036\n\007session\030\r \001(\0132\r.SessionSt"
+    "ate\022\022\n\nsession_id\030\016 \001(\004\022\027\n\017session_versi"
+    "on\030\017 \001(\r\022\034\n\006region\030\020 \001(\0132\014.ImageRegion\022\""
+    "\n\014color_format\030\021 \001(\0162\014.PixelFormat\022\"\n\014de"
+    "pth_format\030\022 \001(\0162\014.PixelFormat*\240\001\n\nImage"
+    "Codec\022\023\n\017IMAGE_CODEC_RAW\020\000\022\023\n\017IMAGE_CODE"
+    "C_LZ4\020\001\022\024\n\020IMAGE_CODEC_ZSTD\020\002\022\023\n\017IMAGE_C"
+    "ODEC_PNG\020\003\022\033\n\027IMAGE_CODEC_DEPTH_PNG16\020\004\022"
+    " \n\034IMAGE_CODEC_DEPTH_DELTA_ZSTD\020\005*`\n\013Pix"
+    "elFormat\022\030\n\024PIXEL_FORMAT_DEFAULT\020\000\022\025\n\021PI"
+    "XEL_FORMAT_RGB8\020\001\022 \n\034PIXEL_FORMAT_DEPTH_"
+    "UINT16_MM\020\002*\235\001\n\017StreamAnnotator\022\030\n\024STREA"
+    "M_ANNOTATOR_ALL\020\000\022\032\n\026STREAM_ANNOTATOR_CO"
+    "LOR\020\001\022\032\n\026STREAM_ANNOTATOR_DEPTH\020\002\022\033\n\027STR"
+    "EAM_ANNOTATOR_BBOX2D\020\004\022\033\n\027STREAM_ANNOTAT"
+    "OR_CAMERA\020\010b\006proto3"
 };
 static ::absl::once_flag descriptor_table_client_5fstream_5fmessage_2eproto_once;
 const ::_pbi::DescriptorTable descriptor_table_client_5fstream_5fmessage_2eproto = {
     false,
     false,
-    647,
+    1939,
     descriptor_table_protodef_client_5fstream_5fmessage_2eproto,
     "client_stream_message.proto",
     &descriptor_table_client_5fstream_5fmessage_2eproto_once,
     nullptr,
     0,
-    7,
+    11,
     schemas,
     file_default_instances,
     TableStruct_client_5fstream_5fmessage_2eproto::offsets,
@@ -339,6 +562,33 @@ const ::_pbi::DescriptorTable descriptor_table_client_5fstream_5fmessage_2eproto
 PROTOBUF_ATTRIBUTE_WEAK const ::_pbi::DescriptorTable* descriptor_table_client_5fstream_5fmessage_2eproto_getter() {
   return &descriptor_table_client_5fstream_5fmessage_2eproto;
 }
+const ::google::protobuf::EnumDescriptor* ImageCodec_descriptor() {
+  ::google::protobuf::internal::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto);
+  return file_level_enum_descriptors_client_5fstream_5fmessage_2eproto[0];
+}
+PROTOBUF_CONSTINIT const uint32_t ImageCodec_internal_data_[] = {
+    393216u, 0u, };
+bool ImageCodec_IsValid(int value) {
+  return 0 <= value && value <= 5;
+}
+const ::google::protobuf::EnumDescriptor* PixelFormat_descriptor() {
+  ::google::protobuf::internal::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto);
+  return file_level_enum_descriptors_client_5fstream_5fmessage_2eproto[1];
+}
+PROTOBUF_CONSTINIT const uint32_t PixelFormat_internal_data_[] = {
+    196608u, 0u, };
+bool PixelFormat_IsValid(int value) {
+  return 0 <= value && value <= 2;
+}
+const ::google::protobuf::EnumDescriptor* StreamAnnotator_descriptor() {
+  ::google::protobuf::internal::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto);
+  return file_level_enum_descriptors_client_5fstream_5fmessage_2eproto[2];
+}
+PROTOBUF_CONSTINIT const uint32_t StreamAnnotator_internal_data_[] = {
+    196608u, 32u, 34u, };
+bool StreamAnnotator_IsValid(int value) {
+  return 0 <= value && value <= 8 && ((279u >> value) & 1) != 0;
+}
 // ===================================================================
 
 class BBox2DType::_Internal {
@@ -936,7 +1186,8 @@ inline PROTOBUF_NDEBUG_INLINE BBox2D::Impl_::Impl_(
     const Impl_& from)
       : _has_bits_{from._has_bits_},
         _cached_size_{0},
-        data_{visibility, arena, from.data_} {}
+        data_{visibility, arena, from.data_},
+        packed_data_(arena, from.packed_data_) {}
 
 BBox2D::BBox2D(
     ::google::protobuf::Arena* arena,
@@ -958,7 +1209,8 @@ inline PROTOBUF_NDEBUG_INLINE BBox2D::Impl_::Impl_(
     ::google::protobuf::internal::InternalVisibility visibility,
     ::google::protobuf::Arena* arena)
       : _cached_size_{0},
-        data_{visibility, arena} {}
+        data_{visibility, arena},
+        packed_data_(arena) {}
 
 inline void BBox2D::SharedCtor(::_pb::Arena* arena) {
   new (&_impl_) Impl_(internal_visibility(), arena);
@@ -971,6 +1223,7 @@ BBox2D::~BBox2D() {
 }
 inline void BBox2D::SharedDtor() {
   ABSL_DCHECK(GetArena() == nullptr);
+  _impl_.packed_data_.Destroy();
   delete _impl_.info_;
   _impl_.~Impl_();
 }
@@ -997,6 +1250,7 @@ PROTOBUF_NOINLINE void BBox2D::Clear() {
   (void) cached_has_bits;
 
   _impl_.data_.Clear();
+  _impl_.packed_data_.ClearToEmpty();
   cached_has_bits = _impl_._has_bits_[0];
   if (cached_has_bits & 0x00000001u) {
     ABSL_DCHECK(_impl_.info_ != nullptr);
@@ -1014,15 +1268,15 @@ const char* BBox2D::_InternalParse(
 
 
 PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
-const ::_pbi::TcParseTable<1, 2, 2, 0, 2> BBox2D::_table_ = {
+const ::_pbi::TcParseTable<2, 3, 2, 0, 2> BBox2D::_table_ = {
   {
     PROTOBUF_FIELD_OFFSET(BBox2D, _impl_._has_bits_),
     0, // no _extensions_
-    2, 8,  // max_field_number, fast_idx_mask
+    3, 24,  // max_field_number, fast_idx_mask
     offsetof(decltype(_table_), field_lookup_table),
-    4294967292,  // skipmap
+    4294967288,  // skipmap
     offsetof(decltype(_table_), field_entries),
-    2,  // num_field_entries
+    3,  // num_field_entries
     2,  // num_aux_entries
     offsetof(decltype(_table_), aux_entries),
     &_BBox2D_default_instance_._instance,
@@ -1031,12 +1285,16 @@ const ::_pbi::TcParseTable<1, 2, 2, 0, 2> BBox2D::_table_ = {
     ::_pbi::TcParser::GetTable<::BBox2D>(),  // to_prefetch
     #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
   }, {{
-    // .BBox2DInfo info = 2;
-    {::_pbi::TcParser::FastMtS1,
-     {18, 0, 1, PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.info_)}},
+    {::_pbi::TcParser::MiniParse, {}},
     // repeated .BBox2DType data = 1;
     {::_pbi::TcParser::FastMtR1,
      {10, 63, 0, PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.data_)}},
+    // .BBox2DInfo info = 2;
+    {::_pbi::TcParser::FastMtS1,
+     {18, 0, 1, PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.info_)}},
+    // bytes packed_data = 3;
+    {::_pbi::TcParser::FastBS1,
+     {26, 63, 0, PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.packed_data_)}},
   }}, {{
     65535, 65535
   }}, {{
@@ -1046,6 +1304,9 @@ const ::_pbi::TcParseTable<1, 2, 2, 0, 2> BBox2D::_table_ = {
     // .BBox2DInfo info = 2;
     {PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.info_), _Internal::kHasBitsOffset + 0, 1,
     (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // bytes packed_data = 3;
+    {PROTOBUF_FIELD_OFFSET(BBox2D, _impl_.packed_data_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kBytes | ::_fl::kRepAString)},
   }}, {{
     {::_pbi::TcParser::GetTable<::BBox2DType>()},
     {::_pbi::TcParser::GetTable<::BBox2DInfo>()},
@@ -1078,6 +1339,12 @@ const ::_pbi::TcParseTable<1, 2, 2, 0, 2> BBox2D::_table_ = {
         2, *_impl_.info_, _impl_.info_->GetCachedSize(), target, stream);
   }
 
+  // bytes packed_data = 3;
+  if (!this->_internal_packed_data().empty()) {
+    const std::string& _s = this->_internal_packed_data();
+    target = stream->WriteBytesMaybeAliased(3, _s, target);
+  }
+
   if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
     target =
         ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
@@ -1100,6 +1367,12 @@ const ::_pbi::TcParseTable<1, 2, 2, 0, 2> BBox2D::_table_ = {
   for (const auto& msg : this->_internal_data()) {
     total_size += ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
   }
+  // bytes packed_data = 3;
+  if (!this->_internal_packed_data().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::BytesSize(
+                                    this->_internal_packed_data());
+  }
+
   // .BBox2DInfo info = 2;
   cached_has_bits = _impl_._has_bits_[0];
   if (cached_has_bits & 0x00000001u) {
@@ -1122,6 +1395,9 @@ void BBox2D::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::
 
   _this->_internal_mutable_data()->MergeFrom(
       from._internal_data());
+  if (!from._internal_packed_data().empty()) {
+    _this->_internal_set_packed_data(from._internal_packed_data());
+  }
   cached_has_bits = from._impl_._has_bits_[0];
   if (cached_has_bits & 0x00000001u) {
     ABSL_DCHECK(from._impl_.info_ != nullptr);
@@ -1149,9 +1425,12 @@ PROTOBUF_NOINLINE bool BBox2D::IsInitialized() const {
 
 void BBox2D::InternalSwap(BBox2D* PROTOBUF_RESTRICT other) {
   using std::swap;
+  auto* arena = GetArena();
+  ABSL_DCHECK_EQ(arena, other->GetArena());
   _internal_metadata_.InternalSwap(&other->_internal_metadata_);
   swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
   _impl_.data_.InternalSwap(&other->_impl_.data_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.packed_data_, &other->_impl_.packed_data_, arena);
   swap(_impl_.info_, other->_impl_.info_);
 }
 
@@ -1499,6 +1778,7 @@ Camera::Camera(
   _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
       from._internal_metadata_);
   new (&_impl_) Impl_(internal_visibility(), arena, from._impl_);
+  _impl_.pose_version_ = from._impl_.pose_version_;
 
   // @@protoc_insertion_point(copy_constructor:Camera)
 }
@@ -1512,6 +1792,7 @@ inline PROTOBUF_NDEBUG_INLINE Camera::Impl_::Impl_(
 
 inline void Camera::SharedCtor(::_pb::Arena* arena) {
   new (&_impl_) Impl_(internal_visibility(), arena);
+  _impl_.pose_version_ = {};
 }
 Camera::~Camera() {
   // @@protoc_insertion_point(destructor:Camera)
@@ -1547,6 +1828,7 @@ PROTOBUF_NOINLINE void Camera::Clear() {
   _impl_.view_matrix_ros_.Clear();
   _impl_.camera_scale_.Clear();
   _impl_.intrinsics_matrix_.Clear();
+  _impl_.pose_version_ = 0u;
   _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
 }
 
@@ -1558,15 +1840,15 @@ const char* Camera::_InternalParse(
 
 
 PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
-const ::_pbi::TcParseTable<2, 3, 0, 0, 2> Camera::_table_ = {
+const ::_pbi::TcParseTable<2, 4, 0, 0, 2> Camera::_table_ = {
   {
     0,  // no _has_bits_
     0, // no _extensions_
-    3, 24,  // max_field_number, fast_idx_mask
+    4, 24,  // max_field_number, fast_idx_mask
     offsetof(decltype(_table_), field_lookup_table),
-    4294967288,  // skipmap
+    4294967280,  // skipmap
     offsetof(decltype(_table_), field_entries),
-    3,  // num_field_entries
+    4,  // num_field_entries
     0,  // num_aux_entries
     offsetof(decltype(_table_), field_names),  // no aux_entries
     &_Camera_default_instance_._instance,
@@ -1575,7 +1857,9 @@ const ::_pbi::TcParseTable<2, 3, 0, 0, 2> Camera::_table_ = {
     ::_pbi::TcParser::GetTable<::Camera>(),  // to_prefetch
     #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
   }, {{
-    {::_pbi::TcParser::MiniParse, {}},
+    // uint32 pose_version = 4;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(Camera, _impl_.pose_version_), 63>(),
+     {32, 63, 0, PROTOBUF_FIELD_OFFSET(Camera, _impl_.pose_version_)}},
     // repeated double view_matrix_ros = 1;
     {::_pbi::TcParser::FastF64P1,
      {10, 63, 0, PROTOBUF_FIELD_OFFSET(Camera, _impl_.view_matrix_ros_)}},
@@ -1597,6 +1881,9 @@ const ::_pbi::TcParseTable<2, 3, 0, 0, 2> Camera::_table_ = {
     // repeated double intrinsics_matrix = 3;
     {PROTOBUF_FIELD_OFFSET(Camera, _impl_.intrinsics_matrix_), 0, 0,
     (0 | ::_fl::kFcRepeated | ::_fl::kPackedDouble)},
+    // uint32 pose_version = 4;
+    {PROTOBUF_FIELD_OFFSET(Camera, _impl_.pose_version_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
   }},
   // no aux_entries
   {{
@@ -1625,6 +1912,13 @@ const ::_pbi::TcParseTable<2, 3, 0, 0, 2> Camera::_table_ = {
     target = stream->WriteFixedPacked(3, _internal_intrinsics_matrix(), target);
   }
 
+  // uint32 pose_version = 4;
+  if (this->_internal_pose_version() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        4, this->_internal_pose_version(), target);
+  }
+
   if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
     target =
         ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
@@ -1678,6 +1972,12 @@ const ::_pbi::TcParseTable<2, 3, 0, 0, 2> Camera::_table_ = {
     ;
     total_size += tag_size + data_size;
   }
+  // uint32 pose_version = 4;
+  if (this->_internal_pose_version() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_pose_version());
+  }
+
   return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
 }
 
@@ -1693,6 +1993,9 @@ void Camera::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::
   _this->_internal_mutable_view_matrix_ros()->MergeFrom(from._internal_view_matrix_ros());
   _this->_internal_mutable_camera_scale()->MergeFrom(from._internal_camera_scale());
   _this->_internal_mutable_intrinsics_matrix()->MergeFrom(from._internal_intrinsics_matrix());
+  if (from._internal_pose_version() != 0) {
+    _this->_impl_.pose_version_ = from._impl_.pose_version_;
+  }
   _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
 }
 
@@ -1713,6 +2016,7 @@ void Camera::InternalSwap(Camera* PROTOBUF_RESTRICT other) {
   _impl_.view_matrix_ros_.InternalSwap(&other->_impl_.view_matrix_ros_);
   _impl_.camera_scale_.InternalSwap(&other->_impl_.camera_scale_);
   _impl_.intrinsics_matrix_.InternalSwap(&other->_impl_.intrinsics_matrix_);
+        swap(_impl_.pose_version_, other->_impl_.pose_version_);
 }
 
 ::google::protobuf::Metadata Camera::GetMetadata() const {
@@ -1722,122 +2026,97 @@ void Camera::InternalSwap(Camera* PROTOBUF_RESTRICT other) {
 }
 // ===================================================================
 
-class ClientStreamMessage::_Internal {
+SessionState_IdToLabelsEntry_DoNotUse::SessionState_IdToLabelsEntry_DoNotUse() {}
+SessionState_IdToLabelsEntry_DoNotUse::SessionState_IdToLabelsEntry_DoNotUse(::google::protobuf::Arena* arena)
+    : SuperType(arena) {}
+::google::protobuf::Metadata SessionState_IdToLabelsEntry_DoNotUse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto_getter,
+                                   &descriptor_table_client_5fstream_5fmessage_2eproto_once,
+                                   file_level_metadata_client_5fstream_5fmessage_2eproto[6]);
+}
+// ===================================================================
+
+class SessionState::_Internal {
  public:
-  using HasBits = decltype(std::declval<ClientStreamMessage>()._impl_._has_bits_);
-  static constexpr ::int32_t kHasBitsOffset =
-    8 * PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._has_bits_);
 };
 
-ClientStreamMessage::ClientStreamMessage(::google::protobuf::Arena* arena)
+SessionState::SessionState(::google::protobuf::Arena* arena)
     : ::google::protobuf::Message(arena) {
   SharedCtor(arena);
-  // @@protoc_insertion_point(arena_constructor:ClientStreamMessage)
+  // @@protoc_insertion_point(arena_constructor:SessionState)
 }
-inline PROTOBUF_NDEBUG_INLINE ClientStreamMessage::Impl_::Impl_(
+inline PROTOBUF_NDEBUG_INLINE SessionState::Impl_::Impl_(
     ::google::protobuf::internal::InternalVisibility visibility, ::google::protobuf::Arena* arena,
     const Impl_& from)
-      : _has_bits_{from._has_bits_},
-        _cached_size_{0},
-        color_image_(arena, from.color_image_),
-        depth_image_(arena, from.depth_image_) {}
+      : idtolabels_{visibility, arena, from.idtolabels_},
+        intrinsics_matrix_{visibility, arena, from.intrinsics_matrix_},
+        camera_scale_{visibility, arena, from.camera_scale_},
+        _cached_size_{0} {}
 
-ClientStreamMessage::ClientStreamMessage(
+SessionState::SessionState(
     ::google::protobuf::Arena* arena,
-    const ClientStreamMessage& from)
+    const SessionState& from)
     : ::google::protobuf::Message(arena) {
-  ClientStreamMessage* const _this = this;
+  SessionState* const _this = this;
   (void)_this;
   _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
       from._internal_metadata_);
   new (&_impl_) Impl_(internal_visibility(), arena, from._impl_);
-  ::uint32_t cached_has_bits = _impl_._has_bits_[0];
-  _impl_.bbox2d_ = (cached_has_bits & 0x00000001u) ? ::google::protobuf::Message::CopyConstruct<::BBox2D>(
-                              arena, *from._impl_.bbox2d_)
-                        : nullptr;
-  _impl_.clock_ = (cached_has_bits & 0x00000002u) ? ::google::protobuf::Message::CopyConstruct<::Clock>(
-                              arena, *from._impl_.clock_)
-                        : nullptr;
-  _impl_.camera_ = (cached_has_bits & 0x00000004u) ? ::google::protobuf::Message::CopyConstruct<::Camera>(
-                              arena, *from._impl_.camera_)
-                        : nullptr;
+  _impl_.version_ = from._impl_.version_;
 
-  // @@protoc_insertion_point(copy_constructor:ClientStreamMessage)
+  // @@protoc_insertion_point(copy_constructor:SessionState)
 }
-inline PROTOBUF_NDEBUG_INLINE ClientStreamMessage::Impl_::Impl_(
+inline PROTOBUF_NDEBUG_INLINE SessionState::Impl_::Impl_(
     ::google::protobuf::internal::InternalVisibility visibility,
     ::google::protobuf::Arena* arena)
-      : _cached_size_{0},
-        color_image_(arena),
-        depth_image_(arena) {}
+      : idtolabels_{visibility, arena},
+        intrinsics_matrix_{visibility, arena},
+        camera_scale_{visibility, arena},
+        _cached_size_{0} {}
 
-inline void ClientStreamMessage::SharedCtor(::_pb::Arena* arena) {
+inline void SessionState::SharedCtor(::_pb::Arena* arena) {
   new (&_impl_) Impl_(internal_visibility(), arena);
-  ::memset(reinterpret_cast<char *>(&_impl_) +
-               offsetof(Impl_, bbox2d_),
-           0,
-           offsetof(Impl_, camera_) -
-               offsetof(Impl_, bbox2d_) +
-               sizeof(Impl_::camera_));
+  _impl_.version_ = {};
 }
-ClientStreamMessage::~ClientStreamMessage() {
-  // @@protoc_insertion_point(destructor:ClientStreamMessage)
+SessionState::~SessionState() {
+  // @@protoc_insertion_point(destructor:SessionState)
   _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
   SharedDtor();
 }
-inline void ClientStreamMessage::SharedDtor() {
+inline void SessionState::SharedDtor() {
   ABSL_DCHECK(GetArena() == nullptr);
-  _impl_.color_image_.Destroy();
-  _impl_.depth_image_.Destroy();
-  delete _impl_.bbox2d_;
-  delete _impl_.clock_;
-  delete _impl_.camera_;
   _impl_.~Impl_();
 }
 
 const ::google::protobuf::MessageLite::ClassData*
-ClientStreamMessage::GetClassData() const {
+SessionState::GetClassData() const {
   PROTOBUF_CONSTINIT static const ::google::protobuf::MessageLite::
       ClassDataFull _data_ = {
           {
               nullptr,  // OnDemandRegisterArenaDtor
-              PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._cached_size_),
+              PROTOBUF_FIELD_OFFSET(SessionState, _impl_._cached_size_),
               false,
           },
-          &ClientStreamMessage::MergeImpl,
-          &ClientStreamMessage::kDescriptorMethods,
+          &SessionState::MergeImpl,
+          &SessionState::kDescriptorMethods,
       };
   return &_data_;
 }
-PROTOBUF_NOINLINE void ClientStreamMessage::Clear() {
-// @@protoc_insertion_point(message_clear_start:ClientStreamMessage)
+PROTOBUF_NOINLINE void SessionState::Clear() {
+// @@protoc_insertion_point(message_clear_start:SessionState)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ::uint32_t cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  _impl_.color_image_.ClearToEmpty();
-  _impl_.depth_image_.ClearToEmpty();
-  cached_has_bits = _impl_._has_bits_[0];
-  if (cached_has_bits & 0x00000007u) {
-    if (cached_has_bits & 0x00000001u) {
-      ABSL_DCHECK(_impl_.bbox2d_ != nullptr);
-      _impl_.bbox2d_->Clear();
-    }
-    if (cached_has_bits & 0x00000002u) {
-      ABSL_DCHECK(_impl_.clock_ != nullptr);
-      _impl_.clock_->Clear();
-    }
-    if (cached_has_bits & 0x00000004u) {
-      ABSL_DCHECK(_impl_.camera_ != nullptr);
-      _impl_.camera_->Clear();
-    }
-  }
-  _impl_._has_bits_.Clear();
+  _impl_.idtolabels_.Clear();
+  _impl_.intrinsics_matrix_.Clear();
+  _impl_.camera_scale_.Clear();
+  _impl_.version_ = 0u;
   _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
 }
 
-const char* ClientStreamMessage::_InternalParse(
+const char* SessionState::_InternalParse(
     const char* ptr, ::_pbi::ParseContext* ctx) {
   ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
   return ptr;
@@ -1845,64 +2124,1212 @@ const char* ClientStreamMessage::_InternalParse(
 
 
 PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
-const ::_pbi::TcParseTable<3, 5, 3, 0, 2> ClientStreamMessage::_table_ = {
+const ::_pbi::TcParseTable<2, 4, 1, 31, 2> SessionState::_table_ = {
   {
-    PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._has_bits_),
+    0,  // no _has_bits_
     0, // no _extensions_
-    5, 56,  // max_field_number, fast_idx_mask
+    4, 24,  // max_field_number, fast_idx_mask
     offsetof(decltype(_table_), field_lookup_table),
-    4294967264,  // skipmap
+    4294967280,  // skipmap
     offsetof(decltype(_table_), field_entries),
-    5,  // num_field_entries
-    3,  // num_aux_entries
+    4,  // num_field_entries
+    1,  // num_aux_entries
     offsetof(decltype(_table_), aux_entries),
-    &_ClientStreamMessage_default_instance_._instance,
+    &_SessionState_default_instance_._instance,
     ::_pbi::TcParser::GenericFallback,  // fallback
     #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
-    ::_pbi::TcParser::GetTable<::ClientStreamMessage>(),  // to_prefetch
+    ::_pbi::TcParser::GetTable<::SessionState>(),  // to_prefetch
     #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
   }, {{
+    // repeated double camera_scale = 4;
+    {::_pbi::TcParser::FastF64P1,
+     {34, 63, 0, PROTOBUF_FIELD_OFFSET(SessionState, _impl_.camera_scale_)}},
+    // uint32 version = 1;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(SessionState, _impl_.version_), 63>(),
+     {8, 63, 0, PROTOBUF_FIELD_OFFSET(SessionState, _impl_.version_)}},
     {::_pbi::TcParser::MiniParse, {}},
-    // .BBox2D bbox2d = 1;
-    {::_pbi::TcParser::FastMtS1,
-     {10, 0, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.bbox2d_)}},
-    // .Clock clock = 2;
-    {::_pbi::TcParser::FastMtS1,
-     {18, 1, 1, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.clock_)}},
-    // .Camera camera = 3;
-    {::_pbi::TcParser::FastMtS1,
-     {26, 2, 2, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.camera_)}},
-    // bytes color_image = 4;
-    {::_pbi::TcParser::FastBS1,
-     {34, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_)}},
-    // bytes depth_image = 5;
-    {::_pbi::TcParser::FastBS1,
-     {42, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_)}},
-    {::_pbi::TcParser::MiniParse, {}},
-    {::_pbi::TcParser::MiniParse, {}},
+    // repeated double intrinsics_matrix = 3;
+    {::_pbi::TcParser::FastF64P1,
+     {26, 63, 0, PROTOBUF_FIELD_OFFSET(SessionState, _impl_.intrinsics_matrix_)}},
   }}, {{
     65535, 65535
   }}, {{
-    // .BBox2D bbox2d = 1;
-    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.bbox2d_), _Internal::kHasBitsOffset + 0, 0,
-    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
-    // .Clock clock = 2;
-    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.clock_), _Internal::kHasBitsOffset + 1, 1,
-    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
-    // .Camera camera = 3;
-    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.camera_), _Internal::kHasBitsOffset + 2, 2,
-    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
-    // bytes color_image = 4;
-    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_), -1, 0,
-    (0 | ::_fl::kFcSingular | ::_fl::kBytes | ::_fl::kRepAString)},
-    // bytes depth_image = 5;
-    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_), -1, 0,
-    (0 | ::_fl::kFcSingular | ::_fl::kBytes | ::_fl::kRepAString)},
-  }}, {{
+    // uint32 version = 1;
+    {PROTOBUF_FIELD_OFFSET(SessionState, _impl_.version_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // map<string, string> idToLabels = 2;
+    {PROTOBUF_FIELD_OFFSET(SessionState, _impl_.idtolabels_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMap)},
+    // repeated double intrinsics_matrix = 3;
+    {PROTOBUF_FIELD_OFFSET(SessionState, _impl_.intrinsics_matrix_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kPackedDouble)},
+    // repeated double camera_scale = 4;
+    {PROTOBUF_FIELD_OFFSET(SessionState, _impl_.camera_scale_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kPackedDouble)},
+  }}, {{
+    {::_pbi::TcParser::GetMapAuxInfo<
+        decltype(SessionState()._impl_.idtolabels_)>(
+        1, 0, 0, 9,
+        9)},
+  }}, {{
+    "\14\0\12\0\0\0\0\0"
+    "SessionState"
+    "idToLabels"
+  }},
+};
+
+::uint8_t* SessionState::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:SessionState)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // uint32 version = 1;
+  if (this->_internal_version() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        1, this->_internal_version(), target);
+  }
+
+  // map<string, string> idToLabels = 2;
+  if (!_internal_idtolabels().empty()) {
+    using MapType = ::google::protobuf::Map<std::string, std::string>;
+    using WireHelper = _pbi::MapEntryFuncs<std::string, std::string,
+                                   _pbi::WireFormatLite::TYPE_STRING,
+                                   _pbi::WireFormatLite::TYPE_STRING>;
+    const auto& field = _internal_idtolabels();
+
+    if (stream->IsSerializationDeterministic() && field.size() > 1) {
+      for (const auto& entry : ::google::protobuf::internal::MapSorterPtr<MapType>(field)) {
+        target = WireHelper::InternalSerialize(
+            2, entry.first, entry.second, target, stream);
+        ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+            entry.first.data(), static_cast<int>(entry.first.length()),
+ ::google::protobuf::internal::WireFormatLite::SERIALIZE, "SessionState.idToLabels");
+        ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+            entry.second.data(), static_cast<int>(entry.second.length()),
+ ::google::protobuf::internal::WireFormatLite::SERIALIZE, "SessionState.idToLabels");
+      }
+    } else {
+      for (const auto& entry : field) {
+        target = WireHelper::InternalSerialize(
+            2, entry.first, entry.second, target, stream);
+        ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+            entry.first.data(), static_cast<int>(entry.first.length()),
+ ::google::protobuf::internal::WireFormatLite::SERIALIZE, "SessionState.idToLabels");
+        ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+            entry.second.data(), static_cast<int>(entry.second.length()),
+ ::google::protobuf::internal::WireFormatLite::SERIALIZE, "SessionState.idToLabels");
+      }
+    }
+  }
+
+  // repeated double intrinsics_matrix = 3;
+  if (this->_internal_intrinsics_matrix_size() > 0) {
+    target = stream->WriteFixedPacked(3, _internal_intrinsics_matrix(), target);
+  }
+
+  // repeated double camera_scale = 4;
+  if (this->_internal_camera_scale_size() > 0) {
+    target = stream->WriteFixedPacked(4, _internal_camera_scale(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:SessionState)
+  return target;
+}
+
+::size_t SessionState::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:SessionState)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // map<string, string> idToLabels = 2;
+  total_size += 1 * ::google::protobuf::internal::FromIntSize(_internal_idtolabels_size());
+  for (const auto& entry : _internal_idtolabels()) {
+    total_size += _pbi::MapEntryFuncs<std::string, std::string,
+                                   _pbi::WireFormatLite::TYPE_STRING,
+                                   _pbi::WireFormatLite::TYPE_STRING>::ByteSizeLong(entry.first, entry.second);
+  }
+  // repeated double intrinsics_matrix = 3;
+  {
+    std::size_t data_size = std::size_t{8} *
+        ::_pbi::FromIntSize(this->_internal_intrinsics_matrix_size())
+    ;
+    std::size_t tag_size = data_size == 0
+        ? 0
+        : 1 + ::_pbi::WireFormatLite::Int32Size(
+                            static_cast<int32_t>(data_size))
+    ;
+    total_size += tag_size + data_size;
+  }
+  // repeated double camera_scale = 4;
+  {
+    std::size_t data_size = std::size_t{8} *
+        ::_pbi::FromIntSize(this->_internal_camera_scale_size())
+    ;
+    std::size_t tag_size = data_size == 0
+        ? 0
+        : 1 + ::_pbi::WireFormatLite::Int32Size(
+                            static_cast<int32_t>(data_size))
+    ;
+    total_size += tag_size + data_size;
+  }
+  // uint32 version = 1;
+  if (this->_internal_version() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_version());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+
+void SessionState::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<SessionState*>(&to_msg);
+  auto& from = static_cast<const SessionState&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:SessionState)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.idtolabels_.MergeFrom(from._impl_.idtolabels_);
+  _this->_internal_mutable_intrinsics_matrix()->MergeFrom(from._internal_intrinsics_matrix());
+  _this->_internal_mutable_camera_scale()->MergeFrom(from._internal_camera_scale());
+  if (from._internal_version() != 0) {
+    _this->_impl_.version_ = from._impl_.version_;
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void SessionState::CopyFrom(const SessionState& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:SessionState)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool SessionState::IsInitialized() const {
+  return true;
+}
+
+void SessionState::InternalSwap(SessionState* PROTOBUF_RESTRICT other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.idtolabels_.InternalSwap(&other->_impl_.idtolabels_);
+  _impl_.intrinsics_matrix_.InternalSwap(&other->_impl_.intrinsics_matrix_);
+  _impl_.camera_scale_.InternalSwap(&other->_impl_.camera_scale_);
+        swap(_impl_.version_, other->_impl_.version_);
+}
+
+::google::protobuf::Metadata SessionState::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto_getter,
+                                   &descriptor_table_client_5fstream_5fmessage_2eproto_once,
+                                   file_level_metadata_client_5fstream_5fmessage_2eproto[7]);
+}
+// ===================================================================
+
+class FrameTrace::_Internal {
+ public:
+};
+
+FrameTrace::FrameTrace(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:FrameTrace)
+}
+FrameTrace::FrameTrace(
+    ::google::protobuf::Arena* arena, const FrameTrace& from)
+    : FrameTrace(arena) {
+  MergeFrom(from);
+}
+inline PROTOBUF_NDEBUG_INLINE FrameTrace::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* arena)
+      : _cached_size_{0} {}
+
+inline void FrameTrace::SharedCtor(::_pb::Arena* arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+  ::memset(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, frame_id_),
+           0,
+           offsetof(Impl_, command_apply_time_) -
+               offsetof(Impl_, frame_id_) +
+               sizeof(Impl_::command_apply_time_));
+}
+FrameTrace::~FrameTrace() {
+  // @@protoc_insertion_point(destructor:FrameTrace)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void FrameTrace::SharedDtor() {
+  ABSL_DCHECK(GetArena() == nullptr);
+  _impl_.~Impl_();
+}
+
+const ::google::protobuf::MessageLite::ClassData*
+FrameTrace::GetClassData() const {
+  PROTOBUF_CONSTINIT static const ::google::protobuf::MessageLite::
+      ClassDataFull _data_ = {
+          {
+              nullptr,  // OnDemandRegisterArenaDtor
+              PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_._cached_size_),
+              false,
+          },
+          &FrameTrace::MergeImpl,
+          &FrameTrace::kDescriptorMethods,
+      };
+  return &_data_;
+}
+PROTOBUF_NOINLINE void FrameTrace::Clear() {
+// @@protoc_insertion_point(message_clear_start:FrameTrace)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  ::memset(&_impl_.frame_id_, 0, static_cast<::size_t>(
+      reinterpret_cast<char*>(&_impl_.command_apply_time_) -
+      reinterpret_cast<char*>(&_impl_.frame_id_)) + sizeof(_impl_.command_apply_time_));
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* FrameTrace::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<3, 6, 0, 0, 2> FrameTrace::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    6, 56,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967232,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    6,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_FrameTrace_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::FrameTrace>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    {::_pbi::TcParser::MiniParse, {}},
+    // uint64 frame_id = 1;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint64_t, offsetof(FrameTrace, _impl_.frame_id_), 63>(),
+     {8, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.frame_id_)}},
+    // double render_time = 2;
+    {::_pbi::TcParser::FastF64S1,
+     {17, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.render_time_)}},
+    // double send_time = 3;
+    {::_pbi::TcParser::FastF64S1,
+     {25, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.send_time_)}},
+    // uint64 command_id = 4;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint64_t, offsetof(FrameTrace, _impl_.command_id_), 63>(),
+     {32, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_id_)}},
+    // double command_send_time = 5;
+    {::_pbi::TcParser::FastF64S1,
+     {41, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_send_time_)}},
+    // double command_apply_time = 6;
+    {::_pbi::TcParser::FastF64S1,
+     {49, 63, 0, PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_apply_time_)}},
+    {::_pbi::TcParser::MiniParse, {}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // uint64 frame_id = 1;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.frame_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt64)},
+    // double render_time = 2;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.render_time_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kDouble)},
+    // double send_time = 3;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.send_time_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kDouble)},
+    // uint64 command_id = 4;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt64)},
+    // double command_send_time = 5;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_send_time_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kDouble)},
+    // double command_apply_time = 6;
+    {PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_apply_time_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kDouble)},
+  }},
+  // no aux_entries
+  {{
+  }},
+};
+
+::uint8_t* FrameTrace::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:FrameTrace)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // uint64 frame_id = 1;
+  if (this->_internal_frame_id() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt64ToArray(
+        1, this->_internal_frame_id(), target);
+  }
+
+  // double render_time = 2;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_render_time = this->_internal_render_time();
+  ::uint64_t raw_render_time;
+  memcpy(&raw_render_time, &tmp_render_time, sizeof(tmp_render_time));
+  if (raw_render_time != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(
+        2, this->_internal_render_time(), target);
+  }
+
+  // double send_time = 3;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_send_time = this->_internal_send_time();
+  ::uint64_t raw_send_time;
+  memcpy(&raw_send_time, &tmp_send_time, sizeof(tmp_send_time));
+  if (raw_send_time != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(
+        3, this->_internal_send_time(), target);
+  }
+
+  // uint64 command_id = 4;
+  if (this->_internal_command_id() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt64ToArray(
+        4, this->_internal_command_id(), target);
+  }
+
+  // double command_send_time = 5;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_send_time = this->_internal_command_send_time();
+  ::uint64_t raw_command_send_time;
+  memcpy(&raw_command_send_time, &tmp_command_send_time, sizeof(tmp_command_send_time));
+  if (raw_command_send_time != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(
+        5, this->_internal_command_send_time(), target);
+  }
+
+  // double command_apply_time = 6;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_apply_time = this->_internal_command_apply_time();
+  ::uint64_t raw_command_apply_time;
+  memcpy(&raw_command_apply_time, &tmp_command_apply_time, sizeof(tmp_command_apply_time));
+  if (raw_command_apply_time != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(
+        6, this->_internal_command_apply_time(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:FrameTrace)
+  return target;
+}
+
+::size_t FrameTrace::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:FrameTrace)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // uint64 frame_id = 1;
+  if (this->_internal_frame_id() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt64SizePlusOne(
+        this->_internal_frame_id());
+  }
+
+  // double render_time = 2;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_render_time = this->_internal_render_time();
+  ::uint64_t raw_render_time;
+  memcpy(&raw_render_time, &tmp_render_time, sizeof(tmp_render_time));
+  if (raw_render_time != 0) {
+    total_size += 9;
+  }
+
+  // double send_time = 3;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_send_time = this->_internal_send_time();
+  ::uint64_t raw_send_time;
+  memcpy(&raw_send_time, &tmp_send_time, sizeof(tmp_send_time));
+  if (raw_send_time != 0) {
+    total_size += 9;
+  }
+
+  // uint64 command_id = 4;
+  if (this->_internal_command_id() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt64SizePlusOne(
+        this->_internal_command_id());
+  }
+
+  // double command_send_time = 5;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_send_time = this->_internal_command_send_time();
+  ::uint64_t raw_command_send_time;
+  memcpy(&raw_command_send_time, &tmp_command_send_time, sizeof(tmp_command_send_time));
+  if (raw_command_send_time != 0) {
+    total_size += 9;
+  }
+
+  // double command_apply_time = 6;
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_apply_time = this->_internal_command_apply_time();
+  ::uint64_t raw_command_apply_time;
+  memcpy(&raw_command_apply_time, &tmp_command_apply_time, sizeof(tmp_command_apply_time));
+  if (raw_command_apply_time != 0) {
+    total_size += 9;
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+
+void FrameTrace::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<FrameTrace*>(&to_msg);
+  auto& from = static_cast<const FrameTrace&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:FrameTrace)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from._internal_frame_id() != 0) {
+    _this->_impl_.frame_id_ = from._impl_.frame_id_;
+  }
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_render_time = from._internal_render_time();
+  ::uint64_t raw_render_time;
+  memcpy(&raw_render_time, &tmp_render_time, sizeof(tmp_render_time));
+  if (raw_render_time != 0) {
+    _this->_impl_.render_time_ = from._impl_.render_time_;
+  }
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_send_time = from._internal_send_time();
+  ::uint64_t raw_send_time;
+  memcpy(&raw_send_time, &tmp_send_time, sizeof(tmp_send_time));
+  if (raw_send_time != 0) {
+    _this->_impl_.send_time_ = from._impl_.send_time_;
+  }
+  if (from._internal_command_id() != 0) {
+    _this->_impl_.command_id_ = from._impl_.command_id_;
+  }
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_send_time = from._internal_command_send_time();
+  ::uint64_t raw_command_send_time;
+  memcpy(&raw_command_send_time, &tmp_command_send_time, sizeof(tmp_command_send_time));
+  if (raw_command_send_time != 0) {
+    _this->_impl_.command_send_time_ = from._impl_.command_send_time_;
+  }
+  static_assert(sizeof(::uint64_t) == sizeof(double),
+                "Code assumes ::uint64_t and double are the same size.");
+  double tmp_command_apply_time = from._internal_command_apply_time();
+  ::uint64_t raw_command_apply_time;
+  memcpy(&raw_command_apply_time, &tmp_command_apply_time, sizeof(tmp_command_apply_time));
+  if (raw_command_apply_time != 0) {
+    _this->_impl_.command_apply_time_ = from._impl_.command_apply_time_;
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void FrameTrace::CopyFrom(const FrameTrace& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:FrameTrace)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool FrameTrace::IsInitialized() const {
+  return true;
+}
+
+void FrameTrace::InternalSwap(FrameTrace* PROTOBUF_RESTRICT other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::google::protobuf::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.command_apply_time_)
+      + sizeof(FrameTrace::_impl_.command_apply_time_)
+      - PROTOBUF_FIELD_OFFSET(FrameTrace, _impl_.frame_id_)>(
+          reinterpret_cast<char*>(&_impl_.frame_id_),
+          reinterpret_cast<char*>(&other->_impl_.frame_id_));
+}
+
+::google::protobuf::Metadata FrameTrace::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto_getter,
+                                   &descriptor_table_client_5fstream_5fmessage_2eproto_once,
+                                   file_level_metadata_client_5fstream_5fmessage_2eproto[8]);
+}
+// ===================================================================
+
+class ImageRegion::_Internal {
+ public:
+};
+
+ImageRegion::ImageRegion(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:ImageRegion)
+}
+ImageRegion::ImageRegion(
+    ::google::protobuf::Arena* arena, const ImageRegion& from)
+    : ImageRegion(arena) {
+  MergeFrom(from);
+}
+inline PROTOBUF_NDEBUG_INLINE ImageRegion::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* arena)
+      : _cached_size_{0} {}
+
+inline void ImageRegion::SharedCtor(::_pb::Arena* arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+  ::memset(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, x_),
+           0,
+           offsetof(Impl_, image_height_) -
+               offsetof(Impl_, x_) +
+               sizeof(Impl_::image_height_));
+}
+ImageRegion::~ImageRegion() {
+  // @@protoc_insertion_point(destructor:ImageRegion)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ImageRegion::SharedDtor() {
+  ABSL_DCHECK(GetArena() == nullptr);
+  _impl_.~Impl_();
+}
+
+const ::google::protobuf::MessageLite::ClassData*
+ImageRegion::GetClassData() const {
+  PROTOBUF_CONSTINIT static const ::google::protobuf::MessageLite::
+      ClassDataFull _data_ = {
+          {
+              nullptr,  // OnDemandRegisterArenaDtor
+              PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_._cached_size_),
+              false,
+          },
+          &ImageRegion::MergeImpl,
+          &ImageRegion::kDescriptorMethods,
+      };
+  return &_data_;
+}
+PROTOBUF_NOINLINE void ImageRegion::Clear() {
+// @@protoc_insertion_point(message_clear_start:ImageRegion)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  ::memset(&_impl_.x_, 0, static_cast<::size_t>(
+      reinterpret_cast<char*>(&_impl_.image_height_) -
+      reinterpret_cast<char*>(&_impl_.x_)) + sizeof(_impl_.image_height_));
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ImageRegion::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<3, 7, 0, 0, 2> ImageRegion::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    7, 56,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967168,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    7,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_ImageRegion_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::ImageRegion>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    {::_pbi::TcParser::MiniParse, {}},
+    // uint32 x = 1;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.x_), 63>(),
+     {8, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.x_)}},
+    // uint32 y = 2;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.y_), 63>(),
+     {16, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.y_)}},
+    // uint32 width = 3;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.width_), 63>(),
+     {24, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.width_)}},
+    // uint32 height = 4;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.height_), 63>(),
+     {32, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.height_)}},
+    // uint32 downscale = 5;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.downscale_), 63>(),
+     {40, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.downscale_)}},
+    // uint32 image_width = 6;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.image_width_), 63>(),
+     {48, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.image_width_)}},
+    // uint32 image_height = 7;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ImageRegion, _impl_.image_height_), 63>(),
+     {56, 63, 0, PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.image_height_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // uint32 x = 1;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.x_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 y = 2;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.y_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 width = 3;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.width_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 height = 4;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.height_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 downscale = 5;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.downscale_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 image_width = 6;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.image_width_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 image_height = 7;
+    {PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.image_height_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+  }},
+  // no aux_entries
+  {{
+  }},
+};
+
+::uint8_t* ImageRegion::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:ImageRegion)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // uint32 x = 1;
+  if (this->_internal_x() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        1, this->_internal_x(), target);
+  }
+
+  // uint32 y = 2;
+  if (this->_internal_y() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        2, this->_internal_y(), target);
+  }
+
+  // uint32 width = 3;
+  if (this->_internal_width() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        3, this->_internal_width(), target);
+  }
+
+  // uint32 height = 4;
+  if (this->_internal_height() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        4, this->_internal_height(), target);
+  }
+
+  // uint32 downscale = 5;
+  if (this->_internal_downscale() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        5, this->_internal_downscale(), target);
+  }
+
+  // uint32 image_width = 6;
+  if (this->_internal_image_width() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        6, this->_internal_image_width(), target);
+  }
+
+  // uint32 image_height = 7;
+  if (this->_internal_image_height() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        7, this->_internal_image_height(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:ImageRegion)
+  return target;
+}
+
+::size_t ImageRegion::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:ImageRegion)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // uint32 x = 1;
+  if (this->_internal_x() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_x());
+  }
+
+  // uint32 y = 2;
+  if (this->_internal_y() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_y());
+  }
+
+  // uint32 width = 3;
+  if (this->_internal_width() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_width());
+  }
+
+  // uint32 height = 4;
+  if (this->_internal_height() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_height());
+  }
+
+  // uint32 downscale = 5;
+  if (this->_internal_downscale() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_downscale());
+  }
+
+  // uint32 image_width = 6;
+  if (this->_internal_image_width() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_image_width());
+  }
+
+  // uint32 image_height = 7;
+  if (this->_internal_image_height() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_image_height());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+
+void ImageRegion::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<ImageRegion*>(&to_msg);
+  auto& from = static_cast<const ImageRegion&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:ImageRegion)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from._internal_x() != 0) {
+    _this->_impl_.x_ = from._impl_.x_;
+  }
+  if (from._internal_y() != 0) {
+    _this->_impl_.y_ = from._impl_.y_;
+  }
+  if (from._internal_width() != 0) {
+    _this->_impl_.width_ = from._impl_.width_;
+  }
+  if (from._internal_height() != 0) {
+    _this->_impl_.height_ = from._impl_.height_;
+  }
+  if (from._internal_downscale() != 0) {
+    _this->_impl_.downscale_ = from._impl_.downscale_;
+  }
+  if (from._internal_image_width() != 0) {
+    _this->_impl_.image_width_ = from._impl_.image_width_;
+  }
+  if (from._internal_image_height() != 0) {
+    _this->_impl_.image_height_ = from._impl_.image_height_;
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ImageRegion::CopyFrom(const ImageRegion& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:ImageRegion)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool ImageRegion::IsInitialized() const {
+  return true;
+}
+
+void ImageRegion::InternalSwap(ImageRegion* PROTOBUF_RESTRICT other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::google::protobuf::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.image_height_)
+      + sizeof(ImageRegion::_impl_.image_height_)
+      - PROTOBUF_FIELD_OFFSET(ImageRegion, _impl_.x_)>(
+          reinterpret_cast<char*>(&_impl_.x_),
+          reinterpret_cast<char*>(&other->_impl_.x_));
+}
+
+::google::protobuf::Metadata ImageRegion::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto_getter,
+                                   &descriptor_table_client_5fstream_5fmessage_2eproto_once,
+                                   file_level_metadata_client_5fstream_5fmessage_2eproto[9]);
+}
+// ===================================================================
+
+class ClientStreamMessage::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ClientStreamMessage>()._impl_._has_bits_);
+  static constexpr ::int32_t kHasBitsOffset =
+    8 * PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._has_bits_);
+};
+
+ClientStreamMessage::ClientStreamMessage(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:ClientStreamMessage)
+}
+inline PROTOBUF_NDEBUG_INLINE ClientStreamMessage::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility, ::google::protobuf::Arena* arena,
+    const Impl_& from)
+      : _has_bits_{from._has_bits_},
+        _cached_size_{0},
+        color_image_(arena, from.color_image_),
+        depth_image_(arena, from.depth_image_),
+        topic_(arena, from.topic_) {}
+
+ClientStreamMessage::ClientStreamMessage(
+    ::google::protobuf::Arena* arena,
+    const ClientStreamMessage& from)
+    : ::google::protobuf::Message(arena) {
+  ClientStreamMessage* const _this = this;
+  (void)_this;
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  new (&_impl_) Impl_(internal_visibility(), arena, from._impl_);
+  ::uint32_t cached_has_bits = _impl_._has_bits_[0];
+  _impl_.bbox2d_ = (cached_has_bits & 0x00000001u) ? ::google::protobuf::Message::CopyConstruct<::BBox2D>(
+                              arena, *from._impl_.bbox2d_)
+                        : nullptr;
+  _impl_.clock_ = (cached_has_bits & 0x00000002u) ? ::google::protobuf::Message::CopyConstruct<::Clock>(
+                              arena, *from._impl_.clock_)
+                        : nullptr;
+  _impl_.camera_ = (cached_has_bits & 0x00000004u) ? ::google::protobuf::Message::CopyConstruct<::Camera>(
+                              arena, *from._impl_.camera_)
+                        : nullptr;
+  _impl_.trace_ = (cached_has_bits & 0x00000008u) ? ::google::protobuf::Message::CopyConstruct<::FrameTrace>(
+                              arena, *from._impl_.trace_)
+                        : nullptr;
+  _impl_.session_ = (cached_has_bits & 0x00000010u) ? ::google::protobuf::Message::CopyConstruct<::SessionState>(
+                              arena, *from._impl_.session_)
+                        : nullptr;
+  _impl_.region_ = (cached_has_bits & 0x00000020u) ? ::google::protobuf::Message::CopyConstruct<::ImageRegion>(
+                              arena, *from._impl_.region_)
+                        : nullptr;
+  ::memcpy(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, color_image_frame_),
+           reinterpret_cast<const char *>(&from._impl_) +
+               offsetof(Impl_, color_image_frame_),
+           offsetof(Impl_, depth_format_) -
+               offsetof(Impl_, color_image_frame_) +
+               sizeof(Impl_::depth_format_));
+
+  // @@protoc_insertion_point(copy_constructor:ClientStreamMessage)
+}
+inline PROTOBUF_NDEBUG_INLINE ClientStreamMessage::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* arena)
+      : _cached_size_{0},
+        color_image_(arena),
+        depth_image_(arena),
+        topic_(arena) {}
+
+inline void ClientStreamMessage::SharedCtor(::_pb::Arena* arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+  ::memset(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, bbox2d_),
+           0,
+           offsetof(Impl_, depth_format_) -
+               offsetof(Impl_, bbox2d_) +
+               sizeof(Impl_::depth_format_));
+}
+ClientStreamMessage::~ClientStreamMessage() {
+  // @@protoc_insertion_point(destructor:ClientStreamMessage)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ClientStreamMessage::SharedDtor() {
+  ABSL_DCHECK(GetArena() == nullptr);
+  _impl_.color_image_.Destroy();
+  _impl_.depth_image_.Destroy();
+  _impl_.topic_.Destroy();
+  delete _impl_.bbox2d_;
+  delete _impl_.clock_;
+  delete _impl_.camera_;
+  delete _impl_.trace_;
+  delete _impl_.session_;
+  delete _impl_.region_;
+  _impl_.~Impl_();
+}
+
+const ::google::protobuf::MessageLite::ClassData*
+ClientStreamMessage::GetClassData() const {
+  PROTOBUF_CONSTINIT static const ::google::protobuf::MessageLite::
+      ClassDataFull _data_ = {
+          {
+              nullptr,  // OnDemandRegisterArenaDtor
+              PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._cached_size_),
+              false,
+          },
+          &ClientStreamMessage::MergeImpl,
+          &ClientStreamMessage::kDescriptorMethods,
+      };
+  return &_data_;
+}
+PROTOBUF_NOINLINE void ClientStreamMessage::Clear() {
+// @@protoc_insertion_point(message_clear_start:ClientStreamMessage)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.color_image_.ClearToEmpty();
+  _impl_.depth_image_.ClearToEmpty();
+  _impl_.topic_.ClearToEmpty();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      ABSL_DCHECK(_impl_.bbox2d_ != nullptr);
+      _impl_.bbox2d_->Clear();
+    }
+    if (cached_has_bits & 0x00000002u) {
+      ABSL_DCHECK(_impl_.clock_ != nullptr);
+      _impl_.clock_->Clear();
+    }
+    if (cached_has_bits & 0x00000004u) {
+      ABSL_DCHECK(_impl_.camera_ != nullptr);
+      _impl_.camera_->Clear();
+    }
+    if (cached_has_bits & 0x00000008u) {
+      ABSL_DCHECK(_impl_.trace_ != nullptr);
+      _impl_.trace_->Clear();
+    }
+    if (cached_has_bits & 0x00000010u) {
+      ABSL_DCHECK(_impl_.session_ != nullptr);
+      _impl_.session_->Clear();
+    }
+    if (cached_has_bits & 0x00000020u) {
+      ABSL_DCHECK(_impl_.region_ != nullptr);
+      _impl_.region_->Clear();
+    }
+  }
+  ::memset(&_impl_.color_image_frame_, 0, static_cast<::size_t>(
+      reinterpret_cast<char*>(&_impl_.depth_format_) -
+      reinterpret_cast<char*>(&_impl_.color_image_frame_)) + sizeof(_impl_.depth_format_));
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ClientStreamMessage::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<5, 18, 6, 49, 2> ClientStreamMessage::_table_ = {
+  {
+    PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_._has_bits_),
+    0, // no _extensions_
+    18, 248,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294705152,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    18,  // num_field_entries
+    6,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_ClientStreamMessage_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::ClientStreamMessage>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    {::_pbi::TcParser::MiniParse, {}},
+    // .BBox2D bbox2d = 1;
+    {::_pbi::TcParser::FastMtS1,
+     {10, 0, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.bbox2d_)}},
+    // .Clock clock = 2;
+    {::_pbi::TcParser::FastMtS1,
+     {18, 1, 1, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.clock_)}},
+    // .Camera camera = 3;
+    {::_pbi::TcParser::FastMtS1,
+     {26, 2, 2, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.camera_)}},
+    // bytes color_image = 4;
+    {::_pbi::TcParser::FastBS1,
+     {34, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_)}},
+    // bytes depth_image = 5;
+    {::_pbi::TcParser::FastBS1,
+     {42, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_)}},
+    // uint32 color_image_frame = 6;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.color_image_frame_), 63>(),
+     {48, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_frame_)}},
+    // uint32 depth_image_frame = 7;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.depth_image_frame_), 63>(),
+     {56, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_frame_)}},
+    // .ImageCodec color_codec = 8;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.color_codec_), 63>(),
+     {64, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_codec_)}},
+    // .ImageCodec depth_codec = 9;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.depth_codec_), 63>(),
+     {72, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_codec_)}},
+    // .FrameTrace trace = 10;
+    {::_pbi::TcParser::FastMtS1,
+     {82, 3, 3, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.trace_)}},
+    // string topic = 11;
+    {::_pbi::TcParser::FastUS1,
+     {90, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.topic_)}},
+    // uint32 annotators = 12;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.annotators_), 63>(),
+     {96, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.annotators_)}},
+    // .SessionState session = 13;
+    {::_pbi::TcParser::FastMtS1,
+     {106, 4, 4, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_)}},
+    // uint64 session_id = 14;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint64_t, offsetof(ClientStreamMessage, _impl_.session_id_), 63>(),
+     {112, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_id_)}},
+    // uint32 session_version = 15;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(ClientStreamMessage, _impl_.session_version_), 63>(),
+     {120, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_version_)}},
+    // .ImageRegion region = 16;
+    {::_pbi::TcParser::FastMtS2,
+     {386, 5, 5, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.region_)}},
+    // .PixelFormat color_format = 17;
+    {::_pbi::TcParser::FastV32S2,
+     {392, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_format_)}},
+    // .PixelFormat depth_format = 18;
+    {::_pbi::TcParser::FastV32S2,
+     {400, 63, 0, PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_format_)}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // .BBox2D bbox2d = 1;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.bbox2d_), _Internal::kHasBitsOffset + 0, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // .Clock clock = 2;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.clock_), _Internal::kHasBitsOffset + 1, 1,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // .Camera camera = 3;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.camera_), _Internal::kHasBitsOffset + 2, 2,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // bytes color_image = 4;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kBytes | ::_fl::kRepAString)},
+    // bytes depth_image = 5;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kBytes | ::_fl::kRepAString)},
+    // uint32 color_image_frame = 6;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_image_frame_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // uint32 depth_image_frame = 7;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_image_frame_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // .ImageCodec color_codec = 8;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_codec_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kOpenEnum)},
+    // .ImageCodec depth_codec = 9;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_codec_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kOpenEnum)},
+    // .FrameTrace trace = 10;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.trace_), _Internal::kHasBitsOffset + 3, 3,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // string topic = 11;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.topic_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // uint32 annotators = 12;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.annotators_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // .SessionState session = 13;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_), _Internal::kHasBitsOffset + 4, 4,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // uint64 session_id = 14;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_id_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt64)},
+    // uint32 session_version = 15;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.session_version_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUInt32)},
+    // .ImageRegion region = 16;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.region_), _Internal::kHasBitsOffset + 5, 5,
+    (0 | ::_fl::kFcOptional | ::_fl::kMessage | ::_fl::kTvTable)},
+    // .PixelFormat color_format = 17;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.color_format_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kOpenEnum)},
+    // .PixelFormat depth_format = 18;
+    {PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_format_), -1, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kOpenEnum)},
+  }}, {{
     {::_pbi::TcParser::GetTable<::BBox2D>()},
     {::_pbi::TcParser::GetTable<::Clock>()},
     {::_pbi::TcParser::GetTable<::Camera>()},
+    {::_pbi::TcParser::GetTable<::FrameTrace>()},
+    {::_pbi::TcParser::GetTable<::SessionState>()},
+    {::_pbi::TcParser::GetTable<::ImageRegion>()},
   }}, {{
+    "\23\0\0\0\0\0\0\0\0\0\0\5\0\0\0\0\0\0\0\0\0\0\0\0"
+    "ClientStreamMessage"
+    "topic"
   }},
 };
 
@@ -1944,6 +3371,95 @@ const ::_pbi::TcParseTable<3, 5, 3, 0, 2> ClientStreamMessage::_table_ = {
     target = stream->WriteBytesMaybeAliased(5, _s, target);
   }
 
+  // uint32 color_image_frame = 6;
+  if (this->_internal_color_image_frame() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        6, this->_internal_color_image_frame(), target);
+  }
+
+  // uint32 depth_image_frame = 7;
+  if (this->_internal_depth_image_frame() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        7, this->_internal_depth_image_frame(), target);
+  }
+
+  // .ImageCodec color_codec = 8;
+  if (this->_internal_color_codec() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteEnumToArray(
+        8, this->_internal_color_codec(), target);
+  }
+
+  // .ImageCodec depth_codec = 9;
+  if (this->_internal_depth_codec() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteEnumToArray(
+        9, this->_internal_depth_codec(), target);
+  }
+
+  // .FrameTrace trace = 10;
+  if (cached_has_bits & 0x00000008u) {
+    target = ::google::protobuf::internal::WireFormatLite::InternalWriteMessage(
+        10, *_impl_.trace_, _impl_.trace_->GetCachedSize(), target, stream);
+  }
+
+  // string topic = 11;
+  if (!this->_internal_topic().empty()) {
+    const std::string& _s = this->_internal_topic();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "ClientStreamMessage.topic");
+    target = stream->WriteStringMaybeAliased(11, _s, target);
+  }
+
+  // uint32 annotators = 12;
+  if (this->_internal_annotators() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        12, this->_internal_annotators(), target);
+  }
+
+  // .SessionState session = 13;
+  if (cached_has_bits & 0x00000010u) {
+    target = ::google::protobuf::internal::WireFormatLite::InternalWriteMessage(
+        13, *_impl_.session_, _impl_.session_->GetCachedSize(), target, stream);
+  }
+
+  // uint64 session_id = 14;
+  if (this->_internal_session_id() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt64ToArray(
+        14, this->_internal_session_id(), target);
+  }
+
+  // uint32 session_version = 15;
+  if (this->_internal_session_version() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(
+        15, this->_internal_session_version(), target);
+  }
+
+  // .ImageRegion region = 16;
+  if (cached_has_bits & 0x00000020u) {
+    target = ::google::protobuf::internal::WireFormatLite::InternalWriteMessage(
+        16, *_impl_.region_, _impl_.region_->GetCachedSize(), target, stream);
+  }
+
+  // .PixelFormat color_format = 17;
+  if (this->_internal_color_format() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteEnumToArray(
+        17, this->_internal_color_format(), target);
+  }
+
+  // .PixelFormat depth_format = 18;
+  if (this->_internal_depth_format() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteEnumToArray(
+        18, this->_internal_depth_format(), target);
+  }
+
   if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
     target =
         ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
@@ -1973,8 +3489,14 @@ const ::_pbi::TcParseTable<3, 5, 3, 0, 2> ClientStreamMessage::_table_ = {
                                     this->_internal_depth_image());
   }
 
+  // string topic = 11;
+  if (!this->_internal_topic().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_topic());
+  }
+
   cached_has_bits = _impl_._has_bits_[0];
-  if (cached_has_bits & 0x00000007u) {
+  if (cached_has_bits & 0x0000003fu) {
     // .BBox2D bbox2d = 1;
     if (cached_has_bits & 0x00000001u) {
       total_size +=
@@ -1993,7 +3515,79 @@ const ::_pbi::TcParseTable<3, 5, 3, 0, 2> ClientStreamMessage::_table_ = {
           1 + ::google::protobuf::internal::WireFormatLite::MessageSize(*_impl_.camera_);
     }
 
+    // .FrameTrace trace = 10;
+    if (cached_has_bits & 0x00000008u) {
+      total_size +=
+          1 + ::google::protobuf::internal::WireFormatLite::MessageSize(*_impl_.trace_);
+    }
+
+    // .SessionState session = 13;
+    if (cached_has_bits & 0x00000010u) {
+      total_size +=
+          1 + ::google::protobuf::internal::WireFormatLite::MessageSize(*_impl_.session_);
+    }
+
+    // .ImageRegion region = 16;
+    if (cached_has_bits & 0x00000020u) {
+      total_size +=
+          2 + ::google::protobuf::internal::WireFormatLite::MessageSize(*_impl_.region_);
+    }
+
+  }
+  // uint32 color_image_frame = 6;
+  if (this->_internal_color_image_frame() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_color_image_frame());
+  }
+
+  // uint32 depth_image_frame = 7;
+  if (this->_internal_depth_image_frame() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_depth_image_frame());
+  }
+
+  // .ImageCodec color_codec = 8;
+  if (this->_internal_color_codec() != 0) {
+    total_size += 1 +
+                  ::_pbi::WireFormatLite::EnumSize(this->_internal_color_codec());
+  }
+
+  // .ImageCodec depth_codec = 9;
+  if (this->_internal_depth_codec() != 0) {
+    total_size += 1 +
+                  ::_pbi::WireFormatLite::EnumSize(this->_internal_depth_codec());
+  }
+
+  // uint32 annotators = 12;
+  if (this->_internal_annotators() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_annotators());
+  }
+
+  // uint32 session_version = 15;
+  if (this->_internal_session_version() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(
+        this->_internal_session_version());
+  }
+
+  // uint64 session_id = 14;
+  if (this->_internal_session_id() != 0) {
+    total_size += ::_pbi::WireFormatLite::UInt64SizePlusOne(
+        this->_internal_session_id());
+  }
+
+  // .PixelFormat color_format = 17;
+  if (this->_internal_color_format() != 0) {
+    total_size += 2 +
+                  ::_pbi::WireFormatLite::EnumSize(this->_internal_color_format());
+  }
+
+  // .PixelFormat depth_format = 18;
+  if (this->_internal_depth_format() != 0) {
+    total_size += 2 +
+                  ::_pbi::WireFormatLite::EnumSize(this->_internal_depth_format());
   }
+
   return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
 }
 
@@ -2013,8 +3607,11 @@ void ClientStreamMessage::MergeImpl(::google::protobuf::MessageLite& to_msg, con
   if (!from._internal_depth_image().empty()) {
     _this->_internal_set_depth_image(from._internal_depth_image());
   }
+  if (!from._internal_topic().empty()) {
+    _this->_internal_set_topic(from._internal_topic());
+  }
   cached_has_bits = from._impl_._has_bits_[0];
-  if (cached_has_bits & 0x00000007u) {
+  if (cached_has_bits & 0x0000003fu) {
     if (cached_has_bits & 0x00000001u) {
       ABSL_DCHECK(from._impl_.bbox2d_ != nullptr);
       if (_this->_impl_.bbox2d_ == nullptr) {
@@ -2042,6 +3639,60 @@ void ClientStreamMessage::MergeImpl(::google::protobuf::MessageLite& to_msg, con
         _this->_impl_.camera_->MergeFrom(*from._impl_.camera_);
       }
     }
+    if (cached_has_bits & 0x00000008u) {
+      ABSL_DCHECK(from._impl_.trace_ != nullptr);
+      if (_this->_impl_.trace_ == nullptr) {
+        _this->_impl_.trace_ =
+            ::google::protobuf::Message::CopyConstruct<::FrameTrace>(arena, *from._impl_.trace_);
+      } else {
+        _this->_impl_.trace_->MergeFrom(*from._impl_.trace_);
+      }
+    }
+    if (cached_has_bits & 0x00000010u) {
+      ABSL_DCHECK(from._impl_.session_ != nullptr);
+      if (_this->_impl_.session_ == nullptr) {
+        _this->_impl_.session_ =
+            ::google::protobuf::Message::CopyConstruct<::SessionState>(arena, *from._impl_.session_);
+      } else {
+        _this->_impl_.session_->MergeFrom(*from._impl_.session_);
+      }
+    }
+    if (cached_has_bits & 0x00000020u) {
+      ABSL_DCHECK(from._impl_.region_ != nullptr);
+      if (_this->_impl_.region_ == nullptr) {
+        _this->_impl_.region_ =
+            ::google::protobuf::Message::CopyConstruct<::ImageRegion>(arena, *from._impl_.region_);
+      } else {
+        _this->_impl_.region_->MergeFrom(*from._impl_.region_);
+      }
+    }
+  }
+  if (from._internal_color_image_frame() != 0) {
+    _this->_impl_.color_image_frame_ = from._impl_.color_image_frame_;
+  }
+  if (from._internal_depth_image_frame() != 0) {
+    _this->_impl_.depth_image_frame_ = from._impl_.depth_image_frame_;
+  }
+  if (from._internal_color_codec() != 0) {
+    _this->_impl_.color_codec_ = from._impl_.color_codec_;
+  }
+  if (from._internal_depth_codec() != 0) {
+    _this->_impl_.depth_codec_ = from._impl_.depth_codec_;
+  }
+  if (from._internal_annotators() != 0) {
+    _this->_impl_.annotators_ = from._impl_.annotators_;
+  }
+  if (from._internal_session_version() != 0) {
+    _this->_impl_.session_version_ = from._impl_.session_version_;
+  }
+  if (from._internal_session_id() != 0) {
+    _this->_impl_.session_id_ = from._impl_.session_id_;
+  }
+  if (from._internal_color_format() != 0) {
+    _this->_impl_.color_format_ = from._impl_.color_format_;
+  }
+  if (from._internal_depth_format() != 0) {
+    _this->_impl_.depth_format_ = from._impl_.depth_format_;
   }
   _this->_impl_._has_bits_[0] |= cached_has_bits;
   _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
@@ -2066,9 +3717,10 @@ void ClientStreamMessage::InternalSwap(ClientStreamMessage* PROTOBUF_RESTRICT ot
   swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
   ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.color_image_, &other->_impl_.color_image_, arena);
   ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.depth_image_, &other->_impl_.depth_image_, arena);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.topic_, &other->_impl_.topic_, arena);
   ::google::protobuf::internal::memswap<
-      PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.camera_)
-      + sizeof(ClientStreamMessage::_impl_.camera_)
+      PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.depth_format_)
+      + sizeof(ClientStreamMessage::_impl_.depth_format_)
       - PROTOBUF_FIELD_OFFSET(ClientStreamMessage, _impl_.bbox2d_)>(
           reinterpret_cast<char*>(&_impl_.bbox2d_),
           reinterpret_cast<char*>(&other->_impl_.bbox2d_));
@@ -2077,7 +3729,7 @@ void ClientStreamMessage::InternalSwap(ClientStreamMessage* PROTOBUF_RESTRICT ot
 ::google::protobuf::Metadata ClientStreamMessage::GetMetadata() const {
   return ::_pbi::AssignDescriptors(&descriptor_table_client_5fstream_5fmessage_2eproto_getter,
                                    &descriptor_table_client_5fstream_5fmessage_2eproto_once,
-                                   file_level_metadata_client_5fstream_5fmessage_2eproto[6]);
+                                   file_level_metadata_client_5fstream_5fmessage_2eproto[10]);
 }
 // @@protoc_insertion_point(namespace_scope)
 namespace google {
@@ -30,6 +30,7 @@
 #include "google/protobuf/map.h"  // IWYU pragma: export
 #include "google/protobuf/map_entry.h"
 #include "google/protobuf/map_field_inl.h"
+#include "google/protobuf/generated_enum_reflection.h"
 #include "google/protobuf/unknown_field_set.h"
 // @@protoc_insertion_point(includes)
 
@@ -73,34 +74,183 @@ extern ClientStreamMessageDefaultTypeInternal _ClientStreamMessage_default_insta
 class Clock;
 struct ClockDefaultTypeInternal;
 extern ClockDefaultTypeInternal _Clock_default_instance_;
+class FrameTrace;
+struct FrameTraceDefaultTypeInternal;
+extern FrameTraceDefaultTypeInternal _FrameTrace_default_instance_;
+class ImageRegion;
+struct ImageRegionDefaultTypeInternal;
+extern ImageRegionDefaultTypeInternal _ImageRegion_default_instance_;
+class SessionState;
+struct SessionStateDefaultTypeInternal;
+extern SessionStateDefaultTypeInternal _SessionState_default_instance_;
+class SessionState_IdToLabelsEntry_DoNotUse;
+struct SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal;
+extern SessionState_IdToLabelsEntry_DoNotUseDefaultTypeInternal _SessionState_IdToLabelsEntry_DoNotUse_default_instance_;
 namespace google {
 namespace protobuf {
 }  // namespace protobuf
 }  // namespace google
 
+enum ImageCodec : int {
+  IMAGE_CODEC_RAW = 0,
+  IMAGE_CODEC_LZ4 = 1,
+  IMAGE_CODEC_ZSTD = 2,
+  IMAGE_CODEC_PNG = 3,
+  IMAGE_CODEC_DEPTH_PNG16 = 4,
+  IMAGE_CODEC_DEPTH_DELTA_ZSTD = 5,
+  ImageCodec_INT_MIN_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::min(),
+  ImageCodec_INT_MAX_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::max(),
+};
+
+bool ImageCodec_IsValid(int value);
+extern const uint32_t ImageCodec_internal_data_[];
+constexpr ImageCodec ImageCodec_MIN = static_cast<ImageCodec>(0);
+constexpr ImageCodec ImageCodec_MAX = static_cast<ImageCodec>(5);
+constexpr int ImageCodec_ARRAYSIZE = 5 + 1;
+const ::google::protobuf::EnumDescriptor*
+ImageCodec_descriptor();
+template <typename T>
+const std::string& ImageCodec_Name(T value) {
+  static_assert(std::is_same<T, ImageCodec>::value ||
+                    std::is_integral<T>::value,
+                "Incorrect type passed to ImageCodec_Name().");
+  return ImageCodec_Name(static_cast<ImageCodec>(value));
+}
+template <>
+inline const std::string& ImageCodec_Name(ImageCodec value) {
+  return ::google::protobuf::internal::NameOfDenseEnum<ImageCodec_descriptor,
+                                                 0, 5>(
+      static_cast<int>(value));
+}
+inline bool ImageCodec_Parse(absl::string_view name, ImageCodec* value) {
+  return ::google::protobuf::internal::ParseNamedEnum<ImageCodec>(
+      ImageCodec_descriptor(), name, value);
+}
+enum PixelFormat : int {
+  PIXEL_FORMAT_DEFAULT = 0,
+  PIXEL_FORMAT_RGB8 = 1,
+  PIXEL_FORMAT_DEPTH_UINT16_MM = 2,
+  PixelFormat_INT_MIN_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::min(),
+  PixelFormat_INT_MAX_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::max(),
+};
+
+bool PixelFormat_IsValid(int value);
+extern const uint32_t PixelFormat_internal_data_[];
+constexpr PixelFormat PixelFormat_MIN = static_cast<PixelFormat>(0);
+constexpr PixelFormat PixelFormat_MAX = static_cast<PixelFormat>(2);
+constexpr int PixelFormat_ARRAYSIZE = 2 + 1;
+const ::google::protobuf::EnumDescriptor*
+PixelFormat_descriptor();
+template <typename T>
+const std::string& PixelFormat_Name(T value) {
+  static_assert(std::is_same<T, PixelFormat>::value ||
+                    std::is_integral<T>::value,
+                "Incorrect type passed to PixelFormat_Name().");
+  return PixelFormat_Name(static_cast<PixelFormat>(value));
+}
+template <>
+inline const std::string& PixelFormat_Name(PixelFormat value) {
+  return ::google::protobuf::internal::NameOfDenseEnum<PixelFormat_descriptor,
+                                                 0, 2>(
+      static_cast<int>(value));
+}
+inline bool PixelFormat_Parse(absl::string_view name, PixelFormat* value) {
+  return ::google::protobuf::internal::ParseNamedEnum<PixelFormat>(
+      PixelFormat_descriptor(), name, value);
+}
+enum StreamAnnotator : int {
+  STREAM_ANNOTATOR_ALL = 0,
+  STREAM_ANNOTATOR_COLOR = 1,
+  STREAM_ANNOTATOR_DEPTH = 2,
+  STREAM_ANNOTATOR_BBOX2D = 4,
+  STREAM_ANNOTATOR_CAMERA = 8,
+  StreamAnnotator_INT_MIN_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::min(),
+  StreamAnnotator_INT_MAX_SENTINEL_DO_NOT_USE_ =
+      std::numeric_limits<::int32_t>::max(),
+};
+
+bool StreamAnnotator_IsValid(int value);
+extern const uint32_t StreamAnnotator_internal_data_[];
+constexpr StreamAnnotator StreamAnnotator_MIN = static_cast<StreamAnnotator>(0);
+constexpr StreamAnnotator StreamAnnotator_MAX = static_cast<StreamAnnotator>(8);
+constexpr int StreamAnnotator_ARRAYSIZE = 8 + 1;
+const ::google::protobuf::EnumDescriptor*
+StreamAnnotator_descriptor();
+template <typename T>
+const std::string& StreamAnnotator_Name(T value) {
+  static_assert(std::is_same<T, StreamAnnotator>::value ||
+                    std::is_integral<T>::value,
+                "Incorrect type passed to StreamAnnotator_Name().");
+  return StreamAnnotator_Name(static_cast<StreamAnnotator>(value));
+}
+template <>
+inline const std::string& StreamAnnotator_Name(StreamAnnotator value) {
+  return ::google::protobuf::internal::NameOfDenseEnum<StreamAnnotator_descriptor,
+                                                 0, 8>(
+      static_cast<int>(value));
+}
+inline bool StreamAnnotator_Parse(absl::string_view name, StreamAnnotator* value) {
+  return ::google::protobuf::internal::ParseNamedEnum<StreamAnnotator>(
+      StreamAnnotator_descriptor(), name, value);
+}
 
 // ===================================================================
 
 
 // -------------------------------------------------------------------
 
-class Clock final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:Clock) */ {
+class SessionState_IdToLabelsEntry_DoNotUse final
+    : public ::google::protobuf::internal::MapEntry<
+          SessionState_IdToLabelsEntry_DoNotUse, std::string, std::string,
+          ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+          ::google::protobuf::internal::WireFormatLite::TYPE_STRING> {
  public:
-  inline Clock() : Clock(nullptr) {}
-  ~Clock() override;
+  using SuperType = ::google::protobuf::internal::MapEntry<
+      SessionState_IdToLabelsEntry_DoNotUse, std::string, std::string,
+      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>;
+  SessionState_IdToLabelsEntry_DoNotUse();
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Clock(
+  explicit PROTOBUF_CONSTEXPR SessionState_IdToLabelsEntry_DoNotUse(
       ::google::protobuf::internal::ConstantInitialized);
+  explicit SessionState_IdToLabelsEntry_DoNotUse(::google::protobuf::Arena* arena);
+  static const SessionState_IdToLabelsEntry_DoNotUse* internal_default_instance() {
+    return reinterpret_cast<const SessionState_IdToLabelsEntry_DoNotUse*>(
+        &_SessionState_IdToLabelsEntry_DoNotUse_default_instance_);
+  }
+  static bool ValidateKey(std::string* s) {
+    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "SessionState.IdToLabelsEntry.key");
+ }
+  static bool ValidateValue(std::string* s) {
+    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "SessionState.IdToLabelsEntry.value");
+ }
+  ::google::protobuf::Metadata GetMetadata() const final;
+  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
+};
+// -------------------------------------------------------------------
 
-  inline Clock(const Clock& from) : Clock(nullptr, from) {}
-  inline Clock(Clock&& from) noexcept
-      : Clock(nullptr, std::move(from)) {}
-  inline Clock& operator=(const Clock& from) {
+class ImageRegion final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:ImageRegion) */ {
+ public:
+  inline ImageRegion() : ImageRegion(nullptr) {}
+  ~ImageRegion() override;
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR ImageRegion(
+      ::google::protobuf::internal::ConstantInitialized);
+
+  inline ImageRegion(const ImageRegion& from) : ImageRegion(nullptr, from) {}
+  inline ImageRegion(ImageRegion&& from) noexcept
+      : ImageRegion(nullptr, std::move(from)) {}
+  inline ImageRegion& operator=(const ImageRegion& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Clock& operator=(Clock&& from) noexcept {
+  inline ImageRegion& operator=(ImageRegion&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -132,16 +282,16 @@ class Clock final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Clock& default_instance() {
+  static const ImageRegion& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Clock* internal_default_instance() {
-    return reinterpret_cast<const Clock*>(
-        &_Clock_default_instance_);
+  static inline const ImageRegion* internal_default_instance() {
+    return reinterpret_cast<const ImageRegion*>(
+        &_ImageRegion_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 4;
-  friend void swap(Clock& a, Clock& b) { a.Swap(&b); }
-  inline void Swap(Clock* other) {
+  static constexpr int kIndexInFileMessages = 9;
+  friend void swap(ImageRegion& a, ImageRegion& b) { a.Swap(&b); }
+  inline void Swap(ImageRegion* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -153,7 +303,7 @@ class Clock final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Clock* other) {
+  void UnsafeArenaSwap(ImageRegion* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -161,13 +311,13 @@ class Clock final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Clock* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<Clock>(arena);
+  ImageRegion* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<ImageRegion>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Clock& from);
+  void CopyFrom(const ImageRegion& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Clock& from) { Clock::MergeImpl(*this, from); }
+  void MergeFrom(const ImageRegion& from) { ImageRegion::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -188,16 +338,16 @@ class Clock final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(Clock* other);
+  void InternalSwap(ImageRegion* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "Clock"; }
+  static ::absl::string_view FullMessageName() { return "ImageRegion"; }
 
  protected:
-  explicit Clock(::google::protobuf::Arena* arena);
-  Clock(::google::protobuf::Arena* arena, const Clock& from);
-  Clock(::google::protobuf::Arena* arena, Clock&& from) noexcept
-      : Clock(arena) {
+  explicit ImageRegion(::google::protobuf::Arena* arena);
+  ImageRegion(::google::protobuf::Arena* arena, const ImageRegion& from);
+  ImageRegion(::google::protobuf::Arena* arena, ImageRegion&& from) noexcept
+      : ImageRegion(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -209,57 +359,90 @@ class Clock final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kSimDtFieldNumber = 1,
-    kSysDtFieldNumber = 2,
-    kSimTimeFieldNumber = 3,
-    kSysTimeFieldNumber = 4,
+    kXFieldNumber = 1,
+    kYFieldNumber = 2,
+    kWidthFieldNumber = 3,
+    kHeightFieldNumber = 4,
+    kDownscaleFieldNumber = 5,
+    kImageWidthFieldNumber = 6,
+    kImageHeightFieldNumber = 7,
   };
-  // double sim_dt = 1;
-  void clear_sim_dt() ;
-  double sim_dt() const;
-  void set_sim_dt(double value);
+  // uint32 x = 1;
+  void clear_x() ;
+  ::uint32_t x() const;
+  void set_x(::uint32_t value);
 
   private:
-  double _internal_sim_dt() const;
-  void _internal_set_sim_dt(double value);
+  ::uint32_t _internal_x() const;
+  void _internal_set_x(::uint32_t value);
 
   public:
-  // double sys_dt = 2;
-  void clear_sys_dt() ;
-  double sys_dt() const;
-  void set_sys_dt(double value);
+  // uint32 y = 2;
+  void clear_y() ;
+  ::uint32_t y() const;
+  void set_y(::uint32_t value);
 
   private:
-  double _internal_sys_dt() const;
-  void _internal_set_sys_dt(double value);
+  ::uint32_t _internal_y() const;
+  void _internal_set_y(::uint32_t value);
 
   public:
-  // double sim_time = 3;
-  void clear_sim_time() ;
-  double sim_time() const;
-  void set_sim_time(double value);
+  // uint32 width = 3;
+  void clear_width() ;
+  ::uint32_t width() const;
+  void set_width(::uint32_t value);
 
   private:
-  double _internal_sim_time() const;
-  void _internal_set_sim_time(double value);
+  ::uint32_t _internal_width() const;
+  void _internal_set_width(::uint32_t value);
 
   public:
-  // double sys_time = 4;
-  void clear_sys_time() ;
-  double sys_time() const;
-  void set_sys_time(double value);
+  // uint32 height = 4;
+  void clear_height() ;
+  ::uint32_t height() const;
+  void set_height(::uint32_t value);
 
   private:
-  double _internal_sys_time() const;
-  void _internal_set_sys_time(double value);
+  ::uint32_t _internal_height() const;
+  void _internal_set_height(::uint32_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:Clock)
+  // uint32 downscale = 5;
+  void clear_downscale() ;
+  ::uint32_t downscale() const;
+  void set_downscale(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_downscale() const;
+  void _internal_set_downscale(::uint32_t value);
+
+  public:
+  // uint32 image_width = 6;
+  void clear_image_width() ;
+  ::uint32_t image_width() const;
+  void set_image_width(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_image_width() const;
+  void _internal_set_image_width(::uint32_t value);
+
+  public:
+  // uint32 image_height = 7;
+  void clear_image_height() ;
+  ::uint32_t image_height() const;
+  void set_image_height(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_image_height() const;
+  void _internal_set_image_height(::uint32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:ImageRegion)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      2, 4, 0,
+      3, 7, 0,
       0, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
@@ -275,10 +458,13 @@ class Clock final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    double sim_dt_;
-    double sys_dt_;
-    double sim_time_;
-    double sys_time_;
+    ::uint32_t x_;
+    ::uint32_t y_;
+    ::uint32_t width_;
+    ::uint32_t height_;
+    ::uint32_t downscale_;
+    ::uint32_t image_width_;
+    ::uint32_t image_height_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -287,23 +473,23 @@ class Clock final : public ::google::protobuf::Message
 };
 // -------------------------------------------------------------------
 
-class Camera final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:Camera) */ {
+class FrameTrace final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:FrameTrace) */ {
  public:
-  inline Camera() : Camera(nullptr) {}
-  ~Camera() override;
+  inline FrameTrace() : FrameTrace(nullptr) {}
+  ~FrameTrace() override;
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Camera(
+  explicit PROTOBUF_CONSTEXPR FrameTrace(
       ::google::protobuf::internal::ConstantInitialized);
 
-  inline Camera(const Camera& from) : Camera(nullptr, from) {}
-  inline Camera(Camera&& from) noexcept
-      : Camera(nullptr, std::move(from)) {}
-  inline Camera& operator=(const Camera& from) {
+  inline FrameTrace(const FrameTrace& from) : FrameTrace(nullptr, from) {}
+  inline FrameTrace(FrameTrace&& from) noexcept
+      : FrameTrace(nullptr, std::move(from)) {}
+  inline FrameTrace& operator=(const FrameTrace& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Camera& operator=(Camera&& from) noexcept {
+  inline FrameTrace& operator=(FrameTrace&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -335,16 +521,16 @@ class Camera final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Camera& default_instance() {
+  static const FrameTrace& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Camera* internal_default_instance() {
-    return reinterpret_cast<const Camera*>(
-        &_Camera_default_instance_);
+  static inline const FrameTrace* internal_default_instance() {
+    return reinterpret_cast<const FrameTrace*>(
+        &_FrameTrace_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 5;
-  friend void swap(Camera& a, Camera& b) { a.Swap(&b); }
-  inline void Swap(Camera* other) {
+  static constexpr int kIndexInFileMessages = 8;
+  friend void swap(FrameTrace& a, FrameTrace& b) { a.Swap(&b); }
+  inline void Swap(FrameTrace* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -356,7 +542,7 @@ class Camera final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Camera* other) {
+  void UnsafeArenaSwap(FrameTrace* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -364,13 +550,13 @@ class Camera final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Camera* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<Camera>(arena);
+  FrameTrace* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<FrameTrace>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Camera& from);
+  void CopyFrom(const FrameTrace& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Camera& from) { Camera::MergeImpl(*this, from); }
+  void MergeFrom(const FrameTrace& from) { FrameTrace::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -391,16 +577,16 @@ class Camera final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(Camera* other);
+  void InternalSwap(FrameTrace* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "Camera"; }
+  static ::absl::string_view FullMessageName() { return "FrameTrace"; }
 
  protected:
-  explicit Camera(::google::protobuf::Arena* arena);
-  Camera(::google::protobuf::Arena* arena, const Camera& from);
-  Camera(::google::protobuf::Arena* arena, Camera&& from) noexcept
-      : Camera(arena) {
+  explicit FrameTrace(::google::protobuf::Arena* arena);
+  FrameTrace(::google::protobuf::Arena* arena, const FrameTrace& from);
+  FrameTrace(::google::protobuf::Arena* arena, FrameTrace&& from) noexcept
+      : FrameTrace(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -412,70 +598,79 @@ class Camera final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kViewMatrixRosFieldNumber = 1,
-    kCameraScaleFieldNumber = 2,
-    kIntrinsicsMatrixFieldNumber = 3,
+    kFrameIdFieldNumber = 1,
+    kRenderTimeFieldNumber = 2,
+    kSendTimeFieldNumber = 3,
+    kCommandIdFieldNumber = 4,
+    kCommandSendTimeFieldNumber = 5,
+    kCommandApplyTimeFieldNumber = 6,
   };
-  // repeated double view_matrix_ros = 1;
-  int view_matrix_ros_size() const;
+  // uint64 frame_id = 1;
+  void clear_frame_id() ;
+  ::uint64_t frame_id() const;
+  void set_frame_id(::uint64_t value);
+
   private:
-  int _internal_view_matrix_ros_size() const;
+  ::uint64_t _internal_frame_id() const;
+  void _internal_set_frame_id(::uint64_t value);
 
   public:
-  void clear_view_matrix_ros() ;
-  double view_matrix_ros(int index) const;
-  void set_view_matrix_ros(int index, double value);
-  void add_view_matrix_ros(double value);
-  const ::google::protobuf::RepeatedField<double>& view_matrix_ros() const;
-  ::google::protobuf::RepeatedField<double>* mutable_view_matrix_ros();
+  // double render_time = 2;
+  void clear_render_time() ;
+  double render_time() const;
+  void set_render_time(double value);
 
   private:
-  const ::google::protobuf::RepeatedField<double>& _internal_view_matrix_ros() const;
-  ::google::protobuf::RepeatedField<double>* _internal_mutable_view_matrix_ros();
+  double _internal_render_time() const;
+  void _internal_set_render_time(double value);
 
   public:
-  // repeated double camera_scale = 2;
-  int camera_scale_size() const;
+  // double send_time = 3;
+  void clear_send_time() ;
+  double send_time() const;
+  void set_send_time(double value);
+
   private:
-  int _internal_camera_scale_size() const;
+  double _internal_send_time() const;
+  void _internal_set_send_time(double value);
 
   public:
-  void clear_camera_scale() ;
-  double camera_scale(int index) const;
-  void set_camera_scale(int index, double value);
-  void add_camera_scale(double value);
-  const ::google::protobuf::RepeatedField<double>& camera_scale() const;
-  ::google::protobuf::RepeatedField<double>* mutable_camera_scale();
+  // uint64 command_id = 4;
+  void clear_command_id() ;
+  ::uint64_t command_id() const;
+  void set_command_id(::uint64_t value);
 
   private:
-  const ::google::protobuf::RepeatedField<double>& _internal_camera_scale() const;
-  ::google::protobuf::RepeatedField<double>* _internal_mutable_camera_scale();
+  ::uint64_t _internal_command_id() const;
+  void _internal_set_command_id(::uint64_t value);
 
   public:
-  // repeated double intrinsics_matrix = 3;
-  int intrinsics_matrix_size() const;
+  // double command_send_time = 5;
+  void clear_command_send_time() ;
+  double command_send_time() const;
+  void set_command_send_time(double value);
+
   private:
-  int _internal_intrinsics_matrix_size() const;
+  double _internal_command_send_time() const;
+  void _internal_set_command_send_time(double value);
 
   public:
-  void clear_intrinsics_matrix() ;
-  double intrinsics_matrix(int index) const;
-  void set_intrinsics_matrix(int index, double value);
-  void add_intrinsics_matrix(double value);
-  const ::google::protobuf::RepeatedField<double>& intrinsics_matrix() const;
-  ::google::protobuf::RepeatedField<double>* mutable_intrinsics_matrix();
+  // double command_apply_time = 6;
+  void clear_command_apply_time() ;
+  double command_apply_time() const;
+  void set_command_apply_time(double value);
 
   private:
-  const ::google::protobuf::RepeatedField<double>& _internal_intrinsics_matrix() const;
-  ::google::protobuf::RepeatedField<double>* _internal_mutable_intrinsics_matrix();
+  double _internal_command_apply_time() const;
+  void _internal_set_command_apply_time(double value);
 
   public:
-  // @@protoc_insertion_point(class_scope:Camera)
+  // @@protoc_insertion_point(class_scope:FrameTrace)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      2, 3, 0,
+      3, 6, 0,
       0, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
@@ -491,9 +686,12 @@ class Camera final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    ::google::protobuf::RepeatedField<double> view_matrix_ros_;
-    ::google::protobuf::RepeatedField<double> camera_scale_;
-    ::google::protobuf::RepeatedField<double> intrinsics_matrix_;
+    ::uint64_t frame_id_;
+    double render_time_;
+    double send_time_;
+    ::uint64_t command_id_;
+    double command_send_time_;
+    double command_apply_time_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -502,23 +700,23 @@ class Camera final : public ::google::protobuf::Message
 };
 // -------------------------------------------------------------------
 
-class BBox2DType final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:BBox2DType) */ {
+class Clock final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:Clock) */ {
  public:
-  inline BBox2DType() : BBox2DType(nullptr) {}
-  ~BBox2DType() override;
+  inline Clock() : Clock(nullptr) {}
+  ~Clock() override;
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR BBox2DType(
+  explicit PROTOBUF_CONSTEXPR Clock(
       ::google::protobuf::internal::ConstantInitialized);
 
-  inline BBox2DType(const BBox2DType& from) : BBox2DType(nullptr, from) {}
-  inline BBox2DType(BBox2DType&& from) noexcept
-      : BBox2DType(nullptr, std::move(from)) {}
-  inline BBox2DType& operator=(const BBox2DType& from) {
+  inline Clock(const Clock& from) : Clock(nullptr, from) {}
+  inline Clock(Clock&& from) noexcept
+      : Clock(nullptr, std::move(from)) {}
+  inline Clock& operator=(const Clock& from) {
     CopyFrom(from);
     return *this;
   }
-  inline BBox2DType& operator=(BBox2DType&& from) noexcept {
+  inline Clock& operator=(Clock&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -550,16 +748,16 @@ class BBox2DType final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const BBox2DType& default_instance() {
+  static const Clock& default_instance() {
     return *internal_default_instance();
   }
-  static inline const BBox2DType* internal_default_instance() {
-    return reinterpret_cast<const BBox2DType*>(
-        &_BBox2DType_default_instance_);
+  static inline const Clock* internal_default_instance() {
+    return reinterpret_cast<const Clock*>(
+        &_Clock_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 0;
-  friend void swap(BBox2DType& a, BBox2DType& b) { a.Swap(&b); }
-  inline void Swap(BBox2DType* other) {
+  static constexpr int kIndexInFileMessages = 4;
+  friend void swap(Clock& a, Clock& b) { a.Swap(&b); }
+  inline void Swap(Clock* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -571,7 +769,7 @@ class BBox2DType final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(BBox2DType* other) {
+  void UnsafeArenaSwap(Clock* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -579,13 +777,13 @@ class BBox2DType final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  BBox2DType* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<BBox2DType>(arena);
+  Clock* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<Clock>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const BBox2DType& from);
+  void CopyFrom(const Clock& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const BBox2DType& from) { BBox2DType::MergeImpl(*this, from); }
+  void MergeFrom(const Clock& from) { Clock::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -606,16 +804,16 @@ class BBox2DType final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(BBox2DType* other);
+  void InternalSwap(Clock* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "BBox2DType"; }
+  static ::absl::string_view FullMessageName() { return "Clock"; }
 
  protected:
-  explicit BBox2DType(::google::protobuf::Arena* arena);
-  BBox2DType(::google::protobuf::Arena* arena, const BBox2DType& from);
-  BBox2DType(::google::protobuf::Arena* arena, BBox2DType&& from) noexcept
-      : BBox2DType(arena) {
+  explicit Clock(::google::protobuf::Arena* arena);
+  Clock(::google::protobuf::Arena* arena, const Clock& from);
+  Clock(::google::protobuf::Arena* arena, Clock&& from) noexcept
+      : Clock(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -627,79 +825,57 @@ class BBox2DType final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kSemanticIdFieldNumber = 1,
-    kXMinFieldNumber = 2,
-    kYMinFieldNumber = 3,
-    kXMaxFieldNumber = 4,
-    kYMaxFieldNumber = 5,
-    kOcclusionRatioFieldNumber = 6,
+    kSimDtFieldNumber = 1,
+    kSysDtFieldNumber = 2,
+    kSimTimeFieldNumber = 3,
+    kSysTimeFieldNumber = 4,
   };
-  // uint32 semanticId = 1;
-  void clear_semanticid() ;
-  ::uint32_t semanticid() const;
-  void set_semanticid(::uint32_t value);
+  // double sim_dt = 1;
+  void clear_sim_dt() ;
+  double sim_dt() const;
+  void set_sim_dt(double value);
 
   private:
-  ::uint32_t _internal_semanticid() const;
-  void _internal_set_semanticid(::uint32_t value);
+  double _internal_sim_dt() const;
+  void _internal_set_sim_dt(double value);
 
   public:
-  // int32 xMin = 2;
-  void clear_xmin() ;
-  ::int32_t xmin() const;
-  void set_xmin(::int32_t value);
-
-  private:
-  ::int32_t _internal_xmin() const;
-  void _internal_set_xmin(::int32_t value);
-
-  public:
-  // int32 yMin = 3;
-  void clear_ymin() ;
-  ::int32_t ymin() const;
-  void set_ymin(::int32_t value);
-
-  private:
-  ::int32_t _internal_ymin() const;
-  void _internal_set_ymin(::int32_t value);
-
-  public:
-  // int32 xMax = 4;
-  void clear_xmax() ;
-  ::int32_t xmax() const;
-  void set_xmax(::int32_t value);
+  // double sys_dt = 2;
+  void clear_sys_dt() ;
+  double sys_dt() const;
+  void set_sys_dt(double value);
 
   private:
-  ::int32_t _internal_xmax() const;
-  void _internal_set_xmax(::int32_t value);
+  double _internal_sys_dt() const;
+  void _internal_set_sys_dt(double value);
 
   public:
-  // int32 yMax = 5;
-  void clear_ymax() ;
-  ::int32_t ymax() const;
-  void set_ymax(::int32_t value);
+  // double sim_time = 3;
+  void clear_sim_time() ;
+  double sim_time() const;
+  void set_sim_time(double value);
 
   private:
-  ::int32_t _internal_ymax() const;
-  void _internal_set_ymax(::int32_t value);
+  double _internal_sim_time() const;
+  void _internal_set_sim_time(double value);
 
   public:
-  // float occlusionRatio = 6;
-  void clear_occlusionratio() ;
-  float occlusionratio() const;
-  void set_occlusionratio(float value);
+  // double sys_time = 4;
+  void clear_sys_time() ;
+  double sys_time() const;
+  void set_sys_time(double value);
 
   private:
-  float _internal_occlusionratio() const;
-  void _internal_set_occlusionratio(float value);
+  double _internal_sys_time() const;
+  void _internal_set_sys_time(double value);
 
   public:
-  // @@protoc_insertion_point(class_scope:BBox2DType)
+  // @@protoc_insertion_point(class_scope:Clock)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      3, 6, 0,
+      2, 4, 0,
       0, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
@@ -715,12 +891,10 @@ class BBox2DType final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    ::uint32_t semanticid_;
-    ::int32_t xmin_;
-    ::int32_t ymin_;
-    ::int32_t xmax_;
-    ::int32_t ymax_;
-    float occlusionratio_;
+    double sim_dt_;
+    double sys_dt_;
+    double sim_time_;
+    double sys_time_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -729,53 +903,23 @@ class BBox2DType final : public ::google::protobuf::Message
 };
 // -------------------------------------------------------------------
 
-class BBox2DInfo_IdToLabelsEntry_DoNotUse final
-    : public ::google::protobuf::internal::MapEntry<
-          BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
-          ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
-          ::google::protobuf::internal::WireFormatLite::TYPE_STRING> {
- public:
-  using SuperType = ::google::protobuf::internal::MapEntry<
-      BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
-      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
-      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>;
-  BBox2DInfo_IdToLabelsEntry_DoNotUse();
-  template <typename = void>
-  explicit PROTOBUF_CONSTEXPR BBox2DInfo_IdToLabelsEntry_DoNotUse(
-      ::google::protobuf::internal::ConstantInitialized);
-  explicit BBox2DInfo_IdToLabelsEntry_DoNotUse(::google::protobuf::Arena* arena);
-  static const BBox2DInfo_IdToLabelsEntry_DoNotUse* internal_default_instance() {
-    return reinterpret_cast<const BBox2DInfo_IdToLabelsEntry_DoNotUse*>(
-        &_BBox2DInfo_IdToLabelsEntry_DoNotUse_default_instance_);
-  }
-  static bool ValidateKey(std::string* s) {
-    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "BBox2DInfo.IdToLabelsEntry.key");
- }
-  static bool ValidateValue(std::string* s) {
-    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "BBox2DInfo.IdToLabelsEntry.value");
- }
-  ::google::protobuf::Metadata GetMetadata() const final;
-  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
-};
-// -------------------------------------------------------------------
-
-class BBox2DInfo final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:BBox2DInfo) */ {
+class Camera final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:Camera) */ {
  public:
-  inline BBox2DInfo() : BBox2DInfo(nullptr) {}
-  ~BBox2DInfo() override;
+  inline Camera() : Camera(nullptr) {}
+  ~Camera() override;
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR BBox2DInfo(
+  explicit PROTOBUF_CONSTEXPR Camera(
       ::google::protobuf::internal::ConstantInitialized);
 
-  inline BBox2DInfo(const BBox2DInfo& from) : BBox2DInfo(nullptr, from) {}
-  inline BBox2DInfo(BBox2DInfo&& from) noexcept
-      : BBox2DInfo(nullptr, std::move(from)) {}
-  inline BBox2DInfo& operator=(const BBox2DInfo& from) {
+  inline Camera(const Camera& from) : Camera(nullptr, from) {}
+  inline Camera(Camera&& from) noexcept
+      : Camera(nullptr, std::move(from)) {}
+  inline Camera& operator=(const Camera& from) {
     CopyFrom(from);
     return *this;
   }
-  inline BBox2DInfo& operator=(BBox2DInfo&& from) noexcept {
+  inline Camera& operator=(Camera&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -807,16 +951,16 @@ class BBox2DInfo final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const BBox2DInfo& default_instance() {
+  static const Camera& default_instance() {
     return *internal_default_instance();
   }
-  static inline const BBox2DInfo* internal_default_instance() {
-    return reinterpret_cast<const BBox2DInfo*>(
-        &_BBox2DInfo_default_instance_);
+  static inline const Camera* internal_default_instance() {
+    return reinterpret_cast<const Camera*>(
+        &_Camera_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 2;
-  friend void swap(BBox2DInfo& a, BBox2DInfo& b) { a.Swap(&b); }
-  inline void Swap(BBox2DInfo* other) {
+  static constexpr int kIndexInFileMessages = 5;
+  friend void swap(Camera& a, Camera& b) { a.Swap(&b); }
+  inline void Swap(Camera* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -828,7 +972,7 @@ class BBox2DInfo final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(BBox2DInfo* other) {
+  void UnsafeArenaSwap(Camera* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -836,13 +980,13 @@ class BBox2DInfo final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  BBox2DInfo* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<BBox2DInfo>(arena);
+  Camera* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<Camera>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const BBox2DInfo& from);
+  void CopyFrom(const Camera& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const BBox2DInfo& from) { BBox2DInfo::MergeImpl(*this, from); }
+  void MergeFrom(const Camera& from) { Camera::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -863,16 +1007,16 @@ class BBox2DInfo final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(BBox2DInfo* other);
+  void InternalSwap(Camera* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "BBox2DInfo"; }
+  static ::absl::string_view FullMessageName() { return "Camera"; }
 
  protected:
-  explicit BBox2DInfo(::google::protobuf::Arena* arena);
-  BBox2DInfo(::google::protobuf::Arena* arena, const BBox2DInfo& from);
-  BBox2DInfo(::google::protobuf::Arena* arena, BBox2DInfo&& from) noexcept
-      : BBox2DInfo(arena) {
+  explicit Camera(::google::protobuf::Arena* arena);
+  Camera(::google::protobuf::Arena* arena, const Camera& from);
+  Camera(::google::protobuf::Arena* arena, Camera&& from) noexcept
+      : Camera(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -884,49 +1028,82 @@ class BBox2DInfo final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kIdToLabelsFieldNumber = 1,
-    kBboxIdsFieldNumber = 2,
+    kViewMatrixRosFieldNumber = 1,
+    kCameraScaleFieldNumber = 2,
+    kIntrinsicsMatrixFieldNumber = 3,
+    kPoseVersionFieldNumber = 4,
   };
-  // map<string, string> idToLabels = 1;
-  int idtolabels_size() const;
+  // repeated double view_matrix_ros = 1;
+  int view_matrix_ros_size() const;
   private:
-  int _internal_idtolabels_size() const;
+  int _internal_view_matrix_ros_size() const;
 
   public:
-  void clear_idtolabels() ;
-  const ::google::protobuf::Map<std::string, std::string>& idtolabels() const;
-  ::google::protobuf::Map<std::string, std::string>* mutable_idtolabels();
+  void clear_view_matrix_ros() ;
+  double view_matrix_ros(int index) const;
+  void set_view_matrix_ros(int index, double value);
+  void add_view_matrix_ros(double value);
+  const ::google::protobuf::RepeatedField<double>& view_matrix_ros() const;
+  ::google::protobuf::RepeatedField<double>* mutable_view_matrix_ros();
 
   private:
-  const ::google::protobuf::Map<std::string, std::string>& _internal_idtolabels() const;
-  ::google::protobuf::Map<std::string, std::string>* _internal_mutable_idtolabels();
+  const ::google::protobuf::RepeatedField<double>& _internal_view_matrix_ros() const;
+  ::google::protobuf::RepeatedField<double>* _internal_mutable_view_matrix_ros();
 
   public:
-  // repeated int32 bboxIds = 2;
-  int bboxids_size() const;
+  // repeated double camera_scale = 2;
+  int camera_scale_size() const;
   private:
-  int _internal_bboxids_size() const;
+  int _internal_camera_scale_size() const;
 
   public:
-  void clear_bboxids() ;
-  ::int32_t bboxids(int index) const;
-  void set_bboxids(int index, ::int32_t value);
-  void add_bboxids(::int32_t value);
-  const ::google::protobuf::RepeatedField<::int32_t>& bboxids() const;
-  ::google::protobuf::RepeatedField<::int32_t>* mutable_bboxids();
+  void clear_camera_scale() ;
+  double camera_scale(int index) const;
+  void set_camera_scale(int index, double value);
+  void add_camera_scale(double value);
+  const ::google::protobuf::RepeatedField<double>& camera_scale() const;
+  ::google::protobuf::RepeatedField<double>* mutable_camera_scale();
 
   private:
-  const ::google::protobuf::RepeatedField<::int32_t>& _internal_bboxids() const;
-  ::google::protobuf::RepeatedField<::int32_t>* _internal_mutable_bboxids();
+  const ::google::protobuf::RepeatedField<double>& _internal_camera_scale() const;
+  ::google::protobuf::RepeatedField<double>* _internal_mutable_camera_scale();
 
   public:
-  // @@protoc_insertion_point(class_scope:BBox2DInfo)
+  // repeated double intrinsics_matrix = 3;
+  int intrinsics_matrix_size() const;
+  private:
+  int _internal_intrinsics_matrix_size() const;
+
+  public:
+  void clear_intrinsics_matrix() ;
+  double intrinsics_matrix(int index) const;
+  void set_intrinsics_matrix(int index, double value);
+  void add_intrinsics_matrix(double value);
+  const ::google::protobuf::RepeatedField<double>& intrinsics_matrix() const;
+  ::google::protobuf::RepeatedField<double>* mutable_intrinsics_matrix();
+
+  private:
+  const ::google::protobuf::RepeatedField<double>& _internal_intrinsics_matrix() const;
+  ::google::protobuf::RepeatedField<double>* _internal_mutable_intrinsics_matrix();
+
+  public:
+  // uint32 pose_version = 4;
+  void clear_pose_version() ;
+  ::uint32_t pose_version() const;
+  void set_pose_version(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_pose_version() const;
+  void _internal_set_pose_version(::uint32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:Camera)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      0, 2, 1,
-      29, 2>
+      2, 4, 0,
+      0, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
   friend class ::google::protobuf::Arena;
@@ -941,12 +1118,10 @@ class BBox2DInfo final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    ::google::protobuf::internal::MapField<BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
-                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
-                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>
-        idtolabels_;
-    ::google::protobuf::RepeatedField<::int32_t> bboxids_;
-    mutable ::google::protobuf::internal::CachedSize _bboxids_cached_byte_size_;
+    ::google::protobuf::RepeatedField<double> view_matrix_ros_;
+    ::google::protobuf::RepeatedField<double> camera_scale_;
+    ::google::protobuf::RepeatedField<double> intrinsics_matrix_;
+    ::uint32_t pose_version_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -955,23 +1130,23 @@ class BBox2DInfo final : public ::google::protobuf::Message
 };
 // -------------------------------------------------------------------
 
-class BBox2D final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:BBox2D) */ {
+class BBox2DType final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:BBox2DType) */ {
  public:
-  inline BBox2D() : BBox2D(nullptr) {}
-  ~BBox2D() override;
+  inline BBox2DType() : BBox2DType(nullptr) {}
+  ~BBox2DType() override;
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR BBox2D(
+  explicit PROTOBUF_CONSTEXPR BBox2DType(
       ::google::protobuf::internal::ConstantInitialized);
 
-  inline BBox2D(const BBox2D& from) : BBox2D(nullptr, from) {}
-  inline BBox2D(BBox2D&& from) noexcept
-      : BBox2D(nullptr, std::move(from)) {}
-  inline BBox2D& operator=(const BBox2D& from) {
+  inline BBox2DType(const BBox2DType& from) : BBox2DType(nullptr, from) {}
+  inline BBox2DType(BBox2DType&& from) noexcept
+      : BBox2DType(nullptr, std::move(from)) {}
+  inline BBox2DType& operator=(const BBox2DType& from) {
     CopyFrom(from);
     return *this;
   }
-  inline BBox2D& operator=(BBox2D&& from) noexcept {
+  inline BBox2DType& operator=(BBox2DType&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -1003,16 +1178,16 @@ class BBox2D final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const BBox2D& default_instance() {
+  static const BBox2DType& default_instance() {
     return *internal_default_instance();
   }
-  static inline const BBox2D* internal_default_instance() {
-    return reinterpret_cast<const BBox2D*>(
-        &_BBox2D_default_instance_);
+  static inline const BBox2DType* internal_default_instance() {
+    return reinterpret_cast<const BBox2DType*>(
+        &_BBox2DType_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 3;
-  friend void swap(BBox2D& a, BBox2D& b) { a.Swap(&b); }
-  inline void Swap(BBox2D* other) {
+  static constexpr int kIndexInFileMessages = 0;
+  friend void swap(BBox2DType& a, BBox2DType& b) { a.Swap(&b); }
+  inline void Swap(BBox2DType* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -1024,7 +1199,7 @@ class BBox2D final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(BBox2D* other) {
+  void UnsafeArenaSwap(BBox2DType* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1032,13 +1207,13 @@ class BBox2D final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  BBox2D* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<BBox2D>(arena);
+  BBox2DType* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<BBox2DType>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const BBox2D& from);
+  void CopyFrom(const BBox2DType& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const BBox2D& from) { BBox2D::MergeImpl(*this, from); }
+  void MergeFrom(const BBox2DType& from) { BBox2DType::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -1059,16 +1234,16 @@ class BBox2D final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(BBox2D* other);
+  void InternalSwap(BBox2DType* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "BBox2D"; }
+  static ::absl::string_view FullMessageName() { return "BBox2DType"; }
 
  protected:
-  explicit BBox2D(::google::protobuf::Arena* arena);
-  BBox2D(::google::protobuf::Arena* arena, const BBox2D& from);
-  BBox2D(::google::protobuf::Arena* arena, BBox2D&& from) noexcept
-      : BBox2D(arena) {
+  explicit BBox2DType(::google::protobuf::Arena* arena);
+  BBox2DType(::google::protobuf::Arena* arena, const BBox2DType& from);
+  BBox2DType(::google::protobuf::Arena* arena, BBox2DType&& from) noexcept
+      : BBox2DType(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -1080,47 +1255,79 @@ class BBox2D final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kDataFieldNumber = 1,
-    kInfoFieldNumber = 2,
+    kSemanticIdFieldNumber = 1,
+    kXMinFieldNumber = 2,
+    kYMinFieldNumber = 3,
+    kXMaxFieldNumber = 4,
+    kYMaxFieldNumber = 5,
+    kOcclusionRatioFieldNumber = 6,
   };
-  // repeated .BBox2DType data = 1;
-  int data_size() const;
+  // uint32 semanticId = 1;
+  void clear_semanticid() ;
+  ::uint32_t semanticid() const;
+  void set_semanticid(::uint32_t value);
+
   private:
-  int _internal_data_size() const;
+  ::uint32_t _internal_semanticid() const;
+  void _internal_set_semanticid(::uint32_t value);
 
   public:
-  void clear_data() ;
-  ::BBox2DType* mutable_data(int index);
-  ::google::protobuf::RepeatedPtrField<::BBox2DType>* mutable_data();
+  // int32 xMin = 2;
+  void clear_xmin() ;
+  ::int32_t xmin() const;
+  void set_xmin(::int32_t value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::BBox2DType>& _internal_data() const;
-  ::google::protobuf::RepeatedPtrField<::BBox2DType>* _internal_mutable_data();
+  ::int32_t _internal_xmin() const;
+  void _internal_set_xmin(::int32_t value);
+
   public:
-  const ::BBox2DType& data(int index) const;
-  ::BBox2DType* add_data();
-  const ::google::protobuf::RepeatedPtrField<::BBox2DType>& data() const;
-  // .BBox2DInfo info = 2;
-  bool has_info() const;
-  void clear_info() ;
-  const ::BBox2DInfo& info() const;
-  PROTOBUF_NODISCARD ::BBox2DInfo* release_info();
-  ::BBox2DInfo* mutable_info();
-  void set_allocated_info(::BBox2DInfo* value);
-  void unsafe_arena_set_allocated_info(::BBox2DInfo* value);
-  ::BBox2DInfo* unsafe_arena_release_info();
+  // int32 yMin = 3;
+  void clear_ymin() ;
+  ::int32_t ymin() const;
+  void set_ymin(::int32_t value);
 
   private:
-  const ::BBox2DInfo& _internal_info() const;
-  ::BBox2DInfo* _internal_mutable_info();
+  ::int32_t _internal_ymin() const;
+  void _internal_set_ymin(::int32_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:BBox2D)
+  // int32 xMax = 4;
+  void clear_xmax() ;
+  ::int32_t xmax() const;
+  void set_xmax(::int32_t value);
+
+  private:
+  ::int32_t _internal_xmax() const;
+  void _internal_set_xmax(::int32_t value);
+
+  public:
+  // int32 yMax = 5;
+  void clear_ymax() ;
+  ::int32_t ymax() const;
+  void set_ymax(::int32_t value);
+
+  private:
+  ::int32_t _internal_ymax() const;
+  void _internal_set_ymax(::int32_t value);
+
+  public:
+  // float occlusionRatio = 6;
+  void clear_occlusionratio() ;
+  float occlusionratio() const;
+  void set_occlusionratio(float value);
+
+  private:
+  float _internal_occlusionratio() const;
+  void _internal_set_occlusionratio(float value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:BBox2DType)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      1, 2, 2,
+      3, 6, 0,
       0, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
@@ -1136,10 +1343,13 @@ class BBox2D final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::uint32_t semanticid_;
+    ::int32_t xmin_;
+    ::int32_t ymin_;
+    ::int32_t xmax_;
+    ::int32_t ymax_;
+    float occlusionratio_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::BBox2DType > data_;
-    ::BBox2DInfo* info_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
@@ -1147,23 +1357,53 @@ class BBox2D final : public ::google::protobuf::Message
 };
 // -------------------------------------------------------------------
 
-class ClientStreamMessage final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:ClientStreamMessage) */ {
+class BBox2DInfo_IdToLabelsEntry_DoNotUse final
+    : public ::google::protobuf::internal::MapEntry<
+          BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
+          ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+          ::google::protobuf::internal::WireFormatLite::TYPE_STRING> {
  public:
-  inline ClientStreamMessage() : ClientStreamMessage(nullptr) {}
-  ~ClientStreamMessage() override;
+  using SuperType = ::google::protobuf::internal::MapEntry<
+      BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
+      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>;
+  BBox2DInfo_IdToLabelsEntry_DoNotUse();
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ClientStreamMessage(
+  explicit PROTOBUF_CONSTEXPR BBox2DInfo_IdToLabelsEntry_DoNotUse(
       ::google::protobuf::internal::ConstantInitialized);
+  explicit BBox2DInfo_IdToLabelsEntry_DoNotUse(::google::protobuf::Arena* arena);
+  static const BBox2DInfo_IdToLabelsEntry_DoNotUse* internal_default_instance() {
+    return reinterpret_cast<const BBox2DInfo_IdToLabelsEntry_DoNotUse*>(
+        &_BBox2DInfo_IdToLabelsEntry_DoNotUse_default_instance_);
+  }
+  static bool ValidateKey(std::string* s) {
+    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "BBox2DInfo.IdToLabelsEntry.key");
+ }
+  static bool ValidateValue(std::string* s) {
+    return ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(s->data(), static_cast<int>(s->size()), ::google::protobuf::internal::WireFormatLite::PARSE, "BBox2DInfo.IdToLabelsEntry.value");
+ }
+  ::google::protobuf::Metadata GetMetadata() const final;
+  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
+};
+// -------------------------------------------------------------------
 
-  inline ClientStreamMessage(const ClientStreamMessage& from) : ClientStreamMessage(nullptr, from) {}
-  inline ClientStreamMessage(ClientStreamMessage&& from) noexcept
-      : ClientStreamMessage(nullptr, std::move(from)) {}
-  inline ClientStreamMessage& operator=(const ClientStreamMessage& from) {
+class SessionState final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:SessionState) */ {
+ public:
+  inline SessionState() : SessionState(nullptr) {}
+  ~SessionState() override;
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR SessionState(
+      ::google::protobuf::internal::ConstantInitialized);
+
+  inline SessionState(const SessionState& from) : SessionState(nullptr, from) {}
+  inline SessionState(SessionState&& from) noexcept
+      : SessionState(nullptr, std::move(from)) {}
+  inline SessionState& operator=(const SessionState& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ClientStreamMessage& operator=(ClientStreamMessage&& from) noexcept {
+  inline SessionState& operator=(SessionState&& from) noexcept {
     if (this == &from) return *this;
     if (GetArena() == from.GetArena()
 #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -1195,16 +1435,16 @@ class ClientStreamMessage final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ClientStreamMessage& default_instance() {
+  static const SessionState& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ClientStreamMessage* internal_default_instance() {
-    return reinterpret_cast<const ClientStreamMessage*>(
-        &_ClientStreamMessage_default_instance_);
+  static inline const SessionState* internal_default_instance() {
+    return reinterpret_cast<const SessionState*>(
+        &_SessionState_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 6;
-  friend void swap(ClientStreamMessage& a, ClientStreamMessage& b) { a.Swap(&b); }
-  inline void Swap(ClientStreamMessage* other) {
+  static constexpr int kIndexInFileMessages = 7;
+  friend void swap(SessionState& a, SessionState& b) { a.Swap(&b); }
+  inline void Swap(SessionState* other) {
     if (other == this) return;
 #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetArena() != nullptr && GetArena() == other->GetArena()) {
@@ -1216,7 +1456,7 @@ class ClientStreamMessage final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ClientStreamMessage* other) {
+  void UnsafeArenaSwap(SessionState* other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1224,13 +1464,13 @@ class ClientStreamMessage final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ClientStreamMessage* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return ::google::protobuf::Message::DefaultConstruct<ClientStreamMessage>(arena);
+  SessionState* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<SessionState>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ClientStreamMessage& from);
+  void CopyFrom(const SessionState& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ClientStreamMessage& from) { ClientStreamMessage::MergeImpl(*this, from); }
+  void MergeFrom(const SessionState& from) { SessionState::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(
@@ -1251,16 +1491,16 @@ class ClientStreamMessage final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
-  void InternalSwap(ClientStreamMessage* other);
+  void InternalSwap(SessionState* other);
  private:
   friend class ::google::protobuf::internal::AnyMetadata;
-  static ::absl::string_view FullMessageName() { return "ClientStreamMessage"; }
+  static ::absl::string_view FullMessageName() { return "SessionState"; }
 
  protected:
-  explicit ClientStreamMessage(::google::protobuf::Arena* arena);
-  ClientStreamMessage(::google::protobuf::Arena* arena, const ClientStreamMessage& from);
-  ClientStreamMessage(::google::protobuf::Arena* arena, ClientStreamMessage&& from) noexcept
-      : ClientStreamMessage(arena) {
+  explicit SessionState(::google::protobuf::Arena* arena);
+  SessionState(::google::protobuf::Arena* arena, const SessionState& from);
+  SessionState(::google::protobuf::Arena* arena, SessionState&& from) noexcept
+      : SessionState(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::MessageLite::ClassData* GetClassData()
@@ -1272,96 +1512,79 @@ class ClientStreamMessage final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kColorImageFieldNumber = 4,
-    kDepthImageFieldNumber = 5,
-    kBbox2DFieldNumber = 1,
-    kClockFieldNumber = 2,
-    kCameraFieldNumber = 3,
+    kIdToLabelsFieldNumber = 2,
+    kIntrinsicsMatrixFieldNumber = 3,
+    kCameraScaleFieldNumber = 4,
+    kVersionFieldNumber = 1,
   };
-  // bytes color_image = 4;
-  void clear_color_image() ;
-  const std::string& color_image() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_color_image(Arg_&& arg, Args_... args);
-  std::string* mutable_color_image();
-  PROTOBUF_NODISCARD std::string* release_color_image();
-  void set_allocated_color_image(std::string* value);
-
+  // map<string, string> idToLabels = 2;
+  int idtolabels_size() const;
   private:
-  const std::string& _internal_color_image() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_color_image(
-      const std::string& value);
-  std::string* _internal_mutable_color_image();
+  int _internal_idtolabels_size() const;
 
   public:
-  // bytes depth_image = 5;
-  void clear_depth_image() ;
-  const std::string& depth_image() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_depth_image(Arg_&& arg, Args_... args);
-  std::string* mutable_depth_image();
-  PROTOBUF_NODISCARD std::string* release_depth_image();
-  void set_allocated_depth_image(std::string* value);
+  void clear_idtolabels() ;
+  const ::google::protobuf::Map<std::string, std::string>& idtolabels() const;
+  ::google::protobuf::Map<std::string, std::string>* mutable_idtolabels();
 
   private:
-  const std::string& _internal_depth_image() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_depth_image(
-      const std::string& value);
-  std::string* _internal_mutable_depth_image();
+  const ::google::protobuf::Map<std::string, std::string>& _internal_idtolabels() const;
+  ::google::protobuf::Map<std::string, std::string>* _internal_mutable_idtolabels();
 
   public:
-  // .BBox2D bbox2d = 1;
-  bool has_bbox2d() const;
-  void clear_bbox2d() ;
-  const ::BBox2D& bbox2d() const;
-  PROTOBUF_NODISCARD ::BBox2D* release_bbox2d();
-  ::BBox2D* mutable_bbox2d();
-  void set_allocated_bbox2d(::BBox2D* value);
-  void unsafe_arena_set_allocated_bbox2d(::BBox2D* value);
-  ::BBox2D* unsafe_arena_release_bbox2d();
-
+  // repeated double intrinsics_matrix = 3;
+  int intrinsics_matrix_size() const;
   private:
-  const ::BBox2D& _internal_bbox2d() const;
-  ::BBox2D* _internal_mutable_bbox2d();
+  int _internal_intrinsics_matrix_size() const;
 
   public:
-  // .Clock clock = 2;
-  bool has_clock() const;
-  void clear_clock() ;
-  const ::Clock& clock() const;
-  PROTOBUF_NODISCARD ::Clock* release_clock();
-  ::Clock* mutable_clock();
-  void set_allocated_clock(::Clock* value);
-  void unsafe_arena_set_allocated_clock(::Clock* value);
-  ::Clock* unsafe_arena_release_clock();
+  void clear_intrinsics_matrix() ;
+  double intrinsics_matrix(int index) const;
+  void set_intrinsics_matrix(int index, double value);
+  void add_intrinsics_matrix(double value);
+  const ::google::protobuf::RepeatedField<double>& intrinsics_matrix() const;
+  ::google::protobuf::RepeatedField<double>* mutable_intrinsics_matrix();
 
   private:
-  const ::Clock& _internal_clock() const;
-  ::Clock* _internal_mutable_clock();
+  const ::google::protobuf::RepeatedField<double>& _internal_intrinsics_matrix() const;
+  ::google::protobuf::RepeatedField<double>* _internal_mutable_intrinsics_matrix();
 
   public:
-  // .Camera camera = 3;
-  bool has_camera() const;
-  void clear_camera() ;
-  const ::Camera& camera() const;
-  PROTOBUF_NODISCARD ::Camera* release_camera();
-  ::Camera* mutable_camera();
-  void set_allocated_camera(::Camera* value);
-  void unsafe_arena_set_allocated_camera(::Camera* value);
-  ::Camera* unsafe_arena_release_camera();
+  // repeated double camera_scale = 4;
+  int camera_scale_size() const;
+  private:
+  int _internal_camera_scale_size() const;
+
+  public:
+  void clear_camera_scale() ;
+  double camera_scale(int index) const;
+  void set_camera_scale(int index, double value);
+  void add_camera_scale(double value);
+  const ::google::protobuf::RepeatedField<double>& camera_scale() const;
+  ::google::protobuf::RepeatedField<double>* mutable_camera_scale();
 
   private:
-  const ::Camera& _internal_camera() const;
-  ::Camera* _internal_mutable_camera();
+  const ::google::protobuf::RepeatedField<double>& _internal_camera_scale() const;
+  ::google::protobuf::RepeatedField<double>* _internal_mutable_camera_scale();
 
   public:
-  // @@protoc_insertion_point(class_scope:ClientStreamMessage)
+  // uint32 version = 1;
+  void clear_version() ;
+  ::uint32_t version() const;
+  void set_version(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_version() const;
+  void _internal_set_version(::uint32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:SessionState)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<
-      3, 5, 3,
-      0, 2>
+      2, 4, 1,
+      31, 2>
       _table_;
   friend class ::google::protobuf::MessageLite;
   friend class ::google::protobuf::Arena;
@@ -1376,338 +1599,2008 @@ class ClientStreamMessage final : public ::google::protobuf::Message
                           ::google::protobuf::Arena* arena);
     inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
                           ::google::protobuf::Arena* arena, const Impl_& from);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::MapField<SessionState_IdToLabelsEntry_DoNotUse, std::string, std::string,
+                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>
+        idtolabels_;
+    ::google::protobuf::RepeatedField<double> intrinsics_matrix_;
+    ::google::protobuf::RepeatedField<double> camera_scale_;
+    ::uint32_t version_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr color_image_;
-    ::google::protobuf::internal::ArenaStringPtr depth_image_;
-    ::BBox2D* bbox2d_;
-    ::Clock* clock_;
-    ::Camera* camera_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
 };
+// -------------------------------------------------------------------
 
-// ===================================================================
+class BBox2DInfo final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:BBox2DInfo) */ {
+ public:
+  inline BBox2DInfo() : BBox2DInfo(nullptr) {}
+  ~BBox2DInfo() override;
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR BBox2DInfo(
+      ::google::protobuf::internal::ConstantInitialized);
+
+  inline BBox2DInfo(const BBox2DInfo& from) : BBox2DInfo(nullptr, from) {}
+  inline BBox2DInfo(BBox2DInfo&& from) noexcept
+      : BBox2DInfo(nullptr, std::move(from)) {}
+  inline BBox2DInfo& operator=(const BBox2DInfo& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline BBox2DInfo& operator=(BBox2DInfo&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetArena() == from.GetArena()
+#ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetArena() != nullptr
+#endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const BBox2DInfo& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const BBox2DInfo* internal_default_instance() {
+    return reinterpret_cast<const BBox2DInfo*>(
+        &_BBox2DInfo_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 2;
+  friend void swap(BBox2DInfo& a, BBox2DInfo& b) { a.Swap(&b); }
+  inline void Swap(BBox2DInfo* other) {
+    if (other == this) return;
+#ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() != nullptr && GetArena() == other->GetArena()) {
+#else   // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() == other->GetArena()) {
+#endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(BBox2DInfo* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  BBox2DInfo* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<BBox2DInfo>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const BBox2DInfo& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const BBox2DInfo& from) { BBox2DInfo::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(
+      ::google::protobuf::MessageLite& to_msg,
+      const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target,
+      ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void InternalSwap(BBox2DInfo* other);
+ private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() { return "BBox2DInfo"; }
+
+ protected:
+  explicit BBox2DInfo(::google::protobuf::Arena* arena);
+  BBox2DInfo(::google::protobuf::Arena* arena, const BBox2DInfo& from);
+  BBox2DInfo(::google::protobuf::Arena* arena, BBox2DInfo&& from) noexcept
+      : BBox2DInfo(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::MessageLite::ClassData* GetClassData()
+      const final;
+
+ public:
+  ::google::protobuf::Metadata GetMetadata() const final;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kIdToLabelsFieldNumber = 1,
+    kBboxIdsFieldNumber = 2,
+  };
+  // map<string, string> idToLabels = 1;
+  int idtolabels_size() const;
+  private:
+  int _internal_idtolabels_size() const;
+
+  public:
+  void clear_idtolabels() ;
+  const ::google::protobuf::Map<std::string, std::string>& idtolabels() const;
+  ::google::protobuf::Map<std::string, std::string>* mutable_idtolabels();
+
+  private:
+  const ::google::protobuf::Map<std::string, std::string>& _internal_idtolabels() const;
+  ::google::protobuf::Map<std::string, std::string>* _internal_mutable_idtolabels();
+
+  public:
+  // repeated int32 bboxIds = 2;
+  int bboxids_size() const;
+  private:
+  int _internal_bboxids_size() const;
+
+  public:
+  void clear_bboxids() ;
+  ::int32_t bboxids(int index) const;
+  void set_bboxids(int index, ::int32_t value);
+  void add_bboxids(::int32_t value);
+  const ::google::protobuf::RepeatedField<::int32_t>& bboxids() const;
+  ::google::protobuf::RepeatedField<::int32_t>* mutable_bboxids();
+
+  private:
+  const ::google::protobuf::RepeatedField<::int32_t>& _internal_bboxids() const;
+  ::google::protobuf::RepeatedField<::int32_t>* _internal_mutable_bboxids();
 
+  public:
+  // @@protoc_insertion_point(class_scope:BBox2DInfo)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<
+      0, 2, 1,
+      29, 2>
+      _table_;
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(
+        ::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena);
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena, const Impl_& from);
+    ::google::protobuf::internal::MapField<BBox2DInfo_IdToLabelsEntry_DoNotUse, std::string, std::string,
+                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING,
+                      ::google::protobuf::internal::WireFormatLite::TYPE_STRING>
+        idtolabels_;
+    ::google::protobuf::RepeatedField<::int32_t> bboxids_;
+    mutable ::google::protobuf::internal::CachedSize _bboxids_cached_byte_size_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
+};
+// -------------------------------------------------------------------
 
+class BBox2D final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:BBox2D) */ {
+ public:
+  inline BBox2D() : BBox2D(nullptr) {}
+  ~BBox2D() override;
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR BBox2D(
+      ::google::protobuf::internal::ConstantInitialized);
 
+  inline BBox2D(const BBox2D& from) : BBox2D(nullptr, from) {}
+  inline BBox2D(BBox2D&& from) noexcept
+      : BBox2D(nullptr, std::move(from)) {}
+  inline BBox2D& operator=(const BBox2D& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline BBox2D& operator=(BBox2D&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetArena() == from.GetArena()
+#ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetArena() != nullptr
+#endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const BBox2D& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const BBox2D* internal_default_instance() {
+    return reinterpret_cast<const BBox2D*>(
+        &_BBox2D_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 3;
+  friend void swap(BBox2D& a, BBox2D& b) { a.Swap(&b); }
+  inline void Swap(BBox2D* other) {
+    if (other == this) return;
+#ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() != nullptr && GetArena() == other->GetArena()) {
+#else   // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() == other->GetArena()) {
+#endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(BBox2D* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  BBox2D* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<BBox2D>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const BBox2D& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const BBox2D& from) { BBox2D::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(
+      ::google::protobuf::MessageLite& to_msg,
+      const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target,
+      ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void InternalSwap(BBox2D* other);
+ private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() { return "BBox2D"; }
+
+ protected:
+  explicit BBox2D(::google::protobuf::Arena* arena);
+  BBox2D(::google::protobuf::Arena* arena, const BBox2D& from);
+  BBox2D(::google::protobuf::Arena* arena, BBox2D&& from) noexcept
+      : BBox2D(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::MessageLite::ClassData* GetClassData()
+      const final;
+
+ public:
+  ::google::protobuf::Metadata GetMetadata() const final;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kDataFieldNumber = 1,
+    kPackedDataFieldNumber = 3,
+    kInfoFieldNumber = 2,
+  };
+  // repeated .BBox2DType data = 1;
+  int data_size() const;
+  private:
+  int _internal_data_size() const;
+
+  public:
+  void clear_data() ;
+  ::BBox2DType* mutable_data(int index);
+  ::google::protobuf::RepeatedPtrField<::BBox2DType>* mutable_data();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::BBox2DType>& _internal_data() const;
+  ::google::protobuf::RepeatedPtrField<::BBox2DType>* _internal_mutable_data();
+  public:
+  const ::BBox2DType& data(int index) const;
+  ::BBox2DType* add_data();
+  const ::google::protobuf::RepeatedPtrField<::BBox2DType>& data() const;
+  // bytes packed_data = 3;
+  void clear_packed_data() ;
+  const std::string& packed_data() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_packed_data(Arg_&& arg, Args_... args);
+  std::string* mutable_packed_data();
+  PROTOBUF_NODISCARD std::string* release_packed_data();
+  void set_allocated_packed_data(std::string* value);
+
+  private:
+  const std::string& _internal_packed_data() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_packed_data(
+      const std::string& value);
+  std::string* _internal_mutable_packed_data();
+
+  public:
+  // .BBox2DInfo info = 2;
+  bool has_info() const;
+  void clear_info() ;
+  const ::BBox2DInfo& info() const;
+  PROTOBUF_NODISCARD ::BBox2DInfo* release_info();
+  ::BBox2DInfo* mutable_info();
+  void set_allocated_info(::BBox2DInfo* value);
+  void unsafe_arena_set_allocated_info(::BBox2DInfo* value);
+  ::BBox2DInfo* unsafe_arena_release_info();
+
+  private:
+  const ::BBox2DInfo& _internal_info() const;
+  ::BBox2DInfo* _internal_mutable_info();
+
+  public:
+  // @@protoc_insertion_point(class_scope:BBox2D)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<
+      2, 3, 2,
+      0, 2>
+      _table_;
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(
+        ::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena);
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena, const Impl_& from);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::RepeatedPtrField< ::BBox2DType > data_;
+    ::google::protobuf::internal::ArenaStringPtr packed_data_;
+    ::BBox2DInfo* info_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
+};
+// -------------------------------------------------------------------
+
+class ClientStreamMessage final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:ClientStreamMessage) */ {
+ public:
+  inline ClientStreamMessage() : ClientStreamMessage(nullptr) {}
+  ~ClientStreamMessage() override;
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR ClientStreamMessage(
+      ::google::protobuf::internal::ConstantInitialized);
+
+  inline ClientStreamMessage(const ClientStreamMessage& from) : ClientStreamMessage(nullptr, from) {}
+  inline ClientStreamMessage(ClientStreamMessage&& from) noexcept
+      : ClientStreamMessage(nullptr, std::move(from)) {}
+  inline ClientStreamMessage& operator=(const ClientStreamMessage& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ClientStreamMessage& operator=(ClientStreamMessage&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetArena() == from.GetArena()
+#ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetArena() != nullptr
+#endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ClientStreamMessage& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ClientStreamMessage* internal_default_instance() {
+    return reinterpret_cast<const ClientStreamMessage*>(
+        &_ClientStreamMessage_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 10;
+  friend void swap(ClientStreamMessage& a, ClientStreamMessage& b) { a.Swap(&b); }
+  inline void Swap(ClientStreamMessage* other) {
+    if (other == this) return;
+#ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() != nullptr && GetArena() == other->GetArena()) {
+#else   // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetArena() == other->GetArena()) {
+#endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ClientStreamMessage* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ClientStreamMessage* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return ::google::protobuf::Message::DefaultConstruct<ClientStreamMessage>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ClientStreamMessage& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const ClientStreamMessage& from) { ClientStreamMessage::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(
+      ::google::protobuf::MessageLite& to_msg,
+      const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target,
+      ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void InternalSwap(ClientStreamMessage* other);
+ private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() { return "ClientStreamMessage"; }
+
+ protected:
+  explicit ClientStreamMessage(::google::protobuf::Arena* arena);
+  ClientStreamMessage(::google::protobuf::Arena* arena, const ClientStreamMessage& from);
+  ClientStreamMessage(::google::protobuf::Arena* arena, ClientStreamMessage&& from) noexcept
+      : ClientStreamMessage(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::MessageLite::ClassData* GetClassData()
+      const final;
+
+ public:
+  ::google::protobuf::Metadata GetMetadata() const final;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kColorImageFieldNumber = 4,
+    kDepthImageFieldNumber = 5,
+    kTopicFieldNumber = 11,
+    kBbox2DFieldNumber = 1,
+    kClockFieldNumber = 2,
+    kCameraFieldNumber = 3,
+    kTraceFieldNumber = 10,
+    kSessionFieldNumber = 13,
+    kRegionFieldNumber = 16,
+    kColorImageFrameFieldNumber = 6,
+    kDepthImageFrameFieldNumber = 7,
+    kColorCodecFieldNumber = 8,
+    kDepthCodecFieldNumber = 9,
+    kAnnotatorsFieldNumber = 12,
+    kSessionVersionFieldNumber = 15,
+    kSessionIdFieldNumber = 14,
+    kColorFormatFieldNumber = 17,
+    kDepthFormatFieldNumber = 18,
+  };
+  // bytes color_image = 4;
+  void clear_color_image() ;
+  const std::string& color_image() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_color_image(Arg_&& arg, Args_... args);
+  std::string* mutable_color_image();
+  PROTOBUF_NODISCARD std::string* release_color_image();
+  void set_allocated_color_image(std::string* value);
+
+  private:
+  const std::string& _internal_color_image() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_color_image(
+      const std::string& value);
+  std::string* _internal_mutable_color_image();
+
+  public:
+  // bytes depth_image = 5;
+  void clear_depth_image() ;
+  const std::string& depth_image() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_depth_image(Arg_&& arg, Args_... args);
+  std::string* mutable_depth_image();
+  PROTOBUF_NODISCARD std::string* release_depth_image();
+  void set_allocated_depth_image(std::string* value);
+
+  private:
+  const std::string& _internal_depth_image() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_depth_image(
+      const std::string& value);
+  std::string* _internal_mutable_depth_image();
+
+  public:
+  // string topic = 11;
+  void clear_topic() ;
+  const std::string& topic() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_topic(Arg_&& arg, Args_... args);
+  std::string* mutable_topic();
+  PROTOBUF_NODISCARD std::string* release_topic();
+  void set_allocated_topic(std::string* value);
+
+  private:
+  const std::string& _internal_topic() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_topic(
+      const std::string& value);
+  std::string* _internal_mutable_topic();
+
+  public:
+  // .BBox2D bbox2d = 1;
+  bool has_bbox2d() const;
+  void clear_bbox2d() ;
+  const ::BBox2D& bbox2d() const;
+  PROTOBUF_NODISCARD ::BBox2D* release_bbox2d();
+  ::BBox2D* mutable_bbox2d();
+  void set_allocated_bbox2d(::BBox2D* value);
+  void unsafe_arena_set_allocated_bbox2d(::BBox2D* value);
+  ::BBox2D* unsafe_arena_release_bbox2d();
+
+  private:
+  const ::BBox2D& _internal_bbox2d() const;
+  ::BBox2D* _internal_mutable_bbox2d();
+
+  public:
+  // .Clock clock = 2;
+  bool has_clock() const;
+  void clear_clock() ;
+  const ::Clock& clock() const;
+  PROTOBUF_NODISCARD ::Clock* release_clock();
+  ::Clock* mutable_clock();
+  void set_allocated_clock(::Clock* value);
+  void unsafe_arena_set_allocated_clock(::Clock* value);
+  ::Clock* unsafe_arena_release_clock();
+
+  private:
+  const ::Clock& _internal_clock() const;
+  ::Clock* _internal_mutable_clock();
+
+  public:
+  // .Camera camera = 3;
+  bool has_camera() const;
+  void clear_camera() ;
+  const ::Camera& camera() const;
+  PROTOBUF_NODISCARD ::Camera* release_camera();
+  ::Camera* mutable_camera();
+  void set_allocated_camera(::Camera* value);
+  void unsafe_arena_set_allocated_camera(::Camera* value);
+  ::Camera* unsafe_arena_release_camera();
+
+  private:
+  const ::Camera& _internal_camera() const;
+  ::Camera* _internal_mutable_camera();
+
+  public:
+  // .FrameTrace trace = 10;
+  bool has_trace() const;
+  void clear_trace() ;
+  const ::FrameTrace& trace() const;
+  PROTOBUF_NODISCARD ::FrameTrace* release_trace();
+  ::FrameTrace* mutable_trace();
+  void set_allocated_trace(::FrameTrace* value);
+  void unsafe_arena_set_allocated_trace(::FrameTrace* value);
+  ::FrameTrace* unsafe_arena_release_trace();
+
+  private:
+  const ::FrameTrace& _internal_trace() const;
+  ::FrameTrace* _internal_mutable_trace();
+
+  public:
+  // .SessionState session = 13;
+  bool has_session() const;
+  void clear_session() ;
+  const ::SessionState& session() const;
+  PROTOBUF_NODISCARD ::SessionState* release_session();
+  ::SessionState* mutable_session();
+  void set_allocated_session(::SessionState* value);
+  void unsafe_arena_set_allocated_session(::SessionState* value);
+  ::SessionState* unsafe_arena_release_session();
+
+  private:
+  const ::SessionState& _internal_session() const;
+  ::SessionState* _internal_mutable_session();
+
+  public:
+  // .ImageRegion region = 16;
+  bool has_region() const;
+  void clear_region() ;
+  const ::ImageRegion& region() const;
+  PROTOBUF_NODISCARD ::ImageRegion* release_region();
+  ::ImageRegion* mutable_region();
+  void set_allocated_region(::ImageRegion* value);
+  void unsafe_arena_set_allocated_region(::ImageRegion* value);
+  ::ImageRegion* unsafe_arena_release_region();
+
+  private:
+  const ::ImageRegion& _internal_region() const;
+  ::ImageRegion* _internal_mutable_region();
+
+  public:
+  // uint32 color_image_frame = 6;
+  void clear_color_image_frame() ;
+  ::uint32_t color_image_frame() const;
+  void set_color_image_frame(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_color_image_frame() const;
+  void _internal_set_color_image_frame(::uint32_t value);
+
+  public:
+  // uint32 depth_image_frame = 7;
+  void clear_depth_image_frame() ;
+  ::uint32_t depth_image_frame() const;
+  void set_depth_image_frame(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_depth_image_frame() const;
+  void _internal_set_depth_image_frame(::uint32_t value);
+
+  public:
+  // .ImageCodec color_codec = 8;
+  void clear_color_codec() ;
+  ::ImageCodec color_codec() const;
+  void set_color_codec(::ImageCodec value);
+
+  private:
+  ::ImageCodec _internal_color_codec() const;
+  void _internal_set_color_codec(::ImageCodec value);
+
+  public:
+  // .ImageCodec depth_codec = 9;
+  void clear_depth_codec() ;
+  ::ImageCodec depth_codec() const;
+  void set_depth_codec(::ImageCodec value);
+
+  private:
+  ::ImageCodec _internal_depth_codec() const;
+  void _internal_set_depth_codec(::ImageCodec value);
+
+  public:
+  // uint32 annotators = 12;
+  void clear_annotators() ;
+  ::uint32_t annotators() const;
+  void set_annotators(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_annotators() const;
+  void _internal_set_annotators(::uint32_t value);
+
+  public:
+  // uint32 session_version = 15;
+  void clear_session_version() ;
+  ::uint32_t session_version() const;
+  void set_session_version(::uint32_t value);
+
+  private:
+  ::uint32_t _internal_session_version() const;
+  void _internal_set_session_version(::uint32_t value);
+
+  public:
+  // uint64 session_id = 14;
+  void clear_session_id() ;
+  ::uint64_t session_id() const;
+  void set_session_id(::uint64_t value);
+
+  private:
+  ::uint64_t _internal_session_id() const;
+  void _internal_set_session_id(::uint64_t value);
+
+  public:
+  // .PixelFormat color_format = 17;
+  void clear_color_format() ;
+  ::PixelFormat color_format() const;
+  void set_color_format(::PixelFormat value);
+
+  private:
+  ::PixelFormat _internal_color_format() const;
+  void _internal_set_color_format(::PixelFormat value);
+
+  public:
+  // .PixelFormat depth_format = 18;
+  void clear_depth_format() ;
+  ::PixelFormat depth_format() const;
+  void set_depth_format(::PixelFormat value);
+
+  private:
+  ::PixelFormat _internal_depth_format() const;
+  void _internal_set_depth_format(::PixelFormat value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:ClientStreamMessage)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<
+      5, 18, 6,
+      49, 2>
+      _table_;
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(
+        ::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena);
+    inline explicit Impl_(::google::protobuf::internal::InternalVisibility visibility,
+                          ::google::protobuf::Arena* arena, const Impl_& from);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr color_image_;
+    ::google::protobuf::internal::ArenaStringPtr depth_image_;
+    ::google::protobuf::internal::ArenaStringPtr topic_;
+    ::BBox2D* bbox2d_;
+    ::Clock* clock_;
+    ::Camera* camera_;
+    ::FrameTrace* trace_;
+    ::SessionState* session_;
+    ::ImageRegion* region_;
+    ::uint32_t color_image_frame_;
+    ::uint32_t depth_image_frame_;
+    int color_codec_;
+    int depth_codec_;
+    ::uint32_t annotators_;
+    ::uint32_t session_version_;
+    ::uint64_t session_id_;
+    int color_format_;
+    int depth_format_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_client_5fstream_5fmessage_2eproto;
+};
+
+// ===================================================================
+
+
+
+
+// ===================================================================
+
+
+#ifdef __GNUC__
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wstrict-aliasing"
+#endif  // __GNUC__
+// -------------------------------------------------------------------
+
+// BBox2DType
+
+// uint32 semanticId = 1;
+inline void BBox2DType::clear_semanticid() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.semanticid_ = 0u;
+}
+inline ::uint32_t BBox2DType::semanticid() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.semanticId)
+  return _internal_semanticid();
+}
+inline void BBox2DType::set_semanticid(::uint32_t value) {
+  _internal_set_semanticid(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.semanticId)
+}
+inline ::uint32_t BBox2DType::_internal_semanticid() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.semanticid_;
+}
+inline void BBox2DType::_internal_set_semanticid(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.semanticid_ = value;
+}
+
+// int32 xMin = 2;
+inline void BBox2DType::clear_xmin() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.xmin_ = 0;
+}
+inline ::int32_t BBox2DType::xmin() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.xMin)
+  return _internal_xmin();
+}
+inline void BBox2DType::set_xmin(::int32_t value) {
+  _internal_set_xmin(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.xMin)
+}
+inline ::int32_t BBox2DType::_internal_xmin() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.xmin_;
+}
+inline void BBox2DType::_internal_set_xmin(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.xmin_ = value;
+}
+
+// int32 yMin = 3;
+inline void BBox2DType::clear_ymin() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.ymin_ = 0;
+}
+inline ::int32_t BBox2DType::ymin() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.yMin)
+  return _internal_ymin();
+}
+inline void BBox2DType::set_ymin(::int32_t value) {
+  _internal_set_ymin(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.yMin)
+}
+inline ::int32_t BBox2DType::_internal_ymin() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.ymin_;
+}
+inline void BBox2DType::_internal_set_ymin(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.ymin_ = value;
+}
+
+// int32 xMax = 4;
+inline void BBox2DType::clear_xmax() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.xmax_ = 0;
+}
+inline ::int32_t BBox2DType::xmax() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.xMax)
+  return _internal_xmax();
+}
+inline void BBox2DType::set_xmax(::int32_t value) {
+  _internal_set_xmax(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.xMax)
+}
+inline ::int32_t BBox2DType::_internal_xmax() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.xmax_;
+}
+inline void BBox2DType::_internal_set_xmax(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.xmax_ = value;
+}
+
+// int32 yMax = 5;
+inline void BBox2DType::clear_ymax() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.ymax_ = 0;
+}
+inline ::int32_t BBox2DType::ymax() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.yMax)
+  return _internal_ymax();
+}
+inline void BBox2DType::set_ymax(::int32_t value) {
+  _internal_set_ymax(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.yMax)
+}
+inline ::int32_t BBox2DType::_internal_ymax() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.ymax_;
+}
+inline void BBox2DType::_internal_set_ymax(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.ymax_ = value;
+}
+
+// float occlusionRatio = 6;
+inline void BBox2DType::clear_occlusionratio() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.occlusionratio_ = 0;
+}
+inline float BBox2DType::occlusionratio() const {
+  // @@protoc_insertion_point(field_get:BBox2DType.occlusionRatio)
+  return _internal_occlusionratio();
+}
+inline void BBox2DType::set_occlusionratio(float value) {
+  _internal_set_occlusionratio(value);
+  // @@protoc_insertion_point(field_set:BBox2DType.occlusionRatio)
+}
+inline float BBox2DType::_internal_occlusionratio() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.occlusionratio_;
+}
+inline void BBox2DType::_internal_set_occlusionratio(float value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.occlusionratio_ = value;
+}
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// BBox2DInfo
+
+// map<string, string> idToLabels = 1;
+inline int BBox2DInfo::_internal_idtolabels_size() const {
+  return _internal_idtolabels().size();
+}
+inline int BBox2DInfo::idtolabels_size() const {
+  return _internal_idtolabels_size();
+}
+inline void BBox2DInfo::clear_idtolabels() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.idtolabels_.Clear();
+}
+inline const ::google::protobuf::Map<std::string, std::string>& BBox2DInfo::_internal_idtolabels() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.idtolabels_.GetMap();
+}
+inline const ::google::protobuf::Map<std::string, std::string>& BBox2DInfo::idtolabels() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_map:BBox2DInfo.idToLabels)
+  return _internal_idtolabels();
+}
+inline ::google::protobuf::Map<std::string, std::string>* BBox2DInfo::_internal_mutable_idtolabels() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _impl_.idtolabels_.MutableMap();
+}
+inline ::google::protobuf::Map<std::string, std::string>* BBox2DInfo::mutable_idtolabels() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_map:BBox2DInfo.idToLabels)
+  return _internal_mutable_idtolabels();
+}
+
+// repeated int32 bboxIds = 2;
+inline int BBox2DInfo::_internal_bboxids_size() const {
+  return _internal_bboxids().size();
+}
+inline int BBox2DInfo::bboxids_size() const {
+  return _internal_bboxids_size();
+}
+inline void BBox2DInfo::clear_bboxids() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.bboxids_.Clear();
+}
+inline ::int32_t BBox2DInfo::bboxids(int index) const {
+  // @@protoc_insertion_point(field_get:BBox2DInfo.bboxIds)
+  return _internal_bboxids().Get(index);
+}
+inline void BBox2DInfo::set_bboxids(int index, ::int32_t value) {
+  _internal_mutable_bboxids()->Set(index, value);
+  // @@protoc_insertion_point(field_set:BBox2DInfo.bboxIds)
+}
+inline void BBox2DInfo::add_bboxids(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_bboxids()->Add(value);
+  // @@protoc_insertion_point(field_add:BBox2DInfo.bboxIds)
+}
+inline const ::google::protobuf::RepeatedField<::int32_t>& BBox2DInfo::bboxids() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:BBox2DInfo.bboxIds)
+  return _internal_bboxids();
+}
+inline ::google::protobuf::RepeatedField<::int32_t>* BBox2DInfo::mutable_bboxids()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:BBox2DInfo.bboxIds)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_bboxids();
+}
+inline const ::google::protobuf::RepeatedField<::int32_t>&
+BBox2DInfo::_internal_bboxids() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.bboxids_;
+}
+inline ::google::protobuf::RepeatedField<::int32_t>* BBox2DInfo::_internal_mutable_bboxids() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.bboxids_;
+}
+
+// -------------------------------------------------------------------
+
+// BBox2D
+
+// repeated .BBox2DType data = 1;
+inline int BBox2D::_internal_data_size() const {
+  return _internal_data().size();
+}
+inline int BBox2D::data_size() const {
+  return _internal_data_size();
+}
+inline void BBox2D::clear_data() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.data_.Clear();
+}
+inline ::BBox2DType* BBox2D::mutable_data(int index)
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable:BBox2D.data)
+  return _internal_mutable_data()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField<::BBox2DType>* BBox2D::mutable_data()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:BBox2D.data)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_data();
+}
+inline const ::BBox2DType& BBox2D::data(int index) const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:BBox2D.data)
+  return _internal_data().Get(index);
+}
+inline ::BBox2DType* BBox2D::add_data() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::BBox2DType* _add = _internal_mutable_data()->Add();
+  // @@protoc_insertion_point(field_add:BBox2D.data)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField<::BBox2DType>& BBox2D::data() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:BBox2D.data)
+  return _internal_data();
+}
+inline const ::google::protobuf::RepeatedPtrField<::BBox2DType>&
+BBox2D::_internal_data() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.data_;
+}
+inline ::google::protobuf::RepeatedPtrField<::BBox2DType>*
+BBox2D::_internal_mutable_data() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.data_;
+}
+
+// .BBox2DInfo info = 2;
+inline bool BBox2D::has_info() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.info_ != nullptr);
+  return value;
+}
+inline void BBox2D::clear_info() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (_impl_.info_ != nullptr) _impl_.info_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::BBox2DInfo& BBox2D::_internal_info() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  const ::BBox2DInfo* p = _impl_.info_;
+  return p != nullptr ? *p : reinterpret_cast<const ::BBox2DInfo&>(::_BBox2DInfo_default_instance_);
+}
+inline const ::BBox2DInfo& BBox2D::info() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:BBox2D.info)
+  return _internal_info();
+}
+inline void BBox2D::unsafe_arena_set_allocated_info(::BBox2DInfo* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (GetArena() == nullptr) {
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.info_);
+  }
+  _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(value);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:BBox2D.info)
+}
+inline ::BBox2DInfo* BBox2D::release_info() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::BBox2DInfo* released = _impl_.info_;
+  _impl_.info_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
+  released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  if (GetArena() == nullptr) {
+    delete old;
+  }
+#else   // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArena() != nullptr) {
+    released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return released;
+}
+inline ::BBox2DInfo* BBox2D::unsafe_arena_release_info() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:BBox2D.info)
+
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::BBox2DInfo* temp = _impl_.info_;
+  _impl_.info_ = nullptr;
+  return temp;
+}
+inline ::BBox2DInfo* BBox2D::_internal_mutable_info() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (_impl_.info_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::BBox2DInfo>(GetArena());
+    _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(p);
+  }
+  return _impl_.info_;
+}
+inline ::BBox2DInfo* BBox2D::mutable_info() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  ::BBox2DInfo* _msg = _internal_mutable_info();
+  // @@protoc_insertion_point(field_mutable:BBox2D.info)
+  return _msg;
+}
+inline void BBox2D::set_allocated_info(::BBox2DInfo* value) {
+  ::google::protobuf::Arena* message_arena = GetArena();
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (message_arena == nullptr) {
+    delete (_impl_.info_);
+  }
+
+  if (value != nullptr) {
+    ::google::protobuf::Arena* submessage_arena = (value)->GetArena();
+    if (message_arena != submessage_arena) {
+      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+
+  _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(value);
+  // @@protoc_insertion_point(field_set_allocated:BBox2D.info)
+}
+
+// bytes packed_data = 3;
+inline void BBox2D::clear_packed_data() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.packed_data_.ClearToEmpty();
+}
+inline const std::string& BBox2D::packed_data() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:BBox2D.packed_data)
+  return _internal_packed_data();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void BBox2D::set_packed_data(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.packed_data_.SetBytes(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:BBox2D.packed_data)
+}
+inline std::string* BBox2D::mutable_packed_data() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  std::string* _s = _internal_mutable_packed_data();
+  // @@protoc_insertion_point(field_mutable:BBox2D.packed_data)
+  return _s;
+}
+inline const std::string& BBox2D::_internal_packed_data() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.packed_data_.Get();
+}
+inline void BBox2D::_internal_set_packed_data(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.packed_data_.Set(value, GetArena());
+}
+inline std::string* BBox2D::_internal_mutable_packed_data() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _impl_.packed_data_.Mutable( GetArena());
+}
+inline std::string* BBox2D::release_packed_data() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:BBox2D.packed_data)
+  return _impl_.packed_data_.Release();
+}
+inline void BBox2D::set_allocated_packed_data(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.packed_data_.SetAllocated(value, GetArena());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.packed_data_.IsDefault()) {
+          _impl_.packed_data_.Set("", GetArena());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:BBox2D.packed_data)
+}
+
+// -------------------------------------------------------------------
+
+// Clock
+
+// double sim_dt = 1;
+inline void Clock::clear_sim_dt() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sim_dt_ = 0;
+}
+inline double Clock::sim_dt() const {
+  // @@protoc_insertion_point(field_get:Clock.sim_dt)
+  return _internal_sim_dt();
+}
+inline void Clock::set_sim_dt(double value) {
+  _internal_set_sim_dt(value);
+  // @@protoc_insertion_point(field_set:Clock.sim_dt)
+}
+inline double Clock::_internal_sim_dt() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.sim_dt_;
+}
+inline void Clock::_internal_set_sim_dt(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sim_dt_ = value;
+}
+
+// double sys_dt = 2;
+inline void Clock::clear_sys_dt() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sys_dt_ = 0;
+}
+inline double Clock::sys_dt() const {
+  // @@protoc_insertion_point(field_get:Clock.sys_dt)
+  return _internal_sys_dt();
+}
+inline void Clock::set_sys_dt(double value) {
+  _internal_set_sys_dt(value);
+  // @@protoc_insertion_point(field_set:Clock.sys_dt)
+}
+inline double Clock::_internal_sys_dt() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.sys_dt_;
+}
+inline void Clock::_internal_set_sys_dt(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sys_dt_ = value;
+}
+
+// double sim_time = 3;
+inline void Clock::clear_sim_time() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sim_time_ = 0;
+}
+inline double Clock::sim_time() const {
+  // @@protoc_insertion_point(field_get:Clock.sim_time)
+  return _internal_sim_time();
+}
+inline void Clock::set_sim_time(double value) {
+  _internal_set_sim_time(value);
+  // @@protoc_insertion_point(field_set:Clock.sim_time)
+}
+inline double Clock::_internal_sim_time() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.sim_time_;
+}
+inline void Clock::_internal_set_sim_time(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sim_time_ = value;
+}
+
+// double sys_time = 4;
+inline void Clock::clear_sys_time() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sys_time_ = 0;
+}
+inline double Clock::sys_time() const {
+  // @@protoc_insertion_point(field_get:Clock.sys_time)
+  return _internal_sys_time();
+}
+inline void Clock::set_sys_time(double value) {
+  _internal_set_sys_time(value);
+  // @@protoc_insertion_point(field_set:Clock.sys_time)
+}
+inline double Clock::_internal_sys_time() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.sys_time_;
+}
+inline void Clock::_internal_set_sys_time(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.sys_time_ = value;
+}
+
+// -------------------------------------------------------------------
+
+// Camera
+
+// repeated double view_matrix_ros = 1;
+inline int Camera::_internal_view_matrix_ros_size() const {
+  return _internal_view_matrix_ros().size();
+}
+inline int Camera::view_matrix_ros_size() const {
+  return _internal_view_matrix_ros_size();
+}
+inline void Camera::clear_view_matrix_ros() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.view_matrix_ros_.Clear();
+}
+inline double Camera::view_matrix_ros(int index) const {
+  // @@protoc_insertion_point(field_get:Camera.view_matrix_ros)
+  return _internal_view_matrix_ros().Get(index);
+}
+inline void Camera::set_view_matrix_ros(int index, double value) {
+  _internal_mutable_view_matrix_ros()->Set(index, value);
+  // @@protoc_insertion_point(field_set:Camera.view_matrix_ros)
+}
+inline void Camera::add_view_matrix_ros(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_view_matrix_ros()->Add(value);
+  // @@protoc_insertion_point(field_add:Camera.view_matrix_ros)
+}
+inline const ::google::protobuf::RepeatedField<double>& Camera::view_matrix_ros() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:Camera.view_matrix_ros)
+  return _internal_view_matrix_ros();
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::mutable_view_matrix_ros()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:Camera.view_matrix_ros)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_view_matrix_ros();
+}
+inline const ::google::protobuf::RepeatedField<double>&
+Camera::_internal_view_matrix_ros() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.view_matrix_ros_;
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_view_matrix_ros() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.view_matrix_ros_;
+}
+
+// repeated double camera_scale = 2;
+inline int Camera::_internal_camera_scale_size() const {
+  return _internal_camera_scale().size();
+}
+inline int Camera::camera_scale_size() const {
+  return _internal_camera_scale_size();
+}
+inline void Camera::clear_camera_scale() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.camera_scale_.Clear();
+}
+inline double Camera::camera_scale(int index) const {
+  // @@protoc_insertion_point(field_get:Camera.camera_scale)
+  return _internal_camera_scale().Get(index);
+}
+inline void Camera::set_camera_scale(int index, double value) {
+  _internal_mutable_camera_scale()->Set(index, value);
+  // @@protoc_insertion_point(field_set:Camera.camera_scale)
+}
+inline void Camera::add_camera_scale(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_camera_scale()->Add(value);
+  // @@protoc_insertion_point(field_add:Camera.camera_scale)
+}
+inline const ::google::protobuf::RepeatedField<double>& Camera::camera_scale() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:Camera.camera_scale)
+  return _internal_camera_scale();
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::mutable_camera_scale()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:Camera.camera_scale)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_camera_scale();
+}
+inline const ::google::protobuf::RepeatedField<double>&
+Camera::_internal_camera_scale() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.camera_scale_;
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_camera_scale() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.camera_scale_;
+}
+
+// repeated double intrinsics_matrix = 3;
+inline int Camera::_internal_intrinsics_matrix_size() const {
+  return _internal_intrinsics_matrix().size();
+}
+inline int Camera::intrinsics_matrix_size() const {
+  return _internal_intrinsics_matrix_size();
+}
+inline void Camera::clear_intrinsics_matrix() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.intrinsics_matrix_.Clear();
+}
+inline double Camera::intrinsics_matrix(int index) const {
+  // @@protoc_insertion_point(field_get:Camera.intrinsics_matrix)
+  return _internal_intrinsics_matrix().Get(index);
+}
+inline void Camera::set_intrinsics_matrix(int index, double value) {
+  _internal_mutable_intrinsics_matrix()->Set(index, value);
+  // @@protoc_insertion_point(field_set:Camera.intrinsics_matrix)
+}
+inline void Camera::add_intrinsics_matrix(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_intrinsics_matrix()->Add(value);
+  // @@protoc_insertion_point(field_add:Camera.intrinsics_matrix)
+}
+inline const ::google::protobuf::RepeatedField<double>& Camera::intrinsics_matrix() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:Camera.intrinsics_matrix)
+  return _internal_intrinsics_matrix();
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::mutable_intrinsics_matrix()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:Camera.intrinsics_matrix)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_intrinsics_matrix();
+}
+inline const ::google::protobuf::RepeatedField<double>&
+Camera::_internal_intrinsics_matrix() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.intrinsics_matrix_;
+}
+inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_intrinsics_matrix() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.intrinsics_matrix_;
+}
+
+// uint32 pose_version = 4;
+inline void Camera::clear_pose_version() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.pose_version_ = 0u;
+}
+inline ::uint32_t Camera::pose_version() const {
+  // @@protoc_insertion_point(field_get:Camera.pose_version)
+  return _internal_pose_version();
+}
+inline void Camera::set_pose_version(::uint32_t value) {
+  _internal_set_pose_version(value);
+  // @@protoc_insertion_point(field_set:Camera.pose_version)
+}
+inline ::uint32_t Camera::_internal_pose_version() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.pose_version_;
+}
+inline void Camera::_internal_set_pose_version(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.pose_version_ = value;
+}
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// SessionState
+
+// uint32 version = 1;
+inline void SessionState::clear_version() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.version_ = 0u;
+}
+inline ::uint32_t SessionState::version() const {
+  // @@protoc_insertion_point(field_get:SessionState.version)
+  return _internal_version();
+}
+inline void SessionState::set_version(::uint32_t value) {
+  _internal_set_version(value);
+  // @@protoc_insertion_point(field_set:SessionState.version)
+}
+inline ::uint32_t SessionState::_internal_version() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.version_;
+}
+inline void SessionState::_internal_set_version(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.version_ = value;
+}
+
+// map<string, string> idToLabels = 2;
+inline int SessionState::_internal_idtolabels_size() const {
+  return _internal_idtolabels().size();
+}
+inline int SessionState::idtolabels_size() const {
+  return _internal_idtolabels_size();
+}
+inline void SessionState::clear_idtolabels() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.idtolabels_.Clear();
+}
+inline const ::google::protobuf::Map<std::string, std::string>& SessionState::_internal_idtolabels() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.idtolabels_.GetMap();
+}
+inline const ::google::protobuf::Map<std::string, std::string>& SessionState::idtolabels() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_map:SessionState.idToLabels)
+  return _internal_idtolabels();
+}
+inline ::google::protobuf::Map<std::string, std::string>* SessionState::_internal_mutable_idtolabels() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _impl_.idtolabels_.MutableMap();
+}
+inline ::google::protobuf::Map<std::string, std::string>* SessionState::mutable_idtolabels() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_map:SessionState.idToLabels)
+  return _internal_mutable_idtolabels();
+}
 
-// ===================================================================
+// repeated double intrinsics_matrix = 3;
+inline int SessionState::_internal_intrinsics_matrix_size() const {
+  return _internal_intrinsics_matrix().size();
+}
+inline int SessionState::intrinsics_matrix_size() const {
+  return _internal_intrinsics_matrix_size();
+}
+inline void SessionState::clear_intrinsics_matrix() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.intrinsics_matrix_.Clear();
+}
+inline double SessionState::intrinsics_matrix(int index) const {
+  // @@protoc_insertion_point(field_get:SessionState.intrinsics_matrix)
+  return _internal_intrinsics_matrix().Get(index);
+}
+inline void SessionState::set_intrinsics_matrix(int index, double value) {
+  _internal_mutable_intrinsics_matrix()->Set(index, value);
+  // @@protoc_insertion_point(field_set:SessionState.intrinsics_matrix)
+}
+inline void SessionState::add_intrinsics_matrix(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_intrinsics_matrix()->Add(value);
+  // @@protoc_insertion_point(field_add:SessionState.intrinsics_matrix)
+}
+inline const ::google::protobuf::RepeatedField<double>& SessionState::intrinsics_matrix() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:SessionState.intrinsics_matrix)
+  return _internal_intrinsics_matrix();
+}
+inline ::google::protobuf::RepeatedField<double>* SessionState::mutable_intrinsics_matrix()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:SessionState.intrinsics_matrix)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_intrinsics_matrix();
+}
+inline const ::google::protobuf::RepeatedField<double>&
+SessionState::_internal_intrinsics_matrix() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.intrinsics_matrix_;
+}
+inline ::google::protobuf::RepeatedField<double>* SessionState::_internal_mutable_intrinsics_matrix() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.intrinsics_matrix_;
+}
 
+// repeated double camera_scale = 4;
+inline int SessionState::_internal_camera_scale_size() const {
+  return _internal_camera_scale().size();
+}
+inline int SessionState::camera_scale_size() const {
+  return _internal_camera_scale_size();
+}
+inline void SessionState::clear_camera_scale() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.camera_scale_.Clear();
+}
+inline double SessionState::camera_scale(int index) const {
+  // @@protoc_insertion_point(field_get:SessionState.camera_scale)
+  return _internal_camera_scale().Get(index);
+}
+inline void SessionState::set_camera_scale(int index, double value) {
+  _internal_mutable_camera_scale()->Set(index, value);
+  // @@protoc_insertion_point(field_set:SessionState.camera_scale)
+}
+inline void SessionState::add_camera_scale(double value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_camera_scale()->Add(value);
+  // @@protoc_insertion_point(field_add:SessionState.camera_scale)
+}
+inline const ::google::protobuf::RepeatedField<double>& SessionState::camera_scale() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:SessionState.camera_scale)
+  return _internal_camera_scale();
+}
+inline ::google::protobuf::RepeatedField<double>* SessionState::mutable_camera_scale()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:SessionState.camera_scale)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_camera_scale();
+}
+inline const ::google::protobuf::RepeatedField<double>&
+SessionState::_internal_camera_scale() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.camera_scale_;
+}
+inline ::google::protobuf::RepeatedField<double>* SessionState::_internal_mutable_camera_scale() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.camera_scale_;
+}
 
-#ifdef __GNUC__
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wstrict-aliasing"
-#endif  // __GNUC__
 // -------------------------------------------------------------------
 
-// BBox2DType
+// FrameTrace
 
-// uint32 semanticId = 1;
-inline void BBox2DType::clear_semanticid() {
+// uint64 frame_id = 1;
+inline void FrameTrace::clear_frame_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.semanticid_ = 0u;
+  _impl_.frame_id_ = ::uint64_t{0u};
 }
-inline ::uint32_t BBox2DType::semanticid() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.semanticId)
-  return _internal_semanticid();
+inline ::uint64_t FrameTrace::frame_id() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.frame_id)
+  return _internal_frame_id();
 }
-inline void BBox2DType::set_semanticid(::uint32_t value) {
-  _internal_set_semanticid(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.semanticId)
+inline void FrameTrace::set_frame_id(::uint64_t value) {
+  _internal_set_frame_id(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.frame_id)
 }
-inline ::uint32_t BBox2DType::_internal_semanticid() const {
+inline ::uint64_t FrameTrace::_internal_frame_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.semanticid_;
+  return _impl_.frame_id_;
 }
-inline void BBox2DType::_internal_set_semanticid(::uint32_t value) {
+inline void FrameTrace::_internal_set_frame_id(::uint64_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.semanticid_ = value;
+  _impl_.frame_id_ = value;
 }
 
-// int32 xMin = 2;
-inline void BBox2DType::clear_xmin() {
+// double render_time = 2;
+inline void FrameTrace::clear_render_time() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.xmin_ = 0;
+  _impl_.render_time_ = 0;
 }
-inline ::int32_t BBox2DType::xmin() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.xMin)
-  return _internal_xmin();
+inline double FrameTrace::render_time() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.render_time)
+  return _internal_render_time();
 }
-inline void BBox2DType::set_xmin(::int32_t value) {
-  _internal_set_xmin(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.xMin)
+inline void FrameTrace::set_render_time(double value) {
+  _internal_set_render_time(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.render_time)
 }
-inline ::int32_t BBox2DType::_internal_xmin() const {
+inline double FrameTrace::_internal_render_time() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.xmin_;
+  return _impl_.render_time_;
 }
-inline void BBox2DType::_internal_set_xmin(::int32_t value) {
+inline void FrameTrace::_internal_set_render_time(double value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.xmin_ = value;
+  _impl_.render_time_ = value;
 }
 
-// int32 yMin = 3;
-inline void BBox2DType::clear_ymin() {
+// double send_time = 3;
+inline void FrameTrace::clear_send_time() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.ymin_ = 0;
+  _impl_.send_time_ = 0;
 }
-inline ::int32_t BBox2DType::ymin() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.yMin)
-  return _internal_ymin();
+inline double FrameTrace::send_time() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.send_time)
+  return _internal_send_time();
 }
-inline void BBox2DType::set_ymin(::int32_t value) {
-  _internal_set_ymin(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.yMin)
+inline void FrameTrace::set_send_time(double value) {
+  _internal_set_send_time(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.send_time)
 }
-inline ::int32_t BBox2DType::_internal_ymin() const {
+inline double FrameTrace::_internal_send_time() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.ymin_;
+  return _impl_.send_time_;
 }
-inline void BBox2DType::_internal_set_ymin(::int32_t value) {
+inline void FrameTrace::_internal_set_send_time(double value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.ymin_ = value;
+  _impl_.send_time_ = value;
 }
 
-// int32 xMax = 4;
-inline void BBox2DType::clear_xmax() {
+// uint64 command_id = 4;
+inline void FrameTrace::clear_command_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.xmax_ = 0;
+  _impl_.command_id_ = ::uint64_t{0u};
 }
-inline ::int32_t BBox2DType::xmax() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.xMax)
-  return _internal_xmax();
+inline ::uint64_t FrameTrace::command_id() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.command_id)
+  return _internal_command_id();
 }
-inline void BBox2DType::set_xmax(::int32_t value) {
-  _internal_set_xmax(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.xMax)
+inline void FrameTrace::set_command_id(::uint64_t value) {
+  _internal_set_command_id(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.command_id)
 }
-inline ::int32_t BBox2DType::_internal_xmax() const {
+inline ::uint64_t FrameTrace::_internal_command_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.xmax_;
+  return _impl_.command_id_;
 }
-inline void BBox2DType::_internal_set_xmax(::int32_t value) {
+inline void FrameTrace::_internal_set_command_id(::uint64_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.xmax_ = value;
+  _impl_.command_id_ = value;
 }
 
-// int32 yMax = 5;
-inline void BBox2DType::clear_ymax() {
+// double command_send_time = 5;
+inline void FrameTrace::clear_command_send_time() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.ymax_ = 0;
+  _impl_.command_send_time_ = 0;
 }
-inline ::int32_t BBox2DType::ymax() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.yMax)
-  return _internal_ymax();
+inline double FrameTrace::command_send_time() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.command_send_time)
+  return _internal_command_send_time();
 }
-inline void BBox2DType::set_ymax(::int32_t value) {
-  _internal_set_ymax(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.yMax)
+inline void FrameTrace::set_command_send_time(double value) {
+  _internal_set_command_send_time(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.command_send_time)
 }
-inline ::int32_t BBox2DType::_internal_ymax() const {
+inline double FrameTrace::_internal_command_send_time() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.ymax_;
+  return _impl_.command_send_time_;
 }
-inline void BBox2DType::_internal_set_ymax(::int32_t value) {
+inline void FrameTrace::_internal_set_command_send_time(double value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.ymax_ = value;
+  _impl_.command_send_time_ = value;
 }
 
-// float occlusionRatio = 6;
-inline void BBox2DType::clear_occlusionratio() {
+// double command_apply_time = 6;
+inline void FrameTrace::clear_command_apply_time() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.occlusionratio_ = 0;
+  _impl_.command_apply_time_ = 0;
 }
-inline float BBox2DType::occlusionratio() const {
-  // @@protoc_insertion_point(field_get:BBox2DType.occlusionRatio)
-  return _internal_occlusionratio();
+inline double FrameTrace::command_apply_time() const {
+  // @@protoc_insertion_point(field_get:FrameTrace.command_apply_time)
+  return _internal_command_apply_time();
 }
-inline void BBox2DType::set_occlusionratio(float value) {
-  _internal_set_occlusionratio(value);
-  // @@protoc_insertion_point(field_set:BBox2DType.occlusionRatio)
+inline void FrameTrace::set_command_apply_time(double value) {
+  _internal_set_command_apply_time(value);
+  // @@protoc_insertion_point(field_set:FrameTrace.command_apply_time)
 }
-inline float BBox2DType::_internal_occlusionratio() const {
+inline double FrameTrace::_internal_command_apply_time() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.occlusionratio_;
+  return _impl_.command_apply_time_;
 }
-inline void BBox2DType::_internal_set_occlusionratio(float value) {
+inline void FrameTrace::_internal_set_command_apply_time(double value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.occlusionratio_ = value;
+  _impl_.command_apply_time_ = value;
 }
 
 // -------------------------------------------------------------------
 
-// -------------------------------------------------------------------
-
-// BBox2DInfo
+// ImageRegion
 
-// map<string, string> idToLabels = 1;
-inline int BBox2DInfo::_internal_idtolabels_size() const {
-  return _internal_idtolabels().size();
+// uint32 x = 1;
+inline void ImageRegion::clear_x() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.x_ = 0u;
 }
-inline int BBox2DInfo::idtolabels_size() const {
-  return _internal_idtolabels_size();
+inline ::uint32_t ImageRegion::x() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.x)
+  return _internal_x();
 }
-inline void BBox2DInfo::clear_idtolabels() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.idtolabels_.Clear();
+inline void ImageRegion::set_x(::uint32_t value) {
+  _internal_set_x(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.x)
 }
-inline const ::google::protobuf::Map<std::string, std::string>& BBox2DInfo::_internal_idtolabels() const {
+inline ::uint32_t ImageRegion::_internal_x() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.idtolabels_.GetMap();
+  return _impl_.x_;
 }
-inline const ::google::protobuf::Map<std::string, std::string>& BBox2DInfo::idtolabels() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_map:BBox2DInfo.idToLabels)
-  return _internal_idtolabels();
+inline void ImageRegion::_internal_set_x(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.x_ = value;
 }
-inline ::google::protobuf::Map<std::string, std::string>* BBox2DInfo::_internal_mutable_idtolabels() {
+
+// uint32 y = 2;
+inline void ImageRegion::clear_y() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _impl_.idtolabels_.MutableMap();
+  _impl_.y_ = 0u;
 }
-inline ::google::protobuf::Map<std::string, std::string>* BBox2DInfo::mutable_idtolabels() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_map:BBox2DInfo.idToLabels)
-  return _internal_mutable_idtolabels();
+inline ::uint32_t ImageRegion::y() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.y)
+  return _internal_y();
 }
-
-// repeated int32 bboxIds = 2;
-inline int BBox2DInfo::_internal_bboxids_size() const {
-  return _internal_bboxids().size();
+inline void ImageRegion::set_y(::uint32_t value) {
+  _internal_set_y(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.y)
 }
-inline int BBox2DInfo::bboxids_size() const {
-  return _internal_bboxids_size();
+inline ::uint32_t ImageRegion::_internal_y() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.y_;
 }
-inline void BBox2DInfo::clear_bboxids() {
+inline void ImageRegion::_internal_set_y(::uint32_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.bboxids_.Clear();
+  _impl_.y_ = value;
 }
-inline ::int32_t BBox2DInfo::bboxids(int index) const {
-  // @@protoc_insertion_point(field_get:BBox2DInfo.bboxIds)
-  return _internal_bboxids().Get(index);
+
+// uint32 width = 3;
+inline void ImageRegion::clear_width() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.width_ = 0u;
 }
-inline void BBox2DInfo::set_bboxids(int index, ::int32_t value) {
-  _internal_mutable_bboxids()->Set(index, value);
-  // @@protoc_insertion_point(field_set:BBox2DInfo.bboxIds)
+inline ::uint32_t ImageRegion::width() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.width)
+  return _internal_width();
 }
-inline void BBox2DInfo::add_bboxids(::int32_t value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_bboxids()->Add(value);
-  // @@protoc_insertion_point(field_add:BBox2DInfo.bboxIds)
+inline void ImageRegion::set_width(::uint32_t value) {
+  _internal_set_width(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.width)
 }
-inline const ::google::protobuf::RepeatedField<::int32_t>& BBox2DInfo::bboxids() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:BBox2DInfo.bboxIds)
-  return _internal_bboxids();
+inline ::uint32_t ImageRegion::_internal_width() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.width_;
 }
-inline ::google::protobuf::RepeatedField<::int32_t>* BBox2DInfo::mutable_bboxids()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:BBox2DInfo.bboxIds)
+inline void ImageRegion::_internal_set_width(::uint32_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_bboxids();
+  _impl_.width_ = value;
 }
-inline const ::google::protobuf::RepeatedField<::int32_t>&
-BBox2DInfo::_internal_bboxids() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.bboxids_;
+
+// uint32 height = 4;
+inline void ImageRegion::clear_height() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.height_ = 0u;
 }
-inline ::google::protobuf::RepeatedField<::int32_t>* BBox2DInfo::_internal_mutable_bboxids() {
+inline ::uint32_t ImageRegion::height() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.height)
+  return _internal_height();
+}
+inline void ImageRegion::set_height(::uint32_t value) {
+  _internal_set_height(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.height)
+}
+inline ::uint32_t ImageRegion::_internal_height() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.bboxids_;
+  return _impl_.height_;
+}
+inline void ImageRegion::_internal_set_height(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.height_ = value;
 }
 
-// -------------------------------------------------------------------
-
-// BBox2D
-
-// repeated .BBox2DType data = 1;
-inline int BBox2D::_internal_data_size() const {
-  return _internal_data().size();
+// uint32 downscale = 5;
+inline void ImageRegion::clear_downscale() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.downscale_ = 0u;
 }
-inline int BBox2D::data_size() const {
-  return _internal_data_size();
+inline ::uint32_t ImageRegion::downscale() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.downscale)
+  return _internal_downscale();
 }
-inline void BBox2D::clear_data() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.data_.Clear();
+inline void ImageRegion::set_downscale(::uint32_t value) {
+  _internal_set_downscale(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.downscale)
 }
-inline ::BBox2DType* BBox2D::mutable_data(int index)
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable:BBox2D.data)
-  return _internal_mutable_data()->Mutable(index);
+inline ::uint32_t ImageRegion::_internal_downscale() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.downscale_;
 }
-inline ::google::protobuf::RepeatedPtrField<::BBox2DType>* BBox2D::mutable_data()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:BBox2D.data)
+inline void ImageRegion::_internal_set_downscale(::uint32_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_data();
-}
-inline const ::BBox2DType& BBox2D::data(int index) const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:BBox2D.data)
-  return _internal_data().Get(index);
+  _impl_.downscale_ = value;
 }
-inline ::BBox2DType* BBox2D::add_data() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+
+// uint32 image_width = 6;
+inline void ImageRegion::clear_image_width() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ::BBox2DType* _add = _internal_mutable_data()->Add();
-  // @@protoc_insertion_point(field_add:BBox2D.data)
-  return _add;
+  _impl_.image_width_ = 0u;
 }
-inline const ::google::protobuf::RepeatedPtrField<::BBox2DType>& BBox2D::data() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:BBox2D.data)
-  return _internal_data();
+inline ::uint32_t ImageRegion::image_width() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.image_width)
+  return _internal_image_width();
 }
-inline const ::google::protobuf::RepeatedPtrField<::BBox2DType>&
-BBox2D::_internal_data() const {
+inline void ImageRegion::set_image_width(::uint32_t value) {
+  _internal_set_image_width(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.image_width)
+}
+inline ::uint32_t ImageRegion::_internal_image_width() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.data_;
+  return _impl_.image_width_;
 }
-inline ::google::protobuf::RepeatedPtrField<::BBox2DType>*
-BBox2D::_internal_mutable_data() {
+inline void ImageRegion::_internal_set_image_width(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.image_width_ = value;
+}
+
+// uint32 image_height = 7;
+inline void ImageRegion::clear_image_height() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.image_height_ = 0u;
+}
+inline ::uint32_t ImageRegion::image_height() const {
+  // @@protoc_insertion_point(field_get:ImageRegion.image_height)
+  return _internal_image_height();
+}
+inline void ImageRegion::set_image_height(::uint32_t value) {
+  _internal_set_image_height(value);
+  // @@protoc_insertion_point(field_set:ImageRegion.image_height)
+}
+inline ::uint32_t ImageRegion::_internal_image_height() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.data_;
+  return _impl_.image_height_;
+}
+inline void ImageRegion::_internal_set_image_height(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.image_height_ = value;
 }
 
-// .BBox2DInfo info = 2;
-inline bool BBox2D::has_info() const {
+// -------------------------------------------------------------------
+
+// ClientStreamMessage
+
+// .BBox2D bbox2d = 1;
+inline bool ClientStreamMessage::has_bbox2d() const {
   bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.info_ != nullptr);
+  PROTOBUF_ASSUME(!value || _impl_.bbox2d_ != nullptr);
   return value;
 }
-inline void BBox2D::clear_info() {
+inline void ClientStreamMessage::clear_bbox2d() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.info_ != nullptr) _impl_.info_->Clear();
+  if (_impl_.bbox2d_ != nullptr) _impl_.bbox2d_->Clear();
   _impl_._has_bits_[0] &= ~0x00000001u;
 }
-inline const ::BBox2DInfo& BBox2D::_internal_info() const {
+inline const ::BBox2D& ClientStreamMessage::_internal_bbox2d() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::BBox2DInfo* p = _impl_.info_;
-  return p != nullptr ? *p : reinterpret_cast<const ::BBox2DInfo&>(::_BBox2DInfo_default_instance_);
+  const ::BBox2D* p = _impl_.bbox2d_;
+  return p != nullptr ? *p : reinterpret_cast<const ::BBox2D&>(::_BBox2D_default_instance_);
 }
-inline const ::BBox2DInfo& BBox2D::info() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:BBox2D.info)
-  return _internal_info();
+inline const ::BBox2D& ClientStreamMessage::bbox2d() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.bbox2d)
+  return _internal_bbox2d();
 }
-inline void BBox2D::unsafe_arena_set_allocated_info(::BBox2DInfo* value) {
+inline void ClientStreamMessage::unsafe_arena_set_allocated_bbox2d(::BBox2D* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (GetArena() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.info_);
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.bbox2d_);
   }
-  _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(value);
+  _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(value);
   if (value != nullptr) {
     _impl_._has_bits_[0] |= 0x00000001u;
   } else {
     _impl_._has_bits_[0] &= ~0x00000001u;
   }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:BBox2D.info)
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.bbox2d)
 }
-inline ::BBox2DInfo* BBox2D::release_info() {
+inline ::BBox2D* ClientStreamMessage::release_bbox2d() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
   _impl_._has_bits_[0] &= ~0x00000001u;
-  ::BBox2DInfo* released = _impl_.info_;
-  _impl_.info_ = nullptr;
+  ::BBox2D* released = _impl_.bbox2d_;
+  _impl_.bbox2d_ = nullptr;
 #ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
   auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
   released = ::google::protobuf::internal::DuplicateIfNonNull(released);
@@ -1721,34 +3614,34 @@ inline ::BBox2DInfo* BBox2D::release_info() {
 #endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
   return released;
 }
-inline ::BBox2DInfo* BBox2D::unsafe_arena_release_info() {
+inline ::BBox2D* ClientStreamMessage::unsafe_arena_release_bbox2d() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:BBox2D.info)
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.bbox2d)
 
   _impl_._has_bits_[0] &= ~0x00000001u;
-  ::BBox2DInfo* temp = _impl_.info_;
-  _impl_.info_ = nullptr;
+  ::BBox2D* temp = _impl_.bbox2d_;
+  _impl_.bbox2d_ = nullptr;
   return temp;
 }
-inline ::BBox2DInfo* BBox2D::_internal_mutable_info() {
+inline ::BBox2D* ClientStreamMessage::_internal_mutable_bbox2d() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.info_ == nullptr) {
-    auto* p = ::google::protobuf::Message::DefaultConstruct<::BBox2DInfo>(GetArena());
-    _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(p);
+  if (_impl_.bbox2d_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::BBox2D>(GetArena());
+    _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(p);
   }
-  return _impl_.info_;
+  return _impl_.bbox2d_;
 }
-inline ::BBox2DInfo* BBox2D::mutable_info() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+inline ::BBox2D* ClientStreamMessage::mutable_bbox2d() ABSL_ATTRIBUTE_LIFETIME_BOUND {
   _impl_._has_bits_[0] |= 0x00000001u;
-  ::BBox2DInfo* _msg = _internal_mutable_info();
-  // @@protoc_insertion_point(field_mutable:BBox2D.info)
+  ::BBox2D* _msg = _internal_mutable_bbox2d();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.bbox2d)
   return _msg;
 }
-inline void BBox2D::set_allocated_info(::BBox2DInfo* value) {
+inline void ClientStreamMessage::set_allocated_bbox2d(::BBox2D* value) {
   ::google::protobuf::Arena* message_arena = GetArena();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (message_arena == nullptr) {
-    delete (_impl_.info_);
+    delete (_impl_.bbox2d_);
   }
 
   if (value != nullptr) {
@@ -1761,284 +3654,429 @@ inline void BBox2D::set_allocated_info(::BBox2DInfo* value) {
     _impl_._has_bits_[0] &= ~0x00000001u;
   }
 
-  _impl_.info_ = reinterpret_cast<::BBox2DInfo*>(value);
-  // @@protoc_insertion_point(field_set_allocated:BBox2D.info)
+  _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.bbox2d)
 }
 
-// -------------------------------------------------------------------
+// .Clock clock = 2;
+inline bool ClientStreamMessage::has_clock() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.clock_ != nullptr);
+  return value;
+}
+inline void ClientStreamMessage::clear_clock() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (_impl_.clock_ != nullptr) _impl_.clock_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const ::Clock& ClientStreamMessage::_internal_clock() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  const ::Clock* p = _impl_.clock_;
+  return p != nullptr ? *p : reinterpret_cast<const ::Clock&>(::_Clock_default_instance_);
+}
+inline const ::Clock& ClientStreamMessage::clock() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.clock)
+  return _internal_clock();
+}
+inline void ClientStreamMessage::unsafe_arena_set_allocated_clock(::Clock* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (GetArena() == nullptr) {
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.clock_);
+  }
+  _impl_.clock_ = reinterpret_cast<::Clock*>(value);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.clock)
+}
+inline ::Clock* ClientStreamMessage::release_clock() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
-// Clock
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::Clock* released = _impl_.clock_;
+  _impl_.clock_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
+  released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  if (GetArena() == nullptr) {
+    delete old;
+  }
+#else   // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArena() != nullptr) {
+    released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return released;
+}
+inline ::Clock* ClientStreamMessage::unsafe_arena_release_clock() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.clock)
 
-// double sim_dt = 1;
-inline void Clock::clear_sim_dt() {
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::Clock* temp = _impl_.clock_;
+  _impl_.clock_ = nullptr;
+  return temp;
+}
+inline ::Clock* ClientStreamMessage::_internal_mutable_clock() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sim_dt_ = 0;
+  if (_impl_.clock_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::Clock>(GetArena());
+    _impl_.clock_ = reinterpret_cast<::Clock*>(p);
+  }
+  return _impl_.clock_;
 }
-inline double Clock::sim_dt() const {
-  // @@protoc_insertion_point(field_get:Clock.sim_dt)
-  return _internal_sim_dt();
+inline ::Clock* ClientStreamMessage::mutable_clock() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  ::Clock* _msg = _internal_mutable_clock();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.clock)
+  return _msg;
 }
-inline void Clock::set_sim_dt(double value) {
-  _internal_set_sim_dt(value);
-  // @@protoc_insertion_point(field_set:Clock.sim_dt)
+inline void ClientStreamMessage::set_allocated_clock(::Clock* value) {
+  ::google::protobuf::Arena* message_arena = GetArena();
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (message_arena == nullptr) {
+    delete (_impl_.clock_);
+  }
+
+  if (value != nullptr) {
+    ::google::protobuf::Arena* submessage_arena = (value)->GetArena();
+    if (message_arena != submessage_arena) {
+      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+
+  _impl_.clock_ = reinterpret_cast<::Clock*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.clock)
 }
-inline double Clock::_internal_sim_dt() const {
+
+// .Camera camera = 3;
+inline bool ClientStreamMessage::has_camera() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.camera_ != nullptr);
+  return value;
+}
+inline void ClientStreamMessage::clear_camera() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (_impl_.camera_ != nullptr) _impl_.camera_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const ::Camera& ClientStreamMessage::_internal_camera() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.sim_dt_;
+  const ::Camera* p = _impl_.camera_;
+  return p != nullptr ? *p : reinterpret_cast<const ::Camera&>(::_Camera_default_instance_);
 }
-inline void Clock::_internal_set_sim_dt(double value) {
+inline const ::Camera& ClientStreamMessage::camera() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.camera)
+  return _internal_camera();
+}
+inline void ClientStreamMessage::unsafe_arena_set_allocated_camera(::Camera* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sim_dt_ = value;
+  if (GetArena() == nullptr) {
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.camera_);
+  }
+  _impl_.camera_ = reinterpret_cast<::Camera*>(value);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.camera)
 }
-
-// double sys_dt = 2;
-inline void Clock::clear_sys_dt() {
+inline ::Camera* ClientStreamMessage::release_camera() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sys_dt_ = 0;
+
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  ::Camera* released = _impl_.camera_;
+  _impl_.camera_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
+  released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  if (GetArena() == nullptr) {
+    delete old;
+  }
+#else   // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArena() != nullptr) {
+    released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return released;
 }
-inline double Clock::sys_dt() const {
-  // @@protoc_insertion_point(field_get:Clock.sys_dt)
-  return _internal_sys_dt();
+inline ::Camera* ClientStreamMessage::unsafe_arena_release_camera() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.camera)
+
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  ::Camera* temp = _impl_.camera_;
+  _impl_.camera_ = nullptr;
+  return temp;
 }
-inline void Clock::set_sys_dt(double value) {
-  _internal_set_sys_dt(value);
-  // @@protoc_insertion_point(field_set:Clock.sys_dt)
+inline ::Camera* ClientStreamMessage::_internal_mutable_camera() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (_impl_.camera_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::Camera>(GetArena());
+    _impl_.camera_ = reinterpret_cast<::Camera*>(p);
+  }
+  return _impl_.camera_;
 }
-inline double Clock::_internal_sys_dt() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.sys_dt_;
+inline ::Camera* ClientStreamMessage::mutable_camera() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  ::Camera* _msg = _internal_mutable_camera();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.camera)
+  return _msg;
 }
-inline void Clock::_internal_set_sys_dt(double value) {
+inline void ClientStreamMessage::set_allocated_camera(::Camera* value) {
+  ::google::protobuf::Arena* message_arena = GetArena();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sys_dt_ = value;
+  if (message_arena == nullptr) {
+    delete (_impl_.camera_);
+  }
+
+  if (value != nullptr) {
+    ::google::protobuf::Arena* submessage_arena = (value)->GetArena();
+    if (message_arena != submessage_arena) {
+      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+
+  _impl_.camera_ = reinterpret_cast<::Camera*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.camera)
 }
 
-// double sim_time = 3;
-inline void Clock::clear_sim_time() {
+// bytes color_image = 4;
+inline void ClientStreamMessage::clear_color_image() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sim_time_ = 0;
+  _impl_.color_image_.ClearToEmpty();
 }
-inline double Clock::sim_time() const {
-  // @@protoc_insertion_point(field_get:Clock.sim_time)
-  return _internal_sim_time();
+inline const std::string& ClientStreamMessage::color_image() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.color_image)
+  return _internal_color_image();
 }
-inline void Clock::set_sim_time(double value) {
-  _internal_set_sim_time(value);
-  // @@protoc_insertion_point(field_set:Clock.sim_time)
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ClientStreamMessage::set_color_image(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.color_image_.SetBytes(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.color_image)
 }
-inline double Clock::_internal_sim_time() const {
+inline std::string* ClientStreamMessage::mutable_color_image() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  std::string* _s = _internal_mutable_color_image();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.color_image)
+  return _s;
+}
+inline const std::string& ClientStreamMessage::_internal_color_image() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.sim_time_;
+  return _impl_.color_image_.Get();
 }
-inline void Clock::_internal_set_sim_time(double value) {
+inline void ClientStreamMessage::_internal_set_color_image(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sim_time_ = value;
+  _impl_.color_image_.Set(value, GetArena());
 }
-
-// double sys_time = 4;
-inline void Clock::clear_sys_time() {
+inline std::string* ClientStreamMessage::_internal_mutable_color_image() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sys_time_ = 0;
-}
-inline double Clock::sys_time() const {
-  // @@protoc_insertion_point(field_get:Clock.sys_time)
-  return _internal_sys_time();
-}
-inline void Clock::set_sys_time(double value) {
-  _internal_set_sys_time(value);
-  // @@protoc_insertion_point(field_set:Clock.sys_time)
+  return _impl_.color_image_.Mutable( GetArena());
 }
-inline double Clock::_internal_sys_time() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.sys_time_;
+inline std::string* ClientStreamMessage::release_color_image() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.color_image)
+  return _impl_.color_image_.Release();
 }
-inline void Clock::_internal_set_sys_time(double value) {
+inline void ClientStreamMessage::set_allocated_color_image(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.sys_time_ = value;
+  _impl_.color_image_.SetAllocated(value, GetArena());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.color_image_.IsDefault()) {
+          _impl_.color_image_.Set("", GetArena());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.color_image)
 }
 
-// -------------------------------------------------------------------
-
-// Camera
-
-// repeated double view_matrix_ros = 1;
-inline int Camera::_internal_view_matrix_ros_size() const {
-  return _internal_view_matrix_ros().size();
+// bytes depth_image = 5;
+inline void ClientStreamMessage::clear_depth_image() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.depth_image_.ClearToEmpty();
 }
-inline int Camera::view_matrix_ros_size() const {
-  return _internal_view_matrix_ros_size();
+inline const std::string& ClientStreamMessage::depth_image() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.depth_image)
+  return _internal_depth_image();
 }
-inline void Camera::clear_view_matrix_ros() {
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ClientStreamMessage::set_depth_image(Arg_&& arg,
+                                                     Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.view_matrix_ros_.Clear();
+  _impl_.depth_image_.SetBytes(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.depth_image)
 }
-inline double Camera::view_matrix_ros(int index) const {
-  // @@protoc_insertion_point(field_get:Camera.view_matrix_ros)
-  return _internal_view_matrix_ros().Get(index);
+inline std::string* ClientStreamMessage::mutable_depth_image() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  std::string* _s = _internal_mutable_depth_image();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.depth_image)
+  return _s;
 }
-inline void Camera::set_view_matrix_ros(int index, double value) {
-  _internal_mutable_view_matrix_ros()->Set(index, value);
-  // @@protoc_insertion_point(field_set:Camera.view_matrix_ros)
+inline const std::string& ClientStreamMessage::_internal_depth_image() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.depth_image_.Get();
 }
-inline void Camera::add_view_matrix_ros(double value) {
+inline void ClientStreamMessage::_internal_set_depth_image(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_view_matrix_ros()->Add(value);
-  // @@protoc_insertion_point(field_add:Camera.view_matrix_ros)
-}
-inline const ::google::protobuf::RepeatedField<double>& Camera::view_matrix_ros() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:Camera.view_matrix_ros)
-  return _internal_view_matrix_ros();
+  _impl_.depth_image_.Set(value, GetArena());
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::mutable_view_matrix_ros()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:Camera.view_matrix_ros)
+inline std::string* ClientStreamMessage::_internal_mutable_depth_image() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_view_matrix_ros();
+  return _impl_.depth_image_.Mutable( GetArena());
 }
-inline const ::google::protobuf::RepeatedField<double>&
-Camera::_internal_view_matrix_ros() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.view_matrix_ros_;
+inline std::string* ClientStreamMessage::release_depth_image() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.depth_image)
+  return _impl_.depth_image_.Release();
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_view_matrix_ros() {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.view_matrix_ros_;
+inline void ClientStreamMessage::set_allocated_depth_image(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.depth_image_.SetAllocated(value, GetArena());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.depth_image_.IsDefault()) {
+          _impl_.depth_image_.Set("", GetArena());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.depth_image)
 }
 
-// repeated double camera_scale = 2;
-inline int Camera::_internal_camera_scale_size() const {
-  return _internal_camera_scale().size();
+// uint32 color_image_frame = 6;
+inline void ClientStreamMessage::clear_color_image_frame() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.color_image_frame_ = 0u;
 }
-inline int Camera::camera_scale_size() const {
-  return _internal_camera_scale_size();
+inline ::uint32_t ClientStreamMessage::color_image_frame() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.color_image_frame)
+  return _internal_color_image_frame();
 }
-inline void Camera::clear_camera_scale() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.camera_scale_.Clear();
+inline void ClientStreamMessage::set_color_image_frame(::uint32_t value) {
+  _internal_set_color_image_frame(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.color_image_frame)
 }
-inline double Camera::camera_scale(int index) const {
-  // @@protoc_insertion_point(field_get:Camera.camera_scale)
-  return _internal_camera_scale().Get(index);
+inline ::uint32_t ClientStreamMessage::_internal_color_image_frame() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.color_image_frame_;
 }
-inline void Camera::set_camera_scale(int index, double value) {
-  _internal_mutable_camera_scale()->Set(index, value);
-  // @@protoc_insertion_point(field_set:Camera.camera_scale)
+inline void ClientStreamMessage::_internal_set_color_image_frame(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.color_image_frame_ = value;
 }
-inline void Camera::add_camera_scale(double value) {
+
+// uint32 depth_image_frame = 7;
+inline void ClientStreamMessage::clear_depth_image_frame() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_camera_scale()->Add(value);
-  // @@protoc_insertion_point(field_add:Camera.camera_scale)
+  _impl_.depth_image_frame_ = 0u;
 }
-inline const ::google::protobuf::RepeatedField<double>& Camera::camera_scale() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:Camera.camera_scale)
-  return _internal_camera_scale();
+inline ::uint32_t ClientStreamMessage::depth_image_frame() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.depth_image_frame)
+  return _internal_depth_image_frame();
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::mutable_camera_scale()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:Camera.camera_scale)
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_camera_scale();
+inline void ClientStreamMessage::set_depth_image_frame(::uint32_t value) {
+  _internal_set_depth_image_frame(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.depth_image_frame)
 }
-inline const ::google::protobuf::RepeatedField<double>&
-Camera::_internal_camera_scale() const {
+inline ::uint32_t ClientStreamMessage::_internal_depth_image_frame() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.camera_scale_;
+  return _impl_.depth_image_frame_;
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_camera_scale() {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.camera_scale_;
+inline void ClientStreamMessage::_internal_set_depth_image_frame(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.depth_image_frame_ = value;
 }
 
-// repeated double intrinsics_matrix = 3;
-inline int Camera::_internal_intrinsics_matrix_size() const {
-  return _internal_intrinsics_matrix().size();
+// .ImageCodec color_codec = 8;
+inline void ClientStreamMessage::clear_color_codec() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.color_codec_ = 0;
 }
-inline int Camera::intrinsics_matrix_size() const {
-  return _internal_intrinsics_matrix_size();
+inline ::ImageCodec ClientStreamMessage::color_codec() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.color_codec)
+  return _internal_color_codec();
 }
-inline void Camera::clear_intrinsics_matrix() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.intrinsics_matrix_.Clear();
+inline void ClientStreamMessage::set_color_codec(::ImageCodec value) {
+  _internal_set_color_codec(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.color_codec)
 }
-inline double Camera::intrinsics_matrix(int index) const {
-  // @@protoc_insertion_point(field_get:Camera.intrinsics_matrix)
-  return _internal_intrinsics_matrix().Get(index);
+inline ::ImageCodec ClientStreamMessage::_internal_color_codec() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return static_cast<::ImageCodec>(_impl_.color_codec_);
 }
-inline void Camera::set_intrinsics_matrix(int index, double value) {
-  _internal_mutable_intrinsics_matrix()->Set(index, value);
-  // @@protoc_insertion_point(field_set:Camera.intrinsics_matrix)
+inline void ClientStreamMessage::_internal_set_color_codec(::ImageCodec value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.color_codec_ = value;
 }
-inline void Camera::add_intrinsics_matrix(double value) {
+
+// .ImageCodec depth_codec = 9;
+inline void ClientStreamMessage::clear_depth_codec() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_intrinsics_matrix()->Add(value);
-  // @@protoc_insertion_point(field_add:Camera.intrinsics_matrix)
+  _impl_.depth_codec_ = 0;
 }
-inline const ::google::protobuf::RepeatedField<double>& Camera::intrinsics_matrix() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:Camera.intrinsics_matrix)
-  return _internal_intrinsics_matrix();
+inline ::ImageCodec ClientStreamMessage::depth_codec() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.depth_codec)
+  return _internal_depth_codec();
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::mutable_intrinsics_matrix()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:Camera.intrinsics_matrix)
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_intrinsics_matrix();
+inline void ClientStreamMessage::set_depth_codec(::ImageCodec value) {
+  _internal_set_depth_codec(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.depth_codec)
 }
-inline const ::google::protobuf::RepeatedField<double>&
-Camera::_internal_intrinsics_matrix() const {
+inline ::ImageCodec ClientStreamMessage::_internal_depth_codec() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.intrinsics_matrix_;
+  return static_cast<::ImageCodec>(_impl_.depth_codec_);
 }
-inline ::google::protobuf::RepeatedField<double>* Camera::_internal_mutable_intrinsics_matrix() {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.intrinsics_matrix_;
+inline void ClientStreamMessage::_internal_set_depth_codec(::ImageCodec value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.depth_codec_ = value;
 }
 
-// -------------------------------------------------------------------
-
-// ClientStreamMessage
-
-// .BBox2D bbox2d = 1;
-inline bool ClientStreamMessage::has_bbox2d() const {
-  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.bbox2d_ != nullptr);
+// .FrameTrace trace = 10;
+inline bool ClientStreamMessage::has_trace() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.trace_ != nullptr);
   return value;
 }
-inline void ClientStreamMessage::clear_bbox2d() {
+inline void ClientStreamMessage::clear_trace() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.bbox2d_ != nullptr) _impl_.bbox2d_->Clear();
-  _impl_._has_bits_[0] &= ~0x00000001u;
+  if (_impl_.trace_ != nullptr) _impl_.trace_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000008u;
 }
-inline const ::BBox2D& ClientStreamMessage::_internal_bbox2d() const {
+inline const ::FrameTrace& ClientStreamMessage::_internal_trace() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::BBox2D* p = _impl_.bbox2d_;
-  return p != nullptr ? *p : reinterpret_cast<const ::BBox2D&>(::_BBox2D_default_instance_);
+  const ::FrameTrace* p = _impl_.trace_;
+  return p != nullptr ? *p : reinterpret_cast<const ::FrameTrace&>(::_FrameTrace_default_instance_);
 }
-inline const ::BBox2D& ClientStreamMessage::bbox2d() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:ClientStreamMessage.bbox2d)
-  return _internal_bbox2d();
+inline const ::FrameTrace& ClientStreamMessage::trace() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.trace)
+  return _internal_trace();
 }
-inline void ClientStreamMessage::unsafe_arena_set_allocated_bbox2d(::BBox2D* value) {
+inline void ClientStreamMessage::unsafe_arena_set_allocated_trace(::FrameTrace* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (GetArena() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.bbox2d_);
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.trace_);
   }
-  _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(value);
+  _impl_.trace_ = reinterpret_cast<::FrameTrace*>(value);
   if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000001u;
+    _impl_._has_bits_[0] |= 0x00000008u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
+    _impl_._has_bits_[0] &= ~0x00000008u;
   }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.bbox2d)
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.trace)
 }
-inline ::BBox2D* ClientStreamMessage::release_bbox2d() {
+inline ::FrameTrace* ClientStreamMessage::release_trace() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  ::BBox2D* released = _impl_.bbox2d_;
-  _impl_.bbox2d_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  ::FrameTrace* released = _impl_.trace_;
+  _impl_.trace_ = nullptr;
 #ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
   auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
   released = ::google::protobuf::internal::DuplicateIfNonNull(released);
@@ -2052,34 +4090,34 @@ inline ::BBox2D* ClientStreamMessage::release_bbox2d() {
 #endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
   return released;
 }
-inline ::BBox2D* ClientStreamMessage::unsafe_arena_release_bbox2d() {
+inline ::FrameTrace* ClientStreamMessage::unsafe_arena_release_trace() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:ClientStreamMessage.bbox2d)
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.trace)
 
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  ::BBox2D* temp = _impl_.bbox2d_;
-  _impl_.bbox2d_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  ::FrameTrace* temp = _impl_.trace_;
+  _impl_.trace_ = nullptr;
   return temp;
 }
-inline ::BBox2D* ClientStreamMessage::_internal_mutable_bbox2d() {
+inline ::FrameTrace* ClientStreamMessage::_internal_mutable_trace() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.bbox2d_ == nullptr) {
-    auto* p = ::google::protobuf::Message::DefaultConstruct<::BBox2D>(GetArena());
-    _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(p);
+  if (_impl_.trace_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::FrameTrace>(GetArena());
+    _impl_.trace_ = reinterpret_cast<::FrameTrace*>(p);
   }
-  return _impl_.bbox2d_;
+  return _impl_.trace_;
 }
-inline ::BBox2D* ClientStreamMessage::mutable_bbox2d() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  _impl_._has_bits_[0] |= 0x00000001u;
-  ::BBox2D* _msg = _internal_mutable_bbox2d();
-  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.bbox2d)
+inline ::FrameTrace* ClientStreamMessage::mutable_trace() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  ::FrameTrace* _msg = _internal_mutable_trace();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.trace)
   return _msg;
 }
-inline void ClientStreamMessage::set_allocated_bbox2d(::BBox2D* value) {
+inline void ClientStreamMessage::set_allocated_trace(::FrameTrace* value) {
   ::google::protobuf::Arena* message_arena = GetArena();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (message_arena == nullptr) {
-    delete (_impl_.bbox2d_);
+    delete (_impl_.trace_);
   }
 
   if (value != nullptr) {
@@ -2087,54 +4125,126 @@ inline void ClientStreamMessage::set_allocated_bbox2d(::BBox2D* value) {
     if (message_arena != submessage_arena) {
       value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
     }
-    _impl_._has_bits_[0] |= 0x00000001u;
+    _impl_._has_bits_[0] |= 0x00000008u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
+    _impl_._has_bits_[0] &= ~0x00000008u;
   }
 
-  _impl_.bbox2d_ = reinterpret_cast<::BBox2D*>(value);
-  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.bbox2d)
+  _impl_.trace_ = reinterpret_cast<::FrameTrace*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.trace)
 }
 
-// .Clock clock = 2;
-inline bool ClientStreamMessage::has_clock() const {
-  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.clock_ != nullptr);
+// string topic = 11;
+inline void ClientStreamMessage::clear_topic() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.topic_.ClearToEmpty();
+}
+inline const std::string& ClientStreamMessage::topic() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.topic)
+  return _internal_topic();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ClientStreamMessage::set_topic(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.topic_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.topic)
+}
+inline std::string* ClientStreamMessage::mutable_topic() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  std::string* _s = _internal_mutable_topic();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.topic)
+  return _s;
+}
+inline const std::string& ClientStreamMessage::_internal_topic() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.topic_.Get();
+}
+inline void ClientStreamMessage::_internal_set_topic(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.topic_.Set(value, GetArena());
+}
+inline std::string* ClientStreamMessage::_internal_mutable_topic() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _impl_.topic_.Mutable( GetArena());
+}
+inline std::string* ClientStreamMessage::release_topic() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.topic)
+  return _impl_.topic_.Release();
+}
+inline void ClientStreamMessage::set_allocated_topic(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.topic_.SetAllocated(value, GetArena());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.topic_.IsDefault()) {
+          _impl_.topic_.Set("", GetArena());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.topic)
+}
+
+// uint32 annotators = 12;
+inline void ClientStreamMessage::clear_annotators() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.annotators_ = 0u;
+}
+inline ::uint32_t ClientStreamMessage::annotators() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.annotators)
+  return _internal_annotators();
+}
+inline void ClientStreamMessage::set_annotators(::uint32_t value) {
+  _internal_set_annotators(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.annotators)
+}
+inline ::uint32_t ClientStreamMessage::_internal_annotators() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.annotators_;
+}
+inline void ClientStreamMessage::_internal_set_annotators(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.annotators_ = value;
+}
+
+// .SessionState session = 13;
+inline bool ClientStreamMessage::has_session() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000010u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.session_ != nullptr);
   return value;
 }
-inline void ClientStreamMessage::clear_clock() {
+inline void ClientStreamMessage::clear_session() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.clock_ != nullptr) _impl_.clock_->Clear();
-  _impl_._has_bits_[0] &= ~0x00000002u;
+  if (_impl_.session_ != nullptr) _impl_.session_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000010u;
 }
-inline const ::Clock& ClientStreamMessage::_internal_clock() const {
+inline const ::SessionState& ClientStreamMessage::_internal_session() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::Clock* p = _impl_.clock_;
-  return p != nullptr ? *p : reinterpret_cast<const ::Clock&>(::_Clock_default_instance_);
+  const ::SessionState* p = _impl_.session_;
+  return p != nullptr ? *p : reinterpret_cast<const ::SessionState&>(::_SessionState_default_instance_);
 }
-inline const ::Clock& ClientStreamMessage::clock() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:ClientStreamMessage.clock)
-  return _internal_clock();
+inline const ::SessionState& ClientStreamMessage::session() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.session)
+  return _internal_session();
 }
-inline void ClientStreamMessage::unsafe_arena_set_allocated_clock(::Clock* value) {
+inline void ClientStreamMessage::unsafe_arena_set_allocated_session(::SessionState* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (GetArena() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.clock_);
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.session_);
   }
-  _impl_.clock_ = reinterpret_cast<::Clock*>(value);
+  _impl_.session_ = reinterpret_cast<::SessionState*>(value);
   if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000002u;
+    _impl_._has_bits_[0] |= 0x00000010u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000002u;
+    _impl_._has_bits_[0] &= ~0x00000010u;
   }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.clock)
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.session)
 }
-inline ::Clock* ClientStreamMessage::release_clock() {
+inline ::SessionState* ClientStreamMessage::release_session() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
-  _impl_._has_bits_[0] &= ~0x00000002u;
-  ::Clock* released = _impl_.clock_;
-  _impl_.clock_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::SessionState* released = _impl_.session_;
+  _impl_.session_ = nullptr;
 #ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
   auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
   released = ::google::protobuf::internal::DuplicateIfNonNull(released);
@@ -2148,34 +4258,34 @@ inline ::Clock* ClientStreamMessage::release_clock() {
 #endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
   return released;
 }
-inline ::Clock* ClientStreamMessage::unsafe_arena_release_clock() {
+inline ::SessionState* ClientStreamMessage::unsafe_arena_release_session() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:ClientStreamMessage.clock)
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.session)
 
-  _impl_._has_bits_[0] &= ~0x00000002u;
-  ::Clock* temp = _impl_.clock_;
-  _impl_.clock_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::SessionState* temp = _impl_.session_;
+  _impl_.session_ = nullptr;
   return temp;
 }
-inline ::Clock* ClientStreamMessage::_internal_mutable_clock() {
+inline ::SessionState* ClientStreamMessage::_internal_mutable_session() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.clock_ == nullptr) {
-    auto* p = ::google::protobuf::Message::DefaultConstruct<::Clock>(GetArena());
-    _impl_.clock_ = reinterpret_cast<::Clock*>(p);
+  if (_impl_.session_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::SessionState>(GetArena());
+    _impl_.session_ = reinterpret_cast<::SessionState*>(p);
   }
-  return _impl_.clock_;
+  return _impl_.session_;
 }
-inline ::Clock* ClientStreamMessage::mutable_clock() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  _impl_._has_bits_[0] |= 0x00000002u;
-  ::Clock* _msg = _internal_mutable_clock();
-  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.clock)
+inline ::SessionState* ClientStreamMessage::mutable_session() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  ::SessionState* _msg = _internal_mutable_session();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.session)
   return _msg;
 }
-inline void ClientStreamMessage::set_allocated_clock(::Clock* value) {
+inline void ClientStreamMessage::set_allocated_session(::SessionState* value) {
   ::google::protobuf::Arena* message_arena = GetArena();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (message_arena == nullptr) {
-    delete (_impl_.clock_);
+    delete (_impl_.session_);
   }
 
   if (value != nullptr) {
@@ -2183,54 +4293,98 @@ inline void ClientStreamMessage::set_allocated_clock(::Clock* value) {
     if (message_arena != submessage_arena) {
       value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
     }
-    _impl_._has_bits_[0] |= 0x00000002u;
+    _impl_._has_bits_[0] |= 0x00000010u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000002u;
+    _impl_._has_bits_[0] &= ~0x00000010u;
   }
 
-  _impl_.clock_ = reinterpret_cast<::Clock*>(value);
-  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.clock)
+  _impl_.session_ = reinterpret_cast<::SessionState*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.session)
 }
 
-// .Camera camera = 3;
-inline bool ClientStreamMessage::has_camera() const {
-  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.camera_ != nullptr);
+// uint64 session_id = 14;
+inline void ClientStreamMessage::clear_session_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.session_id_ = ::uint64_t{0u};
+}
+inline ::uint64_t ClientStreamMessage::session_id() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.session_id)
+  return _internal_session_id();
+}
+inline void ClientStreamMessage::set_session_id(::uint64_t value) {
+  _internal_set_session_id(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.session_id)
+}
+inline ::uint64_t ClientStreamMessage::_internal_session_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.session_id_;
+}
+inline void ClientStreamMessage::_internal_set_session_id(::uint64_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.session_id_ = value;
+}
+
+// uint32 session_version = 15;
+inline void ClientStreamMessage::clear_session_version() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.session_version_ = 0u;
+}
+inline ::uint32_t ClientStreamMessage::session_version() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.session_version)
+  return _internal_session_version();
+}
+inline void ClientStreamMessage::set_session_version(::uint32_t value) {
+  _internal_set_session_version(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.session_version)
+}
+inline ::uint32_t ClientStreamMessage::_internal_session_version() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.session_version_;
+}
+inline void ClientStreamMessage::_internal_set_session_version(::uint32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.session_version_ = value;
+}
+
+// .ImageRegion region = 16;
+inline bool ClientStreamMessage::has_region() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000020u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.region_ != nullptr);
   return value;
 }
-inline void ClientStreamMessage::clear_camera() {
+inline void ClientStreamMessage::clear_region() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.camera_ != nullptr) _impl_.camera_->Clear();
-  _impl_._has_bits_[0] &= ~0x00000004u;
+  if (_impl_.region_ != nullptr) _impl_.region_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000020u;
 }
-inline const ::Camera& ClientStreamMessage::_internal_camera() const {
+inline const ::ImageRegion& ClientStreamMessage::_internal_region() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::Camera* p = _impl_.camera_;
-  return p != nullptr ? *p : reinterpret_cast<const ::Camera&>(::_Camera_default_instance_);
+  const ::ImageRegion* p = _impl_.region_;
+  return p != nullptr ? *p : reinterpret_cast<const ::ImageRegion&>(::_ImageRegion_default_instance_);
 }
-inline const ::Camera& ClientStreamMessage::camera() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:ClientStreamMessage.camera)
-  return _internal_camera();
+inline const ::ImageRegion& ClientStreamMessage::region() const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.region)
+  return _internal_region();
 }
-inline void ClientStreamMessage::unsafe_arena_set_allocated_camera(::Camera* value) {
+inline void ClientStreamMessage::unsafe_arena_set_allocated_region(::ImageRegion* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (GetArena() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.camera_);
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.region_);
   }
-  _impl_.camera_ = reinterpret_cast<::Camera*>(value);
+  _impl_.region_ = reinterpret_cast<::ImageRegion*>(value);
   if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000004u;
+    _impl_._has_bits_[0] |= 0x00000020u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000004u;
+    _impl_._has_bits_[0] &= ~0x00000020u;
   }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.camera)
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:ClientStreamMessage.region)
 }
-inline ::Camera* ClientStreamMessage::release_camera() {
+inline ::ImageRegion* ClientStreamMessage::release_region() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
-  _impl_._has_bits_[0] &= ~0x00000004u;
-  ::Camera* released = _impl_.camera_;
-  _impl_.camera_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000020u;
+  ::ImageRegion* released = _impl_.region_;
+  _impl_.region_ = nullptr;
 #ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
   auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
   released = ::google::protobuf::internal::DuplicateIfNonNull(released);
@@ -2244,34 +4398,34 @@ inline ::Camera* ClientStreamMessage::release_camera() {
 #endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
   return released;
 }
-inline ::Camera* ClientStreamMessage::unsafe_arena_release_camera() {
+inline ::ImageRegion* ClientStreamMessage::unsafe_arena_release_region() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:ClientStreamMessage.camera)
+  // @@protoc_insertion_point(field_release:ClientStreamMessage.region)
 
-  _impl_._has_bits_[0] &= ~0x00000004u;
-  ::Camera* temp = _impl_.camera_;
-  _impl_.camera_ = nullptr;
+  _impl_._has_bits_[0] &= ~0x00000020u;
+  ::ImageRegion* temp = _impl_.region_;
+  _impl_.region_ = nullptr;
   return temp;
 }
-inline ::Camera* ClientStreamMessage::_internal_mutable_camera() {
+inline ::ImageRegion* ClientStreamMessage::_internal_mutable_region() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (_impl_.camera_ == nullptr) {
-    auto* p = ::google::protobuf::Message::DefaultConstruct<::Camera>(GetArena());
-    _impl_.camera_ = reinterpret_cast<::Camera*>(p);
+  if (_impl_.region_ == nullptr) {
+    auto* p = ::google::protobuf::Message::DefaultConstruct<::ImageRegion>(GetArena());
+    _impl_.region_ = reinterpret_cast<::ImageRegion*>(p);
   }
-  return _impl_.camera_;
+  return _impl_.region_;
 }
-inline ::Camera* ClientStreamMessage::mutable_camera() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  _impl_._has_bits_[0] |= 0x00000004u;
-  ::Camera* _msg = _internal_mutable_camera();
-  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.camera)
+inline ::ImageRegion* ClientStreamMessage::mutable_region() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  _impl_._has_bits_[0] |= 0x00000020u;
+  ::ImageRegion* _msg = _internal_mutable_region();
+  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.region)
   return _msg;
 }
-inline void ClientStreamMessage::set_allocated_camera(::Camera* value) {
+inline void ClientStreamMessage::set_allocated_region(::ImageRegion* value) {
   ::google::protobuf::Arena* message_arena = GetArena();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (message_arena == nullptr) {
-    delete (_impl_.camera_);
+    delete (_impl_.region_);
   }
 
   if (value != nullptr) {
@@ -2279,113 +4433,57 @@ inline void ClientStreamMessage::set_allocated_camera(::Camera* value) {
     if (message_arena != submessage_arena) {
       value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
     }
-    _impl_._has_bits_[0] |= 0x00000004u;
+    _impl_._has_bits_[0] |= 0x00000020u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000004u;
+    _impl_._has_bits_[0] &= ~0x00000020u;
   }
 
-  _impl_.camera_ = reinterpret_cast<::Camera*>(value);
-  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.camera)
+  _impl_.region_ = reinterpret_cast<::ImageRegion*>(value);
+  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.region)
 }
 
-// bytes color_image = 4;
-inline void ClientStreamMessage::clear_color_image() {
+// .PixelFormat color_format = 17;
+inline void ClientStreamMessage::clear_color_format() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.color_image_.ClearToEmpty();
-}
-inline const std::string& ClientStreamMessage::color_image() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:ClientStreamMessage.color_image)
-  return _internal_color_image();
+  _impl_.color_format_ = 0;
 }
-template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ClientStreamMessage::set_color_image(Arg_&& arg,
-                                                     Args_... args) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.color_image_.SetBytes(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:ClientStreamMessage.color_image)
+inline ::PixelFormat ClientStreamMessage::color_format() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.color_format)
+  return _internal_color_format();
 }
-inline std::string* ClientStreamMessage::mutable_color_image() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  std::string* _s = _internal_mutable_color_image();
-  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.color_image)
-  return _s;
+inline void ClientStreamMessage::set_color_format(::PixelFormat value) {
+  _internal_set_color_format(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.color_format)
 }
-inline const std::string& ClientStreamMessage::_internal_color_image() const {
+inline ::PixelFormat ClientStreamMessage::_internal_color_format() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.color_image_.Get();
-}
-inline void ClientStreamMessage::_internal_set_color_image(const std::string& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.color_image_.Set(value, GetArena());
-}
-inline std::string* ClientStreamMessage::_internal_mutable_color_image() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _impl_.color_image_.Mutable( GetArena());
+  return static_cast<::PixelFormat>(_impl_.color_format_);
 }
-inline std::string* ClientStreamMessage::release_color_image() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:ClientStreamMessage.color_image)
-  return _impl_.color_image_.Release();
-}
-inline void ClientStreamMessage::set_allocated_color_image(std::string* value) {
+inline void ClientStreamMessage::_internal_set_color_format(::PixelFormat value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.color_image_.SetAllocated(value, GetArena());
-  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.color_image_.IsDefault()) {
-          _impl_.color_image_.Set("", GetArena());
-        }
-  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.color_image)
+  _impl_.color_format_ = value;
 }
 
-// bytes depth_image = 5;
-inline void ClientStreamMessage::clear_depth_image() {
+// .PixelFormat depth_format = 18;
+inline void ClientStreamMessage::clear_depth_format() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.depth_image_.ClearToEmpty();
+  _impl_.depth_format_ = 0;
 }
-inline const std::string& ClientStreamMessage::depth_image() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:ClientStreamMessage.depth_image)
-  return _internal_depth_image();
-}
-template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ClientStreamMessage::set_depth_image(Arg_&& arg,
-                                                     Args_... args) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.depth_image_.SetBytes(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:ClientStreamMessage.depth_image)
+inline ::PixelFormat ClientStreamMessage::depth_format() const {
+  // @@protoc_insertion_point(field_get:ClientStreamMessage.depth_format)
+  return _internal_depth_format();
 }
-inline std::string* ClientStreamMessage::mutable_depth_image() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  std::string* _s = _internal_mutable_depth_image();
-  // @@protoc_insertion_point(field_mutable:ClientStreamMessage.depth_image)
-  return _s;
+inline void ClientStreamMessage::set_depth_format(::PixelFormat value) {
+  _internal_set_depth_format(value);
+  // @@protoc_insertion_point(field_set:ClientStreamMessage.depth_format)
 }
-inline const std::string& ClientStreamMessage::_internal_depth_image() const {
+inline ::PixelFormat ClientStreamMessage::_internal_depth_format() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.depth_image_.Get();
-}
-inline void ClientStreamMessage::_internal_set_depth_image(const std::string& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.depth_image_.Set(value, GetArena());
-}
-inline std::string* ClientStreamMessage::_internal_mutable_depth_image() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _impl_.depth_image_.Mutable( GetArena());
-}
-inline std::string* ClientStreamMessage::release_depth_image() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:ClientStreamMessage.depth_image)
-  return _impl_.depth_image_.Release();
+  return static_cast<::PixelFormat>(_impl_.depth_format_);
 }
-inline void ClientStreamMessage::set_allocated_depth_image(std::string* value) {
+inline void ClientStreamMessage::_internal_set_depth_format(::PixelFormat value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.depth_image_.SetAllocated(value, GetArena());
-  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.depth_image_.IsDefault()) {
-          _impl_.depth_image_.Set("", GetArena());
-        }
-  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:ClientStreamMessage.depth_image)
+  _impl_.depth_format_ = value;
 }
 
 #ifdef __GNUC__
@@ -2395,6 +4493,31 @@ inline void ClientStreamMessage::set_allocated_depth_image(std::string* value) {
 // @@protoc_insertion_point(namespace_scope)
 
 
+namespace google {
+namespace protobuf {
+
+template <>
+struct is_proto_enum<::ImageCodec> : std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor<::ImageCodec>() {
+  return ::ImageCodec_descriptor();
+}
+template <>
+struct is_proto_enum<::PixelFormat> : std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor<::PixelFormat>() {
+  return ::PixelFormat_descriptor();
+}
+template <>
+struct is_proto_enum<::StreamAnnotator> : std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor<::StreamAnnotator>() {
+  return ::StreamAnnotator_descriptor();
+}
+
+}  // namespace protobuf
+}  // namespace google
+
 // @@protoc_insertion_point(global_scope)
 
 #include "google/protobuf/port_undef.inc"
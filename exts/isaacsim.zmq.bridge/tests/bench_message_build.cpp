@@ -0,0 +1,304 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+// Micro-benchmark of the per frame message building of the OGN node (OgnIsaacBridgeZMQNode::sendFrame()),
+// on synthetic annotator data, without Isaac Sim, a GPU or sockets.
+//
+// Compares the ways of building a ClientStreamMessage and its zero-copy frames:
+// - per_frame: a new message and new host buffers for the images and the serialized header every frame
+//   (the node before the message and the buffers were reused)
+// - reused: one message cleared every frame, host buffers from a HostBufferPool (current)
+//
+// and reports per frame: build + serialize time, heap allocations (operator new calls and bytes) and
+// host buffers created. Build and run with `make bench`, which generates the protobuf code with the
+// protoc found on the PATH:
+//
+//     make bench BENCH_ARGS="--frames 2000 --bboxes 10 --inline"
+
+#include "HostBufferPool.h"
+#include "client_stream_message.pb.h"
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <new>
+#include <string>
+#include <vector>
+
+using namespace isaacsim::zmq::bridge;
+
+// Heap allocations of the whole process, the benchmark is single threaded. The replacements pair
+// malloc and free, which GCC reports as mismatched (-Wno-mismatched-new-delete in the Makefile)
+static std::atomic<uint64_t> g_allocations{ 0 };
+static std::atomic<uint64_t> g_allocatedBytes{ 0 };
+
+void* operator new(size_t size) {
+    g_allocations++;
+    g_allocatedBytes += size;
+    if (void* ptr = std::malloc(size ? size : 1)) {
+        return ptr;
+    }
+    throw std::bad_alloc();
+}
+
+void* operator new[](size_t size) {
+    return operator new(size);
+}
+
+void operator delete(void* ptr) noexcept {
+    std::free(ptr);
+}
+
+void operator delete[](void* ptr) noexcept {
+    std::free(ptr);
+}
+
+void operator delete(void* ptr, size_t) noexcept {
+    std::free(ptr);
+}
+
+void operator delete[](void* ptr, size_t) noexcept {
+    std::free(ptr);
+}
+
+static double monotonicSeconds() {
+    return std::chrono::duration<double>(std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+// Layout of the bounding_box_2d_tight_fast annotator, as BBox2D.packed_data
+struct InputDataBBox2d {
+    uint32_t semanticId;
+    int32_t xMin;
+    int32_t yMin;
+    int32_t xMax;
+    int32_t yMax;
+    float occlusionRatio;
+};
+
+// Synthetic data of one frame, in the formats of the node inputs
+struct AnnotatorData {
+    std::vector<InputDataBBox2d> bboxes;
+    std::vector<int32_t> bboxIds;
+    std::vector<std::string> labels;
+    std::vector<uint8_t> color;
+    std::vector<uint8_t> depth;
+    double viewMatrix[16];
+    double intrinsics[9];
+    double scale[3];
+
+    AnnotatorData(uint32_t width, uint32_t height, size_t numBBoxes)
+        : color(static_cast<size_t>(width) * height * 4), depth(static_cast<size_t>(width) * height * 4) {
+        for (size_t i = 0; i < numBBoxes; ++i) {
+            int32_t x = static_cast<int32_t>((i * 37) % (width / 2));
+            int32_t y = static_cast<int32_t>((i * 53) % (height / 2));
+            bboxes.push_back({ static_cast<uint32_t>(i % 4), x, y, x + 40, y + 40, 0.0f });
+            bboxIds.push_back(static_cast<int32_t>(i));
+        }
+        for (size_t i = 0; i < 4; ++i) {
+            labels.push_back("class:object_" + std::to_string(i));
+        }
+        for (size_t i = 0; i < 16; ++i) {
+            viewMatrix[i] = i % 5 == 0 ? 1.0 : 0.0;
+        }
+        double intrinsics_values[9] = { 600.0, 0.0, width / 2.0, 0.0, 600.0, height / 2.0, 0.0, 0.0, 1.0 };
+        std::copy(intrinsics_values, intrinsics_values + 9, intrinsics);
+        std::fill(scale, scale + 3, 1.0);
+    }
+};
+
+// Builds and serializes the message of a frame like the node, with one of the strategies
+class MessageBuilder {
+public:
+    MessageBuilder(bool reuse, bool inlineImages, bool packedBBox)
+        : m_reuse(reuse), m_inline(inlineImages), m_packedBBox(packedBBox) {
+    }
+
+    // Builds the frame, then releases its buffers as ZMQ would once sent. Returns the bytes of the frame
+    size_t build(const AnnotatorData& data, uint64_t frameId) {
+        std::unique_ptr<ClientStreamMessage> owned;
+        ClientStreamMessage* message = &m_message;
+        if (m_reuse) {
+            m_message.Clear();
+        } else {
+            owned = std::make_unique<ClientStreamMessage>();
+            message = owned.get();
+        }
+
+        BBox2D* bbox2d = message->mutable_bbox2d();
+        if (m_packedBBox) {
+            bbox2d->set_packed_data(data.bboxes.data(), data.bboxes.size() * sizeof(InputDataBBox2d));
+        } else {
+            for (const InputDataBBox2d& bbox : data.bboxes) {
+                BBox2DType* bbox_proto = bbox2d->add_data();
+                bbox_proto->set_semanticid(bbox.semanticId);
+                bbox_proto->set_xmin(bbox.xMin);
+                bbox_proto->set_ymin(bbox.yMin);
+                bbox_proto->set_xmax(bbox.xMax);
+                bbox_proto->set_ymax(bbox.yMax);
+                bbox_proto->set_occlusionratio(bbox.occlusionRatio);
+            }
+        }
+        for (int32_t id : data.bboxIds) {
+            bbox2d->mutable_info()->add_bboxids(id);
+        }
+        for (size_t i = 0; i < data.labels.size(); ++i) {
+            (*bbox2d->mutable_info()->mutable_idtolabels())[std::to_string(i)] = data.labels[i];
+        }
+
+        Camera* camera = message->mutable_camera();
+        for (double value : data.viewMatrix) {
+            camera->add_view_matrix_ros(value);
+        }
+        for (double value : data.scale) {
+            camera->add_camera_scale(value);
+        }
+        for (double value : data.intrinsics) {
+            camera->add_intrinsics_matrix(value);
+        }
+
+        message->mutable_clock()->set_sim_dt(1.0 / 60);
+        message->mutable_clock()->set_sim_time(frameId / 60.0);
+        message->mutable_clock()->set_sys_time(monotonicSeconds());
+
+        FrameTrace* trace = message->mutable_trace();
+        trace->set_frame_id(frameId);
+        trace->set_render_time(monotonicSeconds());
+
+        // The copies of the annotator buffers to the host
+        size_t bytes = 0;
+        HostBuffer color = hostBuffer(data.color.size());
+        HostBuffer depth = hostBuffer(data.depth.size());
+        std::memcpy(color.data, data.color.data(), data.color.size());
+        std::memcpy(depth.data, data.depth.data(), data.depth.size());
+        if (m_inline) {
+            message->set_color_image(reinterpret_cast<const char*>(color.data), data.color.size());
+            message->set_depth_image(reinterpret_cast<const char*>(depth.data), data.depth.size());
+        } else {
+            message->set_color_image_frame(1);
+            message->set_depth_image_frame(2);
+            bytes += data.color.size() + data.depth.size();
+        }
+
+        trace->set_send_time(monotonicSeconds());
+        size_t header_size = message->ByteSizeLong();
+        HostBuffer header = hostBuffer(header_size);
+        message->SerializeWithCachedSizesToArray(header.data);
+        return bytes + header_size;
+    }
+
+    // Host buffers allocated so far
+    uint64_t buffersCreated() const {
+        return m_reuse ? static_cast<uint64_t>(g_pinnedBuffers.load()) : m_buffersCreated;
+    }
+
+private:
+    bool m_reuse;
+    bool m_inline;
+    bool m_packedBBox;
+    ClientStreamMessage m_message;
+    std::shared_ptr<HostBufferPool> m_pool{ std::make_shared<HostBufferPool>() };
+    uint64_t m_buffersCreated{ 0 };
+
+    // A pooled buffer, or a new one for the per frame strategy
+    struct HostBuffer {
+        HostBufferPool::Handle pooled;
+        std::unique_ptr<uint8_t[]> owned;
+        uint8_t* data{ nullptr };
+    };
+
+    HostBuffer hostBuffer(size_t size) {
+        HostBuffer buffer;
+        if (m_reuse) {
+            buffer.pooled = m_pool->acquire(size);
+            buffer.data = buffer.pooled->data;
+        } else {
+            buffer.owned.reset(new uint8_t[size]);
+            buffer.data = buffer.owned.get();
+            m_buffersCreated++;
+        }
+        return buffer;
+    }
+};
+
+struct Result {
+    double meanUs;
+    double p99Us;
+    double allocationsPerFrame;
+    double allocatedBytesPerFrame;
+    double hostBuffersPerFrame;
+};
+
+static Result run(bool reuse, const AnnotatorData& data, size_t frames, bool inlineImages, bool packedBBox) {
+    MessageBuilder builder(reuse, inlineImages, packedBBox);
+    size_t warmup = std::max<size_t>(frames / 10, 1);
+    for (size_t frame = 0; frame < warmup; ++frame) {
+        builder.build(data, frame);
+    }
+
+    std::vector<double> durations;
+    durations.reserve(frames);
+    uint64_t allocations = g_allocations;
+    uint64_t allocated_bytes = g_allocatedBytes;
+    uint64_t buffers_created = builder.buffersCreated();
+    for (size_t frame = 0; frame < frames; ++frame) {
+        double start = monotonicSeconds();
+        builder.build(data, warmup + frame);
+        durations.push_back(monotonicSeconds() - start);
+    }
+
+    Result result;
+    double total = 0;
+    for (double duration : durations) {
+        total += duration;
+    }
+    std::sort(durations.begin(), durations.end());
+    result.meanUs = total / frames * 1e6;
+    result.p99Us = durations[std::min(frames - 1, frames * 99 / 100)] * 1e6;
+    result.allocationsPerFrame = static_cast<double>(g_allocations - allocations) / frames;
+    result.allocatedBytesPerFrame = static_cast<double>(g_allocatedBytes - allocated_bytes) / frames;
+    result.hostBuffersPerFrame = static_cast<double>(builder.buffersCreated() - buffers_created) / frames;
+    return result;
+}
+
+int main(int argc, char** argv) {
+    size_t frames = 2000;
+    size_t bboxes = 10;
+    uint32_t width = 720;
+    uint32_t height = 720;
+    bool inline_images = false;
+    bool packed_bbox = true;
+    for (int i = 1; i < argc; ++i) {
+        std::string arg = argv[i];
+        if (arg == "--frames" && i + 1 < argc) {
+            frames = std::max<size_t>(std::strtoul(argv[++i], nullptr, 10), 1);
+        } else if (arg == "--bboxes" && i + 1 < argc) {
+            bboxes = std::strtoul(argv[++i], nullptr, 10);
+        } else if (arg == "--resolution" && i + 2 < argc) {
+            width = static_cast<uint32_t>(std::strtoul(argv[++i], nullptr, 10));
+            height = static_cast<uint32_t>(std::strtoul(argv[++i], nullptr, 10));
+        } else if (arg == "--inline") {
+            inline_images = true;
+        } else if (arg == "--repeated_bbox") {
+            packed_bbox = false;
+        } else {
+            std::fprintf(stderr,
+                         "usage: %s [--frames N] [--bboxes N] [--resolution W H] [--inline] [--repeated_bbox]\n",
+                         argv[0]);
+            return 2;
+        }
+    }
+
+    AnnotatorData data(width, height, bboxes);
+    std::printf("%ux%u, %zu bounding boxes (%s), images %s, %zu frames\n", width, height, bboxes,
+                packed_bbox ? "packed" : "repeated", inline_images ? "inline" : "multipart", frames);
+    for (bool reuse : { false, true }) {
+        Result result = run(reuse, data, frames, inline_images, packed_bbox);
+        std::printf("%10s: %8.1f us/frame (p99 %8.1f), %6.1f allocations %10.0f B/frame, %4.2f host buffers/frame\n",
+                    reuse ? "reused" : "per_frame", result.meanUs, result.p99Us, result.allocationsPerFrame,
+                    result.allocatedBytesPerFrame, result.hostBuffersPerFrame);
+    }
+    return 0;
+}
@@ -0,0 +1,12 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+// Stand-in for the Carbonite logging macros used by the node headers
+
+#include <cstdio>
+
+#define CARB_LOG_ERROR(fmt, ...) std::fprintf(stderr, "[error] " fmt "\n", ##__VA_ARGS__)
+#define CARB_LOG_WARN(fmt, ...) std::fprintf(stderr, "[warning] " fmt "\n", ##__VA_ARGS__)
+#define CARB_LOG_INFO(fmt, ...) ((void)0)
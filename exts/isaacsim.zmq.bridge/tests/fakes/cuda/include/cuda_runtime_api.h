@@ -0,0 +1,99 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+// Host-only stand-in for the CUDA runtime calls used by the node headers, so they build and run without a GPU.
+// Device memory is host memory, the copies run synchronously and the streams and events do nothing.
+// The allocations are counted to check that the buffers are released.
+
+#include <atomic>
+#include <cstdlib>
+#include <cstring>
+
+typedef int cudaError_t;
+typedef void* cudaStream_t;
+typedef void* cudaEvent_t;
+
+static const cudaError_t cudaSuccess = 0;
+static const unsigned cudaEventDisableTiming = 2;
+
+enum cudaMemcpyKind { cudaMemcpyDeviceToHost, cudaMemcpyDeviceToDevice };
+
+static std::atomic<int> g_pinnedBuffers{ 0 };
+static std::atomic<int> g_deviceBuffers{ 0 };
+
+inline const char* cudaGetErrorString(cudaError_t) {
+    return "fake CUDA error";
+}
+
+inline cudaError_t cudaGetLastError() {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaMallocHost(void** ptr, size_t size) {
+    *ptr = std::malloc(size);
+    g_pinnedBuffers++;
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaFreeHost(void* ptr) {
+    std::free(ptr);
+    g_pinnedBuffers--;
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaMalloc(void** ptr, size_t size) {
+    *ptr = std::malloc(size);
+    g_deviceBuffers++;
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaFree(void* ptr) {
+    if (ptr) {
+        std::free(ptr);
+        g_deviceBuffers--;
+    }
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaStreamCreate(cudaStream_t*) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaStreamDestroy(cudaStream_t) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaStreamSynchronize(cudaStream_t) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaEventCreateWithFlags(cudaEvent_t*, unsigned) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaEventDestroy(cudaEvent_t) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaEventRecord(cudaEvent_t, cudaStream_t) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaEventSynchronize(cudaEvent_t) {
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaMemcpyAsync(void* dst, const void* src, size_t size, cudaMemcpyKind, cudaStream_t) {
+    std::memcpy(dst, src, size);
+    return cudaSuccess;
+}
+
+inline cudaError_t cudaMemcpy2DAsync(void* dst, size_t dstPitch, const void* src, size_t srcPitch, size_t width,
+                                     size_t height, cudaMemcpyKind, cudaStream_t) {
+    for (size_t row = 0; row < height; ++row) {
+        std::memcpy(static_cast<char*>(dst) + row * dstPitch, static_cast<const char*>(src) + row * srcPitch, width);
+    }
+    return cudaSuccess;
+}
@@ -0,0 +1,117 @@
+// SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+// Checks of the send path of the node without a GPU: the frames go through AsyncFrameSender with the
+// HostFrameCopier, and CudaFrameCopier runs on the host-only CUDA stand-in in fakes/. Build and run with
+// `make` (or `make tsan` / `make asan` for the sanitizer builds).
+
+#include "AsyncFrameSender.h"
+#include "HostBufferPool.h"
+
+#include <atomic>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+
+using namespace isaacsim::zmq::bridge;
+
+#define EXPECT(condition)                                                                                    \
+    do {                                                                                                     \
+        if (!(condition)) {                                                                                  \
+            std::fprintf(stderr, "%s:%d: expected %s\n", __FILE__, __LINE__, #condition);                    \
+            std::exit(1);                                                                                    \
+        }                                                                                                    \
+    } while (0)
+
+// A region of kRows rows of kRowBytes bytes, every other row of a source image with a pitch of kSrcPitch
+static constexpr size_t kRows = 32;
+static constexpr size_t kRowBytes = 64;
+static constexpr size_t kSrcPitch = 256;
+static constexpr size_t kRegionOffset = 100;
+static constexpr int kFrames = 2000;
+
+struct Frame {
+    HostBufferPool::Handle buffer;
+    int id{ 0 };
+};
+
+// Frames are sent in order, dropped when both slots are in flight, and their buffers go back to the pool
+static void testSendPath() {
+    auto pool = std::make_shared<HostBufferPool>();
+    std::vector<Frame> frames(AsyncFrameSender::kDefaultSlots);
+    std::atomic<int> sent{ 0 };
+    std::atomic<int> last_id{ -1 };
+    int dropped = 0;
+    {
+        AsyncFrameSender sender(std::make_unique<HostFrameCopier>(), [&](size_t slot, bool copied) {
+            EXPECT(copied);
+            Frame& frame = frames[slot];
+            // A slow consumer, so some frames are dropped
+            std::this_thread::sleep_for(std::chrono::microseconds(200));
+            EXPECT(frame.id > last_id);
+            last_id = frame.id;
+            for (size_t i = 0; i < kRows * kRowBytes; ++i) {
+                EXPECT(frame.buffer->data[i] == static_cast<uint8_t>(frame.id));
+            }
+            frame.buffer.reset();
+            sent++;
+        });
+        std::vector<uint8_t> src(kSrcPitch * kRows * 2);
+        for (int id = 0; id < kFrames; ++id) {
+            std::fill(src.begin(), src.end(), static_cast<uint8_t>(id));
+            size_t slot;
+            if (!sender.acquire(slot)) {
+                dropped++;
+                std::this_thread::sleep_for(std::chrono::microseconds(50));
+                continue;
+            }
+            Frame& frame = frames[slot];
+            frame.id = id;
+            frame.buffer = pool->acquire(kRows * kRowBytes);
+            EXPECT(sender.copier().copy(slot, frame.buffer->data, kRowBytes, src.data() + kRegionOffset, kSrcPitch,
+                                        kRowBytes, kRows));
+            EXPECT(sender.submit(slot));
+        }
+        sender.flush();
+        std::printf("send path: %d sent, %d dropped\n", sent.load(), dropped);
+        EXPECT(sent > 0);
+        EXPECT(sent + dropped == kFrames);
+    }
+    pool.reset();
+    EXPECT(g_pinnedBuffers == 0);
+}
+
+// The copies of a slot are staged, the source can be rewritten once record() returns
+static void testCudaStaging() {
+    {
+        CudaFrameCopier copier(AsyncFrameSender::kDefaultSlots);
+        std::vector<uint8_t> src(kSrcPitch * kRows * 2);
+        std::vector<uint8_t> region(kRows * kRowBytes);
+        std::vector<uint8_t> full(src.size());
+        for (int id = 0; id < 10; ++id) {
+            size_t slot = id % AsyncFrameSender::kDefaultSlots;
+            std::fill(src.begin(), src.end(), static_cast<uint8_t>(id));
+            EXPECT(copier.copy(slot, region.data(), kRowBytes, src.data() + kRegionOffset, kSrcPitch, kRowBytes,
+                               kRows));
+            EXPECT(copier.copy(slot, full.data(), full.size(), src.data(), full.size(), full.size(), 1));
+            EXPECT(copier.record(slot));
+            // The next render
+            std::fill(src.begin(), src.end(), 0xff);
+            EXPECT(copier.wait(slot));
+            EXPECT(std::count(region.begin(), region.end(), static_cast<uint8_t>(id)) == int(region.size()));
+            EXPECT(std::count(full.begin(), full.end(), static_cast<uint8_t>(id)) == int(full.size()));
+        }
+        // Two staging buffers per slot, kept across frames
+        EXPECT(g_deviceBuffers == 2 * AsyncFrameSender::kDefaultSlots);
+        EXPECT(copier.copy(0, region.data(), kRowBytes, src.data(), kRowBytes, kRowBytes, 1));
+        copier.discard(0);
+    }
+    EXPECT(g_deviceBuffers == 0);
+    std::printf("cuda staging: ok\n");
+}
+
+int main() {
+    testSendPath();
+    testCudaStaging();
+    return 0;
+}
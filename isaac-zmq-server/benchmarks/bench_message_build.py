@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Micro-benchmark of the per frame message building of the Python client (ZMQAnnotator.stream()),
+on synthetic annotator data, without Isaac Sim or sockets.
+
+Compares the ways of building a ClientStreamMessage:
+- copy: temporary BBox2DInfo / Camera / Clock messages copied in with CopyFrom, label table rebuilt
+  every frame (ZMQAnnotator.stream() before the sub-messages were filled in place)
+- in_place: a new message per frame, sub-messages filled in place, label table cached (current)
+- reuse: one message cleared and refilled every frame
+
+and reports per frame: build + serialize time, Python heap allocated (tracemalloc peak) and native
+heap growth (glibc mallinfo2, the upb protobuf backend allocates its arenas there). The reuse strategy
+shows why the client does not reuse messages: upb arenas are not shrunk by Clear().
+
+    python bench_message_build.py --frames 20000 --bboxes 10 --output message_build.json
+"""
+
+import argparse
+import copy
+import ctypes
+import ctypes.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import client_stream_message_pb2  # noqa: E402
+from google.protobuf import __version__ as protobuf_version  # noqa: E402
+from google.protobuf.internal import api_implementation  # noqa: E402
+from isaac_zmq_server.proto_util import BBOX2D_DTYPE  # noqa: E402
+
+STRATEGIES = ("copy", "in_place", "reuse")
+
+
+class _MallInfo2(ctypes.Structure):
+    _fields_ = [
+        (name, ctypes.c_size_t)
+        for name in ("arena", "ordblks", "smblks", "hblks", "hblkhd", "usmblks", "fsmblks", "uordblks", "fordblks", "keepcost")
+    ]
+
+
+def _load_mallinfo2():
+    """
+    Returns:
+        glibc mallinfo2 function, None if not available (other libc, glibc < 2.33)
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        mallinfo2 = libc.mallinfo2
+    except (OSError, AttributeError, TypeError):
+        return None
+    mallinfo2.restype = _MallInfo2
+    return mallinfo2
+
+
+_mallinfo2 = _load_mallinfo2()
+
+
+def native_heap_bytes() -> int:
+    """
+    Returns:
+        int: Bytes allocated on the native heap (malloc), including mmapped blocks, -1 if unavailable
+    """
+    if _mallinfo2 is None:
+        return -1
+    info = _mallinfo2()
+    return info.uordblks + info.hblkhd
+
+
+class AnnotatorData:
+    """
+    Synthetic data of one frame, in the formats the replicator annotators and the Camera return.
+    """
+
+    def __init__(self, resolution: tuple, num_bboxes: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        width, height = resolution
+        self.bboxes = np.zeros(num_bboxes, dtype=BBOX2D_DTYPE)
+        self.bboxes["semanticId"] = rng.integers(0, 4, num_bboxes)
+        self.bboxes["xMin"] = rng.integers(0, width // 2, num_bboxes)
+        self.bboxes["yMin"] = rng.integers(0, height // 2, num_bboxes)
+        self.bboxes["xMax"] = self.bboxes["xMin"] + 40
+        self.bboxes["yMax"] = self.bboxes["yMin"] + 40
+        self.bbox_ids = np.arange(num_bboxes, dtype=np.uint32)
+        self.id_to_labels = {str(index): {"class": f"object_{index}"} for index in range(4)}
+        self.view_matrix = np.eye(4)
+        self.intrinsics = np.array([[600.0, 0.0, width / 2], [0.0, 600.0, height / 2], [0.0, 0.0, 1.0]])
+        self.camera_scale = np.ones(3)
+        self.color = np.zeros((height, width, 4), dtype=np.uint8)
+        self.depth = np.ones((height, width), dtype=np.float32)
+
+
+def _labels_table(id_to_labels: dict) -> dict:
+    return {str(key): f"class:{next(iter(value.values()))}" for key, value in id_to_labels.items()}
+
+
+class MessageBuilder:
+    """
+    Builds and serializes the ClientStreamMessage of a frame like ZMQAnnotator.stream(), with one of STRATEGIES.
+    """
+
+    def __init__(self, strategy: str, inline: bool, packed_bbox: bool):
+        self.strategy = strategy
+        self.inline = inline
+        self.packed_bbox = packed_bbox
+        self._message = client_stream_message_pb2.ClientStreamMessage()
+        self._labels_source = None
+        self._labels_table = {}
+
+    def build(self, data: AnnotatorData, frame_id: int) -> list:
+        """
+        Returns:
+            list: Frames of the message (serialized header, then the images in multipart mode)
+        """
+        if self.strategy == "copy":
+            return self._build_copy(data, frame_id)
+        if self.strategy == "reuse":
+            client_stream = self._message
+            client_stream.Clear()
+        else:
+            client_stream = client_stream_message_pb2.ClientStreamMessage()
+
+        bbox2d_info = client_stream.bbox2d.info
+        bbox2d_info.bboxIds.extend(data.bbox_ids.tolist())
+        if data.id_to_labels != self._labels_source:
+            self._labels_source = copy.deepcopy(data.id_to_labels)
+            self._labels_table = _labels_table(data.id_to_labels)
+        bbox2d_info.idToLabels.update(self._labels_table)
+        if self.packed_bbox:
+            client_stream.bbox2d.packed_data = np.ascontiguousarray(data.bboxes).tobytes()
+        else:
+            bbox2d_message = client_stream.bbox2d.data
+            for semantic_id, x_min, y_min, x_max, y_max, occlusion_ratio in data.bboxes.tolist():
+                bbox2d_message.add(
+                    semanticId=semantic_id,
+                    xMin=x_min,
+                    yMin=y_min,
+                    xMax=x_max,
+                    yMax=y_max,
+                    occlusionRatio=occlusion_ratio,
+                )
+
+        camera = client_stream.camera
+        camera.view_matrix_ros.extend(data.view_matrix.ravel().tolist())
+        camera.intrinsics_matrix.extend(data.intrinsics.ravel().tolist())
+        camera.camera_scale.extend(data.camera_scale.tolist())
+
+        clock = client_stream.clock
+        clock.sim_dt = 1 / 60
+        clock.sim_time = frame_id / 60
+        clock.sys_time = time.time()
+
+        trace = client_stream.trace
+        trace.frame_id = frame_id
+        trace.render_time = trace.send_time = time.monotonic()
+        return self._serialize(client_stream, data)
+
+    def _build_copy(self, data: AnnotatorData, frame_id: int) -> list:
+        client_stream = client_stream_message_pb2.ClientStreamMessage()
+
+        bbox2d_info = client_stream_message_pb2.BBox2DInfo()
+        bbox2d_info.bboxIds.extend(data.bbox_ids.tolist())
+        bbox2d_info.idToLabels.update(_labels_table(data.id_to_labels))
+        client_stream.bbox2d.info.CopyFrom(bbox2d_info)
+        if self.packed_bbox:
+            client_stream.bbox2d.packed_data = np.ascontiguousarray(data.bboxes).tobytes()
+        else:
+            for bbox in data.bboxes:
+                bbox2d_type = client_stream.bbox2d.data.add()
+                bbox2d_type.semanticId = bbox[0]
+                bbox2d_type.xMin = bbox[1]
+                bbox2d_type.yMin = bbox[2]
+                bbox2d_type.xMax = bbox[3]
+                bbox2d_type.yMax = bbox[4]
+                bbox2d_type.occlusionRatio = bbox[5]
+
+        camera = client_stream_message_pb2.Camera()
+        camera.view_matrix_ros.extend(data.view_matrix.flatten().tolist())
+        camera.intrinsics_matrix.extend(data.intrinsics.flatten().tolist())
+        camera.camera_scale.extend(data.camera_scale.tolist())
+        client_stream.camera.CopyFrom(camera)
+
+        clock = client_stream_message_pb2.Clock()
+        clock.sim_dt = 1 / 60
+        clock.sim_time = frame_id / 60
+        clock.sys_time = time.time()
+        client_stream.clock.CopyFrom(clock)
+
+        client_stream.trace.frame_id = frame_id
+        client_stream.trace.render_time = time.monotonic()
+        client_stream.trace.send_time = time.monotonic()
+        return self._serialize(client_stream, data)
+
+    def _serialize(self, client_stream, data: AnnotatorData) -> list:
+        images = [("color", data.color), ("depth", data.depth)]
+        if not self.inline:
+            for frame_index, (image_name, _) in enumerate(images, start=1):
+                setattr(client_stream, f"{image_name}_image_frame", frame_index)
+            return [client_stream.SerializeToString()] + [image for _, image in images]
+        for image_name, image in images:
+            setattr(client_stream, f"{image_name}_image", bytes(image))
+        return [client_stream.SerializeToString()]
+
+
+def run_strategy(strategy: str, data: AnnotatorData, args) -> dict:
+    """
+    Time and allocations of one strategy, measured in separate passes so tracing does not skew the timings.
+    """
+    frames = args.frames
+    warmup = max(frames // 10, 1)
+
+    # Timing
+    builder = MessageBuilder(strategy, args.inline, not args.repeated_bbox)
+    for frame_id in range(warmup):
+        builder.build(data, frame_id)
+    durations = np.empty(frames)
+    for frame_id in range(frames):
+        start = time.perf_counter()
+        builder.build(data, frame_id)
+        durations[frame_id] = time.perf_counter() - start
+
+    # Native heap growth, after a warmup so pools and caches are already allocated
+    builder = MessageBuilder(strategy, args.inline, not args.repeated_bbox)
+    for frame_id in range(warmup):
+        builder.build(data, frame_id)
+    native_start = native_heap_bytes()
+    for frame_id in range(frames):
+        builder.build(data, frame_id)
+    native_end = native_heap_bytes()
+    native_growth = (native_end - native_start) / frames if native_start >= 0 else None
+
+    # Python heap allocated while building a frame
+    tracing_frames = min(frames, 2000)
+    builder = MessageBuilder(strategy, args.inline, not args.repeated_bbox)
+    builder.build(data, 0)
+    tracemalloc.start()
+    peaks = np.empty(tracing_frames)
+    for frame_id in range(tracing_frames):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        builder.build(data, frame_id)
+        peaks[frame_id] = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return {
+        "time_us": {
+            "mean": float(durations.mean() * 1e6),
+            "p50": float(np.percentile(durations, 50) * 1e6),
+            "p99": float(np.percentile(durations, 99) * 1e6),
+        },
+        "python_heap_peak_bytes": float(peaks.mean()),
+        "native_heap_growth_bytes": native_growth,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Python client message building micro-benchmark")
+    parser.add_argument("--frames", type=int, default=20000, help="Frames built per strategy")
+    parser.add_argument("--bboxes", type=int, default=10, help="Bounding boxes per frame")
+    parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
+    parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+    parser.add_argument("--inline", action="store_true", help="Embed the images in the protobuf message")
+    parser.add_argument("--repeated_bbox", action="store_true", help="Send bounding boxes as repeated messages")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help="Strategies to run (comma separated)")
+    parser.add_argument("--output", default="", help="JSON results file")
+    args = parser.parse_args()
+
+    data = AnnotatorData((args.resolution_x, args.resolution_y), args.bboxes)
+    results = {
+        "config": vars(args),
+        "environment": {
+            "python": platform.python_version(),
+            "protobuf": protobuf_version,
+            "protobuf_backend": api_implementation.Type(),
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+    for strategy in args.strategies.split(","):
+        result = run_strategy(strategy, data, args)
+        results["results"][strategy] = result
+        native = result["native_heap_growth_bytes"]
+        print(
+            "[isaac-zmq-server] {:>8}: {:7.1f} us/frame (p99 {:7.1f}), Python heap {:8.0f} B/frame, "
+            "native heap growth {} B/frame".format(
+                strategy,
+                result["time_us"]["mean"],
+                result["time_us"]["p99"],
+                result["python_heap_peak_bytes"],
+                "n/a" if native is None else f"{native:.0f}",
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[isaac-zmq-server] Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
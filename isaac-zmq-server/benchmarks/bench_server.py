@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Server benchmark: streams synthetic camera frames (synthetic_stream.py) into the real ZMQServer, and runs
+the example processing (parse, draw_bounding_boxes, DepthColorizer, CameraToWorldSpaceTransform) on them.
+
+Reports throughput, end-to-end latency (FrameTrace.send_time -> processed), drop rate, CPU and RSS,
+and saves them as JSON so runs can be compared across versions. Runs headless, on CPU, without Isaac Sim.
+
+    python bench_server.py --cameras 4 --rate 60 --duration 10 --output results.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from isaac_zmq_server.cv import (  # noqa: E402
+    CameraToWorldSpaceTransform,
+    DepthColorizer,
+    draw_bounding_boxes,
+    filter_bboxes,
+)
+from isaac_zmq_server.proto_util import decode_bbox2d, decode_camera, unpack_client_stream  # noqa: E402
+from isaac_zmq_server.server import ZMQServer  # noqa: E402
+from synthetic_stream import run_producer  # noqa: E402
+
+STAGES = ("parse", "draw", "depth", "backproject")
+
+
+class CameraConsumer:
+    """
+    Processes the frames of one camera like example.py does, and records timings.
+    """
+
+    def __init__(self, resolution: tuple, stages: tuple):
+        self.resolution = resolution
+        self.stages = stages
+        self.camera_to_world = CameraToWorldSpaceTransform(resolution)
+        # One per camera, its buffers are not shared between the receiving threads
+        self.depth_colorizer = DepthColorizer()
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.latencies = []
+        self.stage_times = {stage: [] for stage in STAGES}
+
+    def process(self, message: list) -> None:
+        width, height = self.resolution
+        times = {}
+
+        start = time.perf_counter()
+        client_stream, color, depth = unpack_client_stream(message)
+        bboxes, id_to_labels = decode_bbox2d(client_stream.bbox2d)
+        camera_data = decode_camera(client_stream.camera)
+        img_array = np.frombuffer(color, dtype=np.uint8).reshape(height, width, 4)
+        depth_array = np.frombuffer(depth, dtype=np.float32).reshape(height, width, 1)
+        times["parse"] = time.perf_counter() - start
+
+        if "draw" in self.stages:
+            start = time.perf_counter()
+            draw_bounding_boxes(img_array, bboxes, id_to_labels)
+            times["draw"] = time.perf_counter() - start
+
+        if "depth" in self.stages:
+            start = time.perf_counter()
+            self.depth_colorizer.colorize(depth_array)
+            times["depth"] = time.perf_counter() - start
+
+        if "backproject" in self.stages:
+            start = time.perf_counter()
+            objects = filter_bboxes(bboxes, id_to_labels, labels=["class:object"])
+            self.camera_to_world.get_bbox_centers_in_world_coords(objects, depth_array, camera_data, device="cpu")
+            times["backproject"] = time.perf_counter() - start
+
+        latency = time.monotonic() - client_stream.trace.send_time
+        with self.lock:
+            self.processed += 1
+            self.latencies.append(latency)
+            for stage, duration in times.items():
+                self.stage_times[stage].append(duration)
+
+
+def percentiles_ms(samples: list) -> dict:
+    """
+    Returns:
+        dict: mean / p50 / p99 / max of the samples (seconds) in milliseconds
+    """
+    if not samples:
+        return {}
+    samples = np.asarray(samples) * 1e3
+    return {
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "max_ms": float(samples.max()),
+    }
+
+
+def current_rss_mb() -> float:
+    """
+    Returns:
+        float: Current resident set size of this process in MB (Linux), 0 if unavailable
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def run_benchmark(args) -> dict:
+    resolution = (args.resolution_x, args.resolution_y)
+    stages = tuple(args.stages.split(",")) if args.stages else ()
+
+    server = ZMQServer()
+    consumers = []
+    for camera in range(args.cameras):
+        consumer = CameraConsumer(resolution, stages)
+        server.subscribe_to_socket_in_loop(
+            f"camera_{camera}",
+            args.port + camera,
+            consumer.process,
+            multipart=True,
+            buffer_slots=args.buffer_slots,
+        )
+        consumers.append(consumer)
+
+    # One producer process per camera, so producing frames does not compete with the server for the GIL
+    context = multiprocessing.get_context("spawn")
+    pool = context.Pool(args.cameras)
+    producers = [
+        pool.apply_async(
+            run_producer,
+            (args.port + camera, args.rate, args.duration, resolution, args.bboxes),
+            {"multipart": not args.inline, "packed_bbox": not args.repeated_bbox, "seed": camera},
+        )
+        for camera in range(args.cameras)
+    ]
+
+    # Measure the server process only while every producer streams (they take a while to spawn)
+    while not all(consumer.processed for consumer in consumers):
+        if all(producer.ready() for producer in producers):
+            break
+        time.sleep(0.01)
+    processed_start = [consumer.processed for consumer in consumers]
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    wall_start = time.monotonic()
+    produced = [producer.get() for producer in producers]
+    wall = time.monotonic() - wall_start
+    usage_end = resource.getrusage(resource.RUSAGE_SELF)
+    processed_window = [consumer.processed - start for consumer, start in zip(consumers, processed_start)]
+    rss_mb = current_rss_mb()
+
+    # Let the last frames drain before stopping
+    time.sleep(0.5)
+    pool.close()
+    pool.join()
+    server.cleanup()
+
+    cpu_seconds = (usage_end.ru_utime - usage_start.ru_utime) + (usage_end.ru_stime - usage_start.ru_stime)
+    total_produced = sum(result["produced"] for result in produced)
+    total_processed = sum(consumer.processed for consumer in consumers)
+
+    per_camera = []
+    for consumer, result, window_count in zip(consumers, produced, processed_window):
+        per_camera.append(
+            {
+                **result,
+                "processed": consumer.processed,
+                "throughput_fps": window_count / wall,
+                "drop_rate": 1 - consumer.processed / max(result["produced"], 1),
+                "latency": percentiles_ms(consumer.latencies),
+            }
+        )
+
+    all_latencies = [latency for consumer in consumers for latency in consumer.latencies]
+    stage_results = {}
+    for stage in STAGES:
+        samples = [duration for consumer in consumers for duration in consumer.stage_times[stage]]
+        if samples:
+            stage_results[stage] = percentiles_ms(samples)
+
+    return {
+        "config": vars(args),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": {
+            "duration_s": wall,
+            "produced": total_produced,
+            "processed": total_processed,
+            "throughput_fps": sum(processed_window) / wall,
+            "drop_rate": 1 - total_processed / max(total_produced, 1),
+            "latency": percentiles_ms(all_latencies),
+            "stages": stage_results,
+            "cpu_percent": cpu_seconds / wall * 100,
+            "rss_mb": rss_mb,
+            "max_rss_mb": usage_end.ru_maxrss / 1024,
+            "per_camera": per_camera,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Isaac Sim ZMQ server benchmark")
+    parser.add_argument("--cameras", type=int, default=1, help="Number of camera streams")
+    parser.add_argument("--rate", type=float, default=60, help="Frame rate per camera (Hz)")
+    parser.add_argument("--duration", type=float, default=10, help="Streaming duration (seconds)")
+    parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
+    parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+    parser.add_argument("--bboxes", type=int, default=10, help="Bounding boxes per frame")
+    parser.add_argument("--port", type=int, default=5700, help="Port of the first camera, one port per camera")
+    parser.add_argument("--stages", default=",".join(STAGES[1:]), help="Processing stages after parse (comma separated)")
+    parser.add_argument("--buffer_slots", type=int, default=0, help="ZMQServer ring buffer slots, 0 to process on the receive thread")
+    parser.add_argument("--inline", action="store_true", help="Embed the images in the protobuf message")
+    parser.add_argument("--repeated_bbox", action="store_true", help="Send bounding boxes as repeated messages")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    summary = results["results"]
+    print(
+        "[isaac-zmq-server] {} camera(s) @ {} Hz: {:.1f} fps processed, drop rate {:.1%}, "
+        "latency p50 {:.2f} ms / p99 {:.2f} ms, CPU {:.0f}%, RSS {:.0f} MB".format(
+            args.cameras,
+            args.rate,
+            summary["throughput_fps"],
+            summary["drop_rate"],
+            summary["latency"].get("p50_ms", 0),
+            summary["latency"].get("p99_ms", 0),
+            summary["cpu_percent"],
+            summary["rss_mb"],
+        )
+    )
+    print(f"[isaac-zmq-server] Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Synthetic Isaac Sim stream generator.
+
+Emits ClientStreamMessages (proto/client_stream_message.proto) the way the ZMQAnnotator / OGN node do,
+without Isaac Sim: RGBA + depth images, bounding boxes, camera parameters, clock and FrameTrace.
+Used by bench_server.py, and can also feed example.py directly:
+
+    python synthetic_stream.py --port 5561 --rate 60
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import zmq
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import client_stream_message_pb2  # noqa: E402
+from isaac_zmq_server.proto_util import BBOX2D_DTYPE  # noqa: E402
+
+
+class SyntheticStream:
+    """
+    Builds synthetic ClientStreamMessages for one camera.
+
+    The images are generated once, each frame only moves the bounding boxes and updates the clock,
+    so producing a frame costs about as much as it does in the real client (serialization and send).
+    """
+
+    def __init__(
+        self,
+        resolution: tuple = (720, 720),
+        num_bboxes: int = 10,
+        multipart: bool = True,
+        packed_bbox: bool = True,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            resolution (tuple): Image resolution (width, height)
+            num_bboxes (int): Number of bounding boxes per frame
+            multipart (bool): Send the images as separate frames (True) or embedded in the message
+            packed_bbox (bool): Send the bounding boxes as BBox2D.packed_data (True) or repeated messages
+            seed (int): Random seed
+        """
+        self.width, self.height = resolution
+        self.multipart = multipart
+        self.packed_bbox = packed_bbox
+        self.frame_id = 0
+        rng = np.random.default_rng(seed)
+
+        # Color: gradient background, depth: tilted plane 1 - 10 m
+        u, v = np.meshgrid(np.arange(self.width), np.arange(self.height))
+        self.color = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        self.color[..., 0] = u * 255 // max(self.width - 1, 1)
+        self.color[..., 1] = v * 255 // max(self.height - 1, 1)
+        self.color[..., 2] = 128
+        self.color[..., 3] = 255
+        self.depth = (1.0 + 9.0 * v / max(self.height - 1, 1)).astype(np.float32)
+
+        # Bounding boxes, half of them labeled "class:object" (what example.py looks for)
+        self.bboxes = np.zeros(num_bboxes, dtype=BBOX2D_DTYPE)
+        self.bboxes["semanticId"] = np.arange(num_bboxes) % 2
+        size = rng.integers(20, max(min(self.width, self.height) // 4, 21), size=(num_bboxes, 2))
+        self.bboxes["xMin"] = rng.integers(0, self.width - size[:, 0])
+        self.bboxes["yMin"] = rng.integers(0, self.height - size[:, 1])
+        self.bboxes["xMax"] = self.bboxes["xMin"] + size[:, 0]
+        self.bboxes["yMax"] = self.bboxes["yMin"] + size[:, 1]
+        self.bboxes["occlusionRatio"] = rng.random(num_bboxes)
+        self.labels = {"0": "class:object", "1": "class:background"}
+
+        # Pinhole camera looking down the z axis (ROS convention), 20 mm focal length on a 20.955 mm aperture
+        focal = 20.0 / 20.955 * self.width
+        self.intrinsics = [focal, 0.0, self.width / 2, 0.0, focal, self.height / 2, 0.0, 0.0, 1.0]
+        self.view_matrix = np.eye(4).flatten().tolist()
+
+    def next_frame(self, sim_time: float, dt: float) -> list:
+        """
+        Build the next message.
+
+        Args:
+            sim_time (float): Simulation time of the frame
+            dt (float): Simulation delta time
+
+        Returns:
+            list: Message frames, ready for send_multipart
+        """
+        self.frame_id += 1
+        render_time = time.monotonic()
+
+        message = client_stream_message_pb2.ClientStreamMessage()
+
+        # Shift the boxes every frame so consecutive frames differ
+        shift = self.frame_id % 16
+        bboxes = self.bboxes.copy()
+        for field in ("xMin", "xMax"):
+            bboxes[field] = np.minimum(bboxes[field] + shift, self.width - 1)
+
+        if self.packed_bbox:
+            message.bbox2d.packed_data = bboxes.tobytes()
+        else:
+            for semantic_id, x_min, y_min, x_max, y_max, occlusion_ratio in bboxes.tolist():
+                bbox_proto = message.bbox2d.data.add()
+                bbox_proto.semanticId = semantic_id
+                bbox_proto.xMin = x_min
+                bbox_proto.yMin = y_min
+                bbox_proto.xMax = x_max
+                bbox_proto.yMax = y_max
+                bbox_proto.occlusionRatio = occlusion_ratio
+        message.bbox2d.info.bboxIds.extend(range(len(bboxes)))
+        for key, label in self.labels.items():
+            message.bbox2d.info.idToLabels[key] = label
+
+        message.clock.sim_dt = dt
+        message.clock.sim_time = sim_time
+        message.clock.sys_time = time.time()
+
+        message.camera.view_matrix_ros.extend(self.view_matrix)
+        message.camera.camera_scale.extend([1.0, 1.0, 1.0])
+        message.camera.intrinsics_matrix.extend(self.intrinsics)
+
+        message.trace.frame_id = self.frame_id
+        message.trace.render_time = render_time
+        message.trace.send_time = time.monotonic()
+
+        if self.multipart:
+            message.color_image_frame = 1
+            message.depth_image_frame = 2
+            return [message.SerializeToString(), self.color, self.depth]
+
+        message.color_image = self.color.tobytes()
+        message.depth_image = self.depth.tobytes()
+        return [message.SerializeToString()]
+
+
+def run_producer(
+    port: int,
+    rate_hz: float,
+    duration: float,
+    resolution: tuple = (720, 720),
+    num_bboxes: int = 10,
+    multipart: bool = True,
+    packed_bbox: bool = True,
+    server_ip: str = "localhost",
+    seed: int = 0,
+    start_delay: float = 1.0,
+) -> dict:
+    """
+    Stream synthetic frames to a server at a fixed rate (absolute deadlines, like the simulation clock).
+
+    Uses a PUSH socket with HWM 1 and non blocking sends, like the OGN node: frames the server
+    is not ready for are dropped at the sender and counted.
+
+    Args:
+        port (int): Server port
+        rate_hz (float): Frame rate
+        duration (float): Streaming duration in seconds
+        resolution (tuple): Image resolution (width, height)
+        num_bboxes (int): Number of bounding boxes per frame
+        multipart (bool): Send the images as separate frames
+        packed_bbox (bool): Send the bounding boxes as BBox2D.packed_data
+        server_ip (str): Server address
+        seed (int): Random seed
+        start_delay (float): Seconds to wait for the connection before streaming
+
+    Returns:
+        dict: Number of frames produced, sent and dropped at the sender
+    """
+    stream = SyntheticStream(resolution, num_bboxes, multipart, packed_bbox, seed)
+
+    context = zmq.Context()
+    sock = context.socket(zmq.PUSH)
+    sock.set_hwm(1)
+    sock.setsockopt(zmq.LINGER, 0)
+    sock.connect(f"tcp://{server_ip}:{port}")
+    time.sleep(start_delay)
+
+    period = 1 / rate_hz
+    produced = sent = 0
+    start = time.monotonic()
+    deadline = start
+    while deadline - start < duration:
+        frames = stream.next_frame(sim_time=produced * period, dt=period)
+        produced += 1
+        try:
+            sock.send_multipart(frames, flags=zmq.NOBLOCK, copy=False)
+            sent += 1
+        except zmq.Again:
+            pass
+
+        deadline += period
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    sock.close()
+    context.term()
+    return {"produced": produced, "sent": sent, "dropped_at_sender": produced - sent}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic Isaac Sim ZMQ stream")
+    parser.add_argument("--port", type=int, default=5561, help="Server port")
+    parser.add_argument("--server_ip", default="localhost", help="Server address")
+    parser.add_argument("--rate", type=float, default=60, help="Frame rate (Hz)")
+    parser.add_argument("--duration", type=float, default=3600, help="Streaming duration (seconds)")
+    parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
+    parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+    parser.add_argument("--bboxes", type=int, default=10, help="Bounding boxes per frame")
+    parser.add_argument("--inline", action="store_true", help="Embed the images in the protobuf message")
+    parser.add_argument("--repeated_bbox", action="store_true", help="Send bounding boxes as repeated messages")
+    args = parser.parse_args()
+
+    result = run_producer(
+        args.port,
+        args.rate,
+        args.duration,
+        (args.resolution_x, args.resolution_y),
+        args.bboxes,
+        multipart=not args.inline,
+        packed_bbox=not args.repeated_bbox,
+        server_ip=args.server_ip,
+    )
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
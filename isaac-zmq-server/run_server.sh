@@ -5,6 +5,7 @@ docker run --gpus all --network host \
        -e XAUTHORITY=$XAUTHORITY \
        -v $XAUTHORITY:$XAUTHORITY \
        -v ./src:/isaac-zmq-server/src \
+       -v ./benchmarks:/isaac-zmq-server/benchmarks \
        --device /dev/input \
        --device /dev/input/event21 \
        --device /dev/input/event22 \
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x63lient_stream_message.proto\"p\n\nBBox2DType\x12\x12\n\nsemanticId\x18\x01 \x01(\r\x12\x0c\n\x04xMin\x18\x02 \x01(\x05\x12\x0c\n\x04yMin\x18\x03 \x01(\x05\x12\x0c\n\x04xMax\x18\x04 \x01(\x05\x12\x0c\n\x04yMax\x18\x05 \x01(\x05\x12\x16\n\x0eocclusionRatio\x18\x06 \x01(\x02\"\x81\x01\n\nBBox2DInfo\x12/\n\nidToLabels\x18\x01 \x03(\x0b\x32\x1b.BBox2DInfo.IdToLabelsEntry\x12\x0f\n\x07\x62\x62oxIds\x18\x02 \x03(\x05\x1a\x31\n\x0fIdToLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\">\n\x06\x42\x42ox2D\x12\x19\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x0b.BBox2DType\x12\x19\n\x04info\x18\x02 \x01(\x0b\x32\x0b.BBox2DInfo\"K\n\x05\x43lock\x12\x0e\n\x06sim_dt\x18\x01 \x01(\x01\x12\x0e\n\x06sys_dt\x18\x02 \x01(\x01\x12\x10\n\x08sim_time\x18\x03 \x01(\x01\x12\x10\n\x08sys_time\x18\x04 \x01(\x01\"R\n\x06\x43\x61mera\x12\x17\n\x0fview_matrix_ros\x18\x01 \x03(\x01\x12\x14\n\x0c\x63\x61mera_scale\x18\x02 \x03(\x01\x12\x19\n\x11intrinsics_matrix\x18\x03 \x03(\x01\"\x88\x01\n\x13\x43lientStreamMessage\x12\x17\n\x06\x62\x62ox2d\x18\x01 \x01(\x0b\x32\x07.BBox2D\x12\x15\n\x05\x63lock\x18\x02 \x01(\x0b\x32\x06.Clock\x12\x17\n\x06\x63\x61mera\x18\x03 \x01(\x0b\x32\x07.Camera\x12\x13\n\x0b\x63olor_image\x18\x04 \x01(\x0c\x12\x13\n\x0b\x64\x65pth_image\x18\x05 \x01(\x0c\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x63lient_stream_message.proto\"p\n\nBBox2DType\x12\x12\n\nsemanticId\x18\x01 \x01(\r\x12\x0c\n\x04xMin\x18\x02 \x01(\x05\x12\x0c\n\x04yMin\x18\x03 \x01(\x05\x12\x0c\n\x04xMax\x18\x04 \x01(\x05\x12\x0c\n\x04yMax\x18\x05 \x01(\x05\x12\x16\n\x0eocclusionRatio\x18\x06 \x01(\x02\"\x81\x01\n\nBBox2DInfo\x12/\n\nidToLabels\x18\x01 \x03(\x0b\x32\x1b.BBox2DInfo.IdToLabelsEntry\x12\x0f\n\x07\x62\x62oxIds\x18\x02 \x03(\x05\x1a\x31\n\x0fIdToLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"S\n\x06\x42\x42ox2D\x12\x19\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x0b.BBox2DType\x12\x19\n\x04info\x18\x02 \x01(\x0b\x32\x0b.BBox2DInfo\x12\x13\n\x0bpacked_data\x18\x03 \x01(\x0c\"K\n\x05\x43lock\x12\x0e\n\x06sim_dt\x18\x01 \x01(\x01\x12\x0e\n\x06sys_dt\x18\x02 \x01(\x01\x12\x10\n\x08sim_time\x18\x03 \x01(\x01\x12\x10\n\x08sys_time\x18\x04 \x01(\x01\"h\n\x06\x43\x61mera\x12\x17\n\x0fview_matrix_ros\x18\x01 \x03(\x01\x12\x14\n\x0c\x63\x61mera_scale\x18\x02 \x03(\x01\x12\x19\n\x11intrinsics_matrix\x18\x03 \x03(\x01\x12\x14\n\x0cpose_version\x18\x04 \x01(\r\"\xb6\x01\n\x0cSessionState\x12\x0f\n\x07version\x18\x01 \x01(\r\x12\x31\n\nidToLabels\x18\x02 \x03(\x0b\x32\x1d.SessionState.IdToLabelsEntry\x12\x19\n\x11intrinsics_matrix\x18\x03 \x03(\x01\x12\x14\n\x0c\x63\x61mera_scale\x18\x04 \x03(\x01\x1a\x31\n\x0fIdToLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x91\x01\n\nFrameTrace\x12\x10\n\x08\x66rame_id\x18\x01 \x01(\x04\x12\x13\n\x0brender_time\x18\x02 \x01(\x01\x12\x11\n\tsend_time\x18\x03 \x01(\x01\x12\x12\n\ncommand_id\x18\x04 \x01(\x04\x12\x19\n\x11\x63ommand_send_time\x18\x05 \x01(\x01\x12\x1a\n\x12\x63ommand_apply_time\x18\x06 \x01(\x01\"\x80\x01\n\x0bImageRegion\x12\t\n\x01x\x18\x01 \x01(\r\x12\t\n\x01y\x18\x02 \x01(\r\x12\r\n\x05width\x18\x03 \x01(\r\x12\x0e\n\x06height\x18\x04 \x01(\r\x12\x11\n\tdownscale\x18\x05 \x01(\r\x12\x13\n\x0bimage_width\x18\x06 \x01(\r\x12\x14\n\x0cimage_height\x18\x07 \x01(\r\"\xf4\x03\n\x13\x43lientStreamMessage\x12\x17\n\x06\x62\x62ox2d\x18\x01 \x01(\x0b\x32\x07.BBox2D\x12\x15\n\x05\x63lock\x18\x02 \x01(\x0b\x32\x06.Clock\x12\x17\n\x06\x63\x61mera\x18\x03 \x01(\x0b\x32\x07.Camera\x12\x13\n\x0b\x63olor_image\x18\x04 \x01(\x0c\x12\x13\n\x0b\x64\x65pth_image\x18\x05 \x01(\x0c\x12\x19\n\x11\x63olor_image_frame\x18\x06 \x01(\r\x12\x19\n\x11\x64\x65pth_image_frame\x18\x07 \x01(\r\x12 \n\x0b\x63olor_codec\x18\x08 \x01(\x0e\x32\x0b.ImageCodec\x12 \n\x0b\x64\x65pth_codec\x18\t \x01(\x0e\x32\x0b.ImageCodec\x12\x1a\n\x05trace\x18\n \x01(\x0b\x32\x0b.FrameTrace\x12\r\n\x05topic\x18\x0b \x01(\t\x12\x12\n\nannotators\x18\x0c \x01(\r\x12\x1e\n\x07session\x18\r \x01(\x0b\x32\r.SessionState\x12\x12\n\nsession_id\x18\x0e \x01(\x04\x12\x17\n\x0fsession_version\x18\x0f \x01(\r\x12\x1c\n\x06region\x18\x10 \x01(\x0b\x32\x0c.ImageRegion\x12\"\n\x0c\x63olor_format\x18\x11 \x01(\x0e\x32\x0c.PixelFormat\x12\"\n\x0c\x64\x65pth_format\x18\x12 \x01(\x0e\x32\x0c.PixelFormat*\xa0\x01\n\nImageCodec\x12\x13\n\x0fIMAGE_CODEC_RAW\x10\x00\x12\x13\n\x0fIMAGE_CODEC_LZ4\x10\x01\x12\x14\n\x10IMAGE_CODEC_ZSTD\x10\x02\x12\x13\n\x0fIMAGE_CODEC_PNG\x10\x03\x12\x1b\n\x17IMAGE_CODEC_DEPTH_PNG16\x10\x04\x12 \n\x1cIMAGE_CODEC_DEPTH_DELTA_ZSTD\x10\x05*`\n\x0bPixelFormat\x12\x18\n\x14PIXEL_FORMAT_DEFAULT\x10\x00\x12\x15\n\x11PIXEL_FORMAT_RGB8\x10\x01\x12 \n\x1cPIXEL_FORMAT_DEPTH_UINT16_MM\x10\x02*\x9d\x01\n\x0fStreamAnnotator\x12\x18\n\x14STREAM_ANNOTATOR_ALL\x10\x00\x12\x1a\n\x16STREAM_ANNOTATOR_COLOR\x10\x01\x12\x1a\n\x16STREAM_ANNOTATOR_DEPTH\x10\x02\x12\x1b\n\x17STREAM_ANNOTATOR_BBOX2D\x10\x04\x12\x1b\n\x17STREAM_ANNOTATOR_CAMERA\x10\x08\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,6 +23,14 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_BBOX2DINFO_IDTOLABELSENTRY']._loaded_options = None
   _globals['_BBOX2DINFO_IDTOLABELSENTRY']._serialized_options = b'8\001'
+  _globals['_SESSIONSTATE_IDTOLABELSENTRY']._loaded_options = None
+  _globals['_SESSIONSTATE_IDTOLABELSENTRY']._serialized_options = b'8\001'
+  _globals['_IMAGECODEC']._serialized_start=1513
+  _globals['_IMAGECODEC']._serialized_end=1673
+  _globals['_PIXELFORMAT']._serialized_start=1675
+  _globals['_PIXELFORMAT']._serialized_end=1771
+  _globals['_STREAMANNOTATOR']._serialized_start=1774
+  _globals['_STREAMANNOTATOR']._serialized_end=1931
   _globals['_BBOX2DTYPE']._serialized_start=31
   _globals['_BBOX2DTYPE']._serialized_end=143
   _globals['_BBOX2DINFO']._serialized_start=146
@@ -30,11 +38,19 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_BBOX2DINFO_IDTOLABELSENTRY']._serialized_start=226
   _globals['_BBOX2DINFO_IDTOLABELSENTRY']._serialized_end=275
   _globals['_BBOX2D']._serialized_start=277
-  _globals['_BBOX2D']._serialized_end=339
-  _globals['_CLOCK']._serialized_start=341
-  _globals['_CLOCK']._serialized_end=416
-  _globals['_CAMERA']._serialized_start=418
-  _globals['_CAMERA']._serialized_end=500
-  _globals['_CLIENTSTREAMMESSAGE']._serialized_start=503
-  _globals['_CLIENTSTREAMMESSAGE']._serialized_end=639
+  _globals['_BBOX2D']._serialized_end=360
+  _globals['_CLOCK']._serialized_start=362
+  _globals['_CLOCK']._serialized_end=437
+  _globals['_CAMERA']._serialized_start=439
+  _globals['_CAMERA']._serialized_end=543
+  _globals['_SESSIONSTATE']._serialized_start=546
+  _globals['_SESSIONSTATE']._serialized_end=728
+  _globals['_SESSIONSTATE_IDTOLABELSENTRY']._serialized_start=226
+  _globals['_SESSIONSTATE_IDTOLABELSENTRY']._serialized_end=275
+  _globals['_FRAMETRACE']._serialized_start=731
+  _globals['_FRAMETRACE']._serialized_end=876
+  _globals['_IMAGEREGION']._serialized_start=879
+  _globals['_IMAGEREGION']._serialized_end=1007
+  _globals['_CLIENTSTREAMMESSAGE']._serialized_start=1010
+  _globals['_CLIENTSTREAMMESSAGE']._serialized_end=1510
 # @@protoc_insertion_point(module_scope)
@@ -13,13 +13,17 @@ import numpy as np
 
 from isaac_zmq_server.cv import (
     CameraToWorldSpaceTransform,
-    colorize_depth,
+    DepthColorizer,
     draw_bounding_boxes,
+    filter_bboxes,
 )
+from isaac_zmq_server.image_codecs import available_codecs, get_codec
+from isaac_zmq_server.proto_util import annotator_mask, decode_bbox2d, decode_camera, decode_images, unpack_client_stream
 from isaac_zmq_server.server import ZMQServer
-from isaac_zmq_server.ui import App
+from isaac_zmq_server.session import SessionCache
+from isaac_zmq_server.tracing import LatencyTracer
+from isaac_zmq_server.ui import App, TextureSink
 
-import client_stream_message_pb2
 import server_control_message_pb2
 
 parser = argparse.ArgumentParser(description="Isaac Sim ZMQ Client Example")
@@ -27,6 +31,10 @@ parser.add_argument("--port", type=int, default=5561, help="Port to subscribe da
 parser.add_argument("--subscribe_only", type=int, default=0, help="1 to only subscribe to data, 0 to publish and subscribe")
 parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
 parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+parser.add_argument("--color_codec", default="raw", choices=available_codecs(), help="Codec requested for color images")
+parser.add_argument("--depth_codec", default="raw", choices=available_codecs(), help="Codec requested for depth images")
+parser.add_argument("--trace_file", default="", help="Write latency statistics to this JSON file on exit")
+parser.add_argument("--chrome_trace_file", default="", help="Write latency events to this Chrome trace file on exit")
 args = parser.parse_args()
 
 # Set up configuration based on arguments
@@ -34,6 +42,8 @@ SUBSCRIBE_ONLY = bool(args.subscribe_only)
 PORT = args.port
 RESOLUTION_X = args.resolution_x
 RESOLUTION_Y = args.resolution_y
+COLOR_CODEC = get_codec(args.color_codec).codec_id
+DEPTH_CODEC = get_codec(args.depth_codec).codec_id
 
 if SUBSCRIBE_ONLY:
     print("Server is in subscribe only mode at port: {}, resolution: {}x{}".format(PORT, RESOLUTION_X, RESOLUTION_Y))
@@ -57,7 +67,6 @@ class FrankaVisionMission(App):
 
         # UI configuration
         self.dimmention = (RESOLUTION_X, RESOLUTION_Y)
-        self.expected_size = self.dimmention[0] * self.dimmention[1] * 4
         self.hz = 60  # Target refresh rate
 
         self.window_name = f"Isaac Sim ZMQ Server {RESOLUTION_X}x{RESOLUTION_Y}@{PORT}"
@@ -85,8 +94,20 @@ class FrankaVisionMission(App):
         self.texture_data = np.zeros((self.dimmention[1], self.dimmention[0], 4), dtype=np.float32)
         self.depth_data = np.zeros((self.dimmention[1], self.dimmention[0], 4), dtype=np.uint8)
         self.current_camera_command = [0, 0, 0]
+        self.ground_truth_mode = "BBOX2D"
+        self.sim_time = 0.0
+
+        # Received frames are only converted to the float texture when displayed (see update_ui)
+        self.texture_sink = TextureSink(self.texture_data)
+        self.depth_colorizer = DepthColorizer()
 
         self.camera_to_world = CameraToWorldSpaceTransform((self.dimmention[0], self.dimmention[1]))
+        self.session_cache = SessionCache()
+
+        # Latency tracing, commands are traced back to the frame their detection came from
+        self.tracer = LatencyTracer()
+        self.detection_frame_id = 0
+        self.command_id = 0
 
         self.debug_start_time = None
 
@@ -127,9 +148,10 @@ class FrankaVisionMission(App):
                     dpg.add_text("Ground Truth")
                     dpg.add_combo(
                         items=["RGB", "BBOX2D", "DEPTH"],
-                        default_value="BBOX2D",
+                        default_value=self.ground_truth_mode,
                         width=100,
                         tag="ground_truth_mode",
+                        callback=self.ground_truth_mode_evnet,
                     )
                     dpg.add_text("Focal Length", show=not SUBSCRIBE_ONLY)
                     dpg.add_slider_float(
@@ -181,6 +203,9 @@ class FrankaVisionMission(App):
             "camera_annotator",
             self.ports["camera_annotator"],
             self.process_annotations,
+            multipart=True,
+            buffer_slots=3,  # Process the latest frame on a separate thread, without stalling the socket
+            with_recv_time=True,
         )
 
         # Set up senders for various commands (if not in receive-only mode)
@@ -206,142 +231,82 @@ class FrankaVisionMission(App):
                 self.franka_command,
             )
 
-    def proto_bbox_data_to_dict(self, bbox2d_data) -> dict:
-        """
-        Convert protobuf bounding box data to a Python dictionary.
-        source: isaac_bridge_zmq_stream_pb2.BBox2D
-
-        Args:
-            bbox2d_data: Protobuf BBox2D message
-
-        Returns:
-            dict: Dictionary containing bounding box data
-        """
-        # Extract the list of bounding boxes
-        json_bbox_data = []
-        for bbox in bbox2d_data.data:
-            bbox_dict = {
-                "semanticId": str(bbox.semanticId),
-                "xMin": bbox.xMin,
-                "yMin": bbox.yMin,
-                "xMax": bbox.xMax,
-                "yMax": bbox.yMax,
-                "occlusionRatio": bbox.occlusionRatio,
-            }
-            json_bbox_data.append(bbox_dict)
-
-        # Extract idToLabels map and bounding box IDs
-        id_to_labels = dict(bbox2d_data.info.idToLabels)
-        json_bbox_ids = list(bbox2d_data.info.bboxIds)
-
-        # Combine into final dictionary structure
-        bbox2d_info = {"idToLabels": id_to_labels, "bboxIds": json_bbox_ids}
-        bbox2d_data = {"data": json_bbox_data, "info": bbox2d_info}
-        return bbox2d_data
-
-    def proto_camera_data_to_dict(self, camera_data) -> dict:
-        """
-        Convert protobuf camera data to a Python dictionary.
-        source: isaac_bridge_zmq_stream_pb2.Camera
-        Args:
-            camera_data: Protobuf Camera message
-
-        Returns:
-            dict: Dictionary containing camera matrices and parameters
-        """
-        # Convert view matrix from flat array to 4x4 matrix
-        view_matrix_ros_flat = camera_data.view_matrix_ros
-        view_matrix_list = [view_matrix_ros_flat[i : i + 4] for i in range(0, 16, 4)]
-
-        # Get camera scale
-        scale_list = list(camera_data.camera_scale)
-
-        # Convert intrinsics matrix from flat array to 3x3 matrix
-        intrinsics_flat = camera_data.intrinsics_matrix
-        intrinsics_list = [intrinsics_flat[i : i + 3] for i in range(0, 9, 3)]
-
-        # Combine into final dictionary structure
-        camera_data = {
-            "view_matrix_ros": view_matrix_list,
-            "camera_scale": scale_list,
-            "intrinsics_matrix": intrinsics_list,
-        }
-        return camera_data
-
-    def process_annotations(self, message: str) -> None:
+    def process_annotations(self, message: list, recv_time: float) -> None:
         """
         Receive and process annotations from the message.
 
         Extracts image data, bounding box data, depth data, camera data, and delta time from the message.
-        Updates `texture_data` with the image data.
+        Hands the image to the texture sink, which updates `texture_data` when it is displayed.
         Calculates the center of the bounding box in world coordinates.
 
         message:
             client_stream_message_pb2.ClientStreamMessage @ proto/client_stream_message.proto
+            received as a list of frames (images are either embedded or sent as zero-copy frames)
+
+        recv_time:
+            when the message was received from the socket (time.monotonic()), before waiting in the ring buffer
 
         """
+        parse_start = time.monotonic()
         if not self.debug_start_time:
-            self.debug_start_time = time.monotonic()
-
-        client_stream = client_stream_message_pb2.ClientStreamMessage()
+            self.debug_start_time = recv_time
 
         # Deserialize the message
-        client_stream.ParseFromString(message)
+        client_stream, img_data, depth_data = unpack_client_stream(message)
 
         dt = client_stream.clock.sim_dt
         sim_time = client_stream.clock.sim_time
         timecode = client_stream.clock.sys_time
 
-        img_data = client_stream.color_image  # bytes
-        depth_data = client_stream.depth_image  # bytes
+        # Restore the labels and camera metadata of delta encoded messages (see session.py)
+        self.session_cache.apply("camera_annotator", client_stream)
 
-        bbox2d_data = self.proto_bbox_data_to_dict(client_stream.bbox2d)
-        camera_data = self.proto_camera_data_to_dict(client_stream.camera)
+        # Parts not requested in settings_command are missing (None), e.g. right after switching the mode
+        bboxes, id_to_labels = decode_bbox2d(client_stream.bbox2d)
+        camera_data = decode_camera(client_stream.camera)
 
         self.rates_debug(sim_time, timecode)
 
-        if len(img_data) != self.expected_size:
-            print(f"Received image data of size {len(img_data)}, expected {self.expected_size}")
+        # Decode the images, the codec and output (crop, downscale, pixel format) are chosen by the client
+        try:
+            img_data, depth_data = decode_images(client_stream, img_data, depth_data, self.dimmention)
+        except ValueError as e:
+            print(f"[isaac-zmq-server] {e}")
             return
 
-        if dpg.get_value("ground_truth_mode") in ["BBOX2D", "RGB"]:
-            # Reshape to height x width x channels
-            img_array = np.frombuffer(img_data, dtype=np.uint8).reshape(self.dimmention[1], self.dimmention[0], 4)
-
-            if dpg.get_value("ground_truth_mode") == "BBOX2D":
-                try:
-                    img_array = draw_bounding_boxes(img_array, bbox2d_data)
-                except:
-                    print(traceback.format_exc())
-
-        elif dpg.get_value("ground_truth_mode") == "DEPTH":
-            # Reshape to height x width (rows x cols)
-            img_array = np.frombuffer(depth_data, dtype=np.float32).reshape(self.dimmention[1], self.dimmention[0], 1)
-            try:
-                img_array = colorize_depth(img_array)
-            except:
-                print(traceback.format_exc())
-
-        np.divide(img_array, 255.0, out=self.texture_data)
-
-        if not SUBSCRIBE_ONLY:
-            interseting_bbox = self.get_interseting_bbox(bbox2d_data)
+        parse_end = time.monotonic()
+
+        # Draw straight into the reused uint8 buffer of the texture, converted only when displayed
+        ground_truth_mode = self.ground_truth_mode
+        mode_image = depth_data if ground_truth_mode == "DEPTH" else img_data
+        # The texture has the full resolution, cropped or downscaled images are not displayed
+        if mode_image is not None and mode_image.shape[:2] == (self.dimmention[1], self.dimmention[0]):
+            with self.texture_sink.write() as texture_image:
+                if ground_truth_mode in ["BBOX2D", "RGB"]:
+                    np.copyto(texture_image, img_data)
+
+                    if ground_truth_mode == "BBOX2D":
+                        try:
+                            draw_bounding_boxes(texture_image, bboxes, id_to_labels, out=texture_image)
+                        except:
+                            print(traceback.format_exc())
+
+                elif ground_truth_mode == "DEPTH":
+                    try:
+                        self.depth_colorizer.colorize(depth_data, out=texture_image)
+                    except:
+                        print(traceback.format_exc())
+
+        if not SUBSCRIBE_ONLY and depth_data is not None and camera_data is not None:
+            interseting_bbox = self.get_interseting_bbox(bboxes, id_to_labels)
             self.camera_to_world.get_bbox_center_in_world_coords(interseting_bbox, depth_data, camera_data, device="cuda")
+            self.detection_frame_id = client_stream.trace.frame_id
 
-    def get_interseting_bbox(self, bbox_data: dict) -> None:
-        index = -1
-        interseting = ["class:object"]
-        if bbox_data["info"].get("idToLabels"):
-            for k, v in bbox_data["info"]["idToLabels"].items():
-                if v in interseting:
-                    index = k
-                    break
-
-            for box in bbox_data["data"]:
-                if box["semanticId"] == index:
-                    return {"data": box}
+        self.tracer.record_frame(client_stream.trace, recv_time, parse_start, parse_end, time.monotonic())
 
-        return {"data": []}
+    def get_interseting_bbox(self, bboxes: np.ndarray, id_to_labels: dict) -> np.ndarray:
+        interseting = ["class:object"]
+        return filter_bboxes(bboxes, id_to_labels, labels=interseting)[:1]
 
     def rates_debug(self, sim_time: float, timecode: float) -> None:
         # print("[isaac-zmq-server] Message transit time: {:.4f}".format(time.time() - timecode))
@@ -354,7 +319,7 @@ class FrankaVisionMission(App):
             sim_rate = 0
             print("[isaac-zmq-server] Sim time interval is zero.")
 
-        dpg.set_value("sim_time", str("{:.2f}".format(sim_time)))
+        self.sim_time = sim_time
 
         current_time = time.monotonic()
 
@@ -422,6 +387,16 @@ class FrankaVisionMission(App):
         message = server_control_message_pb2.ServerControlMessage()
         # Set other control parameters
         message.settings_command.adaptive_rate = dpg.get_value("adeptive_rate")
+        # Request image codecs, the client reports the codec it actually used in each stream message
+        message.settings_command.color_codec = COLOR_CODEC
+        message.settings_command.depth_codec = DEPTH_CODEC
+        # Only stream the parts used by the current mode, and the detection to world coordinates
+        message.settings_command.annotators = annotator_mask(
+            color=self.ground_truth_mode in ["BBOX2D", "RGB"],
+            depth=self.ground_truth_mode == "DEPTH" or not SUBSCRIBE_ONLY,
+            bbox2d=self.ground_truth_mode == "BBOX2D" or not SUBSCRIBE_ONLY,
+            camera=not SUBSCRIBE_ONLY,
+        )
 
         return message
 
@@ -446,8 +421,25 @@ class FrankaVisionMission(App):
         else:
             message.franka_command.show_marker = False
 
+        # Trace the command, the client echoes it back once applied
+        self.command_id += 1
+        message.trace.command_id = self.command_id
+        message.trace.frame_id = self.detection_frame_id
+        message.trace.send_time = time.monotonic()
+        self.tracer.command_sent(self.command_id, self.detection_frame_id)
+
         return message
 
+    def update_ui(self) -> None:
+        """
+        Display the latest received frame and sim time, once per rendered frame.
+        """
+        self.texture_sink.update()
+        dpg.set_value("sim_time", str("{:.2f}".format(self.sim_time)))
+
+    def ground_truth_mode_evnet(self, sender: int, app_data: str) -> None:
+        self.ground_truth_mode = app_data
+
     def mouse_wheel_evnet(self, sender: int, app_data: int) -> None:
         new_value = dpg.get_value("zoom") + (app_data * 5)
         new_value = max(min(new_value, 200), 20)
@@ -468,6 +460,10 @@ class FrankaVisionMission(App):
 
     def _cleanup(self) -> None:
         super()._cleanup()
+        if args.trace_file:
+            self.tracer.dump_json(args.trace_file)
+        if args.chrome_trace_file:
+            self.tracer.dump_chrome_trace(args.chrome_trace_file)
 
 
 FrankaVisionMission.run_app()
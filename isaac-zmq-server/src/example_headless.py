@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Headless version of example.py, for containers without a display.
+
+Receives the camera stream, processes every frame (bounding boxes, depth, world position of the detection)
+and hands it to the selected sinks. Unless subscribe only, it also drives the Franka mission
+towards the detection, like example.py does.
+
+    python example_headless.py --sinks metrics
+    python example_headless.py --sinks metrics,record --record_dir /tmp/frames --record_every 30
+    python example_headless.py --multiplexed camera_annotator,gripper_annotator
+    python example_headless.py --topics camera_annotator --endpoint tcp://localhost:5562 --subscribe_only 1
+    python example_headless.py --crop 180,180,360,360 --downscale 2 --rgb --depth_mm
+"""
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+
+from isaac_zmq_server.headless import HeadlessRunner
+from isaac_zmq_server.image_codecs import available_codecs, get_codec
+from isaac_zmq_server.image_output import PIXEL_FORMAT_DEFAULT, PIXEL_FORMAT_DEPTH_UINT16_MM, PIXEL_FORMAT_RGB8, ImageOutput
+from isaac_zmq_server.sinks import MetricsSink, NullSink, RecorderSink
+
+import server_control_message_pb2
+
+parser = argparse.ArgumentParser(description="Isaac Sim ZMQ Headless Server Example")
+parser.add_argument("--port", type=int, default=5561, help="Port to subscribe data on")
+parser.add_argument("--subscribe_only", type=int, default=0, help="1 to only subscribe to data, 0 to publish and subscribe")
+parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
+parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+parser.add_argument("--color_codec", default="raw", choices=available_codecs(), help="Codec requested for color images")
+parser.add_argument("--depth_codec", default="raw", choices=available_codecs(), help="Codec requested for depth images")
+parser.add_argument("--sinks", default="metrics", help="Comma separated frame sinks: null, metrics, record")
+parser.add_argument("--record_dir", default="recording", help="Output directory of the record sink")
+parser.add_argument("--record_every", type=int, default=1, help="Record one frame out of every N")
+parser.add_argument("--device", default="cpu", choices=["cpu", "cuda"], help="Device of the detection back-projection")
+parser.add_argument("--multiplexed", default="", help="Comma separated camera ids multiplexed on the port, empty for a single stream")
+parser.add_argument("--topics", default="", help="Comma separated topics to subscribe to in PUB/SUB mode, empty to receive on the port")
+parser.add_argument("--endpoint", default="tcp://localhost:5562", help="Endpoint to subscribe on in PUB/SUB mode (StreamProxy backend)")
+parser.add_argument("--conflate", action="store_true", help="Only keep the latest message in PUB/SUB mode (images inline only)")
+parser.add_argument("--crop", default="", help="x,y,width,height crop of the streamed images in render product pixels, empty for none")
+parser.add_argument("--downscale", type=int, default=1, help="Downscaling factor of the streamed images")
+parser.add_argument("--rgb", action="store_true", help="Stream color as RGB8 instead of RGBA")
+parser.add_argument("--depth_mm", action="store_true", help="Stream depth as uint16 millimeters instead of float32")
+parser.add_argument("--output_stream", default="", help="Camera id, topic or port the output applies to, empty for all streams")
+parser.add_argument("--duration", type=float, default=0, help="Seconds to run, 0 to run until Ctrl+C")
+args = parser.parse_args()
+
+SUBSCRIBE_ONLY = bool(args.subscribe_only)
+HZ = 60
+command_ids = itertools.count(1)
+
+# Output requested from the client (see SettingsCommand.outputs), None to keep its own configuration
+OUTPUT = None
+if args.crop or args.downscale > 1 or args.rgb or args.depth_mm:
+    crop = tuple(int(value) for value in args.crop.split(",")) if args.crop else None
+    if crop is not None and len(crop) != 4:
+        raise ValueError(f"--crop takes x,y,width,height, got {args.crop}")
+    OUTPUT = ImageOutput(
+        crop,
+        args.downscale,
+        PIXEL_FORMAT_RGB8 if args.rgb else PIXEL_FORMAT_DEFAULT,
+        PIXEL_FORMAT_DEPTH_UINT16_MM if args.depth_mm else PIXEL_FORMAT_DEFAULT,
+    )
+
+
+def create_sinks() -> list:
+    sinks = []
+    for sink_name in args.sinks.split(","):
+        if sink_name == "null":
+            sinks.append(NullSink())
+        elif sink_name == "metrics":
+            sinks.append(MetricsSink())
+        elif sink_name == "record":
+            sinks.append(RecorderSink(args.record_dir, every_n=args.record_every))
+        elif sink_name:
+            raise ValueError(f"Unknown sink: {sink_name}")
+    return sinks
+
+
+runner = HeadlessRunner(
+    (args.resolution_x, args.resolution_y),
+    create_sinks(),
+    world_coords=not SUBSCRIBE_ONLY,
+    labels=["class:object"],
+    device=args.device,
+)
+if args.topics:
+    for topic in args.topics.split(","):
+        runner.subscribe_topic(topic, args.endpoint, conflate=args.conflate)
+elif args.multiplexed:
+    runner.subscribe_multiplexed(args.port, args.multiplexed.split(","))
+else:
+    runner.subscribe("camera_annotator", args.port)
+
+
+def settings_command() -> server_control_message_pb2.ServerControlMessage:
+    message = server_control_message_pb2.ServerControlMessage()
+    message.settings_command.adaptive_rate = True
+    message.settings_command.color_codec = get_codec(args.color_codec).codec_id
+    message.settings_command.depth_codec = get_codec(args.depth_codec).codec_id
+    # Only stream the parts this server processes (e.g. no depth when not computing world coordinates)
+    message.settings_command.annotators = runner.required_annotators()
+    if OUTPUT is not None:
+        OUTPUT.fill_command(message.settings_command.outputs.add(), args.output_stream)
+    return message
+
+
+def franka_command() -> server_control_message_pb2.ServerControlMessage:
+    """
+    Move the Franka effector to the first detection of the latest frame (the origin if there is none, like example.py).
+    """
+    message = server_control_message_pb2.ServerControlMessage()
+    frame_id, detections_world_pos = runner.latest_detections.get("camera_annotator", (0, np.zeros((0, 3))))
+    if len(detections_world_pos):
+        message.franka_command.effector_pos.x = detections_world_pos[0][0]
+        message.franka_command.effector_pos.y = detections_world_pos[0][1]
+        message.franka_command.effector_pos.z = detections_world_pos[0][2]
+    message.franka_command.show_marker = True
+    message.trace.command_id = next(command_ids)
+    message.trace.frame_id = frame_id
+    message.trace.send_time = time.monotonic()
+    return message
+
+
+if SUBSCRIBE_ONLY:
+    print("Headless server is in subscribe only mode at port: {}".format(args.port))
+else:
+    print("Headless server is in publish and subscribe mode at port: {}".format(args.port))
+    runner.zmq_server.publish_protobuf_in_loop("settings", 5559, HZ, settings_command)
+    runner.zmq_server.publish_protobuf_in_loop("franka", 5560, HZ, franka_command)
+
+runner.run(args.duration)
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+import traceback
+
+import zmq
+import zmq.asyncio
+
+from .scheduler import DeadlineScheduler
+
+
+class AsyncZMQServer:
+    """
+    asyncio based server for handling ZMQ communication.
+
+    Drop-in alternative to ZMQServer (same subscribe_to_socket_in_loop / publish_protobuf_in_loop
+    surface), where all sockets are served by a single event loop running in one background thread:
+    every subscribed socket is watched by one zmq.asyncio.Poller task.
+    No socket timeouts are involved, so cleanup() returns immediately regardless of the number of sockets.
+    Publishers share one DeadlineScheduler task (see `scheduler.stats()`).
+
+    Callbacks run on the event loop thread, they can be plain functions or coroutine functions.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """Implement singleton pattern for AsyncZMQServer."""
+        if not cls._instance:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the AsyncZMQServer with empty collections for sockets and tasks."""
+        # Skip initialization if already initialized (singleton pattern)
+        if hasattr(self, "push_sockets"):
+            return
+
+        self.push_sockets = {}
+        self.pull_sockets = {}
+        self.scheduler = DeadlineScheduler()
+        self.publish_dropped = {}
+        self._scheduler_task = None
+
+        # Subscribed sockets: socket -> (name, callback, multipart)
+        self._subscriptions = {}
+        self._poll_task = None
+
+        # ZMQ context and event loop (created on first use)
+        self._context = None
+        self._loop = None
+        self._loop_thread = None
+
+    def context(self) -> zmq.asyncio.Context:
+        """
+        Returns the ZMQ context instance.
+        If the context has not been initialized, it creates a new ZMQ context and assigns it to the `_context` attribute.
+
+        Returns:
+            zmq.asyncio.Context: The ZMQ context instance.
+        """
+        if not self._context:
+            self._context = zmq.asyncio.Context()
+        return self._context
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop serving the sockets, starting its thread if needed.
+
+        Returns:
+            asyncio.AbstractEventLoop: The event loop.
+        """
+        if not self._loop:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name="isaac-zmq-server-loop")
+            self._loop_thread.start()
+        return self._loop
+
+    def _run_in_loop(self, coro) -> object:
+        """Run a coroutine on the event loop thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop()).result()
+
+    def get_pull_socket(self, port: int) -> zmq.asyncio.Socket:
+        """
+        Creates and returns a new pull socket that is bound to the specified port.
+
+        Args:
+            port (int): The port number to bind the socket to.
+
+        Returns:
+            zmq.asyncio.Socket: The newly created pull socket.
+        """
+        addr = f"tcp://*:{port}"
+        sock = self.context().socket(zmq.PULL)
+        sock.set_hwm(1)  # High water mark: only buffer 1 message
+        sock.bind(addr)
+        self.pull_sockets[port] = sock
+        return sock
+
+    def get_push_socket(self, port: int) -> zmq.asyncio.Socket:
+        """
+        Creates and returns a ZeroMQ PUSH socket bound to the specified port.
+
+        Args:
+            port (int): The port number to bind the socket to.
+
+        Returns:
+            zmq.asyncio.Socket: The created PUSH socket.
+        """
+        addr = f"tcp://*:{port}"
+        sock = self.context().socket(zmq.PUSH)
+        sock.bind(addr)
+        self.push_sockets[port] = sock
+        return sock
+
+    def subscribe_to_socket_in_loop(self, name: str, port: int, fn: callable, multipart: bool = False) -> None:
+        """
+        Receives messages from a socket and calls a given function for each message.
+
+        The socket is added to the poller of the event loop, no thread is created.
+        See ZMQServer.subscribe_to_socket_in_loop() for the message format.
+
+        Args:
+            name (str): The name of the subscription.
+            port (int): The port number to receive messages from.
+            fn (callable): A function (or coroutine function) that takes a message as input.
+            multipart (bool): Whether to receive all message frames as zero-copy memoryviews.
+        """
+
+        async def subscribe():
+            sock = self.get_pull_socket(port)
+            self._subscriptions[sock] = (name, fn, multipart)
+            # Restart the poll task so it watches the new socket
+            if self._poll_task:
+                self._poll_task.cancel()
+            self._poll_task = asyncio.ensure_future(self._poll_loop(dict(self._subscriptions)))
+
+        self._run_in_loop(subscribe())
+
+    async def _poll_loop(self, subscriptions: dict) -> None:
+        """
+        Task that polls all subscribed sockets and dispatches their messages.
+
+        Args:
+            subscriptions (dict): socket -> (name, callback, multipart)
+        """
+        poller = zmq.asyncio.Poller()
+        for sock in subscriptions:
+            poller.register(sock, zmq.POLLIN)
+
+        while True:
+            events = await poller.poll()
+            for sock, _ in events:
+                name, fn, multipart = subscriptions[sock]
+                try:
+                    if multipart:
+                        frames = await sock.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+                        msg = [frame.buffer for frame in frames]
+                    else:
+                        msg = await sock.recv(flags=zmq.NOBLOCK)
+                    result = fn(msg)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except zmq.Again:
+                    continue
+                except asyncio.CancelledError:
+                    raise
+                except:
+                    print(f"[isaac-zmq-server] Unable to unpack from socket {name}...")
+                    print(traceback.format_exc())
+
+    def publish_protobuf_in_loop(self, name: str, port: int, rate_hz: float, fn: callable) -> None:
+        """
+        Sends protobuf messages from a socket in a loop at a specified rate.
+
+        All publishers run on a single DeadlineScheduler task of the event loop, see
+        ZMQServer.publish_protobuf_in_loop().
+
+        Args:
+            name (str): The name of the publisher.
+            port (int): The port number to send data to.
+            rate_hz (float): The rate at which data is sent in Hz.
+            fn (callable): A callable function that returns a protobuf message.
+        """
+
+        async def start():
+            sock = self.get_push_socket(port)
+            self.publish_dropped[name] = 0
+
+            def publish():
+                """Scheduled function that sends the protobuf message returned by fn."""
+                proto_msg = fn()
+                try:
+                    # Non blocking sends complete immediately, result() raises zmq.Again if the message was not queued
+                    sock.send(proto_msg.SerializeToString(), flags=zmq.NOBLOCK).result()
+                except zmq.Again:
+                    self.publish_dropped[name] += 1
+
+            self.scheduler.add_job(name, rate_hz, publish)
+            if not self._scheduler_task:
+                self._scheduler_task = asyncio.ensure_future(self.scheduler.run_async())
+
+        self._run_in_loop(start())
+
+    def cleanup(self) -> None:
+        """
+        Cancels all tasks, closes all sockets and stops the event loop.
+
+        Pending sends are discarded (no linger), so this returns without waiting on socket timeouts.
+        """
+        if not self._loop:
+            return
+
+        async def shutdown():
+            tasks = [task for task in (self._poll_task, self._scheduler_task) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            for sock in list(self.pull_sockets.values()) + list(self.push_sockets.values()):
+                sock.close(linger=0)
+
+        self._run_in_loop(shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+        self._context.term()
+        self.push_sockets = {}
+        self.pull_sockets = {}
+        self.scheduler = DeadlineScheduler()
+        self._subscriptions = {}
+        self._poll_task = None
+        self._scheduler_task = None
+        self._context = None
+        self._loop = None
+        self._loop_thread = None
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import threading
+
 import cv2
 import numpy as np
 import torch
@@ -12,9 +14,12 @@ class CameraToWorldSpaceTransform:
     """
     Transforms 2D image coordinates to 3D world coordinates using camera parameters.
 
-    This class provides methods to convert a point in a 2D image (such as the center of a
-    bounding box) to its corresponding 3D position in world space, using depth information
+    This class provides methods to convert points in a 2D image (such as the centers of
+    bounding boxes) to their corresponding 3D positions in world space, using depth information
     and camera intrinsic/extrinsic parameters.
+
+    Points are back-projected in batches, and the inverse camera matrices are cached
+    until the camera pose or intrinsics change.
     """
 
     def __init__(self, dimmentions: tuple):
@@ -28,11 +33,21 @@ class CameraToWorldSpaceTransform:
         self.detection_world_pos = [0, 0, 0]
         self.detection_camera_pos = [0, 0]
         self.depth_scale_factor = 1
-        self._gpu_preallocate()
+
+        # Cached camera matrices and their inverses (CPU)
+        self._view_matrix_ros = None
+        self._intrinsics_matrix = None
+        self.inverse_view_matrix = None
+        self.inverse_intrinsics = None
+
+        # GPU buffers are allocated on first use of the cuda device
+        self._depth_data_gpu = None
+        self.inverse_view_matrix_gpu = None
+        self.inverse_intrinsics_gpu = None
 
     def get_bbox_center_in_world_coords(
         self,
-        bbox_data: dict,
+        bboxes: np.ndarray,
         depth_data: bytes,
         camera_data: dict,
         device: str = "cuda",
@@ -40,166 +55,356 @@ class CameraToWorldSpaceTransform:
         """
         Compute the 3D world coordinates of the center of a bounding box.
 
+        The result is stored in `detection_world_pos` (and `detection_camera_pos` in screen space).
+
         Args:
-            bbox_data (dict): Bounding box data containing coordinates
+            bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE), the first one is used
             depth_data (bytes): Raw depth image data
             camera_data (dict): Camera parameters including view and intrinsic matrices
             device (str): Computation device ('cuda' or 'cpu')
         """
-        # Extract bounding box center coordinates (screen space)
-        bbox = bbox_data["data"]
-        if bbox:
-            u = int((bbox["xMin"] + bbox["xMax"]) / 2)
-            v = int((bbox["yMin"] + bbox["yMax"]) / 2)
-        else:
+        if not len(bboxes):
             self.detection_world_pos = [0, 0, 0]
             return
 
-        self.detection_camera_pos = [u, v]
-        point = [u, v]
+        self.detection_camera_pos = bbox_centers(bboxes[:1])[0].tolist()
+        world_points = self.get_bbox_centers_in_world_coords(bboxes[:1], depth_data, camera_data, device)
+        self.detection_world_pos = world_points[0].tolist()
+
+    def get_bbox_centers_in_world_coords(
+        self,
+        bboxes: np.ndarray,
+        depth_data: bytes,
+        camera_data: dict,
+        device: str = "cpu",
+    ) -> np.ndarray:
+        """
+        Compute the 3D world coordinates of the centers of N bounding boxes.
+
+        Args:
+            bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE)
+            depth_data (bytes): Raw depth image data
+            camera_data (dict): Camera parameters including view and intrinsic matrices
+            device (str): Computation device ('cuda' or 'cpu')
+
+        Returns:
+            np.ndarray: (N, 3) array of world positions
+        """
+        return self.get_world_points_from_image_coords(bbox_centers(bboxes), depth_data, camera_data, device)
+
+    def get_world_points_from_image_coords(
+        self,
+        points: np.ndarray,
+        depth_data: bytes,
+        camera_data: dict,
+        device: str = "cpu",
+    ) -> np.ndarray:
+        """
+        Compute the 3D world coordinates of N points in screen space.
+
+        Simplifled implementation of omni.sensor.Camera.get_world_points_from_image_coords()
+        https://docs.omniverse.nvidia.com/py/isaacsim/source/extensions/omni.isaac.sensor/docs/index.html#omni.isaac.sensor.scripts.camera.Camera.get_world_points_from_image_coords
+
+        Args:
+            points (np.ndarray): (N, 2) array of (u, v) screen space coordinates
+            depth_data (bytes): Raw depth image data (or a float32 numpy array)
+            camera_data (dict): Camera parameters including view and intrinsic matrices
+            device (str): Computation device ('cuda' or 'cpu')
+
+        Returns:
+            np.ndarray: (N, 3) array of world positions
+        """
+        # Decoded depth arrays keep their size, cropped or downscaled streams are smaller than the dimmentions
+        if isinstance(depth_data, np.ndarray) and depth_data.ndim >= 2:
+            height, width = depth_data.shape[:2]
+        else:
+            width, height = self.dimmention_x, self.dimmention_y
+
+        # Keep the points within the image bounds
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        u = np.clip(points[:, 0], 0, width - 1)
+        v = np.clip(points[:, 1], 0, height - 1)
 
         # Convert depth data to numpy array - reshape to height x width
-        depth_array = np.frombuffer(depth_data, dtype=np.float32).reshape(self.dimmention_y, self.dimmention_x)
+        depth_array = np.frombuffer(depth_data, dtype=np.float32).reshape(height, width)
         self.depth_scale_factor = 1 / camera_data["camera_scale"][0]
 
-        # Simplifled implementation of
-        # omni.sensor.Camera.get_world_points_from_image_coords()
-        # https://docs.omniverse.nvidia.com/py/isaacsim/source/extensions/omni.isaac.sensor/docs/index.html#omni.isaac.sensor.scripts.camera.Camera.get_world_points_from_image_coords
+        self._update_camera_matrices(camera_data["view_matrix_ros"], camera_data["intrinsics_matrix"])
+
         if device == "cuda":
-            view_matrix_ros = np.array(camera_data["view_matrix_ros"])
-            intrinsics_matrix = np.array(camera_data["intrinsics_matrix"])
-            self._update_camera_matrices(view_matrix_ros, intrinsics_matrix)
-            self._get_bbox_center_in_world_coords_gpu(depth_array, point)
-        else:
-            self._get_bbox_center_in_world_coords_cpu(depth_array, camera_data, point)
+            return self._get_world_points_gpu(depth_array, u, v)
+        return self._get_world_points_cpu(depth_array, u, v)
 
-    def _gpu_preallocate(self) -> None:
+    def _update_camera_matrices(self, view_matrix_ros, intrinsics_matrix) -> None:
         """
-        Pre-allocate GPU memory for computation.
+        Update the cached inverse camera matrices if the camera pose or intrinsics changed.
 
-        This method initializes tensors on the GPU to avoid repeated memory allocations
-        during processing.
+        Args:
+            view_matrix_ros: Camera extrinsic matrix (view matrix in ROS convention), 4x4
+            intrinsics_matrix: Camera intrinsic matrix, 3x3
         """
-        # Pre-allocate memory on GPU for depth data - height x width
-        self._depth_data_gpu = torch.zeros((self.dimmention_y, self.dimmention_x), device="cuda", dtype=torch.float32)
-        # Prepare placeholders for matrices on GPU
-        self.view_matrix_ros_gpu = None
-        self.intrinsics_matrix_gpu = None
-        self.inverse_intrinsics_gpu = None
+        view_matrix_ros = np.asarray(view_matrix_ros, dtype=np.float64).reshape(4, 4)
+        intrinsics_matrix = np.asarray(intrinsics_matrix, dtype=np.float64).reshape(3, 3)
+
+        if self._view_matrix_ros is None or not np.array_equal(view_matrix_ros, self._view_matrix_ros):
+            self._view_matrix_ros = view_matrix_ros.copy()
+            self.inverse_view_matrix = np.linalg.inv(view_matrix_ros)
+            self.inverse_view_matrix_gpu = None
+
+        if self._intrinsics_matrix is None or not np.array_equal(intrinsics_matrix, self._intrinsics_matrix):
+            self._intrinsics_matrix = intrinsics_matrix.copy()
+            try:
+                self.inverse_intrinsics = np.linalg.inv(intrinsics_matrix)
+            except np.linalg.LinAlgError as e:
+                print(f"[isaac-zmq-server] Error computing inverse intrinsics matrix: {e}")
+                self.inverse_intrinsics = np.zeros((3, 3))
+            self.inverse_intrinsics_gpu = None
 
-    def _update_camera_matrices(self, view_matrix_ros, intrinsics_matrix) -> None:
+    def _get_world_points_cpu(self, depth_array: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
         """
-        Update camera matrices on the GPU.
+        Calculate the 3D positions of points in world coordinates based on screen space and depth.
+        (CPU implementation).
 
         Args:
-            view_matrix_ros: Camera extrinsic matrix (view matrix in ROS convention)
-            intrinsics_matrix: Camera intrinsic matrix
+            depth_array: Depth image as numpy array
+            u: (N,) horizontal screen space coordinates
+            v: (N,) vertical screen space coordinates
+
+        Returns:
+            np.ndarray: (N, 3) array of world positions
         """
-        # Update view matrix on GPU
-        if self.view_matrix_ros_gpu is None:
-            self.view_matrix_ros_gpu = torch.tensor(view_matrix_ros, device="cuda", dtype=torch.float32)
-        else:
-            self.view_matrix_ros_gpu.copy_(torch.tensor(view_matrix_ros, device="cuda", dtype=torch.float32))
+        # Note: depth array is in (height, width) format, so access as [v, u]
+        depth_values = depth_array[v, u] * self.depth_scale_factor
 
-        # Update intrinsics matrix on GPU and calculate its inverse
-        if self.intrinsics_matrix_gpu is None:
-            self.intrinsics_matrix_gpu = torch.tensor(intrinsics_matrix, device="cuda", dtype=torch.float32)
-        else:
-            self.intrinsics_matrix_gpu.copy_(torch.tensor(intrinsics_matrix, device="cuda", dtype=torch.float32))
+        # Create homogeneous points (u, v, 1.0), one per row
+        homogenous_points = np.empty((len(u), 3))
+        homogenous_points[:, 0] = u
+        homogenous_points[:, 1] = v
+        homogenous_points[:, 2] = 1.0
 
-        # Compute the inverse of the intrinsics matrix on GPU
-        try:
-            self.inverse_intrinsics_gpu = torch.inverse(self.intrinsics_matrix_gpu)
-        except RuntimeError as e:
-            print(f"[isaac-zmq-server] Error computing inverse intrinsics matrix: {e}")
-            self.inverse_intrinsics_gpu = None
+        # Calculate the points camera coordinates by multiplying the homogeneous points by the inverse intrinsics matrix and the depth values
+        points_camera_coords = (homogenous_points @ self.inverse_intrinsics.T) * depth_values[:, None]
 
-    def _get_bbox_center_in_world_coords_gpu(self, depth_array: np.ndarray, point: tuple) -> None:
+        # Calculate the points world coordinates by applying the inverse view matrix (rotation + translation)
+        inverse_view_matrix = self.inverse_view_matrix
+        return points_camera_coords @ inverse_view_matrix[:3, :3].T + inverse_view_matrix[:3, 3]
+
+    def _get_world_points_gpu(self, depth_array: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
         """
-        Calculate the 3D position of a bounding box in the world coordinates based on screen space and depth.
+        Calculate the 3D positions of points in world coordinates based on screen space and depth.
         (GPU implementation).
 
         Args:
             depth_array: Depth image as numpy array
-            point: 2D point coordinates (u, v) in the image
+            u: (N,) horizontal screen space coordinates
+            v: (N,) vertical screen space coordinates
+
+        Returns:
+            np.ndarray: (N, 3) array of world positions
         """
-        # Copy depth data to device
-        self._depth_data_gpu.copy_(torch.tensor(depth_array, device="cuda", dtype=torch.float32))
+        # Pre-allocate memory on GPU for depth data - height x width
+        if self._depth_data_gpu is None or tuple(self._depth_data_gpu.shape) != depth_array.shape:
+            self._depth_data_gpu = torch.zeros(depth_array.shape, device="cuda", dtype=torch.float32)
+
+        # Upload the inverse matrices only when they changed
+        if self.inverse_view_matrix_gpu is None:
+            self.inverse_view_matrix_gpu = torch.tensor(self.inverse_view_matrix, device="cuda", dtype=torch.float32)
+        if self.inverse_intrinsics_gpu is None:
+            self.inverse_intrinsics_gpu = torch.tensor(self.inverse_intrinsics, device="cuda", dtype=torch.float32)
 
-        # Get depth value at the specified point
-        u, v = point
         # Copy the depth array to the GPU
-        depth_array = np.copy(depth_array)
-        self._depth_data_gpu.copy_(torch.from_numpy(depth_array).cuda())
+        self._depth_data_gpu.copy_(torch.from_numpy(np.ascontiguousarray(depth_array)))
 
-        # Get the depth value at the specified point (u, v)
+        # Get the depth values at the specified points
         # Note: depth array is in (height, width) format, so access as [v, u]
-        depth_value = self._depth_data_gpu[v, u] * self.depth_scale_factor
+        u_gpu = torch.from_numpy(u).cuda()
+        v_gpu = torch.from_numpy(v).cuda()
+        depth_values = self._depth_data_gpu[v_gpu, u_gpu] * self.depth_scale_factor
 
-        # Create a homogeneous point (u, v, 1.0) as a tensor on the GPU
-        homogenous_point = torch.tensor([u, v, 1.0], device="cuda", dtype=torch.float32)
+        # Create homogeneous points (u, v, 1.0) as a tensor on the GPU
+        homogenous_points = torch.stack([u_gpu.float(), v_gpu.float(), torch.ones_like(depth_values)], dim=1)
 
-        # Calculate the point's camera coordinates by multiplying the homogeneous point by the inverse intrinsics matrix and the depth value
-        point_camera_coords = torch.mv(self.inverse_intrinsics_gpu, homogenous_point * depth_value)
+        # Calculate the points camera coordinates by multiplying the homogeneous points by the inverse intrinsics matrix and the depth values
+        points_camera_coords = (homogenous_points @ self.inverse_intrinsics_gpu.T) * depth_values[:, None]
 
-        # Add a 1.0 to the point's camera coordinates to make it homogeneous
-        point_camera_coords_homogenous = torch.cat(
-            [
-                point_camera_coords,
-                torch.tensor([1.0], device="cuda", dtype=torch.float32),
-            ]
-        )
+        # Calculate the points world coordinates by applying the inverse view matrix (rotation + translation)
+        inverse_view_matrix = self.inverse_view_matrix_gpu
+        points_world_coords = points_camera_coords @ inverse_view_matrix[:3, :3].T + inverse_view_matrix[:3, 3]
+
+        return points_world_coords.cpu().numpy()
 
-        # Invert the view matrix on the GPU
-        inverse_view_matrix_gpu = torch.inverse(self.view_matrix_ros_gpu)
 
-        # Calculate the point's world coordinates by multiplying the homogeneous point by the inverse view matrix
-        point_world_coords_homogenous = torch.mv(inverse_view_matrix_gpu, point_camera_coords_homogenous)
+class DepthToPointCloud:
+    """
+    Converts a full depth image to a world space point cloud.
 
-        self.detection_world_pos = point_world_coords_homogenous[:3].cpu().numpy().tolist()
+    Per-pixel ray directions (inverse intrinsics applied to each sampled pixel) only depend on
+    the intrinsics, resolution and sampling, so they are cached and only recomputed when the
+    focal length changes. Each frame then costs a scale of the rays by depth plus the camera
+    transform, written into preallocated buffers.
 
-    def _get_bbox_center_in_world_coords_cpu(self, depth_array: np.ndarray, camera_data: dict, point: tuple) -> None:
+    The returned array is reused on the next call, copy it if it must outlive the frame.
+    Pixels with invalid (infinite) depth produce non finite points, filter them with
+    np.isfinite(points[:, 2]) if needed.
+    """
+
+    def __init__(self, dimmentions: tuple, stride: int = 1, roi: tuple = None):
         """
-        Calculate the 3D position of a bounding box in the world coordinates based on screen space and depth.
-        (CPU implementation).
+        Initializes the class with the given dimensions and sampling.
 
         Args:
-            depth_array: Depth image as numpy array
-            camera_data: Camera parameters including view and intrinsic matrices
-            point: 2D point coordinates (u, v) in the image
+            dimmentions (tuple): Image dimensions (width, height)
+            stride (int): Sample every stride-th pixel along both axes
+            roi (tuple): Region of interest (x, y, width, height) in pixels, None for the full image
         """
+        self.dimmention_x, self.dimmention_y = dimmentions
+        self.set_sampling(stride, roi)
 
-        u, v = point
-        # Note: depth array is in (height, width) format, so access as [v, u]
-        depth_value = (depth_array[v, u]) * self.depth_scale_factor
+    def set_sampling(self, stride: int = 1, roi: tuple = None) -> None:
+        """
+        Change the pixel sampling, the cached rays and buffers are rebuilt on the next frame.
 
-        view_matrix_ros = np.array(camera_data["view_matrix_ros"])
-        intrinsics_matrix = np.array(camera_data["intrinsics_matrix"])
+        Args:
+            stride (int): Sample every stride-th pixel along both axes
+            roi (tuple): Region of interest (x, y, width, height) in pixels, None for the full image
+        """
+        if stride < 1:
+            raise ValueError(f"Stride must be a positive integer, got {stride}")
+
+        x, y, width, height = roi if roi is not None else (0, 0, self.dimmention_x, self.dimmention_y)
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + width), self.dimmention_x), min(int(y + height), self.dimmention_y)
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError(f"ROI {roi} is outside of the image ({self.dimmention_x}x{self.dimmention_y})")
+
+        self.stride = int(stride)
+        self.roi = (x0, y0, x1 - x0, y1 - y0)
+        self._rows = slice(y0, y1, self.stride)
+        self._cols = slice(x0, x1, self.stride)
+        self.shape = (len(range(y0, y1, self.stride)), len(range(x0, x1, self.stride)))
+
+        # Cached rays and per frame buffers
+        self._intrinsics_matrix = None
+        self._inverse_view_rotation = None
+        self._rays = None
+        self._world_rays = None
+        self._depth = np.empty(self.shape, dtype=np.float32)
+        self._scaled = np.empty(self.shape[0] * self.shape[1], dtype=np.float32)
+        self._points = np.empty((self.shape[0] * self.shape[1], 3), dtype=np.float32)
+
+    def compute(self, depth_data, camera_data: dict) -> np.ndarray:
+        """
+        Compute the world space point cloud of a depth image.
 
-        # Create a homogeneous point (u, v, 1.0) as a numpy array
-        homogenous_point = np.array([u, v, 1.0])
+        Args:
+            depth_data: Raw depth image data (bytes, memoryview or float32 numpy array)
+            camera_data (dict): Camera parameters including view and intrinsic matrices (see proto_util.decode_camera)
 
-        # Invert the intrinsics matrix
-        inverse_intrinsics = np.linalg.inv(intrinsics_matrix)
+        Returns:
+            np.ndarray: (N, 3) float32 array of world positions, in row major order of the sampled pixels
+        """
+        depth_array = np.frombuffer(depth_data, dtype=np.float32).reshape(self.dimmention_y, self.dimmention_x)
 
-        # Calculate the point's camera coordinates by multiplying the homogeneous point by the inverse intrinsics matrix and the depth value
-        point_camera_coords = inverse_intrinsics @ (homogenous_point * depth_value)
+        self._update_rays(camera_data["intrinsics_matrix"])
+
+        inverse_view_matrix = np.linalg.inv(np.asarray(camera_data["view_matrix_ros"], dtype=np.float64).reshape(4, 4))
+        inverse_view_rotation = inverse_view_matrix[:3, :3]
+        if self._inverse_view_rotation is None or not np.array_equal(inverse_view_rotation, self._inverse_view_rotation):
+            # The rays are rotated once per camera pose, so a static camera only pays for the scale below
+            self._inverse_view_rotation = inverse_view_rotation.copy()
+            # Stored planar (3, N) so each axis below is a contiguous vector operation
+            self._world_rays = np.ascontiguousarray(inverse_view_rotation.astype(np.float32) @ self._rays)
+
+        # Sample and scale the depth into the preallocated buffer
+        depth_scale_factor = 1 / camera_data["camera_scale"][0]
+        np.multiply(depth_array[self._rows, self._cols], depth_scale_factor, out=self._depth)
+
+        # points = R^-1 (K^-1 [u, v, 1] * depth) + t = (R^-1 K^-1 [u, v, 1]) * depth + t
+        depth = self._depth.reshape(-1)
+        translation = inverse_view_matrix[:3, 3].astype(np.float32)
+        for axis in range(3):
+            np.multiply(self._world_rays[axis], depth, out=self._scaled)
+            np.add(self._scaled, translation[axis], out=self._points[:, axis])
+        return self._points
+
+    def _update_rays(self, intrinsics_matrix) -> None:
+        """
+        Recompute the per-pixel camera space rays if the intrinsics changed.
 
-        # Add a 1.0 to the point's camera coordinates to make it homogeneous
-        point_camera_coords_homogenous = np.append(point_camera_coords, 1.0)
+        Args:
+            intrinsics_matrix: Camera intrinsic matrix, 3x3
+        """
+        intrinsics_matrix = np.asarray(intrinsics_matrix, dtype=np.float64).reshape(3, 3)
+        if self._intrinsics_matrix is not None and np.array_equal(intrinsics_matrix, self._intrinsics_matrix):
+            return
 
-        # Invert the view matrix
-        inverse_view_matrix = np.linalg.inv(view_matrix_ros)
+        try:
+            inverse_intrinsics = np.linalg.inv(intrinsics_matrix)
+        except np.linalg.LinAlgError as e:
+            print(f"[isaac-zmq-server] Error computing inverse intrinsics matrix: {e}")
+            inverse_intrinsics = np.zeros((3, 3))
 
-        # Calculate the point's world coordinates by multiplying the homogeneous point by the inverse view matrix
-        point_world_coords_homogenous = inverse_view_matrix @ point_camera_coords_homogenous
+        # Homogeneous (u, v, 1.0) of the sampled pixels, one per column in row major order
+        u, v = np.meshgrid(
+            np.arange(self.dimmention_x)[self._cols],
+            np.arange(self.dimmention_y)[self._rows],
+        )
+        homogenous_points = np.stack([u.ravel(), v.ravel(), np.ones(u.size)])
+
+        self._intrinsics_matrix = intrinsics_matrix.copy()
+        self._rays = (inverse_intrinsics @ homogenous_points).astype(np.float32)
+        self._inverse_view_rotation = None
 
-        point_world_coords = point_world_coords_homogenous[:3].tolist()
 
-        self.detection_world_pos = point_world_coords
+def bbox_centers(bboxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the center of each bounding box.
 
+    Args:
+        bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE)
 
-def draw_bounding_boxes(img_array: np.ndarray, bbox_data: dict) -> np.ndarray:
+    Returns:
+        np.ndarray: (N, 2) int array of (u, v) centers in screen space
+    """
+    centers = np.empty((len(bboxes), 2), dtype=np.int32)
+    centers[:, 0] = (bboxes["xMin"] + bboxes["xMax"]) // 2
+    centers[:, 1] = (bboxes["yMin"] + bboxes["yMax"]) // 2
+    return centers
+
+
+def filter_bboxes(
+    bboxes: np.ndarray,
+    id_to_labels: dict,
+    labels: list = None,
+    max_occlusion: float = None,
+) -> np.ndarray:
+    """
+    Select bounding boxes by label and occlusion.
+
+    Args:
+        bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE)
+        id_to_labels (dict): Mapping of semantic id to label
+        labels (list): Labels to keep, None keeps all labels
+        max_occlusion (float): Maximum occlusion ratio to keep, None keeps all boxes
+
+    Returns:
+        np.ndarray: The selected bounding boxes
+    """
+    mask = np.ones(len(bboxes), dtype=bool)
+    if labels is not None:
+        ids = [semantic_id for semantic_id, label in id_to_labels.items() if label in labels]
+        mask &= np.isin(bboxes["semanticId"], ids)
+    if max_occlusion is not None:
+        mask &= bboxes["occlusionRatio"] <= max_occlusion
+    return bboxes[mask]
+
+
+def draw_bounding_boxes(
+    img_array: np.ndarray,
+    bboxes: np.ndarray,
+    id_to_labels: dict,
+    out: np.ndarray = None,
+) -> np.ndarray:
     """
     Draw bounding boxes on an image.
 
@@ -208,35 +413,42 @@ def draw_bounding_boxes(img_array: np.ndarray, bbox_data: dict) -> np.ndarray:
 
     Args:
         img_array (np.ndarray): RGB or RGBA image as numpy array
-        bbox_data (dict): Dictionary containing bounding box data
+        bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE)
+        id_to_labels (dict): Mapping of semantic id to label
+        out (np.ndarray): Reused image buffer (same shape and dtype) to draw into, img_array itself to draw
+            in place. A new copy of the image is drawn on if None
 
     Returns:
         np.ndarray: Image with bounding boxes drawn
     """
-    img_with_boxes = img_array.copy()
-    bboxes = bbox_data["data"]
-    id_to_labels = bbox_data["info"]["idToLabels"]
+    if out is None:
+        img_with_boxes = img_array.copy()
+    else:
+        img_with_boxes = out
+        if out is not img_array:
+            np.copyto(out, img_array)
     color = (118, 185, 0)  # Green color for bounding boxes
     font = cv2.FONT_HERSHEY_SIMPLEX
 
     # Get image dimensions
     height, width = img_with_boxes.shape[:2]
 
-    for bbox in bboxes:
-        semantic_id = bbox["semanticId"]
-        x_min, y_min = bbox["xMin"], bbox["yMin"]
-        x_max, y_max = bbox["xMax"], bbox["yMax"]
-
-        # Calculate center point
-        u = int((bbox["xMin"] + bbox["xMax"]) / 2)
-        v = int((bbox["yMin"] + bbox["yMax"]) / 2)
-
+    # Calculate center points, within image bounds
+    centers = bbox_centers(bboxes)
+    np.clip(centers[:, 0], 0, width - 1, out=centers[:, 0])
+    np.clip(centers[:, 1], 0, height - 1, out=centers[:, 1])
+
+    rows = zip(
+        bboxes["semanticId"].tolist(),
+        bboxes["xMin"].tolist(),
+        bboxes["yMin"].tolist(),
+        bboxes["xMax"].tolist(),
+        bboxes["yMax"].tolist(),
+        centers.tolist(),
+    )
+    for semantic_id, x_min, y_min, x_max, y_max, (u, v) in rows:
         # Get the label of this bbox
-        label = id_to_labels.get(str(semantic_id), "Unknown")
-
-        # Ensure coordinates are within image bounds
-        u = max(0, min(u, width-1))
-        v = max(0, min(v, height-1))
+        label = id_to_labels.get(semantic_id, "Unknown")
 
         # Draw center point, bounding box, and label
         cv2.circle(img_with_boxes, (u, v), 10, color, 2)
@@ -249,47 +461,124 @@ def draw_bounding_boxes(img_array: np.ndarray, bbox_data: dict) -> np.ndarray:
     return img_with_boxes
 
 
-def colorize_depth(depth_data: np.ndarray) -> np.ndarray:
+class DepthColorizer:
     """
-    Convert a depth image to a colorized representation.
-
-    This function takes a raw depth image and converts it to a visually
-    interpretable grayscale image by applying logarithmic scaling.
+    Colorizes depth images with a precomputed lookup table over quantized depth.
 
-    Args:
-        depth_data (np.ndarray): Raw depth image data in shape (height, width, 1)
+    Depth is clipped to [near, far] and quantized linearly into `levels` bins. Each bin maps to
+    a packed RGBA color, with the same logarithmic scaling as the original colorize_depth
+    (closer is brighter), optionally through an OpenCV colormap. A frame costs a clip, a scale,
+    an integer cast and a single gather of 32 bit pixels. All intermediate buffers are
+    preallocated and reused.
 
-    Returns:
-        np.ndarray: Colorized depth image as uint8 with shape (height, width, 4)
+    Not thread-safe: the buffers are shared by the calls, use one colorizer per camera or thread.
     """
-    # https://docs.omniverse.nvidia.com/extensions/latest/ext_replicator/programmatic_visualization.html#helper-visualization-functions
-    # Set near and far clipping planes
-    near = 1.0
-    far = 100.0
 
-    # Extract the depth values from the 3D array
-    depth_values = depth_data.squeeze()
+    def __init__(self, near: float = 1.0, far: float = 100.0, colormap: int = None, levels: int = 16384):
+        """
+        Args:
+            near (float): Near clipping distance, mapped to the brightest color
+            far (float): Far clipping distance, mapped to the darkest color
+            colormap (int): OpenCV colormap (e.g. cv2.COLORMAP_JET), grayscale if None
+            levels (int): Number of depth quantization bins (at most 65536)
+        """
+        self.levels = min(max(levels, 2), 65536)
+        self._shape = None
+        self._clipped = None
+        self._indices = None
+        self._rgba = None
+        self.set_range(near, far, colormap)
+
+    def set_range(self, near: float, far: float, colormap: int = None) -> None:
+        """
+        Change the depth range and colormap, rebuilding the lookup table.
+
+        Args:
+            near (float): Near clipping distance, mapped to the brightest color
+            far (float): Far clipping distance, mapped to the darkest color
+            colormap (int): OpenCV colormap (e.g. cv2.COLORMAP_JET), grayscale if None
+        """
+        if not 0 < near < far:
+            raise ValueError(f"DepthColorizer needs 0 < near < far, got near={near} far={far}")
+        self.near = near
+        self.far = far
+        self.colormap = colormap
+        self._scale = np.float32((self.levels - 1) / (far - near))
+
+        # Logarithmic scaling of the bin depths, inverted so closer objects are brighter
+        depths = np.linspace(near, far, self.levels)
+        values = 1.0 - (np.log(depths) - np.log(near)) / (np.log(far) - np.log(near))
+        gray = (values * 255).astype(np.uint8)
+
+        lut = np.empty((self.levels, 4), dtype=np.uint8)
+        if colormap is None:
+            lut[:, :3] = gray[:, None]
+        else:
+            colors = cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), colormap).reshape(256, 3)
+            lut[:, :3] = colors[gray][:, ::-1]  # BGR -> RGB
+        lut[:, 3] = 255
+        self._lut = lut.view(np.uint32).reshape(self.levels)
+
+    def colorize(self, depth_data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert a depth image to a colorized RGBA image.
 
-    # Clip depth values to the specified range
-    depth_values = np.clip(depth_values, near, far)
+        Args:
+            depth_data (np.ndarray): Depth image (height, width) or (height, width, 1) float32
+            out (np.ndarray): Contiguous (height, width, 4) uint8 buffer to write into. If None, a buffer owned
+                by the colorizer is returned, reused on the next call
 
-    # Apply logarithmic scaling to better visualize depth
-    depth_values = (np.log(depth_values) - np.log(near)) / (np.log(far) - np.log(near))
+        Returns:
+            np.ndarray: Colorized depth image as uint8 with shape (height, width, 4)
+        """
+        depth_values = depth_data.reshape(depth_data.shape[:2])
+        self._allocate(depth_values.shape)
+        if out is None:
+            out = self._rgba
+
+        # Quantize: clip to [near, far], fmin maps invalid (NaN) depth to far
+        np.fmin(depth_values, np.float32(self.far), out=self._clipped)
+        np.maximum(self._clipped, np.float32(self.near), out=self._clipped)
+        np.subtract(self._clipped, np.float32(self.near), out=self._clipped)
+        np.multiply(self._clipped, self._scale, out=self._clipped)
+        np.copyto(self._indices, self._clipped, casting="unsafe")
+
+        np.take(self._lut, self._indices, out=out.view(np.uint32).reshape(self._shape), mode="clip")
+        return out
+
+    def _allocate(self, shape: tuple) -> None:
+        """Allocate the intermediate buffers for the image shape, if it changed."""
+        if shape == self._shape:
+            return
+        self._shape = shape
+        self._clipped = np.empty(shape, dtype=np.float32)
+        self._indices = np.empty(shape, dtype=np.uint16)
+        self._rgba = np.empty(shape + (4,), dtype=np.uint8)
 
-    # Invert so closer objects are brighter
-    depth_values = 1.0 - depth_values
 
-    # Convert to 8-bit for display
-    depth_data_uint8 = (depth_values * 255).astype(np.uint8)
+# Colorizers of colorize_depth(), one per thread as their buffers cannot be shared
+_default_depth_colorizers = threading.local()
 
-    # Create an RGBA image (height, width, 4)
-    height, width = depth_values.shape
-    rgba_image = np.zeros((height, width, 4), dtype=np.uint8)
 
-    # # Set RGB channels to the grayscale value
-    rgba_image[:, :, 0] = depth_data_uint8
-    rgba_image[:, :, 1] = depth_data_uint8
-    rgba_image[:, :, 2] = depth_data_uint8
-    rgba_image[:, :, 3] = 255  # Full opacity
+def colorize_depth(depth_data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Convert a depth image to a colorized representation.
 
-    return rgba_image
\ No newline at end of file
+    This function takes a raw depth image and converts it to a visually
+    interpretable grayscale image by applying logarithmic scaling
+    (1 m - 100 m, see DepthColorizer to configure the range and colormap).
+    Thread-safe, each calling thread uses a colorizer of its own.
+
+    Args:
+        depth_data (np.ndarray): Raw depth image data in shape (height, width, 1)
+        out (np.ndarray): Contiguous (height, width, 4) uint8 buffer to write into, a new image if None
+
+    Returns:
+        np.ndarray: Colorized depth image as uint8 with shape (height, width, 4)
+    """
+    colorizer = getattr(_default_depth_colorizers, "colorizer", None)
+    if colorizer is None:
+        colorizer = _default_depth_colorizers.colorizer = DepthColorizer()
+    if out is None:
+        out = np.empty(depth_data.shape[:2] + (4,), dtype=np.uint8)
+    return colorizer.colorize(depth_data, out=out)
@@ -0,0 +1,614 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Pure Python stand-in for the Isaac Sim side of the Franka missions (example_missions.py),
+to exercise the bridge protocol and load test the server without Isaac Sim.
+
+It speaks the same ports and messages as FrankaVisionMission / FrankaMultiVisionMission:
+- streams ClientStreamMessages from the main camera (5561) and optionally the gripper camera (5591),
+  or from any number of cameras multiplexed on 5561 (see ZMQServer.subscribe_to_multiplexed_socket_in_loop),
+  or published on 5561 with a topic per camera (see proxy.StreamProxy)
+- applies the camera_control (5557), settings (5559) and franka (5560) ServerControlMessages
+
+The scene is a trivial kinematic model: a camera on a slide / pan / tilt mount driven by joint
+velocities, an end effector moving towards the commanded position at a limited speed, and a target
+cube on a ground plane, moved to a random position every 8 seconds of simulation time (like the mission).
+Depth is the distance to the image plane, consistent with cv.CameraToWorldSpaceTransform.
+
+    python -m isaac_zmq_server.fake_sim                      # main camera, 60 Hz
+    python -m isaac_zmq_server.fake_sim --cameras 2 --rate 0  # both cameras, as fast as possible
+    python -m isaac_zmq_server.fake_sim --cameras 8 --multiplexed  # 8 cameras on one connection
+    python -m isaac_zmq_server.fake_sim --cameras 2 --publish      # PUB/SUB mode, through a StreamProxy
+    python -m isaac_zmq_server.fake_sim --keyframe_interval 30     # labels and camera metadata sent on change
+    python -m isaac_zmq_server.fake_sim --crop 180 180 360 360 --downscale 2 --rgb --depth_mm  # smaller images
+"""
+
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+import zmq
+
+import client_stream_message_pb2
+import server_control_message_pb2
+
+from .image_codecs import IMAGE_CODEC_RAW, encode_image
+from .image_output import PIXEL_FORMAT_DEFAULT, PIXEL_FORMAT_DEPTH_UINT16_MM, PIXEL_FORMAT_RGB8, ImageOutput
+from .proto_util import BBOX2D_DTYPE, has_annotator, topic_prefix
+from .session import SessionEncoder
+
+HORIZONTAL_APERTURE = 20.955  # mm, Isaac Sim default camera
+TARGET_BOUNDS = (np.array([0.2, -0.2, 0.1]), np.array([0.6, 0.2, 0.5]))  # FrankaVisionMission.franka_sub_loop
+TARGET_PERIOD = 8.0  # seconds of simulation time between target moves
+ID_TO_LABELS = {"0": "class:object"}  # BBox2DInfo.idToLabels of the scene
+
+
+class KinematicScene:
+    """
+    State of the fake scene, advanced with step().
+
+    Camera mount joints (CameraControlCommand.joints_vel): x slides along the world y axis (m),
+    y pans around the world z axis (rad), z tilts the camera (rad).
+    """
+
+    def __init__(self, seed: int = 1234, effector_speed: float = 0.5):
+        """
+        Args:
+            seed (int): Seed of the target randomization
+            effector_speed (float): Maximum end effector speed (m/s)
+        """
+        self.rng = np.random.default_rng(seed)
+        self.effector_speed = effector_speed
+
+        self.sim_time = 0.0
+        self.camera_origin = np.array([1.6, 0.0, 0.9])
+        self.camera_yaw = math.pi  # looking at the robot, down the -x axis
+        self.camera_pitch = -0.35
+        self.mount_joints = np.zeros(3)
+        self.mount_joints_vel = np.zeros(3)
+        self.focal_length = 20.0
+
+        self.target_pos = np.array([0.4, 0.0, 0.3])
+        self.target_half_size = 0.05
+        self.effector_pos = np.array([0.3, 0.0, 0.6])
+        self.effector_command = self.effector_pos.copy()
+        self.show_marker = False
+        self._last_target_move = 0.0
+
+    def step(self, dt: float) -> None:
+        """
+        Advance the scene by dt seconds of simulation time.
+
+        Args:
+            dt (float): Simulation time step
+        """
+        self.sim_time += dt
+        self.mount_joints += self.mount_joints_vel * dt
+        self.mount_joints[2] = np.clip(self.mount_joints[2], -1.2, 1.2)
+
+        # Move the end effector towards its command, at limited speed
+        delta = self.effector_command - self.effector_pos
+        distance = np.linalg.norm(delta)
+        max_step = self.effector_speed * dt
+        if distance <= max_step:
+            self.effector_pos = self.effector_command.copy()
+        else:
+            self.effector_pos = self.effector_pos + delta * (max_step / distance)
+
+        if self.sim_time - self._last_target_move > TARGET_PERIOD:
+            self.target_pos = self.rng.uniform(*TARGET_BOUNDS)
+            self._last_target_move = self.sim_time
+
+    def camera_pose(self, mount: str) -> tuple:
+        """
+        Returns:
+            tuple: (position (3,), rotation (3, 3)) of the camera in the world, the rotation columns are
+                the camera right, down and forward axes (ROS optical convention)
+        """
+        if mount == "gripper":
+            # Looking straight down from the end effector
+            right = np.array([0.0, -1.0, 0.0])
+            forward = np.array([0.0, 0.0, -1.0])
+            position = self.effector_pos + np.array([0.0, 0.0, 0.05])
+        else:
+            yaw = self.camera_yaw - self.mount_joints[1]
+            pitch = self.camera_pitch + self.mount_joints[2]
+            forward = np.array([math.cos(pitch) * math.cos(yaw), math.cos(pitch) * math.sin(yaw), math.sin(pitch)])
+            right = np.cross(forward, [0.0, 0.0, 1.0])
+            right /= np.linalg.norm(right)
+            position = self.camera_origin + np.array([0.0, self.mount_joints[0], 0.0])
+        down = np.cross(forward, right)
+        return position, np.stack([right, down, forward], axis=1)
+
+    def target_corners(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: (8, 3) world positions of the target cube corners
+        """
+        signs = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+        return self.target_pos + signs * self.target_half_size
+
+
+class FakeCamera:
+    """
+    Renders one camera of the KinematicScene: a checkered ground plane, the target cube (labeled "class:object")
+    and the end effector marker. The background is only re-rendered when the camera pose or focal length change.
+    """
+
+    def __init__(self, name: str, port: int, resolution: tuple, mount: str = "main"):
+        """
+        Args:
+            name (str): Name of the camera
+            port (int): Server port to stream to
+            resolution (tuple): Image resolution (width, height)
+            mount (str): "main" (camera mount) or "gripper" (attached to the end effector)
+        """
+        self.name = name
+        self.topic_prefix = topic_prefix(name)
+        self.port = port
+        self.width, self.height = resolution
+        self.mount = mount
+        self.frame_id = 0
+        self.sent = 0
+        self.dropped = 0
+        self.session = None  # SessionEncoder of the delta metadata mode
+        self.output = ImageOutput()  # Crop, downscale and pixel formats of the streamed images
+
+        self.color = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        self.depth = np.empty((self.height, self.width), dtype=np.float32)
+        self._background_key = None
+        self._background_color = np.empty_like(self.color)
+        self._background_depth = np.empty_like(self.depth)
+
+    def intrinsics(self, focal_length: float) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: 3x3 pinhole intrinsics matrix for the focal length (mm)
+        """
+        focal = focal_length / HORIZONTAL_APERTURE * self.width
+        return np.array([[focal, 0.0, self.width / 2], [0.0, focal, self.height / 2], [0.0, 0.0, 1.0]])
+
+    def render(self, scene: KinematicScene) -> tuple:
+        """
+        Render the scene from this camera into the color and depth buffers (reused every frame).
+
+        Args:
+            scene (KinematicScene): The scene
+
+        Returns:
+            tuple: (bboxes record array, view_matrix_ros 4x4, intrinsics 3x3)
+        """
+        position, rotation = scene.camera_pose(self.mount)
+        intrinsics = self.intrinsics(scene.focal_length if self.mount == "main" else 20.0)
+
+        key = (position.tobytes(), rotation.tobytes(), intrinsics.tobytes())
+        if key != self._background_key:
+            self._render_background(position, rotation, intrinsics)
+            self._background_key = key
+        np.copyto(self.color, self._background_color)
+        np.copyto(self.depth, self._background_depth)
+
+        view_matrix = np.eye(4)
+        view_matrix[:3, :3] = rotation.T
+        view_matrix[:3, 3] = -rotation.T @ position
+
+        bboxes = np.zeros(0, dtype=BBOX2D_DTYPE)
+        projected = self._project(scene.target_corners(), position, rotation, intrinsics)
+        if projected is not None:
+            (u_min, v_min), (u_max, v_max), depth = projected
+            if u_min < self.width and v_min < self.height and u_max >= 0 and v_max >= 0:
+                u_min, v_min = max(u_min, 0), max(v_min, 0)
+                u_max, v_max = min(u_max, self.width - 1), min(v_max, self.height - 1)
+                self.color[v_min : v_max + 1, u_min : u_max + 1] = (200, 60, 40, 255)
+                depth_region = self.depth[v_min : v_max + 1, u_min : u_max + 1]
+                np.minimum(depth_region, depth, out=depth_region)
+                bboxes = np.array([(0, u_min, v_min, u_max, v_max, 0.0)], dtype=BBOX2D_DTYPE)
+
+        if self.mount == "main":
+            projected = self._project(scene.effector_pos[None], position, rotation, intrinsics)
+            if projected is not None:
+                cv2.circle(self.color, tuple(int(c) for c in projected[0]), 6, (40, 80, 220, 255), -1)
+
+        return bboxes, view_matrix, intrinsics
+
+    def _project(self, points: np.ndarray, position: np.ndarray, rotation: np.ndarray, intrinsics: np.ndarray):
+        """
+        Project world points to the image.
+
+        Returns:
+            tuple: ((u_min, v_min), (u_max, v_max), min depth) of the points, None if any point is behind the camera
+        """
+        camera_points = (points - position) @ rotation
+        if np.any(camera_points[:, 2] <= 0.01):
+            return None
+        pixels = camera_points @ intrinsics.T
+        pixels = pixels[:, :2] / pixels[:, 2:]
+        pixel_min = np.floor(pixels.min(axis=0)).astype(int)
+        pixel_max = np.ceil(pixels.max(axis=0)).astype(int)
+        return tuple(pixel_min.tolist()), tuple(pixel_max.tolist()), float(camera_points[:, 2].min())
+
+    def _render_background(self, position: np.ndarray, rotation: np.ndarray, intrinsics: np.ndarray) -> None:
+        """Ray cast the ground plane (z = 0): checkered color, distance to the image plane, sky above the horizon."""
+        x = (np.arange(self.width) - intrinsics[0, 2]) / intrinsics[0, 0]
+        y = (np.arange(self.height) - intrinsics[1, 2]) / intrinsics[1, 1]
+
+        # World direction of the ray of each pixel, with a camera space z of 1
+        right, down, forward = rotation.T
+        direction_z = right[2] * x[None, :] + down[2] * y[:, None] + forward[2]
+        hits = direction_z < -1e-6
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depth = np.where(hits, -position[2] / direction_z, np.inf)
+            hit_x = position[0] + depth * (right[0] * x[None, :] + down[0] * y[:, None] + forward[0])
+            hit_y = position[1] + depth * (right[1] * x[None, :] + down[1] * y[:, None] + forward[1])
+            checker = (np.floor(hit_x * 4).astype(np.int64) + np.floor(hit_y * 4).astype(np.int64)) & 1
+
+        self._background_depth[:] = depth
+        gray = np.where(checker, 150, 110).astype(np.uint8)
+        self._background_color[..., 0] = np.where(hits, gray, 150)
+        self._background_color[..., 1] = np.where(hits, gray, 190)
+        self._background_color[..., 2] = np.where(hits, gray, 230)
+        self._background_color[..., 3] = 255
+
+
+class FakeSim:
+    """
+    Fake Isaac Sim client: steps the KinematicScene, streams its cameras to the server and applies
+    the server commands, on the ports of the Franka missions.
+
+    Like the client, sockets connect to the server with a high water mark of 1, and frames the server
+    is not ready for are dropped (counted per camera).
+    """
+
+    def __init__(
+        self,
+        server_ip: str = "localhost",
+        rate_hz: float = 60.0,
+        resolution: tuple = (720, 720),
+        cameras: int = 1,
+        multipart: bool = True,
+        packed_bbox: bool = True,
+        seed: int = 1234,
+        multiplexed: bool = False,
+        publish: bool = False,
+        keyframe_interval: int = 0,
+        output: ImageOutput = None,
+    ):
+        """
+        Args:
+            server_ip (str): Server address
+            rate_hz (float): Simulation and streaming rate, 0 to run as fast as possible
+            resolution (tuple): Image resolution (width, height)
+            cameras (int): 1 for the main camera (FrankaVisionMission), 2 to add the gripper camera (FrankaMultiVisionMission)
+            multipart (bool): Send the images as separate frames (True) or embedded in the message
+            packed_bbox (bool): Send the bounding boxes as BBox2D.packed_data (True) or repeated messages
+            seed (int): Seed of the target randomization
+            multiplexed (bool): Stream all cameras on the main camera port, over one socket, prefixed with
+                their camera id. Cameras after the gripper camera are extra main mount cameras.
+            publish (bool): Publish all cameras on the main camera port over one PUB socket, with their name as
+                topic (ClientStreamMessage.topic), for a StreamProxy. Extra cameras like in multiplexed mode.
+            keyframe_interval (int): Send the labels and camera metadata on change and every keyframe_interval
+                messages only (delta metadata, see session.py), 0 to send them in every message
+            output (ImageOutput): Crop, downscale and pixel formats of the streamed images, unless the server
+                requests another one (SettingsCommand.outputs)
+        """
+        if multiplexed and publish:
+            raise ValueError("The multiplexed and publish modes are exclusive")
+        self.server_ip = server_ip
+        self.rate_hz = rate_hz
+        self.multipart = multipart
+        self.packed_bbox = packed_bbox
+        self.multiplexed = multiplexed
+        self.publish = publish
+        self.scene = KinematicScene(seed)
+
+        self.ports = {
+            "camera_annotator": 5561,
+            "camera_control_command": 5557,
+            "settings": 5559,
+            "franka": 5560,
+        }
+        self.cameras = [FakeCamera("camera_annotator", self.ports["camera_annotator"], resolution, "main")]
+        shared_port = multiplexed or publish
+        if cameras > 1:
+            if not shared_port:
+                self.ports["gripper_annotator"] = 5591
+            port = self.ports["camera_annotator"] if shared_port else self.ports["gripper_annotator"]
+            self.cameras.append(FakeCamera("gripper_annotator", port, resolution, "gripper"))
+        if cameras > 2:
+            if not shared_port:
+                raise ValueError("More than 2 cameras require the multiplexed or publish mode")
+            for index in range(2, cameras):
+                self.cameras.append(FakeCamera(f"camera_{index}", self.ports["camera_annotator"], resolution, "main"))
+        if keyframe_interval > 0:
+            for camera in self.cameras:
+                camera.session = SessionEncoder(keyframe_interval)
+        self.static_output = output or ImageOutput()
+        for camera in self.cameras:
+            camera.output = self.static_output
+
+        self.adaptive_rate = True
+        self.color_codec = IMAGE_CODEC_RAW
+        self.depth_codec = IMAGE_CODEC_RAW
+        self.annotators = 0  # StreamAnnotator bitmask requested by the server, 0 for all
+        self.commands_received = {"camera_control_command": 0, "settings": 0, "franka": 0}
+        self.steps = 0
+        self._command_trace = (0, 0.0, 0.0)
+
+        self._context = None
+        self._push_sockets = {}
+        self._pull_sockets = {}
+
+    def connect(self) -> None:
+        """
+        Connect the stream and command sockets to the server.
+        """
+        self._context = zmq.Context()
+        if self.multiplexed or self.publish:
+            # One connection for all cameras, with one message in flight per camera
+            sock = self._context.socket(zmq.PUB if self.publish else zmq.PUSH)
+            sock.set_hwm(len(self.cameras))
+            sock.setsockopt(zmq.LINGER, 0)
+            sock.connect(f"tcp://{self.server_ip}:{self.ports['camera_annotator']}")
+            for camera in self.cameras:
+                self._push_sockets[camera.name] = sock
+        else:
+            for camera in self.cameras:
+                sock = self._context.socket(zmq.PUSH)
+                sock.set_hwm(1)
+                sock.setsockopt(zmq.LINGER, 0)
+                sock.connect(f"tcp://{self.server_ip}:{camera.port}")
+                self._push_sockets[camera.name] = sock
+        for name in self.commands_received:
+            sock = self._context.socket(zmq.PULL)
+            sock.set_hwm(1)
+            sock.setsockopt(zmq.LINGER, 0)
+            sock.connect(f"tcp://{self.server_ip}:{self.ports[name]}")
+            self._pull_sockets[name] = sock
+
+    def disconnect(self) -> None:
+        """
+        Close all sockets.
+        """
+        for sock in set(self._push_sockets.values()) | set(self._pull_sockets.values()):
+            sock.close()
+        self._push_sockets.clear()
+        self._pull_sockets.clear()
+        if self._context:
+            self._context.term()
+            self._context = None
+
+    def step(self, dt: float) -> None:
+        """
+        Apply the latest server commands, advance the scene and stream every camera.
+
+        Args:
+            dt (float): Simulation time step
+        """
+        self._receive_commands()
+        self.scene.step(dt)
+        for camera in self.cameras:
+            self._stream(camera, dt)
+        self.steps += 1
+
+    def run(self, duration: float = 0) -> dict:
+        """
+        Connect and step at rate_hz (absolute deadlines) until the duration elapsed or Ctrl+C.
+
+        Args:
+            duration (float): Seconds of wall time to run, 0 to run until interrupted
+
+        Returns:
+            dict: See stats()
+        """
+        self.connect()
+        dt = 1 / self.rate_hz if self.rate_hz else 1 / 60
+        start = time.monotonic()
+        deadline = start
+        try:
+            while not duration or time.monotonic() - start < duration:
+                self.step(dt)
+                if self.rate_hz:
+                    deadline += dt
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.disconnect()
+        stats = self.stats()
+        stats["duration"] = time.monotonic() - start
+        return stats
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Steps, simulation time, frames sent / dropped per camera and commands received per channel
+        """
+        return {
+            "steps": self.steps,
+            "sim_time": self.scene.sim_time,
+            "cameras": {camera.name: {"sent": camera.sent, "dropped": camera.dropped} for camera in self.cameras},
+            "commands_received": dict(self.commands_received),
+        }
+
+    def _receive_commands(self) -> None:
+        """Apply the latest message of every command channel (older queued ones are skipped, like a slow sim)."""
+        for name, sock in self._pull_sockets.items():
+            latest = None
+            while True:
+                try:
+                    latest = sock.recv(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+            if latest is None:
+                continue
+            self.commands_received[name] += 1
+            proto_msg = server_control_message_pb2.ServerControlMessage.FromString(latest)
+            getattr(self, f"_apply_{name}")(proto_msg)
+
+    def _apply_camera_control_command(self, proto_msg) -> None:
+        if proto_msg.HasField("camera_control_command"):
+            joints_vel = proto_msg.camera_control_command.joints_vel
+            self.scene.mount_joints_vel[:] = (joints_vel.x, joints_vel.y, joints_vel.z)
+            if proto_msg.camera_control_command.focal_length:
+                self.scene.focal_length = proto_msg.camera_control_command.focal_length
+
+    def _apply_settings(self, proto_msg) -> None:
+        if proto_msg.HasField("settings_command"):
+            self.adaptive_rate = proto_msg.settings_command.adaptive_rate
+            self.color_codec = proto_msg.settings_command.color_codec
+            self.depth_codec = proto_msg.settings_command.depth_codec
+            self.annotators = proto_msg.settings_command.annotators
+            for camera in self.cameras:
+                # Like ZMQAnnotator.stream_name, cameras on a port of their own are selected by port number
+                stream_name = camera.name if self.multiplexed or self.publish else str(camera.port)
+                output = ImageOutput.requested(proto_msg.settings_command.outputs, stream_name)
+                camera.output = output or self.static_output
+
+    def _apply_franka(self, proto_msg) -> None:
+        if proto_msg.HasField("franka_command"):
+            effector_pos = proto_msg.franka_command.effector_pos
+            self.scene.effector_command = np.array([effector_pos.x, effector_pos.y, effector_pos.z])
+            self.scene.show_marker = proto_msg.franka_command.show_marker
+        if proto_msg.HasField("trace"):
+            # Echo the command back in the next frames, for latency tracing
+            self._command_trace = (proto_msg.trace.command_id, proto_msg.trace.send_time, time.monotonic())
+
+    def _stream(self, camera: FakeCamera, dt: float) -> None:
+        """Render a camera and send its ClientStreamMessage, like ZMQAnnotator.stream()."""
+        render_time = time.monotonic()
+        bboxes, view_matrix, intrinsics = camera.render(self.scene)
+
+        client_stream = client_stream_message_pb2.ClientStreamMessage()
+        client_stream.annotators = self.annotators
+        resolution = (camera.width, camera.height)
+        if has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_BBOX2D):
+            bboxes = camera.output.adjust_bboxes(bboxes, resolution)
+            client_stream.bbox2d.info.bboxIds.extend(range(len(bboxes)))
+            if camera.session is None:
+                client_stream.bbox2d.info.idToLabels.update(ID_TO_LABELS)
+            else:
+                camera.session.update_labels(ID_TO_LABELS, lambda: dict(ID_TO_LABELS))
+            if self.packed_bbox:
+                client_stream.bbox2d.packed_data = bboxes.tobytes()
+            else:
+                for semantic_id, x_min, y_min, x_max, y_max, occlusion_ratio in bboxes.tolist():
+                    bbox2d_type = client_stream.bbox2d.data.add()
+                    bbox2d_type.semanticId = semantic_id
+                    bbox2d_type.xMin = x_min
+                    bbox2d_type.yMin = y_min
+                    bbox2d_type.xMax = x_max
+                    bbox2d_type.yMax = y_max
+                    bbox2d_type.occlusionRatio = occlusion_ratio
+
+        send_camera = has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_CAMERA)
+        intrinsics = camera.output.adjust_intrinsics(intrinsics.flatten().tolist(), resolution)
+        if send_camera and camera.session is None:
+            client_stream.camera.view_matrix_ros.extend(view_matrix.flatten().tolist())
+            client_stream.camera.intrinsics_matrix.extend(intrinsics)
+            client_stream.camera.camera_scale.extend([1.0, 1.0, 1.0])
+        elif send_camera:
+            camera.session.update_camera(view_matrix.flatten().tolist(), intrinsics, [1.0, 1.0, 1.0])
+        if camera.session is not None:
+            camera.session.fill(client_stream, camera=send_camera)
+
+        client_stream.clock.sim_dt = dt
+        client_stream.clock.sim_time = self.scene.sim_time
+        client_stream.clock.sys_time = time.time()
+
+        # Only encode the images the server requested, cropped, downscaled and converted
+        camera.output.fill(client_stream, resolution)
+        images = []
+        if has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_COLOR):
+            client_stream.color_codec = self.color_codec
+            images.append(("color", encode_image(camera.output.apply_color(camera.color), self.color_codec)))
+        if has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH):
+            client_stream.depth_codec = self.depth_codec
+            images.append(("depth", encode_image(camera.output.apply_depth(camera.depth), self.depth_codec)))
+        # Raw images can be views of the render buffers, which the next render() overwrites in place
+        # while a zero-copy message may still be queued in ZMQ
+        for index, (image_name, image) in enumerate(images):
+            if isinstance(image, np.ndarray) and (
+                np.shares_memory(image, camera.color) or np.shares_memory(image, camera.depth)
+            ):
+                images[index] = (image_name, image.copy())
+
+        camera.frame_id += 1
+        client_stream.trace.frame_id = camera.frame_id
+        client_stream.trace.render_time = render_time
+        command_id, command_send_time, command_apply_time = self._command_trace
+        client_stream.trace.command_id = command_id
+        client_stream.trace.command_send_time = command_send_time
+        client_stream.trace.command_apply_time = command_apply_time
+
+        if self.multipart:
+            for frame_index, (image_name, image) in enumerate(images, start=1):
+                setattr(client_stream, f"{image_name}_image_frame", frame_index)
+        else:
+            for image_name, image in images:
+                setattr(client_stream, f"{image_name}_image", bytes(image))
+        # Part of the header, taken right before it is serialized and sent
+        client_stream.trace.send_time = time.monotonic()
+        frames = [client_stream.SerializeToString()]
+        if self.multipart:
+            frames += [image for _, image in images]
+        if self.multiplexed:
+            frames.insert(0, camera.name.encode())
+        elif self.publish:
+            frames[0] = camera.topic_prefix + frames[0]
+
+        try:
+            self._push_sockets[camera.name].send_multipart(frames, flags=zmq.NOBLOCK, copy=False)
+            camera.sent += 1
+        except zmq.Again:
+            camera.dropped += 1
+            if camera.session is not None:
+                camera.session.request_keyframe()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Isaac Sim client for the Franka missions")
+    parser.add_argument("--server_ip", default="localhost", help="Server address")
+    parser.add_argument("--rate", type=float, default=60, help="Simulation and streaming rate (Hz), 0 as fast as possible")
+    parser.add_argument("--duration", type=float, default=0, help="Seconds to run, 0 to run until Ctrl+C")
+    parser.add_argument("--cameras", type=int, default=1, help="1: main camera, 2: main and gripper cameras, more if multiplexed")
+    parser.add_argument("--multiplexed", action="store_true", help="Stream all cameras over one connection on the main camera port")
+    parser.add_argument("--publish", action="store_true", help="Publish all cameras with a topic each on the main camera port")
+    parser.add_argument("--resolution_x", type=int, default=720, help="Image resolution x")
+    parser.add_argument("--resolution_y", type=int, default=720, help="Image resolution y")
+    parser.add_argument("--inline", action="store_true", help="Embed the images in the protobuf message")
+    parser.add_argument("--repeated_bbox", action="store_true", help="Send bounding boxes as repeated messages")
+    parser.add_argument("--keyframe_interval", type=int, default=0, help="Delta metadata with a keyframe every N messages, 0 for full metadata")
+    parser.add_argument("--crop", type=int, nargs=4, metavar=("X", "Y", "WIDTH", "HEIGHT"), help="Stream a region of interest")
+    parser.add_argument("--downscale", type=int, default=1, help="Stream every Nth pixel of every Nth row")
+    parser.add_argument("--rgb", action="store_true", help="Stream RGB instead of RGBA color images")
+    parser.add_argument("--depth_mm", action="store_true", help="Stream uint16 millimeter instead of float32 depth images")
+    args = parser.parse_args()
+
+    fake_sim = FakeSim(
+        args.server_ip,
+        args.rate,
+        (args.resolution_x, args.resolution_y),
+        args.cameras,
+        multipart=not args.inline,
+        packed_bbox=not args.repeated_bbox,
+        multiplexed=args.multiplexed,
+        publish=args.publish,
+        keyframe_interval=args.keyframe_interval,
+        output=ImageOutput(
+            args.crop,
+            args.downscale,
+            PIXEL_FORMAT_RGB8 if args.rgb else PIXEL_FORMAT_DEFAULT,
+            PIXEL_FORMAT_DEPTH_UINT16_MM if args.depth_mm else PIXEL_FORMAT_DEFAULT,
+        ),
+    )
+    print(f"[isaac-zmq-server] Fake sim streaming to {args.server_ip}, ports: {fake_sim.ports}")
+    print(f"[isaac-zmq-server] {fake_sim.run(args.duration)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import collections
+import threading
+import time
+
+import numpy as np
+import zmq
+
+
+class FrameSlot:
+    """
+    A preallocated slot of the FrameRingBuffer, holding one (multipart) message.
+
+    `frames` holds one memoryview per message frame, sized to the received data.
+    The views are only valid until the slot is released back to the buffer.
+    """
+
+    def __init__(self, index: int, frame_capacity: int):
+        self.index = index
+        self.buffers = [np.empty(frame_capacity, dtype=np.uint8)]
+        self.frames = []
+        self.sequence = 0
+        self.recv_time = 0.0
+
+
+class FrameRingBuffer:
+    """
+    Preallocated N-slot ring buffer between a receiving thread and its consumers.
+
+    The receiving thread copies each message into a reusable NumPy slot, so slow consumers never
+    block socket draining. Consumers either take the latest frame
+    (skipping older ones) or the next frame in order. When every slot is full, the oldest
+    unconsumed frame is overwritten. All dropped frames are counted, see stats().
+
+    Slot buffers grow to fit larger frames, including the one being received, so no message is dropped
+    for its size. Set frame_capacity to the expected frame size to avoid growing them after startup.
+    """
+
+    def __init__(self, num_slots: int = 3, frame_capacity: int = 0):
+        """
+        Initialize the buffer.
+
+        Args:
+            num_slots (int): Number of slots, at least 2 (one being written and one being consumed)
+            frame_capacity (int): Initial capacity in bytes of each frame buffer
+        """
+        if num_slots < 2:
+            raise ValueError(f"FrameRingBuffer needs at least 2 slots, got {num_slots}")
+
+        self.slots = [FrameSlot(index, frame_capacity) for index in range(num_slots)]
+
+        self._condition = threading.Condition()
+        self._write_slot = self.slots[0]
+        self._free = collections.deque(self.slots[1:])
+        self._ready = collections.deque()
+        self._sequence = 0
+
+        # Counters
+        self.received = 0
+        self.consumed = 0
+        self.dropped_overrun = 0  # Overwritten before any consumer took them
+        self.dropped_stale = 0  # Skipped by consumers asking for the latest frame
+
+    def recv_from(self, sock: zmq.Socket, flags: int = 0) -> None:
+        """
+        Receive one message (all of its frames) from a socket into the write slot and publish it.
+
+        Args:
+            sock (zmq.Socket): Socket to receive from
+            flags (int): zmq receive flags of the first frame
+
+        Raises:
+            zmq.Again: If no message arrived before the socket receive timeout
+        """
+        slot = self._write_slot
+        slot.frames.clear()
+        frame_index = 0
+
+        while True:
+            if frame_index == len(slot.buffers):
+                slot.buffers.append(np.empty(0, dtype=np.uint8))
+
+            # Not recv_into, which truncates a frame larger than the buffer. Receiving the zmq frame without
+            # copying it gives its size first, it is then copied once into the slot like recv_into would
+            frame = sock.recv(flags=flags if frame_index == 0 else 0, copy=False)
+            data = frame.buffer
+            nbytes = data.nbytes
+            if nbytes > len(slot.buffers[frame_index]):
+                # Headroom for the next frames, which are often slightly larger (compressed images)
+                slot.buffers[frame_index] = np.empty(int(nbytes * 1.25), dtype=np.uint8)
+            buffer = slot.buffers[frame_index]
+            buffer[:nbytes] = np.frombuffer(data, dtype=np.uint8)
+            slot.frames.append(memoryview(buffer)[:nbytes])
+
+            frame_index += 1
+            if not frame.more:
+                break
+
+        with self._condition:
+            self._publish()
+
+    def _publish(self) -> None:
+        """Move the write slot to the ready queue and take a new write slot. Requires the lock."""
+        slot = self._write_slot
+        self._sequence += 1
+        slot.sequence = self._sequence
+        slot.recv_time = time.monotonic()
+        self._ready.append(slot)
+        self.received += 1
+
+        if self._free:
+            self._write_slot = self._free.popleft()
+        else:
+            # Every other slot holds an unconsumed frame or is being consumed, overwrite the oldest frame
+            self._write_slot = self._ready.popleft()
+            self.dropped_overrun += 1
+
+        self._condition.notify_all()
+
+    def latest(self, timeout: float = None) -> FrameSlot:
+        """
+        Take the most recent frame, older unconsumed frames are dropped.
+
+        Args:
+            timeout (float): Seconds to wait for a frame, None waits forever
+
+        Returns:
+            FrameSlot: The frame, to release() once processed, or None on timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._ready, timeout):
+                return None
+            slot = self._ready.pop()
+            self.dropped_stale += len(self._ready)
+            self._free.extend(self._ready)
+            self._ready.clear()
+            self.consumed += 1
+            return slot
+
+    def next(self, timeout: float = None) -> FrameSlot:
+        """
+        Take the oldest unconsumed frame, frames are returned in order.
+
+        Args:
+            timeout (float): Seconds to wait for a frame, None waits forever
+
+        Returns:
+            FrameSlot: The frame, to release() once processed, or None on timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._ready, timeout):
+                return None
+            self.consumed += 1
+            return self._ready.popleft()
+
+    def release(self, slot: FrameSlot) -> None:
+        """
+        Return a slot taken with latest() or next() to the buffer.
+
+        Args:
+            slot (FrameSlot): The slot to release
+        """
+        with self._condition:
+            self._free.append(slot)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Received, consumed and dropped frame counters, and the number of frames waiting.
+        """
+        with self._condition:
+            return {
+                "received": self.received,
+                "consumed": self.consumed,
+                "pending": len(self._ready),
+                "dropped_overrun": self.dropped_overrun,
+                "dropped_stale": self.dropped_stale,
+            }
@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import time
+import traceback
+
+from .cv import CameraToWorldSpaceTransform, DepthColorizer, draw_bounding_boxes, filter_bboxes
+from .proto_util import annotator_mask, decode_bbox2d, decode_camera, decode_images, unpack_client_stream
+from .server import ZMQServer
+from .session import SessionCache
+from .sinks import Frame, FrameSink
+
+
+class HeadlessRunner:
+    """
+    Runs the server without a GUI: receives camera streams with the ZMQServer, processes
+    every frame with the cv module and hands the result to pluggable FrameSinks
+    (see sinks.py, and ui.TextureSink to display them).
+
+    Does not import DearPyGui, so it runs in containers without a display.
+    """
+
+    def __init__(
+        self,
+        dimmention: tuple,
+        sinks: list = None,
+        draw_bboxes: bool = True,
+        depth_view: bool = False,
+        world_coords: bool = False,
+        labels: list = None,
+        device: str = "cpu",
+    ):
+        """
+        Args:
+            dimmention (tuple): Image resolution (width, height) of the streams
+            sinks (list): FrameSinks receiving every processed frame
+            draw_bboxes (bool): Draw the bounding boxes on Frame.image
+            depth_view (bool): Put the colorized depth in Frame.image instead of the color image
+            world_coords (bool): Back-project the centers of the detections to world coordinates
+            labels (list): Labels of the detections to back-project, all if None
+            device (str): Device of the back-projection, "cpu" or "cuda"
+        """
+        self.dimmention = dimmention
+        self.sinks = list(sinks or [])
+        self.draw_bboxes = draw_bboxes
+        self.depth_view = depth_view
+        self.world_coords = world_coords
+        self.labels = labels
+        self.device = device
+
+        self.zmq_server = ZMQServer()
+        self.camera_to_world = {}
+        self.session_cache = SessionCache()
+        self.depth_colorizers = {}
+        self.latest_detections = {}  # stream name -> (frame_id, (N, 3) world positions)
+        self.frames_processed = 0
+        self.frames_rejected = 0
+
+    def add_sink(self, sink: FrameSink) -> None:
+        """
+        Add a sink, it receives the frames processed from now on.
+
+        Args:
+            sink (FrameSink): The sink
+        """
+        self.sinks.append(sink)
+
+    def required_annotators(self) -> int:
+        """
+        The parts of the stream messages this runner reads, to request with SettingsCommand.annotators
+        so the client does not copy and send the others.
+
+        Returns:
+            int: StreamAnnotator bitmask, 0 for all parts
+        """
+        return annotator_mask(
+            color=not self.depth_view,
+            depth=self.depth_view or self.world_coords,
+            bbox2d=self.draw_bboxes or self.world_coords,
+            camera=self.world_coords,
+        )
+
+    def subscribe(self, name: str, port: int, buffer_slots: int = 3) -> None:
+        """
+        Receive and process a camera stream.
+
+        Args:
+            name (str): Name of the stream, reported in Frame.name
+            port (int): Port to receive ClientStreamMessages on
+            buffer_slots (int): ZMQServer ring buffer slots, processing always takes the latest frame
+        """
+        self.camera_to_world[name] = CameraToWorldSpaceTransform(self.dimmention)
+        self.depth_colorizers[name] = DepthColorizer()
+        self.zmq_server.subscribe_to_socket_in_loop(
+            name,
+            port,
+            lambda message, recv_time: self.process_frame(name, message, recv_time),
+            multipart=True,
+            buffer_slots=buffer_slots,
+            with_recv_time=True,
+        )
+
+    def subscribe_multiplexed(self, port: int, names: list, buffer_slots: int = 3) -> None:
+        """
+        Receive and process several camera streams multiplexed on one port.
+
+        Args:
+            port (int): Port to receive the multiplexed ClientStreamMessages on
+            names (list): Camera ids of the streams, reported in Frame.name
+            buffer_slots (int): ZMQServer ring buffer slots per camera, processing always takes the latest frame
+        """
+        handlers = {}
+        for name in names:
+            self.camera_to_world[name] = CameraToWorldSpaceTransform(self.dimmention)
+            self.depth_colorizers[name] = DepthColorizer()
+            handlers[name] = lambda message, recv_time, name=name: self.process_frame(name, message, recv_time)
+
+        self.zmq_server.subscribe_to_multiplexed_socket_in_loop(
+            f"multiplexed_{port}",
+            port,
+            handlers,
+            multipart=True,
+            buffer_slots=buffer_slots,
+            with_recv_time=True,
+        )
+
+    def subscribe_topic(self, name: str, endpoint: str, buffer_slots: int = 3, conflate: bool = False) -> None:
+        """
+        Receive and process a camera stream published in PUB/SUB mode, usually through a StreamProxy.
+
+        Args:
+            name (str): Topic of the stream (camera name), reported in Frame.name
+            endpoint (str): Endpoint to subscribe on, e.g. the StreamProxy backend "tcp://localhost:5562"
+            buffer_slots (int): ZMQServer ring buffer slots, processing always takes the latest frame
+            conflate (bool): Only keep the latest message in the socket (single frame messages only)
+        """
+        self.camera_to_world[name] = CameraToWorldSpaceTransform(self.dimmention)
+        self.depth_colorizers[name] = DepthColorizer()
+        self.zmq_server.subscribe_to_topic_in_loop(
+            name,
+            endpoint,
+            name,
+            lambda message, recv_time: self.process_frame(name, message, recv_time),
+            multipart=True,
+            buffer_slots=buffer_slots,
+            conflate=conflate,
+            with_recv_time=True,
+        )
+
+    def process_frame(self, name: str, message: list, recv_time: float = None) -> None:
+        """
+        Parse and process one ClientStreamMessage, then hand it to the sinks.
+
+        Args:
+            name (str): Name of the stream the message was received on
+            message (list): Received frames (see proto_util.unpack_client_stream)
+            recv_time (float): When the message was received from the socket, monotonic seconds, now if None
+        """
+        if recv_time is None:
+            recv_time = time.monotonic()
+
+        # Parts the client did not send (see required_annotators) are None
+        client_stream, img_data, depth_data = unpack_client_stream(message)
+        # Restore the labels and camera metadata of delta encoded messages
+        self.session_cache.apply(name, client_stream)
+        bboxes, id_to_labels = decode_bbox2d(client_stream.bbox2d)
+        camera_data = decode_camera(client_stream.camera)
+        # Images are returned at the streamed size, cropped or downscaled by the client if requested
+        try:
+            color_image, depth_array = decode_images(client_stream, img_data, depth_data, self.dimmention)
+        except ValueError as e:
+            self.frames_rejected += 1
+            print(f"[isaac-zmq-server] {name}: {e}")
+            return
+
+        image = None
+        if self.depth_view:
+            if depth_array is not None:
+                image = self.depth_colorizers[name].colorize(depth_array)
+        elif color_image is not None:
+            image = color_image
+            if self.draw_bboxes:
+                image = draw_bounding_boxes(image, bboxes, id_to_labels)
+
+        detections_world_pos = None
+        if self.world_coords and depth_array is not None and camera_data is not None:
+            detections = bboxes if self.labels is None else filter_bboxes(bboxes, id_to_labels, self.labels)
+            detections_world_pos = self.camera_to_world[name].get_bbox_centers_in_world_coords(
+                detections, depth_array, camera_data, device=self.device
+            )
+            self.latest_detections[name] = (client_stream.trace.frame_id, detections_world_pos)
+
+        frame = Frame(
+            name,
+            client_stream.trace.frame_id,
+            client_stream.clock.sim_time,
+            recv_time,
+            client_stream.trace,
+            image,
+            depth_array,
+            bboxes,
+            id_to_labels,
+            camera_data,
+            detections_world_pos,
+        )
+        self.frames_processed += 1
+        for sink in self.sinks:
+            try:
+                sink.consume(frame)
+            except:
+                print(traceback.format_exc())
+
+    def run(self, duration: float = 0) -> None:
+        """
+        Block until the duration elapsed or the process is interrupted (Ctrl+C), then clean up.
+
+        Args:
+            duration (float): Seconds to run, 0 to run until interrupted
+        """
+        start_time = time.monotonic()
+        try:
+            while not duration or time.monotonic() - start_time < duration:
+                time.sleep(0.1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.cleanup()
+
+    def cleanup(self) -> None:
+        """
+        Stop the streams and close the sinks.
+        """
+        self.zmq_server.cleanup()
+        for sink in self.sinks:
+            sink.close()
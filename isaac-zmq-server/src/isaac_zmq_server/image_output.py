@@ -0,0 +1,301 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Cropping, downscaling and pixel format conversion of the streamed images, shared by the
+# Isaac Sim client (ZMQAnnotator) and the server.
+# This module is duplicated on both sides of the bridge, keep the copies identical.
+
+import numpy as np
+
+from .image_codecs import dequantize_depth, quantize_depth
+
+# Pixel formats, must match the PixelFormat enum @ proto/client_stream_message.proto
+PIXEL_FORMAT_DEFAULT = 0
+PIXEL_FORMAT_RGB8 = 1
+PIXEL_FORMAT_DEPTH_UINT16_MM = 2
+
+
+class ImageOutput:
+    """
+    Output of a stream: a crop rectangle of the render product, an integer downscaling factor and
+    the pixel formats of the images.
+
+    Applied on the client before encoding, so the bytes sent drop with the pixels. Downscaling keeps
+    every downscale-th pixel (nearest), depth is never blended across object edges. The bounding boxes
+    and intrinsics of the message are moved to the streamed images (see ImageRegion), so consumers
+    use them as with full images.
+    """
+
+    def __init__(
+        self,
+        crop: tuple = None,
+        downscale: int = 1,
+        color_format: int = PIXEL_FORMAT_DEFAULT,
+        depth_format: int = PIXEL_FORMAT_DEFAULT,
+    ):
+        """
+        Args:
+            crop (tuple): (x, y, width, height) in render product pixels, None for the full render product.
+                A width or height of 0 extends the crop to the right or bottom edge.
+            downscale (int): Downscaling factor, 1 for none
+            color_format (int): Pixel format of the color image, PIXEL_FORMAT_DEFAULT (RGBA) or PIXEL_FORMAT_RGB8
+            depth_format (int): Pixel format of the depth image, PIXEL_FORMAT_DEFAULT (float32) or PIXEL_FORMAT_DEPTH_UINT16_MM
+        """
+        self.crop = tuple(int(value) for value in crop) if crop else None
+        self.downscale = max(int(downscale or 1), 1)
+        self.color_format = color_format
+        self.depth_format = depth_format
+
+    @classmethod
+    def from_command(cls, stream_output) -> "ImageOutput":
+        """
+        Args:
+            stream_output: StreamOutput of a SettingsCommand @ proto/server_control_message.proto
+
+        Returns:
+            ImageOutput: The requested output, a crop of width and height 0 is the full render product
+        """
+        crop = (stream_output.crop_x, stream_output.crop_y, stream_output.crop_width, stream_output.crop_height)
+        return cls(
+            crop if any(crop) else None,
+            stream_output.downscale,
+            stream_output.color_format,
+            stream_output.depth_format,
+        )
+
+    @classmethod
+    def requested(cls, stream_outputs, stream_name: str) -> "ImageOutput":
+        """
+        Output requested by the server for a stream, a StreamOutput naming the stream wins over one for all streams.
+
+        Args:
+            stream_outputs: SettingsCommand.outputs
+            stream_name (str): Camera id or topic of the stream, or its port number
+
+        Returns:
+            ImageOutput: The requested output, None if the server did not request one
+        """
+        matching = [output for output in stream_outputs if output.stream == stream_name]
+        matching = matching or [output for output in stream_outputs if not output.stream]
+        return cls.from_command(matching[0]) if matching else None
+
+    def fill_command(self, stream_output, stream: str = "") -> None:
+        """
+        Request this output from the client, the inverse of from_command().
+
+        Args:
+            stream_output: StreamOutput to fill, e.g. SettingsCommand.outputs.add()
+            stream (str): Camera id or topic of the stream, or its port number, empty for all streams
+        """
+        stream_output.stream = stream
+        if self.crop:
+            x, y, width, height = self.crop
+            stream_output.crop_x, stream_output.crop_y = x, y
+            stream_output.crop_width, stream_output.crop_height = width, height
+        stream_output.downscale = self.downscale
+        stream_output.color_format = self.color_format
+        stream_output.depth_format = self.depth_format
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ImageOutput) and self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"ImageOutput(crop={self.crop}, downscale={self.downscale}, "
+            f"color_format={self.color_format}, depth_format={self.depth_format})"
+        )
+
+    def _key(self) -> tuple:
+        return (self.crop, self.downscale, self.color_format, self.depth_format)
+
+    @property
+    def resamples(self) -> bool:
+        """Whether the images are cropped or downscaled."""
+        return self.crop is not None or self.downscale > 1
+
+    def region(self, resolution: tuple) -> tuple:
+        """
+        The crop clamped to the render product, and the size of the streamed images.
+
+        Args:
+            resolution (tuple): Render product resolution (width, height)
+
+        Returns:
+            tuple: (x, y, width, height, image_width, image_height)
+        """
+        full_width, full_height = resolution
+        x, y, width, height = self.crop or (0, 0, 0, 0)
+        x = min(x, full_width - 1)
+        y = min(y, full_height - 1)
+        width = min(width or full_width, full_width - x)
+        height = min(height or full_height, full_height - y)
+        # Slicing x:x + width:downscale keeps ceil(width / downscale) pixels
+        image_width = -(-width // self.downscale)
+        image_height = -(-height // self.downscale)
+        return x, y, width, height, image_width, image_height
+
+    def apply_color(self, image: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            image (np.ndarray): RGBA image (height, width, 4) of the render product
+
+        Returns:
+            np.ndarray: Cropped, downscaled and converted image (a view when possible)
+        """
+        image = self._resample(image)
+        if self.color_format == PIXEL_FORMAT_RGB8:
+            image = image[..., :3]
+        return image
+
+    def apply_depth(self, depth: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            depth (np.ndarray): float32 depth image (height, width) of the render product
+
+        Returns:
+            np.ndarray: Cropped, downscaled and converted depth (a view when possible)
+        """
+        depth = self._resample(depth)
+        if self.depth_format == PIXEL_FORMAT_DEPTH_UINT16_MM:
+            depth = quantize_depth(depth)
+        return depth
+
+    def adjust_intrinsics(self, intrinsics_matrix: list, resolution: tuple) -> list:
+        """
+        Move a flattened 3x3 intrinsics matrix to the streamed images.
+
+        Args:
+            intrinsics_matrix (list): Flattened intrinsics of the render product, empty if not available
+            resolution (tuple): Render product resolution (width, height)
+
+        Returns:
+            list: Flattened intrinsics of the streamed images
+        """
+        if not intrinsics_matrix or not self.resamples:
+            return intrinsics_matrix
+        x, y, _, _, _, _ = self.region(resolution)
+        k = np.asarray(intrinsics_matrix, dtype=np.float64).reshape(3, 3).copy()
+        # Pixel u of the render product is pixel (u - x) / downscale of the streamed image
+        k[0] = (k[0] - x * k[2]) / self.downscale
+        k[1] = (k[1] - y * k[2]) / self.downscale
+        return k.flatten().tolist()
+
+    def adjust_bboxes(self, bboxes: np.ndarray, resolution: tuple) -> np.ndarray:
+        """
+        Move bounding boxes to the streamed images, clamped to their bounds.
+
+        Args:
+            bboxes (np.ndarray): Bounding boxes record array (semanticId, xMin, yMin, xMax, yMax, occlusionRatio)
+            resolution (tuple): Render product resolution (width, height)
+
+        Returns:
+            np.ndarray: Adjusted copy of the bounding boxes, or bboxes as is if the images are not resampled
+        """
+        if not self.resamples or len(bboxes) == 0:
+            return bboxes
+        x, y, _, _, image_width, image_height = self.region(resolution)
+        bboxes = bboxes.copy()
+        names = bboxes.dtype.names
+        for name, offset, limit in ((names[1], x, image_width), (names[3], x, image_width)):
+            bboxes[name] = np.clip((bboxes[name] - offset) // self.downscale, 0, limit - 1)
+        for name, offset, limit in ((names[2], y, image_height), (names[4], y, image_height)):
+            bboxes[name] = np.clip((bboxes[name] - offset) // self.downscale, 0, limit - 1)
+        return bboxes
+
+    def fill(self, client_stream, resolution: tuple) -> None:
+        """
+        Set the ImageRegion and pixel formats of a ClientStreamMessage.
+
+        Args:
+            client_stream: ClientStreamMessage to fill
+            resolution (tuple): Render product resolution (width, height)
+        """
+        if self.resamples:
+            region = client_stream.region
+            region.x, region.y, region.width, region.height, region.image_width, region.image_height = self.region(
+                resolution
+            )
+            region.downscale = self.downscale
+        client_stream.color_format = self.color_format
+        client_stream.depth_format = self.depth_format
+
+    def _resample(self, image: np.ndarray) -> np.ndarray:
+        if not self.resamples:
+            return image
+        x, y, width, height, _, _ = self.region((image.shape[1], image.shape[0]))
+        return image[y : y + height : self.downscale, x : x + width : self.downscale]
+
+
+def image_size(client_stream, resolution: tuple) -> tuple:
+    """
+    Size of the images of a ClientStreamMessage.
+
+    Args:
+        client_stream: Parsed ClientStreamMessage
+        resolution (tuple): Render product resolution (width, height), used when the images are not resampled
+
+    Returns:
+        tuple: (width, height)
+    """
+    if client_stream.HasField("region"):
+        return client_stream.region.image_width, client_stream.region.image_height
+    return tuple(resolution)
+
+
+def depth_dtype(depth_format: int):
+    """
+    Returns:
+        Numpy dtype to decode depth images of the pixel format with (see image_codecs.decode_image)
+    """
+    return np.uint16 if depth_format == PIXEL_FORMAT_DEPTH_UINT16_MM else np.float32
+
+
+def color_to_rgba(color: np.ndarray, color_format: int, width: int, height: int) -> np.ndarray:
+    """
+    Reshape a decoded color image and convert it back to RGBA.
+
+    Args:
+        color (np.ndarray): Flat uint8 pixels
+        color_format (int): Pixel format of the image
+        width (int): Image width
+        height (int): Image height
+
+    Returns:
+        np.ndarray: RGBA image (height, width, 4) uint8, a view of color for RGBA images
+
+    Raises:
+        ValueError: If the size of the image does not match
+    """
+    channels = 3 if color_format == PIXEL_FORMAT_RGB8 else 4
+    if color.size != width * height * channels:
+        raise ValueError(f"received color image of size {color.size}, expected {width}x{height}x{channels}")
+    color = color.reshape(height, width, channels)
+    if channels == 4:
+        return color
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., :3] = color
+    rgba[..., 3] = 255
+    return rgba
+
+
+def depth_to_float(depth: np.ndarray, depth_format: int, width: int, height: int) -> np.ndarray:
+    """
+    Reshape a decoded depth image and convert it back to float32.
+
+    Args:
+        depth (np.ndarray): Flat depth decoded with depth_dtype(depth_format)
+        depth_format (int): Pixel format of the image
+        width (int): Image width
+        height (int): Image height
+
+    Returns:
+        np.ndarray: float32 depth (height, width, 1), invalid depth as +inf for quantized formats
+
+    Raises:
+        ValueError: If the size of the image does not match
+    """
+    if depth.size != width * height:
+        raise ValueError(f"received depth image of size {depth.size}, expected {width}x{height}")
+    if depth_format == PIXEL_FORMAT_DEPTH_UINT16_MM:
+        depth = dequantize_depth(depth, np.float32)
+    return depth.reshape(height, width, 1)
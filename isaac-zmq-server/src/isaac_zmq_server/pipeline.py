@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import heapq
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+from multiprocessing import shared_memory
+
+
+def _worker_loop(shm_name: str, slot_size: int, task_queue, result_queue, worker_fn: callable, worker_init: callable):
+    """
+    Worker process main loop: map the shared memory, then process tasks until a None task is received.
+
+    Each task is (sequence, slot index, frame sizes). The frames are passed to worker_fn as memoryviews
+    into the shared memory slot, which is handed back to the pipeline once the result is sent.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        if worker_init is not None:
+            worker_init()
+
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            sequence, slot, sizes = task
+            offset = slot * slot_size
+            frames = []
+            for size in sizes:
+                frames.append(shm.buf[offset : offset + size])
+                offset += size
+
+            try:
+                result = (sequence, slot, True, worker_fn(frames))
+            except:
+                result = (sequence, slot, False, traceback.format_exc())
+            finally:
+                # Views into the shared memory must be released before the slot is reused (and before close)
+                for frame in frames:
+                    frame.release()
+
+            result_queue.put(result)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shm.close()
+
+
+class ProcessPipeline:
+    """
+    Fans received messages out to a pool of worker processes over shared memory.
+
+    The receiving thread copies each message into a free slot of a shared memory block and queues
+    the slot index, so workers process frames in parallel without the GIL and without pickling images.
+    Results are pickled back to the server process, re-ordered (by Clock.sim_time with
+    proto_util.client_stream_sim_time as order_key) and passed to result_fn on a collector thread.
+    Ordering applies to the messages in flight: a result waits until every message with a smaller
+    key has been processed, so streams sharing a pipeline are merged in simulation time order.
+
+    When every slot is in use the message is dropped, so the receiving thread never blocks.
+
+    Worker processes are started with the "spawn" method: worker_fn, worker_init and result
+    values must be picklable (module level functions), and the main script must be guarded
+    by `if __name__ == "__main__":`.
+    """
+
+    def __init__(
+        self,
+        worker_fn: callable,
+        result_fn: callable,
+        num_workers: int = None,
+        num_slots: int = None,
+        slot_size: int = 8 * 1024 * 1024,
+        order_key: callable = None,
+        worker_init: callable = None,
+    ):
+        """
+        Initialize the pipeline, the workers are started by start().
+
+        Args:
+            worker_fn (callable): Runs in the workers, takes a list of frames (memoryviews) and returns a result.
+            result_fn (callable): Runs in the server process, called with each result in order.
+            num_workers (int): Number of worker processes, defaults to the number of cores.
+            num_slots (int): Number of shared memory slots (messages in flight), defaults to 2 per worker.
+            slot_size (int): Size in bytes of a slot, messages larger than this are dropped.
+            order_key (callable): Takes the frames of a message and returns its sort key, None keeps arrival order.
+            worker_init (callable): Runs once in each worker before processing, e.g. to allocate per-process state.
+        """
+        self.worker_fn = worker_fn
+        self.result_fn = result_fn
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.num_slots = num_slots or 2 * self.num_workers
+        self.slot_size = slot_size
+        self.order_key = order_key
+        self.worker_init = worker_init
+
+        self._shm = None
+        self._workers = []
+        self._collector = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._free_slots = queue.SimpleQueue()
+        self._sequence = 0
+
+        # Reordering: (key, sequence) of every submitted message not yet passed to result_fn
+        self._pending = []
+        self._done = {}
+
+        # Counters
+        self.submitted = 0
+        self.completed = 0
+        self.dropped_busy = 0
+        self.dropped_oversize = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        """Allocate the shared memory and start the worker processes and the collector thread."""
+        context = multiprocessing.get_context("spawn")
+        self._shm = shared_memory.SharedMemory(create=True, size=self.num_slots * self.slot_size)
+        for slot in range(self.num_slots):
+            self._free_slots.put(slot)
+
+        self._task_queue = context.Queue()
+        self._result_queue = context.Queue()
+
+        for _ in range(self.num_workers):
+            worker = context.Process(
+                target=_worker_loop,
+                args=(
+                    self._shm.name,
+                    self.slot_size,
+                    self._task_queue,
+                    self._result_queue,
+                    self.worker_fn,
+                    self.worker_init,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        self._collector = threading.Thread(target=self._collect_loop)
+        self._collector.start()
+
+    def submit(self, frames: list) -> bool:
+        """
+        Copy a message into a free slot and queue it for the workers.
+
+        Args:
+            frames (list): Message frames (bytes-like)
+
+        Returns:
+            bool: Whether the message was queued, False if it was dropped
+        """
+        sizes = [memoryview(frame).nbytes for frame in frames]
+        if sum(sizes) > self.slot_size:
+            with self._lock:
+                self.dropped_oversize += 1
+            return False
+
+        key = self.order_key(frames) if self.order_key is not None else None
+
+        try:
+            slot = self._free_slots.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.dropped_busy += 1
+            return False
+
+        offset = slot * self.slot_size
+        for frame, size in zip(frames, sizes):
+            self._shm.buf[offset : offset + size] = frame
+            offset += size
+
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            heapq.heappush(self._pending, (sequence if key is None else key, sequence))
+            self.submitted += 1
+
+        self._task_queue.put((sequence, slot, sizes))
+        return True
+
+    def _collect_loop(self) -> None:
+        """Thread function that receives the worker results and passes them to result_fn in order."""
+        while not self._stop_event.is_set():
+            try:
+                sequence, slot, ok, result = self._result_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            self._free_slots.put(slot)
+            if not ok:
+                print(f"[isaac-zmq-server] Pipeline worker failed:\n{result}")
+                result = None
+
+            with self._lock:
+                self.errors += not ok
+                self._done[sequence] = (ok, result)
+                # Release results while the smallest pending key is done, later keys wait for earlier ones
+                ready = []
+                while self._pending and self._pending[0][1] in self._done:
+                    _, done_sequence = heapq.heappop(self._pending)
+                    ready.append(self._done.pop(done_sequence))
+
+            for ok, result in ready:
+                if not ok:
+                    continue
+                self.completed += 1
+                try:
+                    self.result_fn(result)
+                except:
+                    print("[isaac-zmq-server] Unable to process pipeline result...")
+                    print(traceback.format_exc())
+
+    def stop(self) -> None:
+        """Stop the workers and the collector thread, and free the shared memory."""
+        if self._shm is None:
+            return
+
+        for _ in self._workers:
+            self._task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+
+        self._stop_event.set()
+        self._collector.join()
+
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Submitted, completed, failed and dropped message counters.
+        """
+        with self._lock:
+            in_flight = len(self._pending)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "in_flight": in_flight,
+            "dropped_busy": self.dropped_busy,
+            "dropped_oversize": self.dropped_oversize,
+            "errors": self.errors,
+        }
@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+
+import client_stream_message_pb2
+
+from .image_codecs import decode_image
+from .image_output import color_to_rgba, depth_dtype, depth_to_float, image_size
+
+# Structured dtype of a bounding box, matches InputDataBBox2d (OgnIsaacBridgeZMQNode.cpp)
+# and the BBox2D.packed_data layout
+BBOX2D_DTYPE = np.dtype(
+    [
+        ("semanticId", "<u4"),
+        ("xMin", "<i4"),
+        ("yMin", "<i4"),
+        ("xMax", "<i4"),
+        ("yMax", "<i4"),
+        ("occlusionRatio", "<f4"),
+    ]
+)
+
+
+def unpack_client_stream(message) -> tuple:
+    """
+    Parse a ClientStreamMessage and locate its image payloads.
+
+    The message can arrive either as a single serialized protobuf (images embedded in the
+    color_image / depth_image fields), or as multipart frames where frame 0 is the protobuf
+    header and the images follow as separate frames (see color_image_frame / depth_image_frame).
+    Multipart image payloads are returned as is, so memoryviews stay zero-copy.
+
+    Images the client did not send, as requested by the server (SettingsCommand.annotators),
+    are returned as None.
+
+    Args:
+        message: Serialized message (bytes) or a list of frames (bytes or memoryview)
+
+    Returns:
+        tuple: (ClientStreamMessage, color image buffer or None, depth image buffer or None)
+    """
+    frames = message if isinstance(message, (list, tuple)) else [message]
+
+    client_stream = client_stream_message_pb2.ClientStreamMessage()
+    client_stream.ParseFromString(frames[0])
+
+    color_image = None
+    if has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_COLOR):
+        color_image = _image_payload(frames, client_stream.color_image_frame, client_stream.color_image)
+    depth_image = None
+    if has_annotator(client_stream, client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH):
+        depth_image = _image_payload(frames, client_stream.depth_image_frame, client_stream.depth_image)
+
+    return client_stream, color_image, depth_image
+
+
+def has_annotator(client_stream, annotator: int) -> bool:
+    """
+    Whether a ClientStreamMessage carries an annotator (a StreamAnnotator flag).
+
+    Args:
+        client_stream: Parsed ClientStreamMessage
+        annotator (int): StreamAnnotator flag, e.g. client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH
+
+    Returns:
+        bool: True if the annotator part was sent, messages of older clients carry all of them
+    """
+    return not client_stream.annotators or bool(client_stream.annotators & annotator)
+
+
+def annotator_mask(color: bool = True, depth: bool = True, bbox2d: bool = True, camera: bool = True) -> int:
+    """
+    Build the StreamAnnotator bitmask of the parts a server reads, for SettingsCommand.annotators.
+
+    Args:
+        color (bool): Color image
+        depth (bool): Depth image
+        bbox2d (bool): Bounding boxes
+        camera (bool): Camera parameters
+
+    Returns:
+        int: The bitmask, STREAM_ANNOTATOR_ALL (0) if every part is needed
+
+    Raises:
+        ValueError: If no part is requested, 0 on the wire means every part (STREAM_ANNOTATOR_ALL)
+    """
+    mask = 0
+    if color:
+        mask |= client_stream_message_pb2.STREAM_ANNOTATOR_COLOR
+    if depth:
+        mask |= client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH
+    if bbox2d:
+        mask |= client_stream_message_pb2.STREAM_ANNOTATOR_BBOX2D
+    if camera:
+        mask |= client_stream_message_pb2.STREAM_ANNOTATOR_CAMERA
+    if mask == 0:
+        raise ValueError("At least one annotator must be requested, an empty mask requests all of them")
+    all_annotators = (
+        client_stream_message_pb2.STREAM_ANNOTATOR_COLOR
+        | client_stream_message_pb2.STREAM_ANNOTATOR_DEPTH
+        | client_stream_message_pb2.STREAM_ANNOTATOR_BBOX2D
+        | client_stream_message_pb2.STREAM_ANNOTATOR_CAMERA
+    )
+    return client_stream_message_pb2.STREAM_ANNOTATOR_ALL if mask == all_annotators else mask
+
+
+def topic_prefix(topic: str) -> bytes:
+    """
+    Return the serialized ClientStreamMessage.topic field of a topic.
+
+    In PUB/SUB mode publishers put it in front of the serialized message (protobuf fields can come in
+    any order), so it is both a valid part of the message and the ZMQ subscription prefix of the topic.
+    The field encodes the topic length, so a topic does not match longer topics it is a prefix of.
+
+    Args:
+        topic (str): The topic
+
+    Returns:
+        bytes: The serialized field
+    """
+    return client_stream_message_pb2.ClientStreamMessage(topic=topic).SerializeToString()
+
+
+def client_stream_sim_time(message) -> float:
+    """
+    Return the Clock.sim_time of a ClientStreamMessage, e.g. as a ProcessPipeline order key.
+
+    With multipart messages only the small header frame is parsed.
+
+    Args:
+        message: Serialized message (bytes) or a list of frames (bytes or memoryview)
+
+    Returns:
+        float: Simulation time of the message
+    """
+    frames = message if isinstance(message, (list, tuple)) else [message]
+    return client_stream_message_pb2.ClientStreamMessage.FromString(frames[0]).clock.sim_time
+
+
+def decode_bbox2d(bbox2d_data) -> tuple:
+    """
+    Convert protobuf bounding box data to a NumPy record array.
+    source: client_stream_message_pb2.BBox2D
+
+    Packed bounding boxes (BBox2D.packed_data) are wrapped without copying, boxes sent as
+    repeated BBox2DType messages (older clients) are converted in a single pass.
+
+    Args:
+        bbox2d_data: Protobuf BBox2D message
+
+    Returns:
+        tuple: (np.recarray of BBOX2D_DTYPE, dict mapping semantic id (int) to label)
+    """
+    if bbox2d_data.packed_data:
+        bboxes = np.frombuffer(bbox2d_data.packed_data, dtype=BBOX2D_DTYPE)
+    else:
+        bboxes = np.array(
+            [(b.semanticId, b.xMin, b.yMin, b.xMax, b.yMax, b.occlusionRatio) for b in bbox2d_data.data],
+            dtype=BBOX2D_DTYPE,
+        )
+
+    id_to_labels = {int(k): v for k, v in bbox2d_data.info.idToLabels.items()}
+    return bboxes.view(np.recarray), id_to_labels
+
+
+def decode_camera(camera_data) -> dict:
+    """
+    Convert protobuf camera data to a dictionary of NumPy arrays.
+    source: client_stream_message_pb2.Camera
+
+    Args:
+        camera_data: Protobuf Camera message
+
+    Returns:
+        dict: view_matrix_ros (4x4), camera_scale (3,) and intrinsics_matrix (3x3), None if the matrices are
+            missing (camera not requested, non pinhole camera, or delta metadata not received yet, see session.py)
+    """
+    if len(camera_data.view_matrix_ros) != 16 or len(camera_data.intrinsics_matrix) != 9:
+        return None
+    return {
+        "view_matrix_ros": np.array(camera_data.view_matrix_ros, dtype=np.float64).reshape(4, 4),
+        "camera_scale": np.array(camera_data.camera_scale, dtype=np.float64),
+        "intrinsics_matrix": np.array(camera_data.intrinsics_matrix, dtype=np.float64).reshape(3, 3),
+    }
+
+
+def decode_images(client_stream, color_data, depth_data, resolution: tuple) -> tuple:
+    """
+    Decode the images of a ClientStreamMessage, whatever their codec, pixel format and region.
+
+    Args:
+        client_stream: Parsed ClientStreamMessage
+        color_data: Color image payload (see unpack_client_stream), None if not sent
+        depth_data: Depth image payload, None if not sent
+        resolution (tuple): Render product resolution (width, height), the image size if not cropped or downscaled
+
+    Returns:
+        tuple: (RGBA image (height, width, 4) uint8, depth (height, width, 1) float32), None for the images not sent
+
+    Raises:
+        ValueError: If the size of an image does not match
+    """
+    width, height = image_size(client_stream, resolution)
+    color = None
+    if color_data is not None:
+        color = decode_image(color_data, client_stream.color_codec, np.uint8)
+        color = color_to_rgba(color, client_stream.color_format, width, height)
+    depth = None
+    if depth_data is not None:
+        depth = decode_image(depth_data, client_stream.depth_codec, depth_dtype(client_stream.depth_format))
+        depth = depth_to_float(depth, client_stream.depth_format, width, height)
+    return color, depth
+
+
+def _image_payload(frames: list, frame_index: int, inline_data: bytes):
+    """
+    Return the image payload from its multipart frame, or the inline protobuf bytes if frame_index is 0.
+    """
+    if frame_index == 0:
+        return inline_data
+    if frame_index >= len(frames):
+        raise ValueError(f"Image frame {frame_index} missing, received {len(frames)} frames")
+    return frames[frame_index]
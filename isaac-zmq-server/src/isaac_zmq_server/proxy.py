@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+XSUB/XPUB proxy of the PUB/SUB streaming mode, so several consumers share one camera stream.
+
+In PUB/SUB mode the Isaac Sim client publishes every camera under a topic (ClientStreamMessage.topic)
+to the proxy frontend, on the usual camera port. Consumers (GUI, recorder, perception...) connect to the
+backend and subscribe to the cameras they need. The proxy forwards their subscriptions upstream, so a
+camera nobody subscribed to is not sent over the network, and the frames are rendered once whatever
+the number of consumers.
+
+    python -m isaac_zmq_server.proxy --frontend_port 5561 --backend_port 5562
+    python example_headless.py --topics camera_annotator --endpoint tcp://localhost:5562
+"""
+
+import argparse
+import struct
+import threading
+import time
+
+import zmq
+
+# zmq.proxy_steerable statistics, messages are counted in frames (parts of multipart messages)
+STATISTICS_FIELDS = (
+    "frontend_messages_in",
+    "frontend_bytes_in",
+    "frontend_messages_out",
+    "frontend_bytes_out",
+    "backend_messages_in",
+    "backend_bytes_in",
+    "backend_messages_out",
+    "backend_bytes_out",
+)
+
+
+class StreamProxy:
+    """
+    Forwards the messages published to the frontend (XSUB, bound) to the subscribers of the backend (XPUB, bound),
+    with zmq.proxy_steerable running on a thread of its own (the forwarding itself does not hold the GIL).
+
+    Like the PULL sockets of the server, the high water marks are low so slow subscribers drop frames
+    instead of queuing stale ones, each subscriber has its own queue and does not slow down the others.
+    """
+
+    def __init__(self, frontend_port: int = 5561, backend_port: int = 5562, hwm: int = 16):
+        """
+        Args:
+            frontend_port (int): Port the clients publish to
+            backend_port (int): Port the consumers subscribe on
+            hwm (int): High water mark of the frontend and of each subscriber, in messages
+        """
+        self.frontend_port = frontend_port
+        self.backend_port = backend_port
+        self.hwm = hwm
+
+        self._context = None
+        self._control = None
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Bind the frontend and backend and start forwarding.
+        """
+        self._context = zmq.Context()
+        frontend = self._context.socket(zmq.XSUB)
+        frontend.set_hwm(self.hwm)
+        frontend.bind(f"tcp://*:{self.frontend_port}")
+
+        backend = self._context.socket(zmq.XPUB)
+        backend.set_hwm(self.hwm)
+        backend.bind(f"tcp://*:{self.backend_port}")
+
+        control = self._context.socket(zmq.PAIR)
+        control.bind("inproc://stream_proxy_control")
+        self._control = self._context.socket(zmq.PAIR)
+        self._control.connect("inproc://stream_proxy_control")
+
+        def run():
+            """Thread function forwarding until terminated, then closing the sockets."""
+            try:
+                zmq.proxy_steerable(frontend, backend, None, control)
+            except zmq.ContextTerminated:
+                pass
+            finally:
+                for sock in (frontend, backend, control):
+                    sock.close(linger=0)
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        print(f"[isaac-zmq-server] Stream proxy: publishers on {self.frontend_port}, subscribers on {self.backend_port}")
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Messages and bytes received and sent by the frontend and backend (see STATISTICS_FIELDS)
+        """
+        self._control.send(b"STATISTICS")
+        frames = self._control.recv_multipart()
+        return {field: struct.unpack("=Q", frame)[0] for field, frame in zip(STATISTICS_FIELDS, frames)}
+
+    def stop(self) -> None:
+        """
+        Stop forwarding and close the sockets.
+        """
+        if self._thread is None:
+            return
+        self._control.send(b"TERMINATE")
+        self._thread.join()
+        self._control.close(linger=0)
+        self._context.term()
+        self._thread = None
+        self._control = None
+        self._context = None
+
+    def run(self, duration: float = 0, log_interval: float = 5.0) -> None:
+        """
+        Start, log the statistics periodically and stop when the duration elapsed or the process is interrupted (Ctrl+C).
+
+        Args:
+            duration (float): Seconds to run, 0 to run until interrupted
+            log_interval (float): Seconds between statistics logs
+        """
+        self.start()
+        start_time = time.monotonic()
+        next_log = start_time + log_interval
+        try:
+            while not duration or time.monotonic() - start_time < duration:
+                time.sleep(0.1)
+                if time.monotonic() >= next_log:
+                    next_log += log_interval
+                    print(f"[isaac-zmq-server] Stream proxy: {self.stats()}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PUB/SUB proxy of the Isaac Sim ZMQ camera streams")
+    parser.add_argument("--frontend_port", type=int, default=5561, help="Port the clients publish to")
+    parser.add_argument("--backend_port", type=int, default=5562, help="Port the consumers subscribe on")
+    parser.add_argument("--hwm", type=int, default=16, help="High water mark in messages, per subscriber")
+    parser.add_argument("--duration", type=float, default=0, help="Seconds to run, 0 to run until Ctrl+C")
+    args = parser.parse_args()
+
+    StreamProxy(args.frontend_port, args.backend_port, args.hwm).run(args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""
+Record ClientStreamMessage traffic to disk and replay it, to test and benchmark perception code
+against recorded Isaac Sim sessions without running the simulator.
+
+A recording is a directory:
+    meta.json          format version and recording info
+    index.bin          one INDEX_DTYPE record per message (memory-mappable)
+    chunk_00000.bin    message records, appended until the chunk reaches chunk_size, then chunk_00001.bin...
+
+A message record is the raw ZMQ frames of one (multipart) message:
+    uint32 number of frames, uint64 size of each frame, then the frame bytes back to back.
+
+Record (from a running client, the server side binds like example.py does):
+    python -m isaac_zmq_server.recording record --port 5561 --path session_01
+Replay to a server, at the original rate, N times faster (--speed N) or as fast as possible (--speed 0):
+    python -m isaac_zmq_server.recording replay --port 5561 --path session_01 --speed 2
+"""
+
+import argparse
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+import zmq
+
+import client_stream_message_pb2
+
+from .server import ZMQServer
+
+FORMAT_VERSION = 1
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("chunk", "<u4"),  # Chunk file number
+        ("offset", "<u8"),  # Offset of the message record in the chunk
+        ("size", "<u8"),  # Size of the message record
+        ("num_frames", "<u4"),  # Number of ZMQ frames of the message
+        ("recv_time", "<f8"),  # When the message was received, monotonic seconds
+        ("sim_time", "<f8"),  # Clock.sim_time of the message
+        ("frame_id", "<u8"),  # FrameTrace.frame_id of the message
+    ]
+)
+
+_NUM_FRAMES = struct.Struct("<I")
+
+
+def _chunk_path(path: str, chunk: int) -> str:
+    return os.path.join(path, f"chunk_{chunk:05d}.bin")
+
+
+class StreamRecorder:
+    """
+    Appends received raw ZMQ messages, with their receive time, to a chunked on-disk log (see module docstring).
+
+    write() takes the message as the ZMQServer callbacks get it (bytes, or a list of frames),
+    so a recorder can be subscribed directly, or chained in front of another callback with tee().
+    The log can be read with StreamLog while it is being recorded, up to the last flush().
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1 << 30, parse_header: bool = True, flush_interval: float = 1.0):
+        """
+        Args:
+            path (str): Recording directory, created if missing. An existing recording is overwritten
+            chunk_size (int): Size in bytes after which a new chunk file is started
+            parse_header (bool): Parse the protobuf header (frame 0) to index sim_time and frame_id
+            flush_interval (float): Seconds between flushes of the files, 0 to flush only on close
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.parse_header = parse_header
+        self.flush_interval = flush_interval
+        self.count = 0
+        self.bytes_written = 0
+
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("chunk_") or name in ("index.bin", "meta.json"):
+                os.remove(os.path.join(path, name))
+
+        self._lock = threading.Lock()
+        self._chunk = 0
+        self._chunk_file = open(_chunk_path(path, 0), "wb")
+        self._chunk_offset = 0
+        self._index_file = open(os.path.join(path, "index.bin"), "wb")
+        self._index_record = np.zeros(1, dtype=INDEX_DTYPE)
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+        self._meta = {
+            "format_version": FORMAT_VERSION,
+            "index_dtype": INDEX_DTYPE.descr,
+            "start_wall_time": time.time(),
+            "start_recv_time": time.monotonic(),
+            "chunk_size": chunk_size,
+            "count": 0,
+        }
+        self._write_meta()
+
+    def write(self, message, recv_time: float = None) -> None:
+        """
+        Append one message to the log.
+
+        Args:
+            message: Serialized message (bytes) or a list of frames (bytes, memoryview or zmq.Frame)
+            recv_time (float): When the message was received, monotonic seconds, now if None
+        """
+        if recv_time is None:
+            recv_time = time.monotonic()
+        frames = message if isinstance(message, (list, tuple)) else [message]
+        frames = [frame.buffer if isinstance(frame, zmq.Frame) else frame for frame in frames]
+        sizes = [memoryview(frame).nbytes for frame in frames]
+
+        sim_time = 0.0
+        frame_id = 0
+        if self.parse_header:
+            try:
+                header = client_stream_message_pb2.ClientStreamMessage.FromString(frames[0])
+                sim_time = header.clock.sim_time
+                frame_id = header.trace.frame_id
+            except Exception:
+                pass
+
+        record_header = _NUM_FRAMES.pack(len(frames)) + np.asarray(sizes, dtype="<u8").tobytes()
+        record_size = len(record_header) + sum(sizes)
+
+        with self._lock:
+            if self._closed:
+                return
+            if self._chunk_offset and self._chunk_offset + record_size > self.chunk_size:
+                self._chunk_file.close()
+                self._chunk += 1
+                self._chunk_file = open(_chunk_path(self.path, self._chunk), "wb")
+                self._chunk_offset = 0
+
+            self._chunk_file.write(record_header)
+            for frame in frames:
+                self._chunk_file.write(frame)
+
+            record = self._index_record[0]
+            record["chunk"] = self._chunk
+            record["offset"] = self._chunk_offset
+            record["size"] = record_size
+            record["num_frames"] = len(frames)
+            record["recv_time"] = recv_time
+            record["sim_time"] = sim_time
+            record["frame_id"] = frame_id
+            self._index_file.write(self._index_record.tobytes())
+
+            self._chunk_offset += record_size
+            self.count += 1
+            self.bytes_written += record_size
+
+            if self.flush_interval and recv_time - self._last_flush > self.flush_interval:
+                self._flush()
+
+    def tee(self, fn: callable) -> callable:
+        """
+        Wrap a ZMQServer callback to record each message before passing it on.
+
+        With with_recv_time (see ZMQServer.subscribe_to_socket_in_loop) the receive time is recorded
+        and passed on to fn as well.
+
+        Args:
+            fn (callable): The callback to chain
+
+        Returns:
+            callable: Callback recording then calling fn
+        """
+
+        def record_and_call(message, *recv_time):
+            self.write(message, *recv_time)
+            fn(message, *recv_time)
+
+        return record_and_call
+
+    def flush(self) -> None:
+        """
+        Flush the chunk and index files, making the recorded messages visible to readers.
+        """
+        with self._lock:
+            if not self._closed:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Flush the files and update meta.json. Requires the lock."""
+        self._chunk_file.flush()
+        self._index_file.flush()
+        self._meta["count"] = self.count
+        self._write_meta()
+        self._last_flush = time.monotonic()
+
+    def _write_meta(self) -> None:
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(self._meta, f, indent=2)
+
+    def close(self) -> None:
+        """
+        Flush and close the log files.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            self._chunk_file.close()
+            self._index_file.close()
+
+
+class StreamLog:
+    """
+    Random access to a recording made by StreamRecorder, through memory maps.
+
+    Messages are returned as lists of memoryviews into the mapped chunk files (no copy),
+    in the format the ZMQServer callbacks get them, e.g. for proto_util.unpack_client_stream.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Recording directory
+        """
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        if self.meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording format version: {self.meta.get('format_version')}")
+
+        index_path = os.path.join(path, "index.bin")
+        num_records = os.path.getsize(index_path) // INDEX_DTYPE.itemsize
+        if num_records:
+            self.index = np.memmap(index_path, dtype=INDEX_DTYPE, mode="r", shape=(num_records,))
+        else:
+            self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        self._chunks = {}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, number: int) -> list:
+        return self.read(number)
+
+    def __iter__(self):
+        for number in range(len(self)):
+            yield self.read(number)
+
+    def read(self, number: int) -> list:
+        """
+        Read a message by its number in the recording.
+
+        Args:
+            number (int): Message number, negative numbers count from the end
+
+        Returns:
+            list: memoryview of each frame of the message
+        """
+        record = self.index[number]
+        chunk = self._chunk(int(record["chunk"]))
+        offset = int(record["offset"])
+        num_frames = int(record["num_frames"])
+
+        sizes_offset = offset + _NUM_FRAMES.size
+        sizes = np.frombuffer(chunk, dtype="<u8", count=num_frames, offset=sizes_offset).tolist()
+
+        frames = []
+        position = sizes_offset + 8 * num_frames
+        for size in sizes:
+            frames.append(memoryview(chunk[position : position + size]))
+            position += size
+        return frames
+
+    def find_sim_time(self, sim_time: float) -> int:
+        """
+        Find the first message at or after a simulation time (messages are recorded in sim_time order).
+
+        Args:
+            sim_time (float): Simulation time
+
+        Returns:
+            int: Message number, len(self) if every message is earlier
+        """
+        return int(np.searchsorted(self.index["sim_time"], sim_time, side="left"))
+
+    def find_frame_id(self, frame_id: int) -> int:
+        """
+        Find a message by its FrameTrace.frame_id.
+
+        Args:
+            frame_id (int): Frame id
+
+        Returns:
+            int: Message number, -1 if not recorded
+        """
+        matches = np.flatnonzero(self.index["frame_id"] == frame_id)
+        return int(matches[0]) if len(matches) else -1
+
+    def _chunk(self, chunk: int) -> np.memmap:
+        """Map a chunk file, once."""
+        if chunk not in self._chunks:
+            self._chunks[chunk] = np.memmap(_chunk_path(self.path, chunk), dtype=np.uint8, mode="r")
+        return self._chunks[chunk]
+
+    def close(self) -> None:
+        """
+        Release the memory maps. Messages read before must not be used anymore.
+        """
+        self._chunks.clear()
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+
+
+class StreamReplayer:
+    """
+    Re-publishes a recording through a PUSH socket, like the Isaac Sim client does,
+    at the original rate, N times faster or as fast as possible.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Recording directory
+        """
+        self.log = StreamLog(path)
+        self.sent = 0
+        self.dropped = 0
+
+    def replay(
+        self,
+        port: int,
+        server_ip: str = "localhost",
+        speed: float = 1.0,
+        start: int = 0,
+        end: int = None,
+        loop: bool = False,
+        drop: bool = False,
+        stop_event: threading.Event = None,
+    ) -> dict:
+        """
+        Replay the recording to a server. Blocks until done (or stop_event is set).
+
+        Messages are sent at their recorded receive times, scaled by speed, on absolute
+        deadlines so the rate does not drift.
+
+        Args:
+            port (int): Server port
+            server_ip (str): Server address
+            speed (float): Playback speed, 1 for the original rate, 0 for as fast as possible
+            start (int): First message number
+            end (int): Message number to stop at (excluded), the end of the recording if None
+            loop (bool): Restart from start when reaching end, until stop_event is set
+            drop (bool): Drop messages the server is not ready for (HWM 1, like the client), instead of waiting
+            stop_event (threading.Event): Set to stop replaying
+
+        Returns:
+            dict: Number of messages sent and dropped, and the replay duration in seconds
+        """
+        end = len(self.log) if end is None else min(end, len(self.log))
+        recv_times = np.asarray(self.log.index["recv_time"])
+        stop_event = stop_event or threading.Event()
+
+        context = zmq.Context()
+        sock = context.socket(zmq.PUSH)
+        if drop:
+            sock.set_hwm(1)
+        sock.setsockopt(zmq.LINGER, 0 if drop else -1)
+        sock.connect(f"tcp://{server_ip}:{port}")
+        flags = zmq.NOBLOCK if drop else 0
+
+        replay_start = time.monotonic()
+        try:
+            while not stop_event.is_set() and start < end:
+                pass_start = time.monotonic()
+                for number in range(start, end):
+                    if stop_event.is_set():
+                        break
+                    if speed > 0:
+                        deadline = pass_start + (recv_times[number] - recv_times[start]) / speed
+                        delay = deadline - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                    try:
+                        sock.send_multipart(self.log.read(number), flags=flags, copy=False)
+                        self.sent += 1
+                    except zmq.Again:
+                        self.dropped += 1
+                if not loop:
+                    break
+        finally:
+            sock.close()
+            context.term()
+
+        return {"sent": self.sent, "dropped": self.dropped, "duration": time.monotonic() - replay_start}
+
+
+def record(path: str, port: int, duration: float = 0, chunk_size: int = 1 << 30) -> StreamRecorder:
+    """
+    Record the messages received on a port with the ZMQServer until the duration elapsed or Ctrl+C.
+
+    Args:
+        path (str): Recording directory
+        port (int): Port to receive messages on
+        duration (float): Seconds to record, 0 to record until interrupted
+        chunk_size (int): Size in bytes after which a new chunk file is started
+
+    Returns:
+        StreamRecorder: The closed recorder
+    """
+    recorder = StreamRecorder(path, chunk_size=chunk_size)
+    zmq_server = ZMQServer()
+    zmq_server.subscribe_to_socket_in_loop("recorder", port, recorder.write, multipart=True, with_recv_time=True)
+
+    start_time = time.monotonic()
+    try:
+        while not duration or time.monotonic() - start_time < duration:
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        zmq_server.cleanup()
+        recorder.close()
+    return recorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay Isaac Sim ZMQ streams")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record the messages received on a port")
+    record_parser.add_argument("--path", required=True, help="Recording directory")
+    record_parser.add_argument("--port", type=int, default=5561, help="Port to receive messages on")
+    record_parser.add_argument("--duration", type=float, default=0, help="Seconds to record, 0 until Ctrl+C")
+    record_parser.add_argument("--chunk_size_mb", type=int, default=1024, help="Chunk file size (MB)")
+
+    replay_parser = subparsers.add_parser("replay", help="Replay a recording to a server")
+    replay_parser.add_argument("--path", required=True, help="Recording directory")
+    replay_parser.add_argument("--port", type=int, default=5561, help="Server port")
+    replay_parser.add_argument("--server_ip", default="localhost", help="Server address")
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="Playback speed, 0 for as fast as possible")
+    replay_parser.add_argument("--start_sim_time", type=float, default=0, help="Start at this simulation time")
+    replay_parser.add_argument("--loop", action="store_true", help="Replay in a loop until Ctrl+C")
+    replay_parser.add_argument("--drop", action="store_true", help="Drop messages the server is not ready for")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        recorder = record(args.path, args.port, args.duration, args.chunk_size_mb << 20)
+        print(f"[isaac-zmq-server] Recorded {recorder.count} messages ({recorder.bytes_written / 2**20:.1f} MB) to {args.path}")
+    else:
+        replayer = StreamReplayer(args.path)
+        start = replayer.log.find_sim_time(args.start_sim_time) if args.start_sim_time else 0
+        try:
+            result = replayer.replay(
+                args.port, args.server_ip, args.speed, start=start, loop=args.loop, drop=args.drop
+            )
+        except KeyboardInterrupt:
+            result = {"sent": replayer.sent, "dropped": replayer.dropped}
+        print(f"[isaac-zmq-server] Replayed {args.path}: {result}")
+
+
+if __name__ == "__main__":
+    main()
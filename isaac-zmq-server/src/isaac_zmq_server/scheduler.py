@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import collections
+import heapq
+import threading
+import time
+import traceback
+
+# Policies for a job that fell behind its deadlines
+POLICY_SKIP = "skip"  # Run once, then resume at the next deadline in the future (missed ticks are dropped)
+POLICY_CATCH_UP = "catch_up"  # Run the missed ticks back to back (up to max_catch_up), keeping the tick count
+
+
+class JitterStats:
+    """
+    Lateness statistics of a scheduled job (actual start time - deadline, in seconds).
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window (int): Number of recent samples kept for the percentiles
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = collections.deque(maxlen=window)
+
+    def add(self, lateness: float) -> None:
+        self.count += 1
+        self.total += lateness
+        self.max = max(self.max, lateness)
+        self.recent.append(lateness)
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: mean / max / p50 / p99 lateness in milliseconds
+        """
+        if not self.count:
+            return {"mean_ms": 0.0, "max_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0}
+        recent = sorted(self.recent)
+        return {
+            "mean_ms": self.total / self.count * 1e3,
+            "max_ms": self.max * 1e3,
+            "p50_ms": recent[len(recent) // 2] * 1e3,
+            "p99_ms": recent[min(int(len(recent) * 0.99), len(recent) - 1)] * 1e3,
+        }
+
+
+class ScheduledJob:
+    """A periodic job of the DeadlineScheduler."""
+
+    def __init__(self, name: str, rate_hz: float, fn: callable, policy: str, max_catch_up: int):
+        self.name = name
+        self.period = 1 / rate_hz
+        self.fn = fn
+        self.policy = policy
+        self.max_catch_up = max_catch_up
+        self.deadline = 0.0
+        self.start_time = 0.0
+
+        # Counters
+        self.runs = 0
+        self.missed = 0
+        self.errors = 0
+        self.jitter = JitterStats()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Run, missed and error counters, effective rate and lateness statistics.
+        """
+        elapsed = time.monotonic() - self.start_time
+        return {
+            "runs": self.runs,
+            "missed": self.missed,
+            "errors": self.errors,
+            "rate_hz": self.runs / elapsed if elapsed > 0 else 0.0,
+            **self.jitter.summary(),
+        }
+
+
+class DeadlineScheduler:
+    """
+    Runs periodic jobs against absolute monotonic deadlines, all in a single thread (or asyncio task).
+
+    Each job is due at start + n * period, so the rate does not drift with the cost of the job.
+    A job that falls behind (slow callback, descheduled thread) follows its policy:
+    POLICY_SKIP drops the missed ticks, POLICY_CATCH_UP runs them back to back, at most max_catch_up
+    of them, before dropping the rest. Missed ticks and the lateness of every run are recorded.
+
+    Jobs should not block (e.g. send with zmq.NOBLOCK), a blocking job delays every other job.
+    """
+
+    def __init__(self, policy: str = POLICY_SKIP, max_catch_up: int = 3):
+        """
+        Initialize the scheduler.
+
+        Args:
+            policy (str): Default policy of the jobs, POLICY_SKIP or POLICY_CATCH_UP
+            max_catch_up (int): Maximum number of missed ticks run back to back with POLICY_CATCH_UP
+        """
+        self.policy = policy
+        self.max_catch_up = max_catch_up
+        self.jobs = {}
+
+        self._lock = threading.Lock()
+        self._heap = []
+        self._sequence = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def add_job(self, name: str, rate_hz: float, fn: callable, policy: str = None) -> ScheduledJob:
+        """
+        Add a periodic job, first run as soon as possible.
+
+        Args:
+            name (str): The name of the job.
+            rate_hz (float): The rate at which the job runs in Hz.
+            fn (callable): Function called on each tick.
+            policy (str): POLICY_SKIP or POLICY_CATCH_UP, defaults to the scheduler policy.
+
+        Returns:
+            ScheduledJob: The job, for its statistics.
+        """
+        policy = policy or self.policy
+        if policy not in (POLICY_SKIP, POLICY_CATCH_UP):
+            raise ValueError(f"Unknown scheduling policy: {policy}")
+
+        job = ScheduledJob(name, rate_hz, fn, policy, self.max_catch_up)
+        job.start_time = job.deadline = time.monotonic()
+        with self._lock:
+            self.jobs[name] = job
+            self._push(job)
+        self._wake_event.set()
+        return job
+
+    def _push(self, job: ScheduledJob) -> None:
+        """Queue a job at its deadline. Requires the lock."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (job.deadline, self._sequence, job))
+
+    def run_due(self) -> float:
+        """
+        Run every job that is due, and schedule their next deadline.
+
+        Returns:
+            float: Seconds until the next deadline, None if there are no jobs
+        """
+        while True:
+            with self._lock:
+                if not self._heap:
+                    return None
+                deadline, _, job = self._heap[0]
+                now = time.monotonic()
+                if deadline > now:
+                    return deadline - now
+                heapq.heappop(self._heap)
+
+            job.jitter.add(now - deadline)
+            try:
+                job.fn()
+            except Exception:
+                job.errors += 1
+                print(f"[isaac-zmq-server] Scheduled job {job.name} failed:")
+                print(traceback.format_exc())
+            job.runs += 1
+
+            # Next deadline, relative to the previous one (not to now) so the rate does not drift
+            job.deadline = deadline + job.period
+            now = time.monotonic()
+            behind = int((now - job.deadline) / job.period)
+            if behind > 0:
+                keep = job.max_catch_up if job.policy == POLICY_CATCH_UP else 0
+                if behind > keep:
+                    job.deadline += (behind - keep) * job.period
+                    job.missed += behind - keep
+
+            with self._lock:
+                self._push(job)
+
+    def start(self) -> None:
+        """Start the scheduler thread, if not already running."""
+        if self._thread:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="isaac-zmq-server-scheduler")
+        self._thread.start()
+
+    def _loop(self) -> None:
+        """Thread function that sleeps until the next deadline and runs the due jobs."""
+        while not self._stop_event.is_set():
+            delay = self.run_due()
+            # Sleep until the next deadline, woken early by new jobs or stop()
+            self._wake_event.wait(delay)
+            self._wake_event.clear()
+
+    async def run_async(self) -> None:
+        """Run the scheduler as an asyncio task, until cancelled."""
+        while True:
+            delay = self.run_due()
+            await asyncio.sleep(delay if delay is not None else 0.1)
+
+    def stop(self) -> None:
+        """Stop the scheduler thread and wait for it to finish."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Statistics of each job, by name.
+        """
+        return {name: job.stats() for name, job in self.jobs.items()}
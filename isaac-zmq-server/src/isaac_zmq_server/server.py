@@ -7,6 +7,11 @@ import traceback
 
 import zmq
 
+from .frame_buffer import FrameRingBuffer
+from .pipeline import ProcessPipeline
+from .proto_util import topic_prefix
+from .scheduler import DeadlineScheduler
+
 
 class ZMQServer:
     """
@@ -33,8 +38,13 @@ class ZMQServer:
 
         self.push_sockets = {}
         self.pull_sockets = {}
+        self.sub_sockets = {}
         self.reciveing_threads = {}
-        self.sending_threads = {}
+        self.scheduler = DeadlineScheduler()
+        self.publish_dropped = {}
+        self.frame_buffers = {}
+        self.demux_unknown = {}
+        self.pipelines = []
 
         # ZMQ context
         self._context = None
@@ -51,19 +61,20 @@ class ZMQServer:
             self._context = zmq.Context()
         return self._context
 
-    def get_pull_socket(self, port: int) -> zmq.Socket:
+    def get_pull_socket(self, port: int, hwm: int = 1) -> zmq.Socket:
         """
         Creates and returns a new pull socket that is bound to the specified port.
 
         Args:
             port (int): The port number to bind the socket to.
+            hwm (int): High water mark, the number of messages buffered.
 
         Returns:
             zmq.Socket: The newly created pull socket.
         """
         addr = f"tcp://*:{port}"
         sock = self.context().socket(zmq.PULL)
-        sock.set_hwm(1)  # High water mark: only buffer 1 message
+        sock.set_hwm(hwm)  # High water mark: only buffer hwm messages
         sock.bind(addr)
         sock.setsockopt(zmq.RCVTIMEO, 1000)  # 1 second timeout for receiving
         poller = zmq.Poller()
@@ -71,6 +82,31 @@ class ZMQServer:
         self.pull_sockets[port] = sock
         return sock
 
+    def get_sub_socket(self, name: str, endpoint: str, topics: list, conflate: bool = False) -> zmq.Socket:
+        """
+        Creates and returns a SUB socket connected to a PUB/SUB stream, subscribed to the given topics.
+
+        Args:
+            name (str): Name of the subscription, the socket is kept in `sub_sockets[name]`.
+            endpoint (str): The endpoint to connect to, e.g. "tcp://localhost:5562".
+            topics (list): Topics (ClientStreamMessage.topic) to subscribe to, [""] for all messages.
+            conflate (bool): Keep only the latest message (ZMQ_CONFLATE, single frame messages only).
+
+        Returns:
+            zmq.Socket: The newly created SUB socket.
+        """
+        sock = self.context().socket(zmq.SUB)
+        if conflate:
+            sock.setsockopt(zmq.CONFLATE, 1)  # Must be set before connecting
+        else:
+            sock.set_hwm(1)  # High water mark: only buffer 1 message
+        for topic in topics:
+            sock.setsockopt(zmq.SUBSCRIBE, topic_prefix(topic) if topic else b"")
+        sock.connect(endpoint)
+        sock.setsockopt(zmq.RCVTIMEO, 1000)  # 1 second timeout for receiving
+        self.sub_sockets[name] = sock
+        return sock
+
     def get_push_socket(self, port: int) -> zmq.Socket:
         """
         Creates and returns a ZeroMQ PUSH socket bound to the specified port.
@@ -88,28 +124,342 @@ class ZMQServer:
         self.push_sockets[port] = sock
         return sock
 
-    def subscribe_to_socket_in_loop(self, name: str, port: int, fn: callable) -> None:
+    def subscribe_to_socket_in_loop(
+        self,
+        name: str,
+        port: int,
+        fn: callable,
+        multipart: bool = False,
+        buffer_slots: int = 0,
+        buffer_mode: str = "latest",
+        with_recv_time: bool = False,
+    ) -> None:
         """
         Receives messages from a socket in a loop and calls a given function for each message.
 
         This method creates a new thread that continuously receives messages from the specified
         port and passes them to the provided callback function.
 
+        In multipart mode the message frames are received without copying and the callback gets
+        a list of memoryviews (one per frame), which can be wrapped directly with np.frombuffer.
+        Single frame messages are received as a list of one memoryview in this mode.
+
+        With buffer_slots > 0, the receiving thread copies messages into a FrameRingBuffer
+        (available in `frame_buffers[name]`) and the callback runs on a separate consumer thread,
+        so slow processing does not stall the socket. The consumer gets the latest frame
+        (skipping frames that arrived while it was busy) or the next frame in order, see buffer_mode.
+        The memoryviews passed to the callback are only valid during the call.
+        With fn=None no consumer thread is started, consumers read from the buffer directly.
+
+        With with_recv_time the callback is called as fn(message, recv_time), recv_time being when the last
+        frame of the message was received from the socket (time.monotonic()), before any wait in the buffer.
+
         Args:
             name (str): The name of the receiving thread.
             port (int): The port number to receive messages from.
             fn (callable): A callable function that takes a message as input.
+            multipart (bool): Whether to receive all message frames as zero-copy memoryviews.
+            buffer_slots (int): Number of ring buffer slots, 0 to call fn on the receiving thread.
+            buffer_mode (str): "latest" or "next", how the consumer thread takes frames from the buffer.
+            with_recv_time (bool): Whether to also pass the receive time of the message to fn.
         """
+        if buffer_mode not in ("latest", "next"):
+            raise ValueError(f"Unknown buffer mode: {buffer_mode}")
+
         # Create socket for receiving
         sock = self.get_pull_socket(port)
+        self._receive_in_loop(
+            name,
+            sock,
+            fn,
+            multipart,
+            buffer_slots,
+            buffer_mode,
+            with_recv_time,
+            lambda: self.pull_sockets.pop(port, None),
+        )
+
+    def subscribe_to_topic_in_loop(
+        self,
+        name: str,
+        endpoint: str,
+        topic: str,
+        fn: callable,
+        multipart: bool = False,
+        buffer_slots: int = 0,
+        buffer_mode: str = "latest",
+        conflate: bool = False,
+        with_recv_time: bool = False,
+    ) -> None:
+        """
+        Subscribes to one topic of a PUB/SUB stream and calls a given function for each message.
+
+        In PUB/SUB mode the clients publish each camera under a topic (ClientStreamMessage.topic),
+        usually through a StreamProxy so any number of consumers (GUI, recorder, perception...)
+        receive the same stream. Messages are passed to fn like with subscribe_to_socket_in_loop(),
+        the topic is part of the protobuf header and does not need to be stripped.
+
+        With conflate the socket only keeps the latest message (ZMQ_CONFLATE), for consumers that
+        only care about the latest frame. ZMQ does not conflate multipart messages, so this requires
+        the publisher to send single frame messages (images inline), otherwise use a ring buffer
+        in "latest" mode (buffer_slots > 0) for the same effect.
+
+        Args:
+            name (str): The name of the receiving thread.
+            endpoint (str): The endpoint to connect to, e.g. the StreamProxy backend "tcp://localhost:5562".
+            topic (str): Topic to subscribe to, the camera name of the stream.
+            fn (callable): A callable function that takes a message as input.
+            multipart (bool): Whether to receive all message frames as zero-copy memoryviews.
+            buffer_slots (int): Number of ring buffer slots, 0 to call fn on the receiving thread.
+            buffer_mode (str): "latest" or "next", how the consumer thread takes frames from the buffer.
+            conflate (bool): Keep only the latest message in the socket (single frame messages only).
+            with_recv_time (bool): Whether to also pass the receive time of the message to fn,
+                see subscribe_to_socket_in_loop().
+        """
+        if buffer_mode not in ("latest", "next"):
+            raise ValueError(f"Unknown buffer mode: {buffer_mode}")
+
+        sock = self.get_sub_socket(name, endpoint, [topic], conflate=conflate)
+        self._receive_in_loop(
+            name,
+            sock,
+            fn,
+            multipart,
+            buffer_slots,
+            buffer_mode,
+            with_recv_time,
+            lambda: self.sub_sockets.pop(name, None),
+        )
+
+    def _receive_in_loop(
+        self,
+        name: str,
+        sock: zmq.Socket,
+        fn: callable,
+        multipart: bool,
+        buffer_slots: int,
+        buffer_mode: str,
+        with_recv_time: bool,
+        on_close: callable,
+    ) -> None:
+        """
+        Receives messages from a socket on a new thread and calls fn for each message, then closes the socket
+        and calls on_close once stopped. See subscribe_to_socket_in_loop().
+        """
+        if buffer_slots:
+            self._receive_in_loop_buffered(
+                name, sock, fn, multipart, buffer_slots, buffer_mode, with_recv_time, on_close
+            )
+            return
+
         stop_event = threading.Event()
 
         def loop():
             """Thread function that continuously receives messages."""
             while not stop_event.is_set():
                 try:
-                    msg = sock.recv()
+                    if multipart:
+                        frames = sock.recv_multipart(copy=False)
+                        msg = [frame.buffer for frame in frames]
+                    else:
+                        msg = sock.recv()
+                    if with_recv_time:
+                        fn(msg, time.monotonic())
+                    else:
+                        fn(msg)
+                except zmq.Again:
+                    continue
+                except:
+                    print("[isaac-zmq-server] Unable to unpack from socket...")
+                    print(traceback.format_exc())
+                    continue
+
+            # Clean up when thread is finsihed
+            sock.close()
+            on_close()
+
+        # Start the thread
+        worker = threading.Thread(target=loop)
+        self.reciveing_threads[name] = (worker, stop_event)
+        worker.start()
+
+    def _receive_in_loop_buffered(
+        self,
+        name: str,
+        sock: zmq.Socket,
+        fn: callable,
+        multipart: bool,
+        buffer_slots: int,
+        buffer_mode: str,
+        with_recv_time: bool,
+        on_close: callable,
+    ) -> None:
+        """
+        Receives messages into a FrameRingBuffer and consumes them on a separate thread.
+        See subscribe_to_socket_in_loop().
+        """
+        stop_event = threading.Event()
+        frame_buffer = FrameRingBuffer(buffer_slots)
+        self.frame_buffers[name] = frame_buffer
+
+        def receive_loop():
+            """Thread function that continuously receives messages into the buffer."""
+            while not stop_event.is_set():
+                try:
+                    frame_buffer.recv_from(sock)
+                except zmq.Again:
+                    continue
+                except:
+                    print("[isaac-zmq-server] Unable to receive from socket...")
+                    print(traceback.format_exc())
+                    continue
+
+            # Clean up when thread is finsihed
+            sock.close()
+            on_close()
+
+        # Start the threads
+        worker = threading.Thread(target=receive_loop)
+        self.reciveing_threads[name] = (worker, stop_event)
+        worker.start()
+
+        if fn is not None:
+            self._start_consumer(
+                f"{name}_consumer", frame_buffer, fn, multipart, buffer_mode, with_recv_time, stop_event
+            )
+
+    def _start_consumer(
+        self,
+        name: str,
+        frame_buffer: FrameRingBuffer,
+        fn: callable,
+        multipart: bool,
+        buffer_mode: str,
+        with_recv_time: bool,
+        stop_event: threading.Event,
+    ) -> None:
+        """
+        Starts a thread that takes frames from a FrameRingBuffer and calls fn with them.
+        See subscribe_to_socket_in_loop().
+        """
+
+        def consume_loop():
+            """Thread function that takes frames from the buffer and calls fn."""
+            take = frame_buffer.latest if buffer_mode == "latest" else frame_buffer.next
+            while not stop_event.is_set():
+                slot = take(timeout=1.0)
+                if slot is None:
+                    continue
+                try:
+                    msg = slot.frames if multipart else slot.frames[0]
+                    if with_recv_time:
+                        fn(msg, slot.recv_time)
+                    else:
+                        fn(msg)
+                except:
+                    print("[isaac-zmq-server] Unable to unpack from socket...")
+                    print(traceback.format_exc())
+                finally:
+                    frame_buffer.release(slot)
+
+        consumer = threading.Thread(target=consume_loop)
+        self.reciveing_threads[name] = (consumer, stop_event)
+        consumer.start()
+
+    def subscribe_to_multiplexed_socket_in_loop(
+        self,
+        name: str,
+        port: int,
+        handlers: dict,
+        multipart: bool = False,
+        buffer_slots: int = 0,
+        buffer_mode: str = "latest",
+        with_recv_time: bool = False,
+    ) -> None:
+        """
+        Receives the messages of several cameras multiplexed on one socket and demultiplexes them
+        to a function per camera.
+
+        In multiplexed mode the client prefixes every message with a routing frame holding the
+        camera id (utf-8), followed by the usual message frames. The routing frame is stripped,
+        the handler of the camera gets the remaining frames exactly like with subscribe_to_socket_in_loop().
+        Messages of cameras without a handler are dropped and counted in `demux_unknown[name]`.
+
+        All cameras share one socket, connection and receiving thread. With buffer_slots > 0 each
+        camera gets its own FrameRingBuffer (in `frame_buffers["<name>/<camera_id>"]`) and consumer
+        thread, so a slow camera handler neither stalls the socket nor drops the frames of the other cameras.
+
+        Args:
+            name (str): The name of the receiving thread.
+            port (int): The port number to receive messages from.
+            handlers (dict): Camera id (str) -> callable function that takes a message as input.
+            multipart (bool): Whether to pass all message frames (after the routing frame) as memoryviews.
+            buffer_slots (int): Number of ring buffer slots per camera, 0 to call the handlers on the receiving thread.
+            buffer_mode (str): "latest" or "next", how the consumer threads take frames from the buffers.
+            with_recv_time (bool): Whether to also pass the receive time of the message to the handlers,
+                see subscribe_to_socket_in_loop().
+        """
+        if buffer_mode not in ("latest", "next"):
+            raise ValueError(f"Unknown buffer mode: {buffer_mode}")
+
+        # One message in flight per camera, so the cameras do not drop each others frames
+        sock = self.get_pull_socket(port, hwm=max(1, len(handlers)))
+        stop_event = threading.Event()
+        routes = {camera_id.encode(): fn for camera_id, fn in handlers.items()}
+        self.demux_unknown[name] = 0
+
+        frame_buffers = {}
+        if buffer_slots:
+            for camera_id, fn in handlers.items():
+                frame_buffer = FrameRingBuffer(buffer_slots)
+                self.frame_buffers[f"{name}/{camera_id}"] = frame_buffer
+                frame_buffers[camera_id.encode()] = frame_buffer
+                if fn is not None:
+                    self._start_consumer(
+                        f"{name}/{camera_id}_consumer",
+                        frame_buffer,
+                        fn,
+                        multipart,
+                        buffer_mode,
+                        with_recv_time,
+                        stop_event,
+                    )
+
+        def discard_message():
+            """Receive and drop the remaining frames of the current message."""
+            while sock.getsockopt(zmq.RCVMORE):
+                sock.recv(copy=False)
+
+        def receive():
+            """Receive one message and hand it to the handler or buffer of its camera."""
+            if not buffer_slots:
+                frames = sock.recv_multipart(copy=False)
+                recv_time = time.monotonic()
+                fn = routes.get(frames[0].bytes)
+                if fn is None or len(frames) < 2:
+                    self.demux_unknown[name] += 1
+                    return
+                msg = [frame.buffer for frame in frames[1:]] if multipart else frames[1].bytes
+                if with_recv_time:
+                    fn(msg, recv_time)
+                else:
                     fn(msg)
+                return
+
+            camera_id = sock.recv()
+            frame_buffer = frame_buffers.get(camera_id)
+            if frame_buffer is None or not sock.getsockopt(zmq.RCVMORE):
+                self.demux_unknown[name] += 1
+                discard_message()
+                return
+            # Continue with the frames after the routing frame
+            frame_buffer.recv_from(sock)
+
+        def loop():
+            """Thread function that continuously receives and demultiplexes messages."""
+            while not stop_event.is_set():
+                try:
+                    receive()
                 except zmq.Again:
                     continue
                 except:
@@ -126,53 +476,84 @@ class ZMQServer:
         self.reciveing_threads[name] = (worker, stop_event)
         worker.start()
 
-    def publish_protobuf_in_loop(self, name: str, port: int, rate_hz: float, fn: callable) -> None:
+    def subscribe_to_socket_in_pipeline(self, name: str, port: int, pipeline: ProcessPipeline) -> None:
         """
-        Sends protobuf messages from a socket in a loop at a specified rate.
+        Receives messages from a socket in a loop and fans them out to a ProcessPipeline.
 
-        This method creates a new thread that continuously sends protobuf messages at the specified
-        rate to the specified port. The protobuf message to send is obtained by calling the provided
-        callback function.
+        The message frames are received without copying and copied once into the pipeline shared memory.
+        Several sockets can share a pipeline, their results are then merged in order (see ProcessPipeline).
+        The pipeline is started if needed and stopped by cleanup().
 
         Args:
-            name (str): The name of the sending thread.
-            port (int): The port number to send data to.
-            rate_hz (float): The rate at which data is sent in Hz.
-            fn (callable): A callable function that returns a protobuf message.
+            name (str): The name of the receiving thread.
+            port (int): The port number to receive messages from.
+            pipeline (ProcessPipeline): The pipeline processing the messages.
         """
-        # Create socket for sending
-        sock = self.get_push_socket(port)
+        if pipeline not in self.pipelines:
+            pipeline.start()
+            self.pipelines.append(pipeline)
+
+        # Create socket for receiving
+        sock = self.get_pull_socket(port)
         stop_event = threading.Event()
 
         def loop():
-            """Thread function that continuously sends protobuf messages at the specified rate."""
+            """Thread function that continuously receives messages and submits them to the pipeline."""
             while not stop_event.is_set():
                 try:
-                    # Get the protobuf message from the callback function
-                    proto_msg = fn()
-                    # Serialize the protobuf message and send it
-                    sock.send(proto_msg.SerializeToString())
+                    frames = sock.recv_multipart(copy=False)
+                    pipeline.submit([frame.buffer for frame in frames])
                 except zmq.Again:
                     continue
-                except Exception as e:
-                    print(f"[isaac-zmq-server] Unable to send protobuf to socket: {e}")
+                except:
+                    print("[isaac-zmq-server] Unable to submit to pipeline...")
+                    print(traceback.format_exc())
                     continue
 
-                # Sleep to maintain the desired rate
-                time.sleep(1 / rate_hz)
-
-            # Clean up when thread is finished
+            # Clean up when thread is finsihed
             sock.close()
-            del self.push_sockets[port]
+            del self.pull_sockets[port]
 
-        # Start the sending thread
+        # Start the thread
         worker = threading.Thread(target=loop)
-        self.sending_threads[name] = (worker, stop_event)
+        self.reciveing_threads[name] = (worker, stop_event)
         worker.start()
 
+    def publish_protobuf_in_loop(self, name: str, port: int, rate_hz: float, fn: callable) -> None:
+        """
+        Sends protobuf messages from a socket in a loop at a specified rate.
+
+        All publishers run on a single DeadlineScheduler thread, against absolute deadlines, so the
+        rate does not drift with the cost of building and sending messages (see `scheduler.stats()`).
+        Messages are sent without blocking, a message that cannot be queued (no peer connected,
+        or the peer is not keeping up) is dropped and counted in `publish_dropped[name]`.
+
+        Args:
+            name (str): The name of the publisher.
+            port (int): The port number to send data to.
+            rate_hz (float): The rate at which data is sent in Hz.
+            fn (callable): A callable function that returns a protobuf message.
+        """
+        # Create socket for sending
+        sock = self.get_push_socket(port)
+        self.publish_dropped[name] = 0
+
+        def publish():
+            """Scheduled function that sends the protobuf message returned by fn."""
+            # Get the protobuf message from the callback function
+            proto_msg = fn()
+            try:
+                # Serialize the protobuf message and send it
+                sock.send(proto_msg.SerializeToString(), zmq.NOBLOCK)
+            except zmq.Again:
+                self.publish_dropped[name] += 1
+
+        self.scheduler.add_job(name, rate_hz, publish)
+        self.scheduler.start()
+
     def cleanup(self) -> None:
         """
-        Stops and joins all receiving and sending threads.
+        Stops and joins all receiving threads and the publishers scheduler.
 
         This function is used to clean up the threads when they are no longer needed.
         It sets the stop event for each thread and then joins them to ensure they have finished.
@@ -182,7 +563,13 @@ class ZMQServer:
             stop_event.set()
             worker.join()
 
-        # Stop and join all sending threads
-        for name, (worker, stop_event) in self.sending_threads.items():
-            stop_event.set()
-            worker.join()
+        # Stop the publishers and close their sockets
+        self.scheduler.stop()
+        for port, sock in self.push_sockets.items():
+            sock.close()
+        self.push_sockets = {}
+
+        # Stop the worker processes of all pipelines
+        for pipeline in self.pipelines:
+            pipeline.stop()
+        self.pipelines = []
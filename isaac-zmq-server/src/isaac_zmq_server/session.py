@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+# Delta metadata of the camera streams, shared by the Isaac Sim client (ZMQAnnotator) and the server.
+# This module is duplicated on both sides of the bridge, keep the copies identical.
+#
+# The label table and the camera intrinsics almost never change, and a static camera keeps its pose.
+# With delta metadata they are sent in ClientStreamMessage.session (label table, intrinsics, scale) and
+# Camera.view_matrix_ros (pose) only when they change, and on keyframes so that consumers joining late or
+# missing a message recover. Every message refers to the state it was built with (session_id,
+# session_version and Camera.pose_version), the SessionCache of the consumer puts it back in the message.
+
+import copy
+import random
+
+_NO_LABELS = object()
+
+
+class SessionEncoder:
+    """
+    Client side: tracks the metadata of one stream and sets the delta metadata fields of its messages.
+
+    Call update_labels() / update_camera() with the current metadata, then fill() on every message.
+    """
+
+    def __init__(self, keyframe_interval: int = 30):
+        """
+        Args:
+            keyframe_interval (int): Send the full metadata every keyframe_interval messages, 0 for only on change
+        """
+        self.keyframe_interval = keyframe_interval
+        # Random per client run, a restarted client does not reuse the cached state of the previous run
+        self.session_id = random.getrandbits(63) + 1
+        self.version = 1
+        self.pose_version = 0
+        self.id_to_labels = {}
+        self.intrinsics_matrix = []
+        self.camera_scale = []
+        self.view_matrix = []
+
+        self._labels_source = _NO_LABELS
+        self._session_sent = False
+        self._pose_sent = False
+        self._keyframe_pending = True
+        self._messages_since_keyframe = 0
+
+    def update_labels(self, labels_source, build_labels) -> None:
+        """
+        Update the label table, only rebuilt when its source changed.
+
+        Args:
+            labels_source: Cheap to compare source of the table, e.g. the idToLabels dict of the annotator
+            build_labels: Function returning the table (dict of str semantic id to str label) of labels_source
+        """
+        if labels_source == self._labels_source:
+            return
+        self._labels_source = copy.deepcopy(labels_source)
+        id_to_labels = build_labels()
+        if id_to_labels != self.id_to_labels:
+            self.id_to_labels = id_to_labels
+            self._new_version()
+
+    def update_camera(self, view_matrix: list, intrinsics_matrix: list, camera_scale: list) -> None:
+        """
+        Update the camera metadata.
+
+        Args:
+            view_matrix (list): Flattened 4x4 view matrix (Camera.view_matrix_ros)
+            intrinsics_matrix (list): Flattened 3x3 intrinsics matrix, empty if not available
+            camera_scale (list): Camera world scale (x, y, z)
+        """
+        if intrinsics_matrix != self.intrinsics_matrix or camera_scale != self.camera_scale:
+            self.intrinsics_matrix = intrinsics_matrix
+            self.camera_scale = camera_scale
+            self._new_version()
+        if view_matrix != self.view_matrix:
+            self.view_matrix = view_matrix
+            self.pose_version += 1
+            self._pose_sent = False
+
+    def request_keyframe(self) -> None:
+        """
+        Send the full metadata with the next message, e.g. after a message was dropped.
+        """
+        self._keyframe_pending = True
+
+    def fill(self, client_stream, camera: bool = True) -> bool:
+        """
+        Set the delta metadata fields of a ClientStreamMessage.
+
+        Args:
+            client_stream: ClientStreamMessage to fill
+            camera (bool): Whether the message carries the camera part (see StreamAnnotator)
+
+        Returns:
+            bool: True if the message is a keyframe
+        """
+        self._messages_since_keyframe += 1
+        keyframe = self._keyframe_pending or (
+            self.keyframe_interval > 0 and self._messages_since_keyframe >= self.keyframe_interval
+        )
+        if keyframe:
+            self._keyframe_pending = False
+            self._messages_since_keyframe = 0
+
+        client_stream.session_id = self.session_id
+        client_stream.session_version = self.version
+        if keyframe or not self._session_sent:
+            client_stream.session.version = self.version
+            client_stream.session.idToLabels.update(self.id_to_labels)
+            client_stream.session.intrinsics_matrix.extend(self.intrinsics_matrix)
+            client_stream.session.camera_scale.extend(self.camera_scale)
+            self._session_sent = True
+
+        if camera:
+            client_stream.camera.pose_version = self.pose_version
+            if keyframe or not self._pose_sent:
+                client_stream.camera.view_matrix_ros.extend(self.view_matrix)
+                self._pose_sent = True
+
+        return keyframe
+
+    def _new_version(self) -> None:
+        self.version += 1
+        self._session_sent = False
+
+
+class _StreamState:
+    """Latest session state and pose received on a stream."""
+
+    __slots__ = ("session_id", "session", "pose_version", "view_matrix")
+
+    def __init__(self, session_id: int):
+        self.session_id = session_id
+        self.session = None
+        self.pose_version = 0
+        self.view_matrix = None
+
+
+class SessionCache:
+    """
+    Consumer side: keeps the latest session state and pose of every stream, and reconstructs
+    the full metadata of the messages sent with delta metadata.
+
+    Messages without delta metadata (session_id 0) are left as is.
+    """
+
+    def __init__(self):
+        self._streams = {}
+        self.messages_incomplete = 0
+
+    def apply(self, name: str, client_stream) -> bool:
+        """
+        Put the cached label table, intrinsics, scale and pose back in a ClientStreamMessage (in place).
+
+        Args:
+            name (str): Name of the stream the message was received on
+            client_stream: Parsed ClientStreamMessage
+
+        Returns:
+            bool: False if the state the message refers to was not received yet (the metadata stays
+                incomplete until the next keyframe), True otherwise
+        """
+        if not client_stream.session_id:
+            return True
+
+        stream = self._streams.get(name)
+        if stream is None or stream.session_id != client_stream.session_id:
+            stream = _StreamState(client_stream.session_id)
+            self._streams[name] = stream
+
+        if client_stream.HasField("session"):
+            # Copied, a reference would keep the whole message (and its images) alive
+            stream.session = type(client_stream.session)()
+            stream.session.CopyFrom(client_stream.session)
+        has_camera = client_stream.HasField("camera")
+        camera = client_stream.camera
+        if has_camera and camera.view_matrix_ros:
+            stream.pose_version = camera.pose_version
+            stream.view_matrix = list(camera.view_matrix_ros)
+
+        complete = True
+        session = stream.session
+        if session is not None and session.version == client_stream.session_version:
+            if client_stream.HasField("bbox2d"):
+                client_stream.bbox2d.info.idToLabels.update(session.idToLabels)
+            if has_camera:
+                camera.intrinsics_matrix.extend(session.intrinsics_matrix)
+                camera.camera_scale.extend(session.camera_scale)
+        else:
+            complete = False
+
+        if has_camera and not camera.view_matrix_ros:
+            if stream.view_matrix is not None and stream.pose_version == camera.pose_version:
+                camera.view_matrix_ros.extend(stream.view_matrix)
+            else:
+                complete = False
+
+        if not complete:
+            self.messages_incomplete += 1
+        return complete
+
+    def reset(self, name: str = None) -> None:
+        """
+        Forget the cached state of a stream, or of every stream if name is None.
+
+        Args:
+            name (str): Name of the stream
+        """
+        if name is None:
+            self._streams.clear()
+        else:
+            self._streams.pop(name, None)
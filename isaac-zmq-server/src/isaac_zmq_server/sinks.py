@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import os
+import threading
+import time
+
+import numpy as np
+
+from .tracing import LatencyHistogram
+
+
+class Frame:
+    """
+    A processed camera frame, handed to every FrameSink of a HeadlessRunner.
+
+    The arrays may be views into receive buffers, they are only valid during FrameSink.consume().
+    Copy them if they must outlive the call.
+    """
+
+    __slots__ = (
+        "name",
+        "frame_id",
+        "sim_time",
+        "recv_time",
+        "trace",
+        "image",
+        "depth",
+        "bboxes",
+        "id_to_labels",
+        "camera_data",
+        "detections_world_pos",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        frame_id: int,
+        sim_time: float,
+        recv_time: float,
+        trace,
+        image: np.ndarray,
+        depth: np.ndarray,
+        bboxes: np.ndarray,
+        id_to_labels: dict,
+        camera_data: dict,
+        detections_world_pos: np.ndarray = None,
+    ):
+        """
+        Args:
+            name (str): Name of the stream the frame was received on
+            frame_id (int): FrameTrace.frame_id of the frame
+            sim_time (float): Simulation time of the frame
+            recv_time (float): When the frame was received, monotonic seconds
+            trace: client_stream_message_pb2.FrameTrace of the frame
+            image (np.ndarray): RGBA image (height, width, 4) uint8, with the bounding boxes drawn if enabled,
+                None if the color (or depth in depth view) was not streamed
+            depth (np.ndarray): Depth image (height, width, 1) float32, None if not streamed
+            bboxes (np.ndarray): Bounding boxes record array (see proto_util.BBOX2D_DTYPE)
+            id_to_labels (dict): Mapping of semantic id to label
+            camera_data (dict): Camera parameters (see proto_util.decode_camera), None if not streamed
+            detections_world_pos (np.ndarray): (N, 3) world positions of the detections, None if not computed
+        """
+        self.name = name
+        self.frame_id = frame_id
+        self.sim_time = sim_time
+        self.recv_time = recv_time
+        self.trace = trace
+        self.image = image
+        self.depth = depth
+        self.bboxes = bboxes
+        self.id_to_labels = id_to_labels
+        self.camera_data = camera_data
+        self.detections_world_pos = detections_world_pos
+
+
+class FrameSink:
+    """
+    Base class for the consumers of processed frames.
+
+    consume() is called on the processing thread of the stream, once per processed frame,
+    and should return quickly. Sinks shared by several streams must be thread safe.
+    """
+
+    def consume(self, frame: Frame) -> None:
+        """
+        Consume one processed frame.
+
+        Args:
+            frame (Frame): The processed frame
+
+        Raises:
+            NotImplementedError: If the derived class does not implement this method.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources of the sink, called once the streams are stopped."""
+
+
+class NullSink(FrameSink):
+    """
+    Discards every frame, to measure the server without any consumer.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def consume(self, frame: Frame) -> None:
+        self.count += 1
+
+
+class MetricsSink(FrameSink):
+    """
+    Counts the processed frames and their latencies, and logs them periodically.
+
+    Two latencies are measured per frame, with LatencyHistograms:
+    - processing: frame received -> consumed by the sink
+    - end to end: frame sent by the client (FrameTrace.send_time) -> consumed, only meaningful on the same host
+    """
+
+    def __init__(self, log_interval: float = 5.0):
+        """
+        Args:
+            log_interval (float): Seconds between logged summaries, 0 to never log
+        """
+        self.log_interval = log_interval
+        self.frames = {}
+        self.processing = LatencyHistogram()
+        self.end_to_end = LatencyHistogram()
+
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        self._last_log_time = self._start_time
+        self._interval_frames = 0
+
+    def consume(self, frame: Frame) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.frames[frame.name] = self.frames.get(frame.name, 0) + 1
+            self._interval_frames += 1
+            self.processing.add(now - frame.recv_time)
+            if frame.trace is not None and frame.trace.send_time:
+                self.end_to_end.add(now - frame.trace.send_time)
+
+            if self.log_interval and now - self._last_log_time >= self.log_interval:
+                rate = self._interval_frames / (now - self._last_log_time)
+                self._last_log_time = now
+                self._interval_frames = 0
+                processing = self.processing.summary()
+                print(
+                    "[isaac-zmq-server] {:.1f} fps, processing p50 {:.2f} ms / p99 {:.2f} ms".format(
+                        rate, processing["p50_ms"], processing["p99_ms"]
+                    )
+                )
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: Frame counts per stream, average rate and latency statistics (in milliseconds)
+        """
+        with self._lock:
+            total = sum(self.frames.values())
+            return {
+                "frames": dict(self.frames),
+                "fps": total / max(time.monotonic() - self._start_time, 1e-9),
+                "processing": self.processing.summary(),
+                "end_to_end": self.end_to_end.summary(),
+            }
+
+    def close(self) -> None:
+        print(f"[isaac-zmq-server] Metrics: {self.summary()}")
+
+
+class RecorderSink(FrameSink):
+    """
+    Saves processed frames to a directory, one .npz file per frame
+    (image, depth, bboxes, labels, camera parameters and times).
+
+    Files are written on the processing thread, use every_n to keep up with high rate streams.
+    """
+
+    def __init__(self, directory: str, every_n: int = 1, max_frames: int = 0):
+        """
+        Args:
+            directory (str): Output directory, created if missing
+            every_n (int): Save one frame out of every_n
+            max_frames (int): Stop saving after this many frames, 0 for no limit
+        """
+        self.directory = directory
+        self.every_n = max(every_n, 1)
+        self.max_frames = max_frames
+        self.seen = 0
+        self.saved = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def consume(self, frame: Frame) -> None:
+        with self._lock:
+            self.seen += 1
+            if (self.seen - 1) % self.every_n or (self.max_frames and self.saved >= self.max_frames):
+                return
+            self.saved += 1
+
+        arrays = dict(
+            bboxes=frame.bboxes,
+            label_ids=np.array(list(frame.id_to_labels.keys()), dtype=np.int64),
+            labels=np.array(list(frame.id_to_labels.values()), dtype=str),
+            sim_time=frame.sim_time,
+            recv_time=frame.recv_time,
+        )
+        # Parts not requested from the client (SettingsCommand.annotators) are left out of the file
+        if frame.image is not None:
+            arrays["image"] = frame.image
+        if frame.depth is not None:
+            arrays["depth"] = frame.depth
+        if frame.camera_data is not None:
+            arrays["view_matrix_ros"] = frame.camera_data["view_matrix_ros"]
+            arrays["intrinsics_matrix"] = frame.camera_data["intrinsics_matrix"]
+
+        path = os.path.join(self.directory, f"{frame.name}_{frame.frame_id:08d}.npz")
+        np.savez(path, **arrays)
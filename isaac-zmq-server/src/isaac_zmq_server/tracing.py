@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import bisect
+import collections
+import json
+import math
+import threading
+
+# Stages of the sim -> server -> sim loop, in order
+# serialize:   client, annotator data ready -> message handed to the socket (FrameTrace.render_time -> send_time)
+# send:        transport, client socket -> server socket (FrameTrace.send_time -> received)
+# receive:     server, received -> processing started (time spent in buffers)
+# parse:       server, protobuf parse and image decode
+# process:     server, analysis of the frame (drawing, back-projection...)
+# command_rtt: server sends a command -> client applies it (CommandTrace.send_time -> FrameTrace.command_apply_time)
+# loop:        frame rendered -> command computed from that frame applied by the client
+STAGES = ("serialize", "send", "receive", "parse", "process", "command_rtt", "loop")
+
+# Chrome trace process ids, so the client and server stages show as separate tracks
+_CHROME_PIDS = {"serialize": 1, "send": 2, "receive": 3, "parse": 3, "process": 3, "command_rtt": 2, "loop": 4}
+_CHROME_PROCESS_NAMES = {1: "Isaac Sim", 2: "Transport", 3: "Server", 4: "Closed loop"}
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies (in seconds), with log spaced buckets from 1 us to 10 s (10 per decade).
+    """
+
+    EDGES = [10 ** (exponent / 10) for exponent in range(-60, 11)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, latency: float) -> None:
+        self.counts[bisect.bisect_left(self.EDGES, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.min = min(self.min, latency)
+        self.max = max(self.max, latency)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Approximate percentile, the upper edge of the bucket it falls in (clamped to the max).
+
+        Args:
+            percent (float): Percentile in [0, 100]
+
+        Returns:
+            float: Latency in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                edge = self.EDGES[index] if index < len(self.EDGES) else self.max
+                return min(edge, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: count and mean / min / max / p50 / p90 / p99 latency in milliseconds
+        """
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1e3,
+            "min_ms": self.min * 1e3,
+            "max_ms": self.max * 1e3,
+            "p50_ms": self.percentile(50) * 1e3,
+            "p90_ms": self.percentile(90) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+        }
+
+
+class LatencyTracer:
+    """
+    Records per-stage latencies of the sim -> server -> sim loop from FrameTrace / CommandTrace
+    timestamps (see proto/client_stream_message.proto), as histograms and Chrome trace events.
+
+    All times are monotonic seconds. Stages measured across processes (send, command_rtt, loop)
+    are only meaningful when the client and server run on the same host.
+    """
+
+    def __init__(self, max_events: int = 100000, max_frames: int = 1000):
+        """
+        Args:
+            max_events (int): Number of recent Chrome trace events kept
+            max_frames (int): Number of recent frames remembered to match commands to their frame
+        """
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self.events = collections.deque(maxlen=max_events)
+        self.frames_received = 0
+        self.frames_lost = 0
+
+        self._lock = threading.Lock()
+        self._max_frames = max_frames
+        self._frame_render_times = collections.OrderedDict()  # frame_id -> render_time
+        self._command_frames = collections.OrderedDict()  # command_id -> frame_id
+        self._last_frame_id = 0
+        self._last_command_id = 0
+
+    def record(self, stage: str, start: float, end: float, frame_id: int = 0) -> None:
+        """
+        Record one stage duration.
+
+        Args:
+            stage (str): One of STAGES (or a custom stage name)
+            start (float): Stage start, monotonic seconds
+            end (float): Stage end, monotonic seconds
+            frame_id (int): Frame the stage belongs to, for the trace events
+        """
+        with self._lock:
+            self._record(stage, start, end, frame_id)
+
+    def _record(self, stage: str, start: float, end: float, frame_id: int) -> None:
+        """Record one stage duration. Requires the lock."""
+        if stage not in self.histograms:
+            self.histograms[stage] = LatencyHistogram()
+        self.histograms[stage].add(max(end - start, 0.0))
+        self.events.append((stage, start, end, frame_id))
+
+    def record_frame(
+        self,
+        trace,
+        recv_time: float,
+        parse_start: float,
+        parse_end: float,
+        process_end: float,
+    ) -> None:
+        """
+        Record the stages of a received frame, and of the command echoed back in its trace.
+
+        Args:
+            trace: client_stream_message_pb2.FrameTrace of the frame
+            recv_time (float): When the frame was received from the socket
+            parse_start (float): When parsing started
+            parse_end (float): When parsing ended (processing started)
+            process_end (float): When processing ended
+        """
+        frame_id = trace.frame_id
+        with self._lock:
+            self.frames_received += 1
+            if self._last_frame_id and frame_id > self._last_frame_id + 1:
+                self.frames_lost += frame_id - self._last_frame_id - 1
+            self._last_frame_id = max(self._last_frame_id, frame_id)
+
+            if trace.render_time:
+                self._remember(self._frame_render_times, frame_id, trace.render_time)
+                self._record("serialize", trace.render_time, trace.send_time, frame_id)
+                self._record("send", trace.send_time, recv_time, frame_id)
+            self._record("receive", recv_time, parse_start, frame_id)
+            self._record("parse", parse_start, parse_end, frame_id)
+            self._record("process", parse_end, process_end, frame_id)
+
+            # Each command is echoed back in every frame until the next one is applied, only count it once
+            command_id = trace.command_id
+            if command_id and command_id != self._last_command_id:
+                self._last_command_id = command_id
+                self._record("command_rtt", trace.command_send_time, trace.command_apply_time, frame_id)
+
+                command_frame_id = self._command_frames.get(command_id)
+                render_time = self._frame_render_times.get(command_frame_id)
+                if render_time:
+                    self._record("loop", render_time, trace.command_apply_time, command_frame_id)
+
+    def command_sent(self, command_id: int, frame_id: int) -> None:
+        """
+        Remember which frame a command was computed from, to measure the closed loop latency.
+
+        Args:
+            command_id (int): CommandTrace.command_id of the sent command
+            frame_id (int): FrameTrace.frame_id of the frame it was computed from
+        """
+        with self._lock:
+            self._remember(self._command_frames, command_id, frame_id)
+
+    def _remember(self, mapping: collections.OrderedDict, key, value) -> None:
+        """Add to a bounded mapping, forgetting the oldest entries. Requires the lock."""
+        mapping[key] = value
+        while len(mapping) > self._max_frames:
+            mapping.popitem(last=False)
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: Latency statistics per stage (in milliseconds) and frame counters
+        """
+        with self._lock:
+            return {
+                "frames_received": self.frames_received,
+                "frames_lost": self.frames_lost,
+                "stages": {stage: histogram.summary() for stage, histogram in self.histograms.items()},
+            }
+
+    def dump_json(self, path: str) -> None:
+        """
+        Write the per stage statistics and histograms to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        data = self.summary()
+        with self._lock:
+            data["histograms"] = {
+                "edges_ms": [edge * 1e3 for edge in LatencyHistogram.EDGES],
+                "counts": {stage: histogram.counts for stage, histogram in self.histograms.items()},
+            }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def dump_chrome_trace(self, path: str) -> None:
+        """
+        Write the recent stage events as a Chrome trace file (chrome://tracing, https://ui.perfetto.dev).
+
+        Args:
+            path (str): Output file path
+        """
+        trace_events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            for pid, name in _CHROME_PROCESS_NAMES.items()
+        ]
+        with self._lock:
+            events = list(self.events)
+        for stage, start, end, frame_id in events:
+            trace_events.append(
+                {
+                    "name": stage,
+                    "cat": "latency",
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": max(end - start, 0.0) * 1e6,
+                    "pid": _CHROME_PIDS.get(stage, 3),
+                    "tid": stage,
+                    "args": {"frame_id": frame_id},
+                }
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
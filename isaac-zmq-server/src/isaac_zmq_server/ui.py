@@ -1,7 +1,13 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import contextlib
+import threading
+
 import dearpygui.dearpygui as dpg
+import numpy as np
+
+from .sinks import Frame, FrameSink
 
 
 class App:
@@ -72,11 +78,21 @@ class App:
         # Show the viewport
         dpg.show_viewport()
 
+    def update_ui(self) -> None:
+        """
+        Update the UI before each rendered frame.
+
+        Called on the GUI thread at the display refresh rate. Derived classes can override it
+        to push the latest received data to the UI (see TextureSink), instead of doing it
+        for every received frame.
+        """
+
     def _run(self) -> None:
         """
         Run the main application loop.
         """
         while dpg.is_dearpygui_running():
+            self.update_ui()
             dpg.render_dearpygui_frame()
 
     def _cleanup(self) -> None:
@@ -98,3 +114,78 @@ class App:
         app.create_network_iface()
         app._run()
         app._cleanup()
+
+
+class TextureSink(FrameSink):
+    """
+    Displays frames in a DearPyGUI raw texture, at the display refresh rate.
+
+    Frames stay uint8 RGBA until they are displayed: consume() / write() fill a reused uint8 buffer,
+    and update(), called from App.update_ui once per rendered frame, converts it into the texture
+    only if a new frame arrived since the last render. Received frames that are never displayed
+    are never converted.
+
+    DearPyGUI 2.0 raw textures are float only (mvFormat_Float_rgba), the conversion is a single
+    float32 multiply. A uint8 texture_data buffer is filled with a plain copy instead.
+    """
+
+    def __init__(self, texture_data: np.ndarray):
+        """
+        Args:
+            texture_data (np.ndarray): The (height, width, 4) buffer of the raw texture, float32 or uint8
+        """
+        self.texture_data = texture_data
+        self._scale = np.float32(1 / 255) if texture_data.dtype != np.uint8 else None
+        self._lock = threading.Lock()
+        self._pending = np.zeros(texture_data.shape, dtype=np.uint8)
+        self._displayed = np.zeros(texture_data.shape, dtype=np.uint8)
+        self._dirty = False
+        self.frames_received = 0
+        self.frames_displayed = 0
+
+    def consume(self, frame: Frame) -> None:
+        if frame.image is not None:
+            self.set_image(frame.image)
+
+    def set_image(self, image: np.ndarray) -> None:
+        """
+        Set the image displayed on the next rendered frame.
+
+        Args:
+            image (np.ndarray): RGBA image (height, width, 4) uint8
+        """
+        with self.write() as buffer:
+            np.copyto(buffer, image)
+
+    @contextlib.contextmanager
+    def write(self):
+        """
+        Context manager giving the reused uint8 RGBA buffer of the next displayed frame, to draw into directly
+        (e.g. cv.draw_bounding_boxes(..., out=buffer)). The frame is displayed once the block exits without error.
+
+        Yields:
+            np.ndarray: (height, width, 4) uint8 buffer
+        """
+        with self._lock:
+            yield self._pending
+            self._dirty = True
+            self.frames_received += 1
+
+    def update(self) -> bool:
+        """
+        Convert the latest image into the texture, if a new one arrived. Call from the GUI thread.
+
+        Returns:
+            bool: Whether the texture was updated
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._pending, self._displayed = self._displayed, self._pending
+            self._dirty = False
+        if self._scale is None:
+            np.copyto(self.texture_data, self._displayed)
+        else:
+            np.multiply(self._displayed, self._scale, out=self.texture_data)
+        self.frames_displayed += 1
+        return True